@@ -7,7 +7,12 @@ import asyncio
 
 from . import api_bp
 from .decorators import require_auth, require_roles, handle_model_errors
-from ..api_lib import load_model, predict as predict_ue, train as train_model
+from ..api_lib import (
+    load_model,
+    predict as predict_ue,
+    predict_batch as predict_ue_batch,
+    train as train_model,
+)
 from ..data.nef_collector import NEFDataCollector
 from ..clients.nef_client import NEFClient, NEFClientError
 from ..errors import (
@@ -216,6 +221,42 @@ def predict_with_qos():
     )
 
 
+@api_bp.route("/predict-batch", methods=["POST"])
+@require_auth
+@require_roles("predict", "admin")
+@limiter.limit(limit_for("predict"))
+@validate_content_type("application/json")
+@validate_request_size(20)  # 20MB max for multi-UE prediction batches
+@validate_json_input(PredictionRequestWithQoS, allow_list=True)
+@handle_model_errors("Batch prediction")
+def predict_batch():
+    """Predict for a list of UE payloads in one request.
+
+    The model scores all payloads with one feature matrix; predictions are
+    returned in request order under ``predictions``, each in the same shape
+    as a ``/predict-with-qos`` response.
+    """
+    reqs = request.validated_data  # type: ignore[attr-defined]
+    if not isinstance(reqs, list):
+        reqs = [reqs]
+
+    _require_model_ready()
+    model = load_model(current_app.config["MODEL_PATH"])
+    outcomes = predict_ue_batch(
+        [req.model_dump(exclude_none=True) for req in reqs], model=model
+    )
+    predictions = []
+    for req, (result, features) in zip(reqs, outcomes):
+        track_prediction(result["antenna_id"], result["confidence"])
+        if hasattr(current_app, "metrics_collector"):
+            current_app.metrics_collector.drift_monitor.update(features)  # type: ignore[attr-defined]
+        predictions.append(
+            _prediction_response_payload(req, result, features, include_qos=True)
+        )
+
+    return jsonify({"predictions": predictions})
+
+
 @api_bp.route("/qos-feedback", methods=["POST"])
 @require_auth
 @require_roles("predict", "admin", "nef")
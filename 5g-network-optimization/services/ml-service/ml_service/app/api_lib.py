@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List
 
 from .initialization.model_init import ModelManager
 from .core.qos import qos_from_request
@@ -29,6 +29,27 @@ def predict(ue_data: dict, model: Any | None = None) -> tuple[dict, dict]:
     mdl = model or load_model()
     features = mdl.extract_features(ue_data)
     result = mdl.predict(features)
+    return _with_qos_compliance(ue_data, result, features), features
+
+
+def predict_batch(
+    ue_data_list: List[dict], model: Any | None = None
+) -> List[tuple[dict, dict]]:
+    """Return ``predict`` results for several UEs from one batched model call."""
+    mdl = model or load_model()
+    features_list = [mdl.extract_features(ue_data) for ue_data in ue_data_list]
+    if hasattr(mdl, "predict_batch"):
+        results = mdl.predict_batch(features_list)
+    else:
+        results = [mdl.predict(features) for features in features_list]
+    return [
+        (_with_qos_compliance(ue_data, result, features), features)
+        for ue_data, result, features in zip(ue_data_list, results, features_list)
+    ]
+
+
+def _with_qos_compliance(ue_data: dict, result: dict, features: dict) -> dict:
+    """Attach QoS compliance to ``result`` and record the QoS metrics."""
     try:
         qos = qos_from_request(ue_data)
 
@@ -63,7 +84,7 @@ def predict(ue_data: dict, model: Any | None = None) -> tuple[dict, dict]:
                 metrics.ADAPTIVE_CONFIDENCE.labels(service_type=service_type).set(adaptive_required)
             except Exception as exc:
                 metrics.logger.debug("Failed to track QoS metrics: %s", exc)
-            return result, features
+            return result
 
         compliance, violations = evaluate_qos_compliance(
             qos_context=qos,
@@ -86,7 +107,7 @@ def predict(ue_data: dict, model: Any | None = None) -> tuple[dict, dict]:
     except (KeyError, TypeError, ValueError) as exc:
         metrics.logger.error("QoS evaluation failed: %s", exc)
         raise ModelError(f"QoS evaluation failed: {exc}") from exc
-    return result, features
+    return result
 
 
 def train(
@@ -92,6 +92,8 @@ DEFAULT_ASYNC_MODEL_OPERATION_TIMEOUT = 300.0
 # Monitoring and Metrics Configuration
 DEFAULT_DATA_DRIFT_WINDOW_SIZE = 100
 DEFAULT_DATA_DRIFT_MAX_SAMPLES = 10000
+DEFAULT_DATA_DRIFT_BINS = 10
+DEFAULT_DATA_DRIFT_KS_ALPHA = 0.001
 DEFAULT_SAMPLE_CHECK_INTERVAL = 1000
 DEFAULT_METRICS_INTERVAL = 10.0
 DEFAULT_STATS_LOG_INTERVAL = 3600.0  # 1 hour
@@ -6,13 +6,14 @@ prediction pipeline can bias away from antennas with a poor QoS track record.
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
-from statistics import mean
-from typing import Deque, Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
+import threading
 import time
 
+from .qos_window import RollingQoSWindow
+
 
 QoSMetricDict = Dict[str, float]
 
@@ -35,7 +36,12 @@ class AntennaQoSProfiler:
 
         self.window_seconds = float(window_seconds)
         self.max_samples = int(max_samples)
-        self._profiles: Dict[tuple[str, str], Deque[AntennaQoSRecord]] = {}
+        self._profiles: Dict[tuple[str, str], RollingQoSWindow] = {}
+        # Bumped after every record/reset to invalidate ``_rate_snapshots``.
+        # ``_lock`` guards the version, the snapshots and profile creation.
+        self._version = 0
+        self._rate_snapshots: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
 
     def record(
         self,
@@ -50,9 +56,13 @@ class AntennaQoSProfiler:
 
         now = time.time() if timestamp is None else float(timestamp)
         key = (antenna_id, service_type.lower())
-        history = self._profiles.setdefault(key, deque(maxlen=self.max_samples))
-        history.append(AntennaQoSRecord(now, dict(metrics), bool(passed)))
-        self._prune(history, now)
+        with self._lock:
+            history = self._profiles.get(key)
+            if history is None:
+                history = self._profiles[key] = RollingQoSWindow(self.max_samples)
+        history.append(AntennaQoSRecord(now, dict(metrics), bool(passed)), self.window_seconds)
+        with self._lock:
+            self._version += 1
 
     def get_profile(self, antenna_id: str, service_type: str) -> Dict[str, object]:
         key = (antenna_id, service_type.lower())
@@ -69,9 +79,9 @@ class AntennaQoSProfiler:
             }
 
         cutoff = time.time() - self.window_seconds
-        samples = [rec for rec in history if rec.timestamp >= cutoff]
+        counts = history.counts(cutoff)
 
-        if not samples:
+        if not counts.sample_count:
             return {
                 "antenna_id": antenna_id,
                 "service_type": service_type,
@@ -79,23 +89,62 @@ class AntennaQoSProfiler:
                 "success_rate": None,
                 "violation_count": 0,
                 "metrics": {},
-                "last_timestamp": history[-1].timestamp,
+                "last_timestamp": history.last_timestamp(),
             }
 
-        passed_samples = [rec for rec in samples if rec.passed]
-        success_rate = len(passed_samples) / len(samples) if samples else None
-        metrics_summary = self._summarise_metrics(samples)
-
         return {
             "antenna_id": antenna_id,
             "service_type": service_type,
-            "sample_count": len(samples),
-            "success_rate": success_rate,
-            "violation_count": len(samples) - len(passed_samples),
-            "metrics": metrics_summary,
-            "last_timestamp": samples[-1].timestamp,
+            "sample_count": counts.sample_count,
+            "success_rate": counts.passed_count / counts.sample_count,
+            "violation_count": counts.sample_count - counts.passed_count,
+            "metrics": history.summary(cutoff),
+            "last_timestamp": counts.last_timestamp,
         }
 
+    def success_rates(
+        self, antenna_ids: Sequence[str], service_type: str
+    ) -> Tuple[Tuple[int, Optional[float]], ...]:
+        """Return ``(sample_count, success_rate)`` per antenna as :meth:`get_profile` would.
+
+        The tuple for the latest ``antenna_ids`` of each service type is
+        cached. It is reused until a record or reset, or until its oldest
+        counted sample leaves the window. A snapshot is tagged with the
+        version read before counting, so a record that lands mid-count
+        invalidates it.
+        """
+        service = service_type.lower()
+        ids = tuple(antenna_ids)
+        cutoff = time.time() - self.window_seconds
+        with self._lock:
+            version = self._version
+            cached = self._rate_snapshots.get(service)
+        if cached is not None:
+            cached_ids, cached_version, cached_cutoff, oldest, rates = cached
+            if (
+                cached_version == version
+                and cached_cutoff <= cutoff
+                and (oldest is None or oldest >= cutoff)
+                and cached_ids == ids
+            ):
+                return rates
+
+        rates_list = []
+        oldest = None
+        for antenna_id in ids:
+            history = self._profiles.get((antenna_id, service))
+            counts = history.counts(cutoff) if history else None
+            if not counts or not counts.sample_count:
+                rates_list.append((0, None))
+                continue
+            rates_list.append((counts.sample_count, counts.passed_count / counts.sample_count))
+            if oldest is None or counts.oldest_timestamp < oldest:
+                oldest = counts.oldest_timestamp
+        rates = tuple(rates_list)
+        with self._lock:
+            self._rate_snapshots[service] = (ids, version, cutoff, oldest, rates)
+        return rates
+
     def get_antenna_qos_score(
         self,
         antenna_id: str,
@@ -149,45 +198,18 @@ class AntennaQoSProfiler:
         return sample_count >= min_samples and success_rate < threshold
 
     def reset(self, antenna_id: Optional[str] = None, service_type: Optional[str] = None) -> None:
-        if antenna_id is None and service_type is None:
-            self._profiles.clear()
-            return
-
-        if antenna_id is not None and service_type is not None:
-            self._profiles.pop((antenna_id, service_type.lower()), None)
-        else:
-            keys_to_remove = [
-                key
-                for key in self._profiles
-                if (antenna_id is None or key[0] == antenna_id)
-                and (service_type is None or key[1] == service_type.lower())
-            ]
-            for key in keys_to_remove:
-                self._profiles.pop(key, None)
-
-    def _prune(self, history: Deque[AntennaQoSRecord], now: float) -> None:
-        cutoff = now - self.window_seconds
-        while history and history[0].timestamp < cutoff:
-            history.popleft()
-
-    @staticmethod
-    def _summarise_metrics(samples: list[AntennaQoSRecord]) -> Dict[str, Dict[str, float]]:
-        aggregates: Dict[str, list[float]] = {}
-        for sample in samples:
-            for metric, value in sample.metrics.items():
-                if not isinstance(value, (int, float)):
-                    continue
-                aggregates.setdefault(metric, []).append(float(value))
-
-        summary: Dict[str, Dict[str, float]] = {}
-        for metric, values in aggregates.items():
-            if not values:
-                continue
-            summary[metric] = {
-                "avg": mean(values),
-                "min": min(values),
-                "max": max(values),
-            }
-        return summary
-
-
+        with self._lock:
+            if antenna_id is None and service_type is None:
+                self._profiles.clear()
+            elif antenna_id is not None and service_type is not None:
+                self._profiles.pop((antenna_id, service_type.lower()), None)
+            else:
+                keys_to_remove = [
+                    key
+                    for key in self._profiles
+                    if (antenna_id is None or key[0] == antenna_id)
+                    and (service_type is None or key[1] == service_type.lower())
+                ]
+                for key in keys_to_remove:
+                    self._profiles.pop(key, None)
+            self._version += 1
@@ -8,13 +8,13 @@ future predictions or adapt thresholds.
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
-from statistics import mean
-from typing import Deque, Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional
 
 import time
 
+from .qos_window import RollingQoSWindow
+
 QoSMetricDict = Dict[str, float]
 
 
@@ -47,7 +47,7 @@ class QoSHistoryTracker:
 
         self.window_seconds = float(window_seconds)
         self.max_samples = int(max_samples)
-        self._history: Dict[str, Deque[QoSRecord]] = {}
+        self._history: Dict[str, RollingQoSWindow] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -64,9 +64,10 @@ class QoSHistoryTracker:
         """Append a QoS observation to the UE history."""
 
         now = time.time() if timestamp is None else float(timestamp)
-        history = self._history.setdefault(ue_id, deque(maxlen=self.max_samples))
-        history.append(QoSRecord(now, service_type, dict(metrics), bool(passed)))
-        self._prune(history, now)
+        history = self._history.get(ue_id)
+        if history is None:
+            history = self._history[ue_id] = RollingQoSWindow(self.max_samples)
+        history.append(QoSRecord(now, service_type, dict(metrics), bool(passed)), self.window_seconds)
 
     def get_qos_history(self, ue_id: str, window_seconds: Optional[float] = None) -> Dict[str, object]:
         """Return aggregated QoS statistics for ``ue_id`` within ``window_seconds``.
@@ -95,38 +96,35 @@ class QoSHistoryTracker:
 
         window = float(window_seconds) if window_seconds is not None else self.window_seconds
         cutoff = time.time() - window
-        samples = [rec for rec in history if rec.timestamp >= cutoff]
+        counts = history.counts(cutoff)
 
-        if not samples:
+        if not counts.sample_count:
             return {
                 "ue_id": ue_id,
                 "sample_count": 0,
                 "success_rate": None,
                 "violation_count": 0,
                 "metrics": {},
-                "last_timestamp": history[-1].timestamp,
+                "last_timestamp": history.last_timestamp(),
                 "degradation_detected": False,
             }
 
-        passed_samples = [rec for rec in samples if rec.passed]
-        success_rate = len(passed_samples) / len(samples) if samples else None
-
-        metrics_summary = self._summarise_metrics(sample.metrics for sample in samples)
-        degradation = success_rate is not None and len(samples) >= 5 and success_rate < 0.8
+        success_rate = counts.passed_count / counts.sample_count
+        degradation = counts.sample_count >= 5 and success_rate < 0.8
 
         return {
             "ue_id": ue_id,
-            "sample_count": len(samples),
+            "sample_count": counts.sample_count,
             "success_rate": success_rate,
-            "violation_count": len(samples) - len(passed_samples),
-            "metrics": metrics_summary,
-            "last_timestamp": samples[-1].timestamp,
+            "violation_count": counts.sample_count - counts.passed_count,
+            "metrics": history.summary(cutoff),
+            "last_timestamp": counts.last_timestamp,
             "degradation_detected": degradation,
         }
 
     def get_recent_samples(self, ue_id: str, limit: int = 20) -> Iterable[QoSRecord]:
-        history = self._history.get(ue_id) or []
-        return list(history)[-limit:]
+        history = self._history.get(ue_id)
+        return history.recent(limit) if history else []
 
     def has_degradation(self, ue_id: str, *, threshold: float = 0.8, min_samples: int = 5) -> bool:
         stats = self.get_qos_history(ue_id)
@@ -141,35 +139,3 @@ class QoSHistoryTracker:
             self._history.clear()
         else:
             self._history.pop(ue_id, None)
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-    def _prune(self, history: Deque[QoSRecord], now: float) -> None:
-        cutoff = now - self.window_seconds
-        while history and history[0].timestamp < cutoff:
-            history.popleft()
-
-    @staticmethod
-    def _summarise_metrics(samples: Iterable[QoSMetricDict]) -> Dict[str, Dict[str, float]]:
-        aggregates: Dict[str, Dict[str, float]] = {}
-        for metrics in samples:
-            for metric, value in metrics.items():
-                if not isinstance(value, (int, float)):
-                    continue
-                entry = aggregates.setdefault(metric, {"values": []})
-                entry["values"].append(float(value))
-
-        summary: Dict[str, Dict[str, float]] = {}
-        for metric, data in aggregates.items():
-            values = data["values"]
-            if not values:
-                continue
-            summary[metric] = {
-                "avg": mean(values),
-                "min": min(values),
-                "max": max(values),
-            }
-        return summary
-
-
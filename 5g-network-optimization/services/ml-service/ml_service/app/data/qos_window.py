@@ -0,0 +1,296 @@
+"""Sliding-window QoS aggregates shared by the QoS trackers.
+
+:class:`RollingQoSWindow` stores QoS records in append order, like the
+bounded deques the trackers used before. It also keeps pass counts,
+per-metric running sums and monotonic min/max deques for the records
+inside the most recent query window. Records leave those aggregates when
+they are evicted or pruned, or lazily when a later query moves the window
+cutoff past them. Counts and metric summaries therefore cost O(1)
+amortised instead of a rescan of every stored record.
+
+The incremental path needs timestamps that never decrease in append
+order, which holds whenever records are stamped on arrival. In that case
+the samples inside a window always form a suffix of the history. While
+an out-of-order record is still stored, queries filter and summarise the
+stored records directly, exactly as before.
+
+Queries move the live suffix and update the aggregates, so they mutate
+shared state just like appends. One lock per window serialises both.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from statistics import mean
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Finite floats are summed exactly as integer multiples of the smallest
+# subnormal, so running means equal ``statistics.mean`` bit for bit.
+_EXACT_SHIFT = 1074
+
+
+def _exact(value: float) -> int:
+    numerator, denominator = value.as_integer_ratio()
+    return numerator << (_EXACT_SHIFT + 1 - denominator.bit_length())
+
+
+def summarise_metrics(samples: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Return per-metric ``avg``/``min``/``max`` over numeric values in ``samples``."""
+    aggregates: Dict[str, List[float]] = {}
+    for metrics in samples:
+        for metric, value in metrics.items():
+            if not isinstance(value, (int, float)):
+                continue
+            aggregates.setdefault(metric, []).append(float(value))
+
+    summary: Dict[str, Dict[str, float]] = {}
+    for metric, values in aggregates.items():
+        if not values:
+            continue
+        summary[metric] = {
+            "avg": mean(values),
+            "min": min(values),
+            "max": max(values),
+        }
+    return summary
+
+
+class WindowCounts(NamedTuple):
+    """Pass counts for the samples inside one window."""
+
+    sample_count: int
+    passed_count: int
+    last_timestamp: Optional[float]
+    oldest_timestamp: Optional[float]
+
+
+class _MetricWindow:
+    """Running aggregates for one metric over the live records."""
+
+    __slots__ = ("entries", "total", "nan", "pos_inf", "neg_inf", "minima", "maxima")
+
+    def __init__(self) -> None:
+        # ``(seq, position)`` of every live occurrence, oldest first. The
+        # head orders metrics by first appearance, as in a full rescan.
+        self.entries: Deque[Tuple[int, int]] = deque()
+        self.total = 0
+        self.nan = 0
+        self.pos_inf = 0
+        self.neg_inf = 0
+        self.minima: Deque[Tuple[int, float]] = deque()
+        self.maxima: Deque[Tuple[int, float]] = deque()
+
+    def add(self, seq: int, position: int, value: float) -> None:
+        self.entries.append((seq, position))
+        if math.isfinite(value):
+            self.total += _exact(value)
+        elif value != value:
+            self.nan += 1
+        elif value > 0:
+            self.pos_inf += 1
+        else:
+            self.neg_inf += 1
+        # Strict comparisons keep the earliest of equal values at the head,
+        # which is the one ``min``/``max`` return.
+        minima = self.minima
+        while minima and minima[-1][1] > value:
+            minima.pop()
+        minima.append((seq, value))
+        maxima = self.maxima
+        while maxima and maxima[-1][1] < value:
+            maxima.pop()
+        maxima.append((seq, value))
+
+    def remove(self, seq: int, value: float) -> None:
+        self.entries.popleft()
+        if math.isfinite(value):
+            self.total -= _exact(value)
+        elif value != value:
+            self.nan -= 1
+        elif value > 0:
+            self.pos_inf -= 1
+        else:
+            self.neg_inf -= 1
+        if self.minima and self.minima[0][0] == seq:
+            self.minima.popleft()
+        if self.maxima and self.maxima[0][0] == seq:
+            self.maxima.popleft()
+
+    def summary(self) -> Dict[str, float]:
+        if self.nan or (self.pos_inf and self.neg_inf):
+            avg = math.nan
+        elif self.pos_inf:
+            avg = math.inf
+        elif self.neg_inf:
+            avg = -math.inf
+        else:
+            avg = self.total / (len(self.entries) << _EXACT_SHIFT)
+        return {"avg": avg, "min": self.minima[0][1], "max": self.maxima[0][1]}
+
+
+class RollingQoSWindow:
+    """Bounded QoS record history with incrementally maintained aggregates.
+
+    Records need ``timestamp``, ``metrics`` and ``passed`` attributes.
+    """
+
+    def __init__(self, max_samples: int) -> None:
+        self.max_samples = int(max_samples)
+        self.records: Deque[Any] = deque()
+        self._next_seq = 0
+        # Suffix of ``records`` inside the last queried window, with the
+        # aggregates below maintained over exactly these records.
+        self._live: Deque[Tuple[int, Any]] = deque()
+        self._cutoff = -math.inf
+        self._passed = 0
+        self._metrics: Dict[str, _MetricWindow] = {}
+        self._max_timestamp = -math.inf
+        # Sequence number of the newest record stamped earlier than a record
+        # appended before it; windows are suffixes once it is the head.
+        self._last_disorder = -1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.recent())
+
+    def recent(self, limit: Optional[int] = None) -> List[Any]:
+        """Return the stored records, or the newest ``limit`` of them, oldest first."""
+        with self._lock:
+            records = list(self.records)
+        return records if limit is None else records[-limit:]
+
+    def last_timestamp(self) -> Optional[float]:
+        """Return the timestamp of the newest stored record."""
+        with self._lock:
+            return self.records[-1].timestamp if self.records else None
+
+    def append(self, record: Any, window_seconds: float) -> None:
+        """Append ``record`` and prune records older than ``window_seconds`` before it."""
+        with self._lock:
+            self._append(record, window_seconds)
+
+    def counts(self, cutoff: float) -> WindowCounts:
+        """Return pass counts for records stamped at or after ``cutoff``."""
+        with self._lock:
+            return self._counts(cutoff)
+
+    def summary(self, cutoff: float) -> Dict[str, Dict[str, float]]:
+        """Return per-metric ``avg``/``min``/``max`` for records at or after ``cutoff``."""
+        with self._lock:
+            return self._summary(cutoff)
+
+    # ------------------------------------------------------------------
+    # Internal helpers; callers hold ``_lock``
+    # ------------------------------------------------------------------
+    def _append(self, record: Any, window_seconds: float) -> None:
+        if len(self.records) >= self.max_samples:
+            self._popleft()
+        seq = self._next_seq
+        self._next_seq += 1
+        self.records.append(record)
+        self._live.append((seq, record))
+        self._add(seq, record)
+
+        if record.timestamp >= self._max_timestamp:
+            self._max_timestamp = record.timestamp
+        elif record.timestamp != record.timestamp:
+            # A NaN-stamped record is never inside a window, not even as the head.
+            self._last_disorder = seq + 1
+        else:
+            self._last_disorder = seq
+
+        cutoff = record.timestamp - window_seconds
+        while self.records and self.records[0].timestamp < cutoff:
+            self._popleft()
+
+    def _counts(self, cutoff: float) -> WindowCounts:
+        if self._expire(cutoff):
+            live = self._live
+            if not live:
+                return WindowCounts(0, 0, None, None)
+            return WindowCounts(len(live), self._passed, live[-1][1].timestamp, live[0][1].timestamp)
+
+        samples = [rec for rec in self.records if rec.timestamp >= cutoff]
+        if not samples:
+            return WindowCounts(0, 0, None, None)
+        return WindowCounts(
+            len(samples),
+            sum(1 for rec in samples if rec.passed),
+            samples[-1].timestamp,
+            min(rec.timestamp for rec in samples),
+        )
+
+    def _summary(self, cutoff: float) -> Dict[str, Dict[str, float]]:
+        if not self._expire(cutoff):
+            return summarise_metrics(rec.metrics for rec in self.records if rec.timestamp >= cutoff)
+
+        ordered = sorted(self._metrics.items(), key=lambda item: item[1].entries[0])
+        summary: Dict[str, Dict[str, float]] = {}
+        for metric, window in ordered:
+            if window.nan:
+                # ``min``/``max`` depend on where NaNs sit; rescan this metric.
+                values = [
+                    float(rec.metrics[metric])
+                    for _, rec in self._live
+                    if isinstance(rec.metrics.get(metric), (int, float))
+                ]
+                summary[metric] = {"avg": mean(values), "min": min(values), "max": max(values)}
+            else:
+                summary[metric] = window.summary()
+        return summary
+
+    def _ordered(self) -> bool:
+        return self._last_disorder <= self._next_seq - len(self.records)
+
+    def _expire(self, cutoff: float) -> bool:
+        """Move the live suffix to ``cutoff``; ``False`` when it is not a suffix."""
+        if not self._ordered():
+            return False
+        if cutoff < self._cutoff:
+            self._rebuild()
+        self._cutoff = cutoff
+        live = self._live
+        while live and live[0][1].timestamp < cutoff:
+            seq, record = live.popleft()
+            self._remove(seq, record)
+        return True
+
+    def _rebuild(self) -> None:
+        self._live.clear()
+        self._passed = 0
+        self._metrics.clear()
+        self._cutoff = -math.inf
+        first = self._next_seq - len(self.records)
+        for offset, record in enumerate(self.records):
+            self._live.append((first + offset, record))
+            self._add(first + offset, record)
+
+    def _popleft(self) -> None:
+        seq = self._next_seq - len(self.records)
+        record = self.records.popleft()
+        if self._live and self._live[0][0] == seq:
+            self._live.popleft()
+            self._remove(seq, record)
+
+    def _add(self, seq: int, record: Any) -> None:
+        self._passed += bool(record.passed)
+        for position, (metric, value) in enumerate(record.metrics.items()):
+            if isinstance(value, (int, float)):
+                window = self._metrics.get(metric)
+                if window is None:
+                    window = self._metrics[metric] = _MetricWindow()
+                window.add(seq, position, float(value))
+
+    def _remove(self, seq: int, record: Any) -> None:
+        self._passed -= bool(record.passed)
+        for metric, value in record.metrics.items():
+            if isinstance(value, (int, float)):
+                window = self._metrics[metric]
+                window.remove(seq, float(value))
+                if not window.entries:
+                    del self._metrics[metric]
@@ -0,0 +1,176 @@
+"""Compiled model-input schema.
+
+:class:`CompiledFeatureSchema` turns a prepared feature dictionary into the
+numeric row fed to the model. The dict-based path walks the features four
+times: it fills defaults for missing model columns, clamps values with
+:func:`~ml_service.app.config.feature_specs.sanitize_feature_ranges`, checks
+them with :func:`~ml_service.app.config.feature_specs.validate_feature_ranges`
+and then builds the row from ``feature_names``. The compiled schema resolves
+every column's default and range once. It then does all four steps in one pass
+that writes straight into a preallocated row, or into one row of a batch
+block.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import feature_specs
+
+__all__ = ["CompiledFeatureSchema", "compile_feature_schema"]
+
+# Returned by ``_sanitized`` for values that ``validate_feature_ranges`` rejects.
+_INVALID = object()
+
+_Bounds = Tuple[Optional[float], Optional[float], Optional[frozenset]]
+
+
+def _bounds(spec: Dict[str, Any]) -> _Bounds:
+    categories = spec.get("categories")
+    return (
+        spec.get("min"),
+        spec.get("max"),
+        frozenset(categories) if categories is not None else None,
+    )
+
+
+def _column_range(spec: Optional[Dict[str, Any]]) -> Tuple[Optional[_Bounds], float, float]:
+    """Return ``(bounds, lo, hi)`` for a column.
+
+    ``lo``/``hi`` enable the in-range fast path of
+    :meth:`CompiledFeatureSchema.fill_row`. They are NaN, which never
+    compares in range, when the column has no numeric range, or when ints
+    near the range edges would not survive the float round trip.
+    """
+    if spec is None:
+        return None, math.nan, math.nan
+    bounds = _bounds(spec)
+    lo, hi, categories = bounds
+    if categories is not None or lo is None or hi is None or max(abs(lo), abs(hi)) > 2.0**53:
+        return bounds, math.nan, math.nan
+    return bounds, lo, hi
+
+
+def _sanitized(value: Any, bounds: _Bounds) -> Any:
+    """Return ``value`` as the dict path leaves it, or ``_INVALID``.
+
+    The value goes through :func:`sanitize_feature_ranges` and then
+    :func:`validate_feature_ranges`, fused into one step.
+    """
+    lo, hi, categories = bounds
+    if categories is not None:
+        return value if value in categories else _INVALID
+
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return _INVALID
+
+    if not math.isfinite(numeric):
+        if hi is not None:
+            numeric = hi
+        elif lo is not None:
+            numeric = lo
+        else:
+            return value
+    elif lo is not None and numeric < lo:
+        numeric = lo
+    elif hi is not None and numeric > hi:
+        numeric = hi
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = int(round(numeric))
+        numeric = float(value)
+    else:
+        value = numeric
+
+    if (lo is not None and numeric < lo) or (hi is not None and numeric > hi):
+        return _INVALID
+    return value
+
+
+class CompiledFeatureSchema:
+    """Column plan for ``feature_names`` under the loaded feature ranges.
+
+    :meth:`fill_row` stores the same defaulted and clamped values in the
+    feature dictionary as the dict path. It returns ``False``, without
+    raising, when a value needs that path instead: a range violation, a
+    non-numeric column or an unencoded ``service_type``. The caller then
+    re-runs the dict path to raise its exact error. That re-run gives the
+    same result because defaulting and clamping are idempotent.
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        default_for: Callable[[str], Any],
+        specs: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        if specs is None:
+            specs = feature_specs.FEATURE_SPECS
+        self.feature_names: Tuple[str, ...] = tuple(feature_names)
+        self.width = len(self.feature_names)
+        self._specs = specs
+        self._columns = tuple(
+            (name, default_for(name), *_column_range(specs.get(name)))
+            for name in self.feature_names
+        )
+        columns = set(self.feature_names)
+        # Ranged features that are not model columns are still clamped and
+        # validated when present, exactly as the dict path does.
+        self._extra = tuple(
+            (name, _bounds(spec)) for name, spec in specs.items() if name not in columns
+        )
+
+    def matches(self, feature_names: Sequence[str]) -> bool:
+        """Return whether this plan is current for ``feature_names``."""
+        return self._specs is feature_specs.FEATURE_SPECS and self.feature_names == tuple(feature_names)
+
+    def fill_row(self, features: Dict[str, Any], out: np.ndarray) -> bool:
+        """Write the model row for ``features`` into ``out`` in column order."""
+        values: List[Any] = []
+        append = values.append
+        for name, default, bounds, lo, hi in self._columns:
+            value = features.get(name)
+            if value is None:
+                value = default
+                features[name] = value
+            if bounds is not None:
+                # Plain in-range floats and ints come out of the dict path
+                # unchanged, so skip the general clamp for them.
+                kind = type(value)
+                if (kind is float or kind is int) and lo <= value <= hi:
+                    append(value)
+                    continue
+                value = _sanitized(value, bounds)
+                if value is _INVALID:
+                    return False
+                features[name] = value
+            append(value)
+
+        for name, bounds in self._extra:
+            if name in features:
+                value = _sanitized(features[name], bounds)
+                if value is _INVALID:
+                    return False
+                features[name] = value
+
+        service_type = features.get("service_type")
+        if service_type is not None and not isinstance(service_type, (int, float)):
+            return False
+        try:
+            out[:] = values
+        except (TypeError, ValueError):
+            return False
+        return True
+
+
+def compile_feature_schema(
+    feature_names: Sequence[str],
+    default_for: Callable[[str], Any],
+) -> CompiledFeatureSchema:
+    """Compile ``feature_names`` against the loaded ``FEATURE_SPECS``."""
+    return CompiledFeatureSchema(feature_names, default_for)
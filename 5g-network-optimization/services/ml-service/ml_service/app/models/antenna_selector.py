@@ -6,17 +6,19 @@ import os
 import logging
 import threading
 from collections import deque
+from contextlib import nullcontext
 import json
 import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, cast
+from typing import Dict, Any, List, Optional, Sequence, cast
 
 import yaml
 
 from sklearn.exceptions import NotFittedError
 from sklearn.preprocessing import StandardScaler
 from ..features import pipeline
+from ..features.compiled_schema import CompiledFeatureSchema, compile_feature_schema
 from ..core.qos import qos_from_request
 from ..features.transform_registry import (
     register_feature_transform,
@@ -50,6 +52,7 @@ from ..utils.resource_manager import (
 )
 from ..utils.type_helpers import safe_float
 from .async_model_operations import AsyncModelInterface, get_async_model_manager
+from .model_snapshot import EMPTY_SNAPSHOT, ModelSnapshot, fresh_estimator
 from .ping_pong_prevention import PingPongPrevention
 from .qos_bias import QoSBiasManager
 from ..monitoring import metrics
@@ -215,6 +218,12 @@ class AntennaSelector(AsyncModelInterface):
     # invoked concurrently, so a lock ensures feature names are added only once.
     _init_lock = threading.Lock()
 
+    # Fitted state read by inference. Replaced as a whole by ``_publish``;
+    # the class defaults let subclasses assign estimators before
+    # ``AntennaSelector.__init__`` runs.
+    _snapshot: ModelSnapshot = EMPTY_SNAPSHOT
+    _feature_names: Sequence[str] = ()
+
     @staticmethod
     def _safe_float(value: Any, fallback: float) -> float:
         """Return ``value`` as float with ``fallback`` on failure.
@@ -384,10 +393,12 @@ class AntennaSelector(AsyncModelInterface):
             variable or ``config/features.yaml``.
         """
         self.model_path = model_path
-        # Thread-safety: protect concurrent reads/writes to the underlying estimator
+        # Serialises training and hot-swaps of the fitted state. Inference
+        # reads ``model_snapshot`` instead and never takes this lock.
         self._model_lock = threading.RLock()
-        self.model: Optional[lgb.LGBMClassifier] = None
+        self.model = None
         self.scaler = StandardScaler()
+        self._compiled_schema: Optional[CompiledFeatureSchema] = None
 
         if config_path is None:
             config_path = os.environ.get("FEATURE_CONFIG_PATH", str(DEFAULT_FEATURE_CONFIG))
@@ -412,7 +423,7 @@ class AntennaSelector(AsyncModelInterface):
             self.base_feature_names = list(_FALLBACK_FEATURES)
 
         self.neighbor_count = 0
-        self.feature_names = list(self.base_feature_names)
+        feature_names = list(self.base_feature_names)
 
         if neighbor_count is None:
             neighbor_count = get_neighbor_count_from_env(logger=logger)
@@ -420,12 +431,13 @@ class AntennaSelector(AsyncModelInterface):
         if neighbor_count and neighbor_count > 0:
             self.neighbor_count = int(neighbor_count)
             for idx in range(self.neighbor_count):
-                self.feature_names.extend([
+                feature_names.extend([
                     f"rsrp_a{idx+1}",
                     f"sinr_a{idx+1}",
                     f"rsrq_a{idx+1}",
                     f"neighbor_cell_load_a{idx+1}",
                 ])
+        self.feature_names = feature_names
 
         # QoS-derived features are optional for validation; they will be
         # populated with safe defaults when absent.
@@ -439,6 +451,9 @@ class AntennaSelector(AsyncModelInterface):
         self.qos_bias_min_samples = int(os.getenv("QOS_BIAS_MIN_SAMPLES", "5"))
         self.qos_bias_success_threshold = float(os.getenv("QOS_BIAS_SUCCESS_THRESHOLD", "0.9"))
         self.qos_bias_min_multiplier = float(os.getenv("QOS_BIAS_MIN_MULTIPLIER", "0.35"))
+        # Per service type: (success rates, bias config, multipliers, details)
+        self._qos_bias_snapshots: Dict[str, tuple] = {}
+        self._bias_class_ids: Optional[tuple[np.ndarray, tuple[str, ...]]] = None
         
         # Anti-ping-pong configuration from environment
         self.min_handover_interval_s = float(os.getenv("MIN_HANDOVER_INTERVAL_S", "2.0"))
@@ -504,8 +519,9 @@ class AntennaSelector(AsyncModelInterface):
         with self._init_lock:
             if desired_count <= self.neighbor_count:
                 return
+            feature_names = list(self.feature_names)
             for idx in range(self.neighbor_count, desired_count):
-                self.feature_names.extend(
+                feature_names.extend(
                     [
                         f"rsrp_a{idx+1}",
                         f"sinr_a{idx+1}",
@@ -514,6 +530,70 @@ class AntennaSelector(AsyncModelInterface):
                     ]
                 )
             self.neighbor_count = desired_count
+            self.feature_names = feature_names
+
+    @property
+    def model_snapshot(self) -> ModelSnapshot:
+        """The fitted state that predictions currently read."""
+        return self._snapshot
+
+    @property
+    def model(self) -> Optional[lgb.LGBMClassifier]:
+        return self._snapshot.model
+
+    @model.setter
+    def model(self, value: Optional[lgb.LGBMClassifier]) -> None:
+        self._publish(model=value)
+
+    @property
+    def calibrated_model(self) -> Any:
+        return self._snapshot.calibrated_model
+
+    @calibrated_model.setter
+    def calibrated_model(self, value: Any) -> None:
+        self._publish(calibrated_model=value)
+
+    @property
+    def scaler(self) -> Any:
+        return self._snapshot.scaler
+
+    @scaler.setter
+    def scaler(self, value: Any) -> None:
+        self._publish(scaler=value)
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Model input columns. Replace the list to change them; do not mutate it."""
+        return self._feature_names
+
+    @feature_names.setter
+    def feature_names(self, value: List[str]) -> None:
+        self._publish(feature_names=value)
+
+    def _publish(self, **changes: Any) -> ModelSnapshot:
+        """Replace the current snapshot with one that applies ``changes``.
+
+        Estimators must not be fitted in place once published; fit a
+        :func:`fresh_estimator` copy and publish it instead. Pass everything
+        that changes together, such as model, scaler and feature names, so no
+        prediction pairs a new model with old inputs.
+        """
+        with self.__dict__.get("_model_lock") or nullcontext():
+            current = self._snapshot
+            state = {
+                "model": current.model,
+                "calibrated_model": current.calibrated_model,
+                "scaler": current.scaler,
+                "feature_names": current.feature_names,
+            }
+            if "feature_names" in changes:
+                names = changes.pop("feature_names")
+                self._feature_names = names
+                state["feature_names"] = tuple(names)
+            state.update(changes)
+            snapshot = ModelSnapshot(version=current.version + 1, **state)
+            self._snapshot = snapshot
+        return snapshot
 
     def _initialize_model(self):
         """Initialize a default LightGBM model."""
@@ -633,14 +713,143 @@ class AntennaSelector(AsyncModelInterface):
         """Predict the optimal antenna for the UE with ping-pong prevention."""
         # Start timing for feature extraction stage
         _stage_start = time.time()
-        
+
+        snapshot = self._snapshot
+        schema = self._feature_schema(snapshot)
+        X = np.empty((1, schema.width), dtype=float)
+        prepared, service_type_label = self._prediction_input(features, schema, X[0])
+        X = self._scale_model_input(X, snapshot.scaler)
+
+        # Record feature extraction latency (includes all preparation work)
+        metrics.PREDICTION_STAGE_LATENCY.labels(stage='feature_extraction').observe(
+            time.time() - _stage_start
+        )
+
+        ue_id = prepared.get("ue_id", "unknown")
+
+        # Start timing for model inference stage
+        _inference_start = time.time()
+        try:
+            probas, classes_, fallback = self._predict_probabilities(X, snapshot)
+            if fallback is not None:
+                result = fallback
+            else:
+                result = self._result_from_probabilities(
+                    probas[0],
+                    classes_,
+                    service_type_label,
+                    self._apply_qos_bias(probas[0], classes_, service_type_label),
+                    calibrated=snapshot.calibrated_model is not None,
+                )
+        except RuntimeModelError:
+            raise
+        except (lgb.basic.LightGBMError, NotFittedError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.error("Model prediction failed for UE %s: %s", ue_id, exc)
+            raise RuntimeModelError(f"Model prediction failed for UE {ue_id}: {exc}") from exc
+        # Record model inference latency
+        metrics.PREDICTION_STAGE_LATENCY.labels(stage='model_inference').observe(
+            time.time() - _inference_start
+        )
+
+        return self._finalize_prediction(result, prepared, service_type_label)
+
+    def predict_batch(self, features_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Predict for several UEs with one feature matrix and one ``predict_proba``.
+
+        QoS bias is applied per service type on the probability matrix; the
+        geographic check and ping-pong prevention then run per UE in input
+        order, so every result matches what :meth:`predict` returns for the
+        same features. Subclasses that override :meth:`predict` are served
+        one UE at a time through their own implementation.
+        """
+        if not features_list:
+            return []
+        if type(self).predict is not AntennaSelector.predict:
+            return [self.predict(features) for features in features_list]
+
+        _stage_start = time.time()
+        snapshot = self._snapshot
+        schema = self._feature_schema(snapshot)
+        X = np.empty((len(features_list), schema.width), dtype=float)
+        inputs = [
+            self._prediction_input(features, schema, X[idx])
+            for idx, features in enumerate(features_list)
+        ]
+        X = self._scale_model_input(X, snapshot.scaler)
+        labels = [label for _, label in inputs]
+        metrics.PREDICTION_STAGE_LATENCY.labels(stage='feature_extraction').observe(
+            time.time() - _stage_start
+        )
+
+        _inference_start = time.time()
+        try:
+            probas, classes_, fallback = self._predict_probabilities(X, snapshot)
+            if fallback is not None:
+                results = [dict(fallback) for _ in inputs]
+            else:
+                calibrated = snapshot.calibrated_model is not None
+                results = [
+                    self._result_from_probabilities(
+                        probas[idx], classes_, labels[idx], bias, calibrated=calibrated
+                    )
+                    for idx, bias in enumerate(self._apply_qos_bias_batch(probas, classes_, labels))
+                ]
+        except RuntimeModelError:
+            raise
+        except (lgb.basic.LightGBMError, NotFittedError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.error("Batch model prediction failed for %d UEs: %s", len(inputs), exc)
+            raise RuntimeModelError(f"Batch model prediction failed: {exc}") from exc
+        metrics.PREDICTION_STAGE_LATENCY.labels(stage='model_inference').observe(
+            time.time() - _inference_start
+        )
+
+        return [
+            self._finalize_prediction(result, prepared, label)
+            for result, (prepared, label) in zip(results, inputs)
+        ]
+
+    def _feature_schema(self, snapshot: Optional[ModelSnapshot] = None) -> CompiledFeatureSchema:
+        """Return the compiled schema for the feature names in ``snapshot``.
+
+        Defaults to the current snapshot.
+        """
+        feature_names = (snapshot or self._snapshot).feature_names
+        schema = getattr(self, "_compiled_schema", None)
+        if schema is None or not schema.matches(feature_names):
+            schema = compile_feature_schema(feature_names, self._default_feature_value)
+            self._compiled_schema = schema
+        return schema
+
+    def _prediction_input(
+        self,
+        features: Dict[str, Any],
+        schema: CompiledFeatureSchema,
+        out: np.ndarray,
+    ) -> tuple[Dict[str, Any], str]:
+        """Write the unscaled model row into ``out``.
+
+        Returns the prepared features and the QoS service label.
+        """
         prepared = self._prepare_features_for_model(features)
+        if not schema.fill_row(prepared, out):
+            out[:] = self._reference_row(prepared, schema.feature_names)
+
+        service_type_label = prepared.get("service_type_label") or prepared.get("service_type") or "default"
+        if isinstance(service_type_label, (int, float)):
+            service_type_label = str(service_type_label)
+        return prepared, service_type_label
+
+    def _reference_row(self, prepared: Dict[str, Any], feature_names: Sequence[str]) -> list:
+        """Dict-based model row for ``prepared``.
+
+        Raises the range and encoding errors that the compiled schema
+        only detects.
+        """
         self._ensure_feature_defaults(prepared)
         sanitize_feature_ranges(prepared)
         # Validate required features and their configured ranges
         validate_feature_ranges(prepared)
 
-        # Convert features to the format expected by the model and scale
         # Ensure `service_type` is numeric for prediction as well
         try:
             from ml_service.app.core.qos_encoding import encode_service_type
@@ -651,113 +860,105 @@ class AntennaSelector(AsyncModelInterface):
         except (ImportError, KeyError, TypeError, ValueError) as exc:
             raise RuntimeModelError("Failed to encode service_type for prediction") from exc
 
-        X = np.array([[prepared[name] for name in self.feature_names]], dtype=float)
-        if self.scaler:
+        return [prepared[name] for name in feature_names]
+
+    @staticmethod
+    def _scale_model_input(X: np.ndarray, scaler: Any) -> np.ndarray:
+        if scaler:
             try:
-                X = self.scaler.transform(X)
+                X = scaler.transform(X)
             except NotFittedError:
                 pass
+        return X
 
-        service_type_label = prepared.get("service_type_label") or prepared.get("service_type") or "default"
-        if isinstance(service_type_label, (int, float)):
-            service_type_label = str(service_type_label)
-        
-        # Record feature extraction latency (includes all preparation work)
-        metrics.PREDICTION_STAGE_LATENCY.labels(stage='feature_extraction').observe(
-            time.time() - _stage_start
-        )
+    @staticmethod
+    def _predict_probabilities(X: np.ndarray, snapshot: ModelSnapshot):
+        """Return ``(probas, classes_, None)`` for ``X`` or ``(None, None, fallback)``.
 
-        def _perform_prediction():
-            # Perform a single prediction attempt via probabilities
-            with self._model_lock:
-                if self.model is None:
-                    return {
-                        "antenna_id": FALLBACK_ANTENNA_ID,
-                        "confidence": FALLBACK_CONFIDENCE,
-                        "fallback_reason": "model_not_initialized",
-                        "qos_bias_applied": False,
-                    }
+        Reads only ``snapshot``, so no lock is needed: training publishes a
+        new snapshot instead of mutating this one. ``probas`` always has one
+        row per row of ``X``.
+        """
+        if snapshot.model is None:
+            return None, None, {
+                "antenna_id": FALLBACK_ANTENNA_ID,
+                "confidence": FALLBACK_CONFIDENCE,
+                "fallback_reason": "model_not_initialized",
+                "qos_bias_applied": False,
+            }
 
-                # Use calibrated model if available (better confidence estimates)
-                # Otherwise use base model
-                prediction_model = getattr(self, 'calibrated_model', None) or self.model
-                model = cast(lgb.LGBMClassifier, prediction_model if hasattr(prediction_model, 'classes_') else self.model)
-
-                if (
-                    hasattr(prediction_model, "__sklearn_is_fitted__")
-                    and not prediction_model.__sklearn_is_fitted__()
-                ):
-                    return {
-                        "antenna_id": FALLBACK_ANTENNA_ID,
-                        "confidence": FALLBACK_CONFIDENCE,
-                        "fallback_reason": "model_unfitted",
-                        "qos_bias_applied": False,
-                    }
-                
-                # Ensure the returned probabilities are a NumPy array so
-                # indexing and numpy ops work correctly even if some
-                # implementations return sparse-like objects.
-                probas = np.asarray(prediction_model.predict_proba(X) if hasattr(prediction_model, 'predict_proba') else model.predict_proba(X))
-                # If the estimator returns a 2D array (n_samples, n_classes)
-                # take the first row; if it's already 1D use it as-is.
-                if probas.ndim == 1:
-                    probabilities = probas
-                else:
-                    probabilities = probas[0]
-                
-                # Get classes from base model (calibrated model wraps it)
-                if hasattr(prediction_model, 'classes_'):
-                    classes_ = np.asarray(prediction_model.classes_)
-                else:
-                    classes_ = np.asarray(model.classes_)
+        # Use calibrated model if available (better confidence estimates)
+        # Otherwise use base model
+        prediction_model = snapshot.prediction_model
+        model = cast(lgb.LGBMClassifier, prediction_model if hasattr(prediction_model, 'classes_') else snapshot.model)
+
+        if (
+            hasattr(prediction_model, "__sklearn_is_fitted__")
+            and not prediction_model.__sklearn_is_fitted__()
+        ):
+            return None, None, {
+                "antenna_id": FALLBACK_ANTENNA_ID,
+                "confidence": FALLBACK_CONFIDENCE,
+                "fallback_reason": "model_unfitted",
+                "qos_bias_applied": False,
+            }
 
-            adjusted_probabilities, bias_details, bias_applied = self._apply_qos_bias(
-                probabilities,
-                classes_,
-                service_type_label,
-            )
+        # Ensure the returned probabilities are a NumPy array so
+        # indexing and numpy ops work correctly even if some
+        # implementations return sparse-like objects.
+        probas = np.asarray(prediction_model.predict_proba(X) if hasattr(prediction_model, 'predict_proba') else model.predict_proba(X))
+        # Some estimators return a flat vector for a single sample.
+        if probas.ndim == 1:
+            probas = probas.reshape(1, -1)
 
-            if bias_applied:
-                probabilities = adjusted_probabilities
+        # Classes are read from the estimator rather than ``snapshot.classes``
+        # so stubs that set ``classes_`` after assignment keep working.
+        classes_ = np.asarray(model.classes_)
+        return probas, classes_, None
 
-            idx = int(np.argmax(probabilities))
-            antenna_id = classes_[idx]
-            confidence = float(probabilities[idx])
-            
-            result = {
-                "antenna_id": antenna_id,
-                "confidence": confidence
-            }
-            
-            if bias_applied:
-                result["qos_bias_applied"] = True
-                result["qos_bias_service_type"] = service_type_label
-                result["qos_bias_scores"] = bias_details
-            else:
-                result["qos_bias_applied"] = False
+    def _result_from_probabilities(
+        self,
+        probabilities: np.ndarray,
+        classes_: np.ndarray,
+        service_type_label: str,
+        bias: tuple[np.ndarray, Dict[str, float], bool],
+        *,
+        calibrated: bool = False,
+    ) -> Dict[str, Any]:
+        adjusted_probabilities, bias_details, bias_applied = bias
+        if bias_applied:
+            probabilities = adjusted_probabilities
+
+        idx = int(np.argmax(probabilities))
+        antenna_id = classes_[idx]
+        confidence = float(probabilities[idx])
+
+        result = {
+            "antenna_id": antenna_id,
+            "confidence": confidence
+        }
+
+        if bias_applied:
+            result["qos_bias_applied"] = True
+            result["qos_bias_service_type"] = service_type_label
+            result["qos_bias_scores"] = bias_details
+        else:
+            result["qos_bias_applied"] = False
 
-            # Add calibration indicator if calibrated model was used
-            if hasattr(self, 'calibrated_model') and self.calibrated_model is not None:
-                result["confidence_calibrated"] = True
-            
-            return result
-        
+        # Add calibration indicator if calibrated model was used
+        if calibrated:
+            result["confidence_calibrated"] = True
+
+        return result
+
+    def _finalize_prediction(
+        self,
+        result: Dict[str, Any],
+        prepared: Dict[str, Any],
+        service_type_label: str,
+    ) -> Dict[str, Any]:
+        """Apply the geographic check, diversity monitoring and ping-pong prevention."""
         ue_id = prepared.get("ue_id", "unknown")
-        
-        # Start timing for model inference stage
-        _inference_start = time.time()
-        try:
-            result = _perform_prediction()
-        except RuntimeModelError:
-            raise
-        except (lgb.basic.LightGBMError, NotFittedError, ValueError, TypeError, KeyError, AttributeError) as exc:
-            logger.error("Model prediction failed for UE %s: %s", ue_id, exc)
-            raise RuntimeModelError(f"Model prediction failed for UE {ue_id}: {exc}") from exc
-        # Record model inference latency
-        metrics.PREDICTION_STAGE_LATENCY.labels(stage='model_inference').observe(
-            time.time() - _inference_start
-        )
-        
         predicted_antenna = str(result["antenna_id"])
         confidence = float(result.get("confidence", 0.0))
 
@@ -963,27 +1164,51 @@ class AntennaSelector(AsyncModelInterface):
 
         return result
 
-    def _apply_qos_bias(
+    def _qos_bias_multipliers(
         self,
-        probabilities: np.ndarray,
         classes_: np.ndarray,
         service_type: str | None,
-    ) -> tuple[np.ndarray, Dict[str, float], bool]:
-        """Reduce probabilities for antennas with poor QoS track record."""
+    ) -> tuple[Optional[np.ndarray], Dict[str, float]]:
+        """Per-class probability multipliers for antennas with a poor QoS record.
 
+        Returns ``(None, {})`` when no antenna is penalised.
+        """
         if not self.qos_bias_enabled or not getattr(self, "antenna_profiler", None):
-            return probabilities, {}, False
+            return None, {}
 
         service_label = (service_type or "default").lower()
-        adjusted = probabilities.astype(float).copy()
+        antenna_ids = self._class_ids(classes_)
+        rates = self.antenna_profiler.success_rates(antenna_ids, service_label)
+        config = (
+            self.qos_bias_min_samples,
+            self.qos_bias_success_threshold,
+            self.qos_bias_min_multiplier,
+        )
+        cached = self._qos_bias_snapshots.get(service_label)
+        if cached is None or cached[0] is not rates or cached[1] != config:
+            cached = (rates, config, *self._bias_snapshot(antenna_ids, rates))
+            self._qos_bias_snapshots[service_label] = cached
+        _, _, multipliers, bias_details = cached
+        return multipliers, dict(bias_details)
+
+    def _class_ids(self, classes_: np.ndarray) -> tuple[str, ...]:
+        """Antenna ids for ``classes_``, reused while the class vector is unchanged."""
+        cached = self._bias_class_ids
+        if cached is None or cached[0] is not classes_:
+            cached = (classes_, tuple(str(antenna) for antenna in classes_))
+            self._bias_class_ids = cached
+        return cached[1]
+
+    def _bias_snapshot(
+        self,
+        antenna_ids: tuple[str, ...],
+        rates: tuple[tuple[int, Optional[float]], ...],
+    ) -> tuple[Optional[np.ndarray], Dict[str, float]]:
+        """Multipliers for the whole class vector from per-antenna success rates."""
+        multipliers = np.ones(len(rates), dtype=float)
         bias_details: Dict[str, float] = {}
-        bias_applied = False
 
-        for idx, antenna in enumerate(classes_):
-            antenna_id = str(antenna)
-            profile = self.antenna_profiler.get_profile(antenna_id, service_label)
-            success_rate = profile.get("success_rate")
-            sample_count = profile.get("sample_count", 0)
+        for idx, (sample_count, success_rate) in enumerate(rates):
             if success_rate is None or sample_count < self.qos_bias_min_samples:
                 continue
 
@@ -992,13 +1217,26 @@ class AntennaSelector(AsyncModelInterface):
                     self.qos_bias_min_multiplier,
                     success_rate / self.qos_bias_success_threshold,
                 )
-                adjusted[idx] *= penalty
-                bias_details[antenna_id] = float(penalty)
-                bias_applied = True
+                multipliers[idx] = penalty
+                bias_details[antenna_ids[idx]] = float(penalty)
+
+        if not bias_details:
+            return None, bias_details
+        return multipliers, bias_details
+
+    def _apply_qos_bias(
+        self,
+        probabilities: np.ndarray,
+        classes_: np.ndarray,
+        service_type: str | None,
+    ) -> tuple[np.ndarray, Dict[str, float], bool]:
+        """Reduce probabilities for antennas with poor QoS track record."""
 
-        if not bias_applied:
+        multipliers, bias_details = self._qos_bias_multipliers(classes_, service_type)
+        if multipliers is None:
             return probabilities, bias_details, False
 
+        adjusted = probabilities.astype(float) * multipliers
         total = adjusted.sum()
         if total <= 0:
             return probabilities, bias_details, False
@@ -1006,6 +1244,38 @@ class AntennaSelector(AsyncModelInterface):
         adjusted /= total
         return adjusted, bias_details, True
 
+    def _apply_qos_bias_batch(
+        self,
+        probas: np.ndarray,
+        classes_: np.ndarray,
+        service_types: List[str],
+    ) -> List[tuple[np.ndarray, Dict[str, float], bool]]:
+        """Row-wise :meth:`_apply_qos_bias` over a probability matrix.
+
+        Antenna profiles are looked up once per distinct service type.
+        """
+        out: List[tuple[np.ndarray, Dict[str, float], bool]] = [
+            (probas[idx], {}, False) for idx in range(len(service_types))
+        ]
+        rows_by_label: Dict[str, List[int]] = {}
+        for idx, label in enumerate(service_types):
+            rows_by_label.setdefault((label or "default").lower(), []).append(idx)
+
+        for label, rows in rows_by_label.items():
+            multipliers, bias_details = self._qos_bias_multipliers(classes_, label)
+            if multipliers is None:
+                for idx in rows:
+                    out[idx] = (probas[idx], bias_details, False)
+                continue
+            adjusted = probas[rows].astype(float) * multipliers
+            totals = adjusted.sum(axis=1)
+            for pos, idx in enumerate(rows):
+                if totals[pos] <= 0:
+                    out[idx] = (probas[idx], bias_details, False)
+                else:
+                    out[idx] = (adjusted[pos] / totals[pos], dict(bias_details), True)
+        return out
+
     def record_qos_feedback(
         self,
         *,
@@ -1060,9 +1330,10 @@ class AntennaSelector(AsyncModelInterface):
     def train(self, training_data):
         """Train the model with provided data.
 
-        This method acquires the model lock to ensure that no concurrent
-        prediction is performed while the estimator object is being
-        replaced by a newly-trained one.
+        The scaler and model are fitted as fresh copies and published
+        together once fitting succeeds, so predictions running meanwhile keep
+        using the previous snapshot. The model lock only serialises training
+        runs against each other and against hot-swaps.
         
         Raises:
             ValueError: If training data is invalid (too few samples, missing
@@ -1133,21 +1404,23 @@ class AntennaSelector(AsyncModelInterface):
         # Convert to numpy arrays and scale
         X = np.array(X, dtype=float)
         y = np.array(y)
-        self.scaler.fit(X)
-        X = self.scaler.transform(X)
 
-        # Thread-safe training with lock
         with self._model_lock:
+            scaler = fresh_estimator(self.scaler)
+            scaler.fit(X)
+            X = scaler.transform(X)
+
             # Train the model
-            model = cast(lgb.LGBMClassifier, self.model)
+            model = cast(lgb.LGBMClassifier, fresh_estimator(self.model))
             model.fit(X, y)
-            
+            self._publish(model=model, scaler=scaler)
+
             # Return training metrics
             return {
                 "samples": len(X),
                 "classes": len(set(y)),
                 "feature_importance": dict(
-                    zip(self.feature_names, cast(lgb.LGBMClassifier, self.model).feature_importances_)
+                    zip(self.feature_names, model.feature_importances_)
                 ),
             }
 
@@ -1191,8 +1464,9 @@ class AntennaSelector(AsyncModelInterface):
             return False
         save_path = str(save_path)
 
-        # Thread-safe model saving
+        # Thread-safe model saving; one snapshot keeps model and scaler paired
         with self._model_lock:
+            snapshot = self._snapshot
             try:
                 os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
@@ -1200,7 +1474,7 @@ class AntennaSelector(AsyncModelInterface):
                 temp_path = f"{save_path}.tmp"
                 joblib.dump(
                     {
-                        "model": self.model,
+                        "model": snapshot.model,
                         "feature_names": self.feature_names,
                         "neighbor_count": self.neighbor_count,
                     },
@@ -1213,7 +1487,7 @@ class AntennaSelector(AsyncModelInterface):
                 # Save scaler separately
                 scaler_path = f"{save_path}.scaler"
                 temp_scaler_path = f"{scaler_path}.tmp"
-                joblib.dump(self.scaler, temp_scaler_path)
+                joblib.dump(snapshot.scaler, temp_scaler_path)
                 os.replace(temp_scaler_path, scaler_path)
 
                 # Save metadata
@@ -1257,7 +1531,7 @@ class AntennaSelector(AsyncModelInterface):
                 return False
 
     def load(self, path=None):
-        """Load the model from disk with thread safety."""
+        """Load the model from disk and publish it as one snapshot."""
         load_path = path or self.model_path
         if not load_path or not os.path.exists(load_path):
             return False
@@ -1267,20 +1541,24 @@ class AntennaSelector(AsyncModelInterface):
             try:
                 data = joblib.load(load_path)
                 if isinstance(data, dict) and "model" in data:
-                    self.model = cast(lgb.LGBMClassifier, data["model"])
-                    self.feature_names = data.get("feature_names", self.feature_names)
-                    self.neighbor_count = data.get("neighbor_count", self.neighbor_count)
+                    model = cast(lgb.LGBMClassifier, data["model"])
                 else:
-                    self.model = cast(lgb.LGBMClassifier, data)
+                    model = cast(lgb.LGBMClassifier, data)
 
                 # Load scaler from separate file if available, else fallback to legacy
                 scaler_path = f"{load_path}.scaler"
                 if os.path.exists(scaler_path):
-                    self.scaler = joblib.load(scaler_path)
+                    scaler = joblib.load(scaler_path)
                 elif isinstance(data, dict):
-                    self.scaler = data.get("scaler", StandardScaler())
+                    scaler = data.get("scaler", StandardScaler())
                 else:
-                    self.scaler = StandardScaler()
+                    scaler = StandardScaler()
+
+                feature_names = self.feature_names
+                if isinstance(data, dict) and "model" in data:
+                    feature_names = data.get("feature_names", feature_names)
+                    self.neighbor_count = data.get("neighbor_count", self.neighbor_count)
+                self._publish(model=model, scaler=scaler, feature_names=feature_names)
 
                 logger.info("Successfully loaded model from %s", load_path)
                 return True
@@ -1296,7 +1574,7 @@ class AntennaSelector(AsyncModelInterface):
             self.model = None
             
             # Clear feature data
-            self.feature_names.clear()
+            self.feature_names = []
             
             # Unregister from resource manager
             if hasattr(self, '_resource_id') and self._resource_id:
@@ -13,6 +13,7 @@ from sklearn.utils.class_weight import compute_class_weight
 
 from .antenna_selector import AntennaSelector
 from .base_model_mixin import BaseModelMixin
+from .model_snapshot import fresh_estimator
 from ..utils.exception_handler import ModelError
 from ..config.constants import DEFAULT_MIN_TRAINING_SAMPLES, env_constants
 
@@ -98,7 +99,10 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
     ) -> dict:
         """Train the model with optional validation, early stopping, and confidence calibration.
         
-        This method is thread-safe and acquires the model lock during training.
+        The scaler, model and calibrated model are fitted as fresh copies and
+        published as one snapshot after the collapse guard passes, so
+        concurrent predictions never see a half-trained model. The model lock
+        only serialises training runs and hot-swaps.
         
         Confidence calibration improves the quality of probability estimates,
         making confidence values more reliable for QoS-aware decisions.
@@ -108,8 +112,9 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
         
         # Use the mixin's build_dataset method and scale features
         X_arr, y_arr = self.build_dataset(training_data)
-        self.scaler.fit(X_arr)
-        X_arr = self.scaler.transform(X_arr)
+        scaler = fresh_estimator(self.scaler)
+        scaler.fit(X_arr)
+        X_arr = scaler.transform(X_arr)
         X_train, X_val, y_train, y_val = self._split_dataset(
             X_arr, y_arr, validation_split
         )
@@ -140,10 +145,9 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
             logger.warning(
                 "Training data contains one class; fitting constant classifier for smoke/persistence path"
             )
-            with self._model_lock:
-                self.model = _ConstantClassifier(str(classes[0]), X_arr.shape[1])
-                self.model.fit(X_arr, y_arr)
-                self.calibrated_model = None
+            constant = _ConstantClassifier(str(classes[0]), X_arr.shape[1])
+            constant.fit(X_arr, y_arr)
+            self._publish(model=constant, calibrated_model=None, scaler=scaler)
             return {
                 "samples": len(X_arr),
                 "classes": 1,
@@ -160,6 +164,7 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                 "constant_classifier": True,
             }
 
+        model = fresh_estimator(self.model)
         if len(classes) > 0:
             weights = compute_class_weight(
                 class_weight="balanced",
@@ -167,7 +172,7 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                 y=y_arr,
             )
             class_weights = {str(cls): float(weight) for cls, weight in zip(classes, weights)}
-            self.model.set_params(class_weight=class_weights)
+            model.set_params(class_weight=class_weights)
         else:
             class_weights = {}
 
@@ -178,9 +183,10 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
             if early_stopping_rounds:
                 fit_params["callbacks"] = [lgb.early_stopping(early_stopping_rounds)]
 
-        # Thread-safe training with lock
+        calibrated_model = None
+        # Serialise with other training runs and hot-swaps
         with self._model_lock:
-            self.model.fit(X_train, y_train, **fit_params)
+            model.fit(X_train, y_train, **fit_params)
             
             # Apply confidence calibration if enabled and we have validation data
             if self.calibrate_confidence and X_val is not None and len(X_val) >= 30:
@@ -189,20 +195,20 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                     
                     # Use CalibratedClassifierCV with pre-split data
                     # We pass cv='prefit' since model is already trained
-                    self.calibrated_model = CalibratedClassifierCV(
-                        self.model,
+                    calibrated_model = CalibratedClassifierCV(
+                        model,
                         method=self.calibration_method,
                         cv='prefit'
                     )
                     
                     # Fit calibration on validation set
-                    self.calibrated_model.fit(X_val, y_val)
+                    calibrated_model.fit(X_val, y_val)
                     
                     logger.info("Confidence calibration completed successfully")
                     
                     # Test calibrated vs uncalibrated
-                    uncal_probs = self.model.predict_proba(X_val)
-                    cal_probs = self.calibrated_model.predict_proba(X_val)
+                    uncal_probs = model.predict_proba(X_val)
+                    cal_probs = calibrated_model.predict_proba(X_val)
                     
                     # Log calibration impact
                     uncal_conf_avg = np.mean(np.max(uncal_probs, axis=1))
@@ -213,17 +219,15 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                     
                 except Exception as e:
                     logger.warning("Confidence calibration failed: %s, using uncalibrated model", e)
-                    self.calibrated_model = None
-            else:
-                self.calibrated_model = None
-                if self.calibrate_confidence:
-                    if X_val is None:
-                        logger.info("Skipping calibration: no validation data")
-                    elif len(X_val) < 30:
-                        logger.info("Skipping calibration: insufficient validation samples (%d < 30)", len(X_val))
+                    calibrated_model = None
+            elif self.calibrate_confidence:
+                if X_val is None:
+                    logger.info("Skipping calibration: no validation data")
+                elif len(X_val) < 30:
+                    logger.info("Skipping calibration: insufficient validation samples (%d < 30)", len(X_val))
 
             # Detect collapsed predictors by inspecting training predictions
-            train_predictions = self.model.predict(X_arr)
+            train_predictions = model.predict(X_arr)
             unique_predictions = len({str(pred) for pred in train_predictions})
             expected_classes = len(classes) if len(classes) else unique_predictions
             diversity_threshold = max(1, int(np.ceil(expected_classes * 0.75)))
@@ -236,6 +240,7 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                 )
                 logger.error(msg)
                 raise ModelError(msg)
+            self._publish(model=model, calibrated_model=calibrated_model, scaler=scaler)
             if not collapse_guard_enabled and unique_predictions < diversity_threshold:
                 logger.warning(
                     "Skipping collapse guard for small training set: samples=%d unique=%d threshold=%d",
@@ -250,11 +255,11 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                 "feature_importance": {
                     name: float(val)
                     for name, val in zip(
-                        self.feature_names, self.model.feature_importances_
+                        self.feature_names, model.feature_importances_
                     )
                 },
-                "confidence_calibrated": self.calibrated_model is not None,
-                "calibration_method": self.calibration_method if self.calibrated_model else None,
+                "confidence_calibrated": calibrated_model is not None,
+                "calibration_method": self.calibration_method if calibrated_model else None,
                 "class_distribution": {str(cls): int(count) for cls, count in class_counts.items()},
                 "class_weights": class_weights,
                 "imbalance_ratio": imbalance_ratio,
@@ -264,7 +269,7 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
 
             if eval_set:
                 # Use calibrated model for validation metrics if available
-                prediction_model = self.calibrated_model if self.calibrated_model else self.model
+                prediction_model = calibrated_model if calibrated_model else model
                 y_pred = prediction_model.predict(X_val)
                 metrics["val_accuracy"] = float(accuracy_score(y_val, y_pred))
                 metrics["val_f1"] = float(
@@ -307,8 +312,8 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
                     logger.warning("Failed to compute confusion matrix metrics: %s", e)
                 
                 # Add calibration metrics if calibrated
-                if self.calibrated_model:
-                    y_pred_uncal = self.model.predict(X_val)
+                if calibrated_model:
+                    y_pred_uncal = model.predict(X_val)
                     metrics["val_accuracy_uncalibrated"] = float(accuracy_score(y_val, y_pred_uncal))
                     metrics["confidence_improvement"] = float(
                         metrics["val_accuracy"] - metrics["val_accuracy_uncalibrated"]
@@ -381,8 +386,8 @@ class LightGBMSelector(BaseModelMixin, AntennaSelector):
         
         # Build and scale dataset
         X_arr, y_arr = self.build_dataset(training_data)
-        self.scaler.fit(X_arr)
-        X_scaled = self.scaler.transform(X_arr)
+        # The final ``train`` call below fits and publishes its own scaler.
+        X_scaled = fresh_estimator(self.scaler).fit_transform(X_arr)
         
         # Check if we have enough samples for CV
         class_counts = Counter(y_arr)
@@ -0,0 +1,63 @@
+"""Immutable, versioned view of a selector's fitted state.
+
+Inference reads one :class:`ModelSnapshot` reference and never takes the
+model lock. Writers build new estimator objects, then replace the snapshot
+in a single attribute assignment, which is atomic in CPython. An inference
+call that started before the swap finishes on the old objects; the next one
+sees the new ones.
+
+This relies on published estimators never being fitted in place. Training
+paths therefore fit a fresh copy from :func:`fresh_estimator` and publish
+it once fitting succeeds.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+from sklearn.base import clone
+
+__all__ = ["ModelSnapshot", "EMPTY_SNAPSHOT", "fresh_estimator"]
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """Everything inference reads from a selector, captured together."""
+
+    version: int
+    model: Any
+    calibrated_model: Any
+    scaler: Any
+    feature_names: Tuple[str, ...]
+
+    @property
+    def prediction_model(self) -> Any:
+        """The calibrated model when there is one, otherwise the base model."""
+        return self.calibrated_model or self.model
+
+
+EMPTY_SNAPSHOT = ModelSnapshot(0, None, None, None, ())
+
+
+def fresh_estimator(estimator: Any, *, keep_state: bool = False) -> Any:
+    """Return an unpublished copy of ``estimator`` that is safe to fit.
+
+    scikit-learn compatible estimators are cloned unfitted, which is where
+    ``fit`` starts anyway. With ``keep_state``, or for objects that cannot
+    be cloned, the copy is a deep copy, so incremental learners keep what
+    they learned. If neither works, the object itself is returned and is
+    fitted in place, as before.
+    """
+    if estimator is None:
+        return None
+    if not keep_state:
+        try:
+            return clone(estimator)
+        except (TypeError, RuntimeError):
+            pass
+    try:
+        return copy.deepcopy(estimator)
+    except Exception:  # noqa: BLE001
+        return estimator
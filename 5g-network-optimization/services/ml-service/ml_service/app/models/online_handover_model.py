@@ -5,6 +5,7 @@ from sklearn.linear_model import SGDClassifier
 import numpy as np
 
 from .antenna_selector import AntennaSelector
+from .model_snapshot import fresh_estimator
 
 
 class OnlineHandoverModel(AntennaSelector):
@@ -45,26 +46,31 @@ class OnlineHandoverModel(AntennaSelector):
     def train(self, training_data: list) -> dict:
         """Train using ``partial_fit`` on the entire dataset.
         
-        This method is thread-safe and acquires the model lock during training.
+        ``partial_fit`` runs on a copy of the published model, which is then
+        published together with the refitted scaler.
         """
         if not training_data:
             raise ValueError("Training data cannot be empty")
         
         X, y = self._build_dataset(training_data)
-        self.scaler.fit(X)
-        X = self.scaler.transform(X)
+        scaler = fresh_estimator(self.scaler)
+        scaler.fit(X)
+        X = scaler.transform(X)
         classes = np.unique(y)
         
-        # Thread-safe training with lock
+        # Serialise with other updates and hot-swaps
         with self._model_lock:
+            model = fresh_estimator(self.model, keep_state=True)
+            model.partial_fit(X, y, classes=classes)
             self._classes = classes
-            self.model.partial_fit(X, y, classes=classes)
+            self._publish(model=model, scaler=scaler)
             return {"samples": len(X), "classes": len(classes)}
 
     def update(self, sample: dict, success: bool = True) -> None:
         """Update model incrementally from a single feedback sample.
         
-        This method is thread-safe and acquires the model lock during update.
+        The update is applied to a copy of the published model, so
+        predictions never read a model while ``partial_fit`` mutates it.
         """
         features = self.extract_features(sample)
         features = self._prepare_features_for_model(features)
@@ -76,17 +82,19 @@ class OnlineHandoverModel(AntennaSelector):
         if self.scaler:
             X = self.scaler.transform(X)
         
-        # Thread-safe model update with lock
+        # Serialise with other updates and hot-swaps
         with self._model_lock:
+            model = fresh_estimator(self.model, keep_state=True)
             if self._classes is None:
                 self._classes = np.array([label])
-                self.model.partial_fit(X, [label], classes=self._classes)
+                model.partial_fit(X, [label], classes=self._classes)
             else:
                 if label not in self._classes:
                     self._classes = np.unique(np.append(self._classes, label))
-                    self.model.partial_fit(X, [label], classes=self._classes)
+                    model.partial_fit(X, [label], classes=self._classes)
                 else:
-                    self.model.partial_fit(X, [label])
+                    model.partial_fit(X, [label])
+            self._publish(model=model)
             self.feedback_window.append(1 if success else 0)
 
     def drift_detected(self) -> bool:
@@ -8,6 +8,7 @@ import threading
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
 import psutil
 
 logger = logging.getLogger(__name__)
@@ -53,7 +54,8 @@ from ..config.constants import (
     TRAINING_DURATION_BUCKETS,
     DEFAULT_DATA_DRIFT_WINDOW_SIZE,
     DEFAULT_DATA_DRIFT_MAX_SAMPLES,
-    DEFAULT_SAMPLE_CHECK_INTERVAL,
+    DEFAULT_DATA_DRIFT_BINS,
+    DEFAULT_DATA_DRIFT_KS_ALPHA,
     DEFAULT_METRICS_INTERVAL,
     DEFAULT_METRICS_STOP_TIMEOUT
 )
@@ -66,6 +68,13 @@ from ..utils.resource_manager import (
     global_resource_manager,
     ResourceType
 )
+from .drift import (
+    FeatureWindow,
+    ks_critical_value,
+    ks_statistic,
+    population_stability_index,
+    quantile_edges,
+)
 
 # Track prediction requests
 PREDICTION_REQUESTS = _get_or_create_counter(
@@ -163,6 +172,13 @@ DATA_DRIFT_SCORE = _get_or_create_gauge(
     'Average change between consecutive feature distributions',
 )
 
+# Population stability index of each feature against the reference window
+FEATURE_DRIFT_PSI = _get_or_create_gauge(
+    'ml_feature_drift_psi',
+    'Population stability index of the latest feature window',
+    ['feature'],
+)
+
 # Rate of failed prediction requests over the last collection interval
 ERROR_RATE = _get_or_create_gauge(
     'ml_prediction_error_rate',
@@ -233,6 +249,25 @@ ADAPTIVE_CONFIDENCE = _get_or_create_gauge(
     ['service_type'],
 )
 
+# --- Feature Cache Metrics ---
+
+FEATURE_CACHE_REQUESTS = _get_or_create_counter(
+    'ml_feature_cache_requests_total',
+    'Feature extraction cache lookups',
+    ['result'],  # 'hit', 'miss'
+)
+
+FEATURE_CACHE_EVICTIONS = _get_or_create_counter(
+    'ml_feature_cache_evictions_total',
+    'Feature extraction cache entries evicted by capacity or TTL',
+)
+
+FEATURE_CACHE_LOOKUP_LATENCY = _get_or_create_histogram(
+    'ml_feature_cache_lookup_seconds',
+    'Latency of feature extraction cache lookups',
+    buckets=[0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001],
+)
+
 class MetricsMiddleware:
     """Middleware to track metrics for API endpoints."""
 
@@ -394,8 +429,23 @@ def track_training(
         store_feature_importance(feature_importance, path=store_path)
 
 
+# Placeholder for non-numeric feature values; a distinct object so that it
+# can be told apart from NaN values supplied by callers.
+_MISSING = float("nan")
+# Bound on cached feature-key layouts in ``DataDriftMonitor``.
+_MAX_DRIFT_LAYOUTS = 64
+
+
 class DataDriftMonitor:
-    """Compute feature distribution changes over rolling windows."""
+    """Compute feature distribution changes over consecutive windows.
+
+    Each prediction is buffered as one row of the open window, which closes
+    after ``window_size`` rows (see :mod:`.drift`). An update costs
+    O(features) and at most two windows are held, so memory does not grow
+    with the request rate; ``max_samples`` is only reported in
+    :meth:`get_memory_stats`. :meth:`compute_drift` summarises and scores
+    the most recently closed window against the first one.
+    """
 
     def __init__(
         self,
@@ -406,22 +456,41 @@ class DataDriftMonitor:
         thresholds: Dict[str, float] | None = None,
         baseline: Dict[str, float] | None = None,
         baseline_path: str | None = None,
+        bins: int = DEFAULT_DATA_DRIFT_BINS,
+        ks_alpha: float = DEFAULT_DATA_DRIFT_KS_ALPHA,
     ) -> None:
         if window_size <= 0:
             raise ValueError("Window size must be positive")
         if max_samples < window_size * 2:
             raise ValueError("Max samples must be at least 2x window size")
+        if bins <= 0:
+            raise ValueError("Bin count must be positive")
+        if not 0.0 < ks_alpha < 1.0:
+            raise ValueError("KS significance level must be between 0 and 1")
 
         self.window_size = window_size
         self.max_samples = max_samples
         self.threshold = threshold
         self.thresholds = thresholds or {}
+        self.bins = bins
+        self.ks_alpha = ks_alpha
         self._baseline: Dict[str, float] | None = baseline or (
             self._load_baseline(baseline_path) if baseline_path else None
         )
 
-        self._current: List[Dict[str, float]] = []
-        self._previous: List[Dict[str, float]] = []
+        self._columns: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._layouts: Dict[tuple, np.ndarray] = {}
+        # ``(layout, values)`` per sample of the open window, turned into a
+        # block of rows in one step when the window closes.
+        self._pending: List[tuple] = []
+        # Rows of the last closed window, summarised only when it is scored.
+        self._completed: np.ndarray | None = None
+        self._reference: FeatureWindow | None = None
+        # Quantiles of the reference window; every later window is binned
+        # on these edges.
+        self._edges: np.ndarray | None = None
+        self._last_report: Dict[str, Dict[str, float]] = {}
         self._lock = threading.Lock()
         self._sample_count = 0
 
@@ -449,105 +518,182 @@ class DataDriftMonitor:
             return None
 
     def update(self, features: Dict[str, float]) -> None:
-        """Add feature vector from a prediction request with memory bounds."""
-        numeric = {k: v for k, v in features.items() if isinstance(v, (int, float))}
-        if not numeric:
+        """Add feature vector from a prediction request."""
+        values = [v if isinstance(v, (int, float)) else _MISSING for v in features.values()]
+        if values.count(_MISSING) == len(values):
             return
-            
+
+        keys = tuple(features)
         with self._lock:
+            # Requests from one route share a key order, so the column
+            # lookup is done once per layout rather than per feature.
+            layout = self._layouts.get(keys)
+            if layout is None:
+                layout = self._layout(keys)
+            self._pending.append((layout, values))
             self._sample_count += 1
-            self._current.append(numeric)
-            
-            # Enforce window size limit
-            if len(self._current) > self.window_size:
-                self._current.pop(0)
-            
-            # Enforce global memory limit - emergency cleanup
-            if self._sample_count % DEFAULT_SAMPLE_CHECK_INTERVAL == 0:  # Check periodically
-                total_samples = len(self._current) + len(self._previous)
-                if total_samples > self.max_samples:
-                    self.logger.warning(
-                        "DataDriftMonitor approaching memory limit (%d/%d samples). "
-                        "Performing emergency cleanup.", 
-                        total_samples, self.max_samples
-                    )
-                    # Keep only most recent samples
-                    excess = total_samples - self.max_samples // 2
-                    if len(self._previous) > excess:
-                        self._previous = self._previous[excess:]
-                    else:
-                        self._previous.clear()
-                        remaining_excess = excess - len(self._previous)
-                        if len(self._current) > remaining_excess:
-                            self._current = self._current[remaining_excess:]
-
-    def _mean(self, samples: List[Dict[str, float]]) -> Dict[str, float]:
-        totals: Dict[str, float] = {}
-        counts: Dict[str, int] = {}
-        for sample in samples:
-            for k, v in sample.items():
-                totals[k] = totals.get(k, 0.0) + v
-                counts[k] = counts.get(k, 0) + 1
-        return {k: totals[k] / counts[k] for k in totals}
+            if len(self._pending) >= self.window_size:
+                self._close_window()
+
+    def _layout(self, keys: tuple) -> np.ndarray:
+        if len(self._layouts) >= _MAX_DRIFT_LAYOUTS:
+            self._layouts.clear()
+        columns = self._columns
+        layout = np.array(
+            [columns[name] if name in columns else self._add_column(name) for name in keys],
+            dtype=np.intp,
+        )
+        self._layouts[keys] = layout
+        return layout
+
+    def _add_column(self, name: str) -> int:
+        col = len(self._names)
+        self._columns[name] = col
+        self._names.append(name)
+        if self._reference is not None:
+            self._reference.resize(col + 1)
+        if self._edges is not None:
+            pad = np.full((1, self._edges.shape[1]), np.inf)
+            self._edges = np.vstack([self._edges, pad])
+        return col
+
+    def _close_window(self) -> None:
+        """Summarise the full block for :meth:`compute_drift` and start a new one."""
+        rows = self._block()
+        if self._reference is None:
+            self._edges = quantile_edges(rows, self.bins)
+            self._reference = FeatureWindow.from_rows(rows, self._edges)
+            if self._baseline is None:
+                self._baseline = {
+                    self._names[col]: mean for col, mean in self._reference.means().items()
+                }
+        self._completed = rows
+        self._pending = []
+
+    def _block(self) -> np.ndarray:
+        """Return the pending samples as rows with one column per feature."""
+        pending = self._pending
+        rows = np.full((len(pending), len(self._names)), np.nan)
+        start = 0
+        while start < len(pending):
+            layout = pending[start][0]
+            end = start + 1
+            while end < len(pending) and pending[end][0] is layout:
+                end += 1
+            rows[start:end, layout] = [values for _, values in pending[start:end]]
+            start = end
+        return rows
 
     def compute_drift(self) -> float:
-        """Return average absolute change between current window and baseline.
-
-        The first full window establishes the baseline distribution unless one
-        is provided explicitly. Subsequent windows are compared against this
-        baseline. When drift for any feature exceeds its configured threshold, a
-        warning is logged.
+        """Return average absolute change between the last window and baseline.
+
+        The first full window establishes the baseline means unless they are
+        provided explicitly, and always fixes the reference distribution.
+        Later windows are compared against both: the returned score averages
+        the per-feature mean shifts, while :meth:`get_drift_report` also
+        exposes PSI and KS scores per feature. A warning is logged when a
+        mean shift exceeds its configured threshold, or when the KS statistic
+        is significant at level ``ks_alpha``.
         """
         with self._lock:
-            if len(self._current) < self.window_size:
+            rows = self._completed
+            if rows is None:
                 return 0.0
-
-            curr_means = self._mean(self._current)
-            if self._baseline is None:
-                self._baseline = curr_means
-                self._current.clear()
-                return 0.0
-
-            keys = set(self._baseline).intersection(curr_means)
-            if not keys:
-                self._current.clear()
+            self._completed = None
+            missing = len(self._names) - rows.shape[1]
+            if missing:
+                rows = np.hstack([rows, np.full((rows.shape[0], missing), np.nan)])
+            window = FeatureWindow.from_rows(rows, self._edges)
+
+            report: Dict[str, Dict[str, float]] = {}
+            means = window.means()
+            stds = window.std()
+            for col, mean in means.items():
+                report[self._names[col]] = {"mean": mean, "std": float(stds[col])}
+
+            diffs = {}
+            for name in set(self._baseline).intersection(report):
+                diffs[name] = abs(report[name]["mean"] - self._baseline[name])
+                report[name]["mean_shift"] = diffs[name]
+
+            ks_alerts = {}
+            reference = self._reference
+            scored = np.flatnonzero((reference.count > 0) & (window.count > 0))
+            if scored.size:
+                ref_hist = reference.hist[scored]
+                cur_hist = window.hist[scored]
+                psi = population_stability_index(ref_hist, cur_hist)
+                ks = ks_statistic(ref_hist, cur_hist)
+                critical = ks_critical_value(
+                    reference.count[scored], window.count[scored], self.ks_alpha
+                )
+                for col, psi_value, ks_value, limit in zip(scored, psi, ks, critical):
+                    name = self._names[col]
+                    report[name]["psi"] = float(psi_value)
+                    report[name]["ks"] = float(ks_value)
+                    FEATURE_DRIFT_PSI.labels(feature=name).set(float(psi_value))
+                    if ks_value > limit:
+                        ks_alerts[name] = (float(ks_value), float(limit))
+            self._last_report = report
+
+            for feat, val in diffs.items():
+                threshold = self.thresholds.get(feat, self.threshold)
+                if val > threshold:
+                    self._log_alert(feat, val, threshold)
+            for feat, (val, limit) in ks_alerts.items():
+                self._log_alert(feat, val, limit, statistic="KS")
+
+            if not diffs:
                 return 0.0
+            return sum(diffs.values()) / len(diffs)
 
-            diffs = {k: abs(curr_means[k] - self._baseline[k]) for k in keys}
-            self._current.clear()
+    def get_drift_report(self) -> Dict[str, Dict[str, float]]:
+        """Return per-feature statistics from the last :meth:`compute_drift`.
 
-            alerts = {k: v for k, v in diffs.items() if v > self.thresholds.get(k, self.threshold)}
-            for feat, val in alerts.items():
-                self._log_alert(feat, val, self.thresholds.get(feat, self.threshold))
+        Each entry has the window ``mean`` and ``std``, plus ``mean_shift``
+        when the feature has a baseline mean and ``psi``/``ks`` when it
+        appeared in the reference window.
+        """
+        with self._lock:
+            return {name: dict(scores) for name, scores in self._last_report.items()}
 
-            return sum(diffs.values()) / len(diffs)
-    
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory usage statistics for monitoring."""
         with self._lock:
+            current = len(self._pending)
+            previous = self._completed.shape[0] if self._completed is not None else 0
             return {
-                "current_samples": len(self._current),
-                "previous_samples": len(self._previous),
-                "total_samples": len(self._current) + len(self._previous),
+                "current_samples": current,
+                "previous_samples": previous,
+                "total_samples": current + previous,
                 "max_samples": self.max_samples,
                 "window_size": self.window_size,
                 "sample_count": self._sample_count,
-                "memory_utilization": (len(self._current) + len(self._previous)) / self.max_samples
+                "tracked_features": len(self._names),
+                "memory_utilization": (current + previous) / self.max_samples
             }
-    
+
     def reset(self) -> None:
         """Reset all stored data and counters."""
         with self._lock:
-            self._current.clear()
-            self._previous.clear()
+            self._pending = []
+            self._completed = None
+            self._last_report = {}
             self._sample_count = 0
             self.logger.info("DataDriftMonitor reset - all data cleared")
 
-    def _log_alert(self, feature: str, drift: float, threshold: float) -> None:
+    def _log_alert(
+        self,
+        feature: str,
+        drift: float,
+        threshold: float,
+        statistic: str = "mean shift",
+    ) -> None:
         """Log a warning when drift exceeds the configured threshold."""
         self.logger.warning(
-            "Data drift detected for %s: %.4f exceeds threshold %.4f",
+            "Data drift detected for %s: %s %.4f exceeds threshold %.4f",
             feature,
+            statistic,
             drift,
             threshold,
         )
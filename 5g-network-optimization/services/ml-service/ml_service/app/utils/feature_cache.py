@@ -2,8 +2,9 @@
 
 import time
 import threading
-import json
-from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Hashable, Mapping, Optional, Tuple
 from functools import lru_cache
 from dataclasses import dataclass
 from ..config.constants import (
@@ -12,19 +13,69 @@ from ..config.constants import (
     DEFAULT_FALLBACK_RSRQ,
     env_constants,
 )
+from ..monitoring import metrics
 
+# Request fields whose values determine the extracted features.
+_KEY_FIELDS = (
+    'latitude', 'longitude', 'speed', 'velocity', 'acceleration',
+    'Cell_id', 'altitude', 'direction', 'rf_metrics'
+)
+
+# Leads the fingerprint of a mapping so it never equals that of a sequence.
+_MAPPING_TAG = object()
+
+_CACHE_HITS = metrics.FEATURE_CACHE_REQUESTS.labels(result="hit")
+_CACHE_MISSES = metrics.FEATURE_CACHE_REQUESTS.labels(result="miss")
+
+
+_NESTED = (dict, list, tuple)
+
+
+class _NaNLeaf(Exception):
+    """Raised while freezing a key that holds a NaN leaf."""
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable structural copy of a nested dict or sequence.
+
+    Mappings flatten to ``(tag, key, value, key, value, ...)``. Raises
+    ``_NaNLeaf`` for a NaN leaf, which never compares equal to itself.
+    """
+    if isinstance(value, dict):
+        items = [_MAPPING_TAG]
+        for key, item in value.items():
+            if isinstance(item, _NESTED):
+                item = _freeze(item)
+            elif isinstance(item, float) and item != item:
+                raise _NaNLeaf
+            items.append(key)
+            items.append(item)
+        return tuple(items)
+    items = []
+    for item in value:
+        if isinstance(item, _NESTED):
+            item = _freeze(item)
+        elif isinstance(item, float) and item != item:
+            raise _NaNLeaf
+        items.append(item)
+    return tuple(items)
 
-@dataclass
+
+@dataclass(frozen=True)
 class CachedFeatures:
-    """Container for cached feature extraction results."""
-    features: Dict[str, Any]
+    """Container for cached feature extraction results.
+
+    ``features`` is a read-only view of a private snapshot, so an entry can
+    be shared across lookups without defensive copies of the entry itself.
+    """
+    features: Mapping[str, Any]
     timestamp: float
     ue_id: str
     data_hash: int
 
 
 class FeatureExtractionCache:
-    """Thread-safe cache for feature extraction results."""
+    """Thread-safe LRU cache for feature extraction results."""
     
     def __init__(self, max_size: int = env_constants.FEATURE_CACHE_SIZE, ttl_seconds: float = env_constants.FEATURE_CACHE_TTL):
         """Initialize the feature cache.
@@ -35,8 +86,8 @@ class FeatureExtractionCache:
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, CachedFeatures] = {}
-        self._access_times: Dict[str, float] = {}
+        # Least recently used entry first.
+        self._cache: "OrderedDict[Tuple[Any, ...], CachedFeatures]" = OrderedDict()
         self._lock = threading.RLock()
         
         # Performance counters
@@ -44,111 +95,96 @@ class FeatureExtractionCache:
         self._misses = 0
         self._evictions = 0
     
-    def _generate_cache_key(self, ue_id: str, data: Dict[str, Any]) -> Tuple[str, int]:
-        """Generate cache key and data hash for UE data."""
-        # Create a stable hash of the relevant data fields
-        relevant_fields = [
-            'latitude', 'longitude', 'speed', 'velocity', 'acceleration',
-            'Cell_id', 'altitude', 'direction', 'rf_metrics'
-        ]
-        
-        hash_data = []
-        for field in relevant_fields:
-            value = data.get(field)
-            if isinstance(value, (dict, list)):
-                # Use JSON serialization for stable hashing of nested structures
-                try:
-                    hash_data.append(json.dumps(value, sort_keys=True))
-                except TypeError:
-                    # Fallback to string representation if non-serializable
-                    hash_data.append(str(value))
-            else:
-                hash_data.append(value)
-        
-        data_hash = hash(tuple(hash_data))
-        cache_key = f"{ue_id}:{data_hash}"
-        
-        return cache_key, data_hash
+    def _generate_cache_key(self, ue_id: str, data: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """Generate the cache key for UE data.
+
+        The key is a structural fingerprint of the relevant fields, compared
+        by value, so distinct payloads never share an entry. Nested mappings
+        keep their key order; a reordered payload misses instead of hitting.
+        Keys holding unhashable leaves raise ``TypeError`` on lookup and are
+        not cached. Payloads with a NaN leaf get no key (``None``): such a
+        key could never hit and would only evict live entries.
+        """
+        get = data.get
+        key = [ue_id]
+        try:
+            for field in _KEY_FIELDS:
+                value = get(field)
+                if isinstance(value, _NESTED):
+                    value = _freeze(value)
+                elif isinstance(value, float) and value != value:
+                    return None
+                key.append(value)
+        except _NaNLeaf:
+            return None
+        return tuple(key)
     
     def get(self, ue_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get cached features if available and not expired."""
-        cache_key, data_hash = self._generate_cache_key(ue_id, data)
+        start = time.perf_counter()
+        cache_key = self._generate_cache_key(ue_id, data)
         current_time = time.time()
+        features = None
         
         with self._lock:
-            cached = self._cache.get(cache_key)
+            try:
+                cached = None if cache_key is None else self._cache.get(cache_key)
+            except TypeError:
+                cached = None
             
-            if cached is None:
-                self._misses += 1
-                return None
-            
-            # Check if cache entry is expired
-            if current_time - cached.timestamp > self.ttl_seconds:
+            # Drop the entry if it has expired
+            if cached is not None and current_time - cached.timestamp > self.ttl_seconds:
                 del self._cache[cache_key]
-                del self._access_times[cache_key]
-                self._misses += 1
-                return None
+                cached = None
             
-            # Update access time
-            self._access_times[cache_key] = current_time
-            self._hits += 1
-            return cached.features.copy()  # Return copy to prevent modification
+            if cached is None:
+                self._misses += 1
+            else:
+                self._cache.move_to_end(cache_key)
+                self._hits += 1
+                # Callers mutate the returned features in place
+                features = cached.features.copy()
+        
+        (_CACHE_MISSES if features is None else _CACHE_HITS).inc()
+        metrics.FEATURE_CACHE_LOOKUP_LATENCY.observe(time.perf_counter() - start)
+        return features
     
     def put(self, ue_id: str, data: Dict[str, Any], features: Dict[str, Any]) -> None:
         """Cache extracted features."""
-        cache_key, data_hash = self._generate_cache_key(ue_id, data)
-        current_time = time.time()
-        
-        with self._lock:
-            # Evict expired entries if we're at capacity
-            if len(self._cache) >= self.max_size:
-                self._evict_expired()
-                
-                # If still at capacity, evict LRU entry
-                if len(self._cache) >= self.max_size:
-                    self._evict_lru()
-            
-            cached_features = CachedFeatures(
-                features=features.copy(),
-                timestamp=current_time,
-                ue_id=ue_id,
-                data_hash=data_hash
-            )
-            
-            self._cache[cache_key] = cached_features
-            self._access_times[cache_key] = current_time
-    
-    def _evict_expired(self) -> None:
-        """Remove expired cache entries."""
-        current_time = time.time()
-        expired_keys = []
-        
-        for key, cached in self._cache.items():
-            if current_time - cached.timestamp > self.ttl_seconds:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
-            del self._access_times[key]
-            self._evictions += 1
-    
-    def _evict_lru(self) -> None:
-        """Remove least recently used cache entry."""
-        if not self._access_times:
+        cache_key = self._generate_cache_key(ue_id, data)
+        if cache_key is None:
+            return
+        try:
+            data_hash = hash(cache_key)
+        except TypeError:
             return
+        cached_features = CachedFeatures(
+            features=MappingProxyType(dict(features)),
+            timestamp=time.time(),
+            ue_id=ue_id,
+            data_hash=data_hash
+        )
+        evicted = 0
         
-        # Find the least recently accessed key
-        lru_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
+        with self._lock:
+            cache = self._cache
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+            else:
+                # Evict least recently used entries if we're at capacity
+                while cache and len(cache) >= self.max_size:
+                    cache.popitem(last=False)
+                    evicted += 1
+                self._evictions += evicted
+            cache[cache_key] = cached_features
         
-        del self._cache[lru_key]
-        del self._access_times[lru_key]
-        self._evictions += 1
+        if evicted:
+            metrics.FEATURE_CACHE_EVICTIONS.inc(evicted)
     
     def clear(self) -> None:
         """Clear all cached entries."""
         with self._lock:
             self._cache.clear()
-            self._access_times.clear()
             self._hits = 0
             self._misses = 0
             self._evictions = 0
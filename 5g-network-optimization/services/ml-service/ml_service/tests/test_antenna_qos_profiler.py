@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import itertools
+import sys
+import threading
 import time
 
 import pytest
@@ -74,3 +77,95 @@ def test_reset_specific_service() -> None:
     assert profiler.get_profile("antA", "urllc")["sample_count"] == 1
 
 
+def test_profile_expires_samples_as_time_advances(monkeypatch) -> None:
+    profiler = AntennaQoSProfiler(window_seconds=10.0, max_samples=10)
+    clock = [1000.0]
+    monkeypatch.setattr("ml_service.app.data.antenna_profiler.time.time", lambda: clock[0])
+
+    for offset, latency in enumerate((40.0, 10.0, 30.0, 20.0)):
+        profiler.record("antA", "embb", {"latency_ms": latency}, offset != 1, timestamp=1000.0 + offset)
+
+    clock[0] = 1011.5
+    profile = profiler.get_profile("antA", "embb")
+    assert profile["sample_count"] == 2
+    assert profile["success_rate"] == 1.0
+    assert profile["metrics"]["latency_ms"] == {"avg": 25.0, "min": 20.0, "max": 30.0}
+
+    # Querying an earlier time again sees the expired samples once more.
+    clock[0] = 1005.0
+    profile = profiler.get_profile("antA", "embb")
+    assert profile["sample_count"] == 4
+    assert profile["metrics"]["latency_ms"]["min"] == 10.0
+
+
+def test_success_rates_snapshot_tracks_records_and_expiry(monkeypatch) -> None:
+    profiler = AntennaQoSProfiler(window_seconds=10.0, max_samples=10)
+    clock = [1000.0]
+    monkeypatch.setattr("ml_service.app.data.antenna_profiler.time.time", lambda: clock[0])
+    profiler.record("antA", "embb", {}, True, timestamp=995.0)
+    profiler.record("antA", "embb", {}, False, timestamp=999.0)
+
+    rates = profiler.success_rates(("antA", "antB"), "eMBB")
+    assert rates == ((2, 0.5), (0, None))
+    assert profiler.success_rates(("antA", "antB"), "embb") is rates
+
+    clock[0] = 1006.0
+    assert profiler.success_rates(("antA", "antB"), "embb") == ((1, 0.0), (0, None))
+
+    profiler.record("antB", "embb", {}, True, timestamp=1006.0)
+    assert profiler.success_rates(("antA", "antB"), "embb") == ((1, 0.0), (1, 1.0))
+
+
+def test_record_during_success_rates_invalidates_the_snapshot(monkeypatch) -> None:
+    profiler = AntennaQoSProfiler(window_seconds=10.0, max_samples=10)
+    monkeypatch.setattr("ml_service.app.data.antenna_profiler.time.time", lambda: 1000.0)
+    profiler.record("antA", "embb", {}, False, timestamp=999.0)
+    history = profiler._profiles[("antA", "embb")]
+    counts = history.counts
+
+    def counts_then_record(cutoff):
+        result = counts(cutoff)
+        monkeypatch.setattr(history, "counts", counts)
+        profiler.record("antA", "embb", {}, True, timestamp=999.5)
+        return result
+
+    monkeypatch.setattr(history, "counts", counts_then_record)
+    assert profiler.success_rates(("antA",), "embb") == ((1, 0.0),)
+    assert profiler.success_rates(("antA",), "embb") == ((2, 0.5),)
+
+
+def test_concurrent_profile_queries_keep_aggregates_consistent(monkeypatch) -> None:
+    profiler = AntennaQoSProfiler(window_seconds=10.0, max_samples=50)
+    for offset in range(50):
+        profiler.record("antA", "embb", {"latency_ms": float(offset)}, offset % 2 == 0, timestamp=1000.0 + offset)
+
+    # Readers alternate between cutoffs so each query expires or rebuilds
+    # the live window that the others are reading.
+    clocks = itertools.cycle((1052.0, 1045.0, 1058.0))
+    monkeypatch.setattr("ml_service.app.data.antenna_profiler.time.time", lambda: next(clocks))
+    errors = []
+
+    def query() -> None:
+        try:
+            for _ in range(300):
+                profiler.get_profile("antA", "embb")
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=query) for _ in range(6)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    monkeypatch.setattr("ml_service.app.data.antenna_profiler.time.time", lambda: 1052.0)
+    profile = profiler.get_profile("antA", "embb")
+    assert profile["sample_count"] == 8
+    assert profile["violation_count"] == 4
+    assert profile["metrics"]["latency_ms"] == {"avg": 45.5, "min": 42.0, "max": 49.0}
@@ -63,6 +63,26 @@ def test_apply_qos_bias_no_change_when_samples_insufficient() -> None:
     assert details == {}
 
 
+def test_qos_bias_snapshot_refreshes_after_feedback() -> None:
+    selector = _make_selector()
+    profiler = selector.antenna_profiler
+    now = time.time()
+    for idx in range(3):
+        profiler.record("antB", "embb", {"latency_ms": 160.0}, False, timestamp=now - 3 + idx)
+
+    classes = np.array(["antA", "antB"])
+    first, details = selector._qos_bias_multipliers(classes, "embb")
+    again, _ = selector._qos_bias_multipliers(classes, "EMBB")
+    assert again is first
+    assert details == {"antB": 0.3}
+
+    for idx in range(3):
+        profiler.record("antB", "embb", {"latency_ms": 20.0}, True, timestamp=now + idx)
+    refreshed, details = selector._qos_bias_multipliers(classes, "embb")
+    assert refreshed is not first
+    assert details == {"antB": 0.5 / 0.9}
+
+
 def test_record_qos_feedback_updates_history_and_threshold() -> None:
     selector = _make_selector()
     selector.qos_history.reset()
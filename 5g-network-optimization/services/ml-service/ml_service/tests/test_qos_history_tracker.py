@@ -75,3 +75,15 @@ def test_reset_clears_history() -> None:
     assert stats["sample_count"] == 0
 
 
+def test_out_of_order_samples_match_window_filter() -> None:
+    tracker = QoSHistoryTracker(window_seconds=60.0, max_samples=10)
+    now = time.time()
+
+    tracker.record("ue-1", "embb", {"latency_ms": 10.0}, True, timestamp=now - 1)
+    tracker.record("ue-1", "embb", {"latency_ms": 40.0}, False, timestamp=now - 30)
+    tracker.record("ue-1", "embb", {"latency_ms": 25.0}, True, timestamp=now)
+
+    stats = tracker.get_qos_history("ue-1", window_seconds=10.0)
+    assert stats["sample_count"] == 2
+    assert stats["metrics"]["latency_ms"] == {"avg": 17.5, "min": 10.0, "max": 25.0}
+    assert tracker.get_qos_history("ue-1")["sample_count"] == 3
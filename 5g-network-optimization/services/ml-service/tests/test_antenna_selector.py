@@ -216,6 +216,28 @@ def test_predict_with_mock_and_persistence(tmp_path):
     assert loaded.predict(features) == result
 
 
+def test_predict_batch_matches_single_predictions():
+    model = LightGBMSelector()
+    lat_idx = model.feature_names.index("latitude")
+
+    class RowModel(DummyModel):
+        def predict_proba(self, X):
+            # Row-dependent probabilities so each UE gets its own answer.
+            return [[0.9, 0.1] if row[lat_idx] < 0.5 else [0.3, 0.7] for row in np.asarray(X)]
+
+    model.model = RowModel()
+    batch = []
+    for idx, latitude in enumerate((0.0, 1.0, 0.2)):
+        features = antenna_selector.DEFAULT_TEST_FEATURES.copy()
+        features.update(latitude=latitude, ue_id=f"ue{idx}", connected_to=None)
+        batch.append(features)
+
+    expected = [model.predict(dict(features)) for features in batch]
+    assert model.predict_batch([dict(features) for features in batch]) == expected
+    assert [r["antenna_id"] for r in expected] == ["other", "mock_ant", "other"]
+    assert model.predict_batch([]) == []
+
+
 def test_predict_sanitizes_out_of_range():
     model = LightGBMSelector()
 
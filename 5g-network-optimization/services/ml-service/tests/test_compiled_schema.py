@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from ml_service.app.models import antenna_selector
+from ml_service.app.models.lightgbm_selector import LightGBMSelector
+
+
+def _features(**overrides):
+    features = antenna_selector.DEFAULT_TEST_FEATURES.copy()
+    features.update(ue_id="ue1", connected_to=None)
+    features.update(overrides)
+    return features
+
+
+def test_compiled_row_matches_dict_path():
+    model = LightGBMSelector(neighbor_count=2)
+    schema = model._feature_schema()
+    features = _features(
+        latitude=-5,
+        longitude=math.inf,
+        speed="12.5",
+        handover_count=250,
+        stability=True,
+        cell_load=None,
+        rsrp_a1=-95.0,
+    )
+    features.pop("altitude")
+
+    reference = model._prepare_features_for_model(features)
+    expected = np.array([model._reference_row(reference, schema.feature_names)], dtype=float)[0]
+
+    prepared = model._prepare_features_for_model(features)
+    row = np.empty(schema.width)
+    assert schema.fill_row(prepared, row)
+
+    assert row.tobytes() == expected.tobytes()
+    assert prepared == reference
+    assert prepared["latitude"] == 0.0
+    assert prepared["handover_count"] == 100 and isinstance(prepared["handover_count"], int)
+
+
+def test_compiled_row_defers_errors_to_dict_path():
+    model = LightGBMSelector()
+    schema = model._feature_schema()
+
+    prepared = model._prepare_features_for_model(_features(latitude="north"))
+    assert not schema.fill_row(prepared, np.empty(schema.width))
+    with pytest.raises(ValueError, match="latitude=north is not numeric"):
+        model.predict(_features(latitude="north"))
+
+
+def test_schema_recompiles_when_feature_names_change():
+    model = LightGBMSelector()
+    schema = model._feature_schema()
+    assert model._feature_schema() is schema
+
+    model.ensure_neighbor_capacity(1)
+
+    recompiled = model._feature_schema()
+    assert recompiled is not schema
+    assert recompiled.width == schema.width + 4
+    assert recompiled.feature_names[-1] == "neighbor_cell_load_a1"
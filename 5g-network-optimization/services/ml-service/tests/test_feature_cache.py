@@ -0,0 +1,100 @@
+from prometheus_client import REGISTRY
+
+from ml_service.app.utils import feature_cache as feature_cache_module
+from ml_service.app.utils.feature_cache import FeatureExtractionCache
+
+
+def _data(**overrides):
+    data = {
+        "latitude": 100.0,
+        "longitude": 50.0,
+        "speed": 2.0,
+        "direction": [1.0, 0.0, 0.0],
+        "rf_metrics": {"antenna_1": {"rsrp": -80.0, "sinr": 12.0}},
+    }
+    data.update(overrides)
+    return data
+
+
+def _requests(result):
+    return REGISTRY.get_sample_value("ml_feature_cache_requests_total", {"result": result}) or 0.0
+
+
+def test_cached_features_are_isolated_from_callers():
+    cache = FeatureExtractionCache(max_size=4)
+    features = {"latitude": 100.0}
+    cache.put("ue1", _data(), features)
+    features["latitude"] = -1.0
+
+    first = cache.get("ue1", _data())
+    first["latitude"] = -2.0
+
+    assert cache.get("ue1", _data()) == {"latitude": 100.0}
+    assert cache.get("ue2", _data()) is None
+    assert cache.get("ue1", _data(rf_metrics={"antenna_1": {"rsrp": -81.0, "sinr": 12.0}})) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FeatureExtractionCache(max_size=2)
+    cache.put("ue1", _data(), {"v": 1})
+    cache.put("ue2", _data(), {"v": 2})
+    assert cache.get("ue1", _data()) == {"v": 1}
+
+    cache.put("ue3", _data(), {"v": 3})
+
+    assert cache.get("ue2", _data()) is None
+    assert cache.get("ue1", _data()) == {"v": 1}
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_expired_entries_miss(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(feature_cache_module.time, "time", lambda: now[0])
+    cache = FeatureExtractionCache(max_size=4, ttl_seconds=5.0)
+    cache.put("ue1", _data(), {"v": 1})
+
+    now[0] += 5.0
+    assert cache.get("ue1", _data()) == {"v": 1}
+    now[0] += 0.5
+    assert cache.get("ue1", _data()) is None
+    assert cache.get_stats()["cache_size"] == 0
+
+
+def test_unhashable_payloads_are_not_cached():
+    cache = FeatureExtractionCache(max_size=4)
+    data = _data(rf_metrics={"antenna_1": {"tags": {"a", "b"}}})
+
+    cache.put("ue1", data, {"v": 1})
+
+    assert cache.get("ue1", data) is None
+    assert cache.get_stats()["cache_size"] == 0
+
+
+def test_payloads_with_nan_leaves_are_not_cached():
+    cache = FeatureExtractionCache(max_size=2)
+    cache.put("ue1", _data(), {"v": 1})
+    cache.put("ue2", _data(), {"v": 2})
+
+    for data in (
+        _data(speed=float("nan")),
+        _data(direction=[float("nan"), 0.0, 0.0]),
+        _data(rf_metrics={"antenna_1": {"rsrp": float("nan"), "sinr": 12.0}}),
+    ):
+        cache.put("ue1", data, {"v": 3})
+        assert cache.get("ue1", data) is None
+
+    assert cache.get("ue1", _data()) == {"v": 1}
+    assert cache.get("ue2", _data()) == {"v": 2}
+    assert cache.get_stats()["evictions"] == 0
+
+
+def test_lookups_are_exported_to_prometheus():
+    cache = FeatureExtractionCache(max_size=4)
+    hits, misses = _requests("hit"), _requests("miss")
+
+    cache.get("ue1", _data())
+    cache.put("ue1", _data(), {"v": 1})
+    cache.get("ue1", _data())
+
+    assert _requests("hit") == hits + 1
+    assert _requests("miss") == misses + 1
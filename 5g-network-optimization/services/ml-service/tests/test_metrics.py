@@ -2,6 +2,8 @@ from flask import Flask
 import json
 import logging
 
+import numpy as np
+
 from ml_service.app.monitoring import metrics
 from ml_service.app.monitoring.metrics import (
     MetricsMiddleware,
@@ -107,3 +109,44 @@ def test_metrics_collector_updates_error_rate(monkeypatch):
     collector._update_error_rate()
     assert metrics.ERROR_RATE._value.get() == 1 / 3
     collector.stop()
+
+
+def test_drift_monitor_reports_shape_change_without_mean_shift(caplog):
+    rng = np.random.default_rng(0)
+    monitor = DataDriftMonitor(window_size=200, thresholds={"f1": 0.5})
+
+    for value in rng.normal(0.0, 1.0, 200):
+        monitor.update({"f1": float(value), "f2": 1.0, "ue_id": "ue1"})
+    assert monitor.compute_drift() == 0.0
+
+    with caplog.at_level(logging.WARNING):
+        for value in rng.normal(0.0, 4.0, 200):
+            monitor.update({"f1": float(value), "f2": 1.0, "ue_id": "ue1"})
+        drift = monitor.compute_drift()
+
+    report = monitor.get_drift_report()
+    assert drift < 0.5
+    assert report["f1"]["std"] > 3.0
+    assert report["f1"]["psi"] > 0.25
+    assert report["f2"]["psi"] == 0.0 and report["f2"]["ks"] == 0.0
+    assert "ue_id" not in report
+    assert any("f1: KS" in r.message for r in caplog.records)
+
+
+def test_drift_monitor_memory_is_bounded_by_window():
+    monitor = DataDriftMonitor(window_size=10, max_samples=20)
+    for i in range(1000):
+        monitor.update({"f1": float(i % 7)})
+
+    stats = monitor.get_memory_stats()
+    assert stats["sample_count"] == 1000
+    assert stats["current_samples"] == 0
+    assert stats["previous_samples"] == 10
+    assert stats["tracked_features"] == 1
+
+    for _ in range(10):
+        monitor.update({"f1": 3.0, "late": 2.0})
+    monitor.compute_drift()
+    report = monitor.get_drift_report()
+    assert report["late"] == {"mean": 2.0, "std": 0.0}
+    assert "psi" in report["f1"]
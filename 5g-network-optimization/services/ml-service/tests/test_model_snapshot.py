@@ -0,0 +1,104 @@
+import threading
+
+import numpy as np
+
+from ml_service.app.models.lightgbm_selector import LightGBMSelector
+from ml_service.app.models.online_handover_model import OnlineHandoverModel
+
+
+def _sample(ue_id, lon, rsrp_a1, rsrp_a2, optimal):
+    return {
+        "ue_id": ue_id,
+        "latitude": 0,
+        "longitude": lon,
+        "speed": 1.0,
+        "direction": [1, 0, 0],
+        "connected_to": optimal,
+        "rf_metrics": {
+            "a1": {"rsrp": rsrp_a1, "sinr": 10},
+            "a2": {"rsrp": rsrp_a2, "sinr": 10},
+        },
+        "optimal_antenna": optimal,
+    }
+
+
+def _dataset():
+    return [
+        _sample("1", 0, -70, -80, "a1"),
+        _sample("2", 100, -80, -65, "a2"),
+        _sample("3", 20, -72, -85, "a1"),
+        _sample("4", 80, -85, -68, "a2"),
+    ]
+
+
+def test_training_publishes_a_new_snapshot_and_leaves_the_old_one_intact():
+    selector = LightGBMSelector()
+    before = selector.model_snapshot
+
+    selector.train(_dataset(), validation_split=0)
+    after = selector.model_snapshot
+
+    assert after.version > before.version
+    assert after.model is selector.model and after.scaler is selector.scaler
+    assert after.model is not before.model and after.scaler is not before.scaler
+    assert not hasattr(before.scaler, "mean_")
+    assert after.feature_names == tuple(selector.feature_names)
+
+
+def test_feature_name_changes_publish_a_snapshot(tmp_path):
+    selector = LightGBMSelector(neighbor_count=0)
+    selector.train(_dataset(), validation_split=0)
+    path = tmp_path / "model.joblib"
+    assert selector.save(path)
+    before = selector.model_snapshot
+
+    selector.ensure_neighbor_capacity(selector.neighbor_count + 2)
+    widened = selector.model_snapshot
+
+    assert widened.version == before.version + 1
+    assert widened.feature_names == tuple(selector.feature_names)
+    assert len(widened.feature_names) == len(before.feature_names) + 8
+    assert selector._feature_schema().feature_names == widened.feature_names
+
+    assert selector.load(path)
+    loaded = selector.model_snapshot
+    assert loaded.version == widened.version + 1
+    assert loaded.feature_names == before.feature_names
+    assert loaded.model is not before.model
+
+
+def test_prediction_does_not_wait_for_the_model_lock():
+    selector = LightGBMSelector()
+    selector.train(_dataset(), validation_split=0)
+    held, release = threading.Event(), threading.Event()
+    results = []
+
+    def hold_lock():
+        with selector._model_lock:
+            held.set()
+            release.wait(10)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait(10)
+    predictor = threading.Thread(target=lambda: results.append(selector.predict(_dataset()[0])))
+    predictor.start()
+    predictor.join(10)
+    release.set()
+    holder.join()
+
+    assert not predictor.is_alive()
+    assert results and results[0]["antenna_id"] in {"a1", "a2"}
+
+
+def test_online_update_does_not_mutate_the_published_model():
+    model = OnlineHandoverModel()
+    model.train(_dataset())
+    before = model.model_snapshot
+    coef = before.model.coef_.copy()
+
+    model.update(_dataset()[1], success=True)
+
+    assert model.model_snapshot.version == before.version + 1
+    assert model.model is not before.model
+    np.testing.assert_array_equal(before.model.coef_, coef)
@@ -110,6 +110,29 @@ def test_predict_with_qos_accepts_enriched_nef_payload(client, auth_header):
     assert data["qos_bias_service_type"] == "urllc"
 
 
+def test_predict_batch_returns_predictions_in_request_order(client, auth_header):
+    def fake_predict_batch(payloads, model=None):
+        return [
+            ({"antenna_id": f"antenna_for_{p['ue_id']}", "confidence": 0.7}, {"f": 1})
+            for p in payloads
+        ]
+
+    payload = [
+        {"ue_id": "u1", "latitude": 1.0, "longitude": 2.0},
+        {"ue_id": "u2", "latitude": 3.0, "longitude": 4.0},
+    ]
+    with patch("ml_service.app.api.routes.load_model", return_value=MagicMock()), patch(
+        "ml_service.app.api.routes.predict_ue_batch", side_effect=fake_predict_batch
+    ):
+        resp = client.post("/api/predict-batch", json=payload, headers=auth_header)
+
+    assert resp.status_code == 200
+    predictions = resp.get_json()["predictions"]
+    assert [p["ue_id"] for p in predictions] == ["u1", "u2"]
+    assert predictions[1]["predicted_antenna"] == "antenna_for_u2"
+    assert predictions[0]["qos_compliance"] == {"service_priority_ok": True}
+
+
 def test_predict_invalid_request(client, auth_header):
     mock_model = MagicMock()
     with patch("ml_service.app.api.routes.load_model", return_value=mock_model):
@@ -1,7 +1,9 @@
 import hashlib
 import math
 import random
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from rf_models.path_loss import ABGPathLossModel, CloseInPathLossModel
 
 class BaseAntennaModel(ABC):
@@ -40,6 +42,9 @@ class MacroCellModel:
 
     MODEL_NAME = "3gpp_tr_38_901_rma_directional"
     MODEL_VERSION = "v2"
+    # Positions are quantised to 10 m bins for LOS/shadowing draws; this is
+    # the number of bins each antenna keeps cached (LRU eviction).
+    DEFAULT_GRID_CACHE_SIZE = 16384
 
     def __init__(
         self,
@@ -64,6 +69,7 @@ class MacroCellModel:
         random_seed=0,
         average_building_height_m=5.0,
         street_width_m=20.0,
+        grid_cache_size=DEFAULT_GRID_CACHE_SIZE,
     ):
         """
         Args:
@@ -75,6 +81,8 @@ class MacroCellModel:
           path_loss_exponent: Environment-specific exponent (e.g., 3.76 for Urban Macro NLOS) :contentReference[oaicite:0]{index=0}
           sigma_sf: Shadow-fading std dev (dB)
           bandwidth_hz: System bandwidth in Hz
+          grid_cache_size: Max number of 10 m bins whose LOS/shadowing draws
+            are cached; 0 disables the cache
         """
         self.ant_id = ant_id
         self.position = position
@@ -97,6 +105,10 @@ class MacroCellModel:
         self.random_seed = int(random_seed)
         self.average_building_height_m = float(average_building_height_m)
         self.street_width_m = float(street_width_m)
+        self.grid_cache_size = max(0, int(grid_cache_size))
+        # bin -> [los_uniform, shadow_db_if_los, shadow_db_if_nlos]
+        self._grid_cache: "OrderedDict[tuple, list]" = OrderedDict()
+        self._grid_lock = threading.Lock()
 
         if self.bw <= 0 or self.resource_blocks <= 0:
             raise ValueError("bandwidth_hz and resource_blocks must be positive")
@@ -129,23 +141,79 @@ class MacroCellModel:
         )
         return self.max_gain_dbi - total_attenuation
 
-    def _deterministic_uniform(self, ue_position, namespace: str) -> float:
-        quantized = tuple(round(float(value) / 10.0) for value in ue_position)
+    @staticmethod
+    def _quantize(ue_position) -> tuple:
+        return tuple(round(float(value) / 10.0) for value in ue_position)
+
+    def _hash_uniform(self, quantized: tuple, namespace: str) -> float:
         payload = f"{self.random_seed}:{self.ant_id}:{namespace}:{quantized}".encode()
         digest = hashlib.sha256(payload).digest()
         return int.from_bytes(digest[:8], "big") / float(2**64)
 
+    def _hash_shadow_fading_db(self, quantized: tuple, los: bool) -> float:
+        payload = f"{self.random_seed}:{self.ant_id}:shadow:{los}:{quantized}".encode()
+        seed = int.from_bytes(hashlib.sha256(payload).digest()[:8], "big")
+        sigma = self.shadow_fading_std_db if los else max(6.0, self.shadow_fading_std_db)
+        return random.Random(seed).gauss(0.0, sigma)
+
+    def _grid_entry(self, quantized: tuple) -> list:
+        """Return the cached draws for a 10 m bin, filling it on first use.
+
+        Values are produced by the same SHA-256 derivation as the uncached
+        path, so cached and freshly computed draws are bit-identical.
+        """
+        with self._grid_lock:
+            entry = self._grid_cache.get(quantized)
+            if entry is not None:
+                self._grid_cache.move_to_end(quantized)
+                return entry
+        entry = [self._hash_uniform(quantized, "los"), None, None]
+        if self.grid_cache_size:
+            with self._grid_lock:
+                self._grid_cache[quantized] = entry
+                while len(self._grid_cache) > self.grid_cache_size:
+                    self._grid_cache.popitem(last=False)
+        return entry
+
+    def clear_grid_cache(self) -> None:
+        """Drop cached LOS/shadowing draws (e.g. after changing RF parameters)."""
+        with self._grid_lock:
+            self._grid_cache.clear()
+
+    def _deterministic_uniform(self, ue_position, namespace: str) -> float:
+        quantized = self._quantize(ue_position)
+        if namespace == "los":
+            return self._grid_entry(quantized)[0]
+        return self._hash_uniform(quantized, namespace)
+
     def _is_los(self, ue_position) -> bool:
         return self._deterministic_uniform(ue_position, "los") < self.los_probability
 
+    def _cached_shadow_fading_db(self, entry: list, quantized: tuple, los) -> float:
+        if not isinstance(los, bool):
+            # The hash payload embeds ``str(los)``; only cache canonical flags.
+            return self._hash_shadow_fading_db(quantized, los)
+        slot = 1 if los else 2
+        value = entry[slot]
+        if value is None:
+            value = self._hash_shadow_fading_db(quantized, los)
+            entry[slot] = value
+        return value
+
     def _shadow_fading_db(self, ue_position, *, los: bool) -> float:
         if not self.shadowing_enabled or self.shadow_fading_std_db <= 0:
             return 0.0
-        quantized = tuple(round(float(value) / 10.0) for value in ue_position)
-        payload = f"{self.random_seed}:{self.ant_id}:shadow:{los}:{quantized}".encode()
-        seed = int.from_bytes(hashlib.sha256(payload).digest()[:8], "big")
-        sigma = self.shadow_fading_std_db if los else max(6.0, self.shadow_fading_std_db)
-        return random.Random(seed).gauss(0.0, sigma)
+        quantized = self._quantize(ue_position)
+        return self._cached_shadow_fading_db(self._grid_entry(quantized), quantized, los)
+
+    def los_and_shadowing(self, ue_position) -> tuple:
+        """Return ``(los, shadow_fading_db)`` for a UE position in one lookup."""
+        quantized = self._quantize(ue_position)
+        entry = self._grid_entry(quantized)
+        los = entry[0] < self.los_probability
+        if not self.shadowing_enabled or self.shadow_fading_std_db <= 0:
+            return los, 0.0
+        return los, self._cached_shadow_fading_db(entry, quantized, los)
 
     def _rma_los_path_loss_db(self, d_2d: float, d_3d: float) -> float:
         # 3GPP TR 38.901 RMa LOS, valid for 10 m <= d_2D <= 10 km.
@@ -186,11 +254,13 @@ class MacroCellModel:
     def path_loss_db(self, ue_position, include_shadowing: bool = False) -> float:
         d_2d = max(math.dist(self.position[:2], ue_position[:2]), 10.0)
         d_3d = max(math.dist(self.position, ue_position), 10.0)
-        los = self._is_los(ue_position)
+        quantized = self._quantize(ue_position)
+        entry = self._grid_entry(quantized)
+        los = entry[0] < self.los_probability
         los_path_loss = self._rma_los_path_loss_db(d_2d, d_3d)
         path_loss = los_path_loss if los else self._rma_nlos_path_loss_db(d_3d, los_path_loss)
-        if include_shadowing:
-            path_loss += self._shadow_fading_db(ue_position, los=los)
+        if include_shadowing and self.shadowing_enabled and self.shadow_fading_std_db > 0:
+            path_loss += self._cached_shadow_fading_db(entry, quantized, los)
         return path_loss
 
     def received_power_dbm(self, ue_position, include_shadowing: bool | None = None):
@@ -20,6 +20,7 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for tests
     class _FallbackRuntime:
         ensure_topology = staticmethod(lambda *args, **kwargs: None)
         upsert_ue_state = staticmethod(lambda *args, **kwargs: None)
+        remove_ue_state = staticmethod(lambda *args, **kwargs: None)
 
     handover_runtime = _FallbackRuntime()  # type: ignore[assignment]
 
@@ -299,6 +300,7 @@ def delete_UE(
         add_gnb_id_to_ue_json(UE, json_UE)
 
         crud.ue.remove_supi(db=db, supi=supi)
+        handover_runtime.remove_ue_state(supi)
         return json_UE
 
 ### Get list of UEs of specific gNB
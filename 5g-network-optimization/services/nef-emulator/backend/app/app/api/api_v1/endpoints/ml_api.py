@@ -2,9 +2,9 @@
 
 import os
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 try:
@@ -134,6 +134,28 @@ def set_mode(payload: ModeRequest):
         "use_ml": current_mode in ("ml", "hybrid", "complexity_aware_ml_a3"),
     }
 
+@router.get("/state")
+def get_feature_vectors(ue_id: Optional[List[str]] = Query(None)):
+    """
+    Return ML feature vectors for several UEs from one runtime snapshot.
+    GET /api/v1/ml/state?ue_id=<>&ue_id=<>  (omit ue_id for every UE)
+
+    All vectors are computed under a single runtime lock acquisition and one
+    batched RF pass, so they describe the same instant. Requested UEs that
+    are not tracked are listed under ``missing`` instead of failing the call.
+    """
+    requested = list(dict.fromkeys(ue_id)) if ue_id else None
+    if runtime is not None:
+        features = runtime.feature_vectors(requested)
+    else:
+        known = list(state_mgr.ue_states) if requested is None else [
+            supi for supi in requested if supi in state_mgr.ue_states
+        ]
+        features = state_mgr.get_feature_vectors(known)
+    missing = [supi for supi in requested or () if supi not in features]
+    return {"features": features, "missing": missing}
+
+
 @router.get("/state/{ue_id}")
 def get_feature_vector(ue_id: str):
     """
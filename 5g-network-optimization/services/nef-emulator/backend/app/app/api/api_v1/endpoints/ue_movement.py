@@ -1,4 +1,4 @@
-import threading, logging, time, requests, copy, asyncio
+import threading, logging, time, requests, copy
 import os
 from fastapi import APIRouter, Path, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.encoders import jsonable_encoder
@@ -36,6 +36,47 @@ except ModuleNotFoundError:  # pragma: no cover - isolated legacy source-loader
     def _configured_speed_mps(ue_data):
         return float(ue_data.get("speed_mps") or 0.0)
 
+try:
+    from app.simulation.scheduler import (
+        NEED_FEATURES,
+        TICK_DONE,
+        TickScheduler,
+        scheduler_enabled as _scheduler_enabled,
+    )
+except ModuleNotFoundError:  # pragma: no cover - isolated legacy source-loader tests
+    if os.getenv("TESTING", "").lower() not in {"1", "true", "yes"}:
+        raise
+
+    NEED_FEATURES = "need_features"
+    TICK_DONE = "tick_done"
+    TickScheduler = None
+
+    def _scheduler_enabled():
+        return False
+
+try:
+    from app.db.subscription_cache import subscription_cache, watch_subscriptions
+except ModuleNotFoundError:  # pragma: no cover - isolated legacy source-loader tests
+    if os.getenv("TESTING", "").lower() not in {"1", "true", "yes"}:
+        raise
+
+    class _UncachedSubscriptions:
+        @staticmethod
+        def lookup(collection, loader, **query):
+            return loader()
+
+    subscription_cache = _UncachedSubscriptions()
+
+    def watch_subscriptions(db):
+        return False
+
+try:
+    from app.api import live_feed
+except ImportError:  # pragma: no cover - isolated legacy source-loader tests
+    if os.getenv("TESTING", "").lower() not in {"1", "true", "yes"}:
+        raise
+    live_feed = None
+
 logger = logging.getLogger(__name__)
 
 def log_timer_exception(ex: Exception) -> None:
@@ -83,6 +124,8 @@ except ModuleNotFoundError:  # pragma: no cover - fallback used only in tests
         set_movement_provenance = staticmethod(lambda *args, **kwargs: None)
         decide_handover = staticmethod(lambda *args, **kwargs: None)
         get_cell_by_key = staticmethod(lambda *args, **kwargs: None)
+        feature_vectors = staticmethod(lambda *args, **kwargs: {})
+        coverage_index = staticmethod(lambda cells: cells)
 
     handover_runtime = _FallbackRuntime()  # type: ignore[assignment]
 
@@ -93,6 +136,27 @@ from app.schemas import Msg
 from app.tools import monitoring_callbacks, timer
 from sqlalchemy.orm import Session
 
+_scheduler_lock = threading.Lock()
+_scheduler: Optional[Any] = None
+
+
+def _batch_feature_vectors(keys):
+    """Feature vectors for scheduler session keys from one batched RF pass."""
+    vectors = handover_runtime.feature_vectors([key[0] for key in keys])
+    return {key: vectors.get(key[0]) for key in keys}
+
+
+def _movement_scheduler():
+    """Return the shared tick scheduler when ``UE_MOVEMENT_SCHEDULER`` is set."""
+    global _scheduler
+    if TickScheduler is None or not _scheduler_enabled():
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TickScheduler(_batch_feature_vectors)
+        return _scheduler
+
+
 class _RealBackgroundTasks(threading.Thread):
 
     def __init__(self, group=None, target=None, name=None, args=(), kwargs=None): 
@@ -101,11 +165,40 @@ class _RealBackgroundTasks(threading.Thread):
         self._kwargs = kwargs
         self._stop_threads = False
         self._wait_event = threading.Event()
+        self._scheduler = None
+        self._session = None
         return
 
+    def start(self):
+        scheduler = _movement_scheduler()
+        if scheduler is None:
+            super().start()
+            return
+        self._scheduler = scheduler
+        self._session = scheduler.register(self._session_key(), self._steps())
+
     def run(self):
-        
+        # Drive the movement steps on this thread; the feature vector is
+        # looked up per UE and each tick ends with an interruptible sleep.
+        for phase in self._steps():
+            if phase == TICK_DONE:
+                self._wait_event.clear()
+                interval = parse_env_float("UE_MOVEMENT_INTERVAL_SECONDS", 1.0, min_value=0.1)
+                self._wait_event.wait(interval)
+
+    def _session_key(self):
+        return (self._args[1], f"{self._args[0].id}")
+
+    def _steps(self):
+        """Yield ``NEED_FEATURES``/``TICK_DONE`` phases of the movement loop.
+
+        ``NEED_FEATURES`` is answered with a precomputed feature vector (or
+        ``None`` to look it up here) and ``TICK_DONE`` marks the pause
+        between ticks, so the same loop runs on its own thread or on the
+        shared :class:`TickScheduler`.
+        """
         db_mongo = client.fastapi
+        watch_subscriptions(db_mongo)
 
         current_user = self._args[0]
         supi = self._args[1]
@@ -181,7 +274,8 @@ class _RealBackgroundTasks(threading.Thread):
         moving_position_index = current_position_index
 
         handover_runtime.ensure_topology(json_cells)
-        initial_candidate = check_distance(ue_data["latitude"], ue_data["longitude"], json_cells)
+        cell_index = handover_runtime.coverage_index(json_cells)
+        initial_candidate = check_distance(ue_data["latitude"], ue_data["longitude"], cell_index)
         handover_runtime.upsert_ue_state(supi, ue_data["latitude"], ue_data["longitude"], _configured_speed_mps(ue_data), ue_data.get("Cell_id"), initial_candidate.get("id") if initial_candidate else None)
         handover_runtime.set_movement_provenance(
             supi,
@@ -201,10 +295,20 @@ class _RealBackgroundTasks(threading.Thread):
         external_id = ue_data.get("external_identifier")
         ipv4_addr = ue_data.get("ip_address_v4")
 
-        def fetch_subscription(key: str, loader):
+        def fetch_subscription(key: str, monitoring_type: str):
             doc = subscription_docs[key]
             if not active_subscriptions.get(key):
-                doc = loader()
+                doc = subscription_cache.lookup(
+                    "MonitoringEvent",
+                    lambda: crud_mongo.read_by_multiple_pairs(
+                        db_mongo,
+                        "MonitoringEvent",
+                        externalId=external_id,
+                        monitoringType=monitoring_type,
+                    ),
+                    externalId=external_id,
+                    monitoringType=monitoring_type,
+                )
                 subscription_docs[key] = doc
                 active_subscriptions[key] = bool(doc)
             return subscription_docs[key]
@@ -262,7 +366,7 @@ class _RealBackgroundTasks(threading.Thread):
                 )
                 ue_data["latitude"] = latitude
                 ue_data["longitude"] = longitude
-                cell_now = check_distance(ue_data["latitude"], ue_data["longitude"], json_cells)
+                cell_now = check_distance(ue_data["latitude"], ue_data["longitude"], cell_index)
                 candidate_id = cell_now.get("id") if cell_now else None
 
                 current_key = str(previous_cell_id) if previous_cell_id is not None else None
@@ -289,8 +393,10 @@ class _RealBackgroundTasks(threading.Thread):
 
                 # Update UE signal metrics (RSRP/SINR) based on current position
                 # These are calculated dynamically by the NetworkStateManager using RF models
+                feature_vector = yield NEED_FEATURES
                 try:
-                    feature_vector = handover_runtime.state_manager.get_feature_vector(supi)
+                    if feature_vector is None:
+                        feature_vector = handover_runtime.state_manager.get_feature_vector(supi)
                     neighbor_rsrp = feature_vector.get("neighbor_rsrp_dbm", {})
                     neighbor_sinr = feature_vector.get("neighbor_sinrs", {})
                     # Get the serving cell's signal values
@@ -303,6 +409,7 @@ class _RealBackgroundTasks(threading.Thread):
                         best_cell = max(neighbor_rsrp, key=neighbor_rsrp.get)
                         ue_data["rsrp"] = round(neighbor_rsrp[best_cell], 1)
                         ue_data["sinr"] = round(neighbor_sinr.get(best_cell, 10.0), 1)
+                    _publish_live_metrics(supi, feature_vector)
                 except (KeyError, AttributeError) as e:
                     logger.debug("Could not update signal metrics for UE %s: %s", supi, e)
 
@@ -430,15 +537,7 @@ class _RealBackgroundTasks(threading.Thread):
                 logger.info("UE %s initial attach to cell %s", supi, ue_data["Cell_id"])
             
             # MonitoringEvent API - Loss of connectivity
-            loss_doc = fetch_subscription(
-                "loss_of_connectivity",
-                lambda: crud_mongo.read_by_multiple_pairs(
-                    db_mongo,
-                    "MonitoringEvent",
-                    externalId=external_id,
-                    monitoringType="LOSS_OF_CONNECTIVITY",
-                ),
-            )
+            loss_doc = fetch_subscription("loss_of_connectivity", "LOSS_OF_CONNECTIVITY")
 
             if active_subscriptions.get("loss_of_connectivity") and loss_of_connectivity_ack == "FALSE":
                 if not monitoring_event_sub_validation(
@@ -475,7 +574,11 @@ class _RealBackgroundTasks(threading.Thread):
 
             # As Session With QoS API - search for active subscription in db
             if not active_subscriptions.get("as_session_with_qos"):
-                qos_sub = crud_mongo.read(db_mongo, "QoSMonitoring", "ipv4Addr", ipv4_addr)
+                qos_sub = subscription_cache.lookup(
+                    "QoSMonitoring",
+                    lambda: crud_mongo.read(db_mongo, "QoSMonitoring", "ipv4Addr", ipv4_addr),
+                    ipv4Addr=ipv4_addr,
+                )
                 if qos_sub:
                     active_subscriptions["as_session_with_qos"] = True
                     if "PERIODIC" in qos_sub["qosMonInfo"]["repFreqs"]:
@@ -511,15 +614,7 @@ class _RealBackgroundTasks(threading.Thread):
                         ue_data["gnb_id_hex"] = cell_id_hex[:6] if cell_id_hex else None
 
                     if previous_cell_id is None:
-                        reach_doc = fetch_subscription(
-                            "ue_reachability",
-                            lambda: crud_mongo.read_by_multiple_pairs(
-                                db_mongo,
-                                "MonitoringEvent",
-                                externalId=external_id,
-                                monitoringType="UE_REACHABILITY",
-                            ),
-                        )
+                        reach_doc = fetch_subscription("ue_reachability", "UE_REACHABILITY")
                         if active_subscriptions.get("ue_reachability"):
                             if monitoring_event_sub_validation(
                                 reach_doc,
@@ -541,15 +636,7 @@ class _RealBackgroundTasks(threading.Thread):
                             else:
                                 drop_subscription("ue_reachability")
 
-                    loc_doc = fetch_subscription(
-                        "location_reporting",
-                        lambda: crud_mongo.read_by_multiple_pairs(
-                            db_mongo,
-                            "MonitoringEvent",
-                            externalId=external_id,
-                            monitoringType="LOCATION_REPORTING",
-                        ),
-                    )
+                    loc_doc = fetch_subscription("location_reporting", "LOCATION_REPORTING")
                     if active_subscriptions.get("location_reporting"):
                         if monitoring_event_sub_validation(
                             loc_doc,
@@ -594,9 +681,7 @@ class _RealBackgroundTasks(threading.Thread):
                 ue_data["cell_id_hex"] = None
                 ue_data["gnb_id_hex"] = None
 
-            self._wait_event.clear()
-            interval = parse_env_float("UE_MOVEMENT_INTERVAL_SECONDS", 1.0, min_value=0.1)
-            self._wait_event.wait(interval)
+            yield TICK_DONE
             state_manager.set_ue(supi, ue_data)
 
             if self._stop_threads:
@@ -629,6 +714,19 @@ class _RealBackgroundTasks(threading.Thread):
     def stop(self):
         self._stop_threads = True
         self._wait_event.set()
+        if self._session is not None:
+            self._scheduler.request_stop(self._session.key)
+
+    def join(self, timeout=None):
+        if self._session is None:
+            super().join(timeout)
+        else:
+            self._session.done.wait(timeout)
+
+    def is_alive(self):
+        if self._session is None:
+            return super().is_alive()
+        return not self._session.done.is_set()
 
 
 BackgroundTasks = _RealBackgroundTasks
@@ -829,7 +927,10 @@ def state_ues(
 
 def _build_live_metrics_payload(supi: str) -> dict:
     feature_vector = handover_runtime.state_manager.get_feature_vector(supi)
+    return _live_metrics_from_features(supi, feature_vector)
 
+
+def _live_metrics_from_features(supi: str, feature_vector: dict) -> dict:
     neighbor_rsrp = feature_vector.get("neighbor_rsrp_dbm", {}) or {}
     neighbor_sinr = feature_vector.get("neighbor_sinrs", {}) or {}
     serving_key = feature_vector.get("connected_to")
@@ -855,6 +956,17 @@ def _build_live_metrics_payload(supi: str) -> dict:
     }
 
 
+def _publish_live_metrics(supi: str, feature_vector: dict) -> None:
+    """Push this tick's snapshot to ``/ws/ue-metrics`` subscribers of ``supi``."""
+    if live_feed is None or not live_feed.hub.has_subscribers(live_feed.UE_METRICS_TOPIC, supi):
+        return
+    live_feed.hub.publish(
+        live_feed.UE_METRICS_TOPIC,
+        _live_metrics_from_features(supi, feature_vector),
+        key=supi,
+    )
+
+
 @router.get("/live-metrics/{supi}", status_code=200)
 def live_metrics(
     *,
@@ -885,16 +997,18 @@ async def ws_live_metrics(websocket: WebSocket):
 
     await websocket.accept()
 
-    try:
-        while True:
+    # Snapshots are published by the UE's movement loop once per tick; the
+    # first one is built here so the client does not wait for the next tick.
+    with live_feed.hub.subscribe(live_feed.UE_METRICS_TOPIC, key=supi) as subscription:
+        try:
             try:
-                payload = _build_live_metrics_payload(supi)
-                await websocket.send_json(payload)
+                await websocket.send_json(_build_live_metrics_payload(supi))
             except Exception as err:
                 await websocket.send_json({"error": str(err), "supi": supi})
-            await asyncio.sleep(1.0)
-    except WebSocketDisconnect:
-        return
+            while True:
+                await websocket.send_json(await subscription.get())
+        except WebSocketDisconnect:
+            return
 
 
 @router.websocket("/ws/handovers")
@@ -911,21 +1025,20 @@ async def ws_handovers(websocket: WebSocket):
 
     await websocket.accept()
 
-    last_sent = 0.0
-
-    try:
-        while True:
-            events = state_manager.get_recent_handovers(limit=limit)
-            if events:
-                # events are sorted descending; send oldest -> newest
-                for event in reversed(events):
-                    event_time = event.get("time", 0.0) or 0.0
-                    if event_time > last_sent:
-                        await websocket.send_json(event)
-                        last_sent = max(last_sent, event_time)
-            await asyncio.sleep(1.0)
-    except WebSocketDisconnect:
-        return
+    # Subscribe before reading the backlog so no handover falls in between;
+    # events already covered by the backlog are skipped by their cursor.
+    with live_feed.hub.subscribe(live_feed.HANDOVERS_TOPIC, maxsize=limit) as subscription:
+        try:
+            events, cursor = state_manager.get_handovers_since(0, limit=limit)
+            for event in events:
+                await websocket.send_json(event)
+            while True:
+                event = await subscription.get()
+                if event.get("seq", 0) > cursor:
+                    await websocket.send_json(event)
+                    cursor = event["seq"]
+        except WebSocketDisconnect:
+            return
 
 
 @router.get("/handover-stats", status_code=200)
@@ -961,6 +1074,20 @@ def get_recent_handovers(
     """
     return state_manager.get_recent_handovers(limit=limit)
 
+
+@router.get("/handovers-since", status_code=200)
+def get_handovers_since(
+    cursor: int = 0,
+    limit: int = 200,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get handover events recorded after ``cursor``, oldest first.
+    Pass the returned ``cursor`` back in to poll incrementally.
+    """
+    events, next_cursor = state_manager.get_handovers_since(cursor, limit=limit)
+    return {"events": events, "cursor": next_cursor}
+
 #Functions
 def retrieve_ue_state(supi: str, user_id: int) -> bool:
     try:
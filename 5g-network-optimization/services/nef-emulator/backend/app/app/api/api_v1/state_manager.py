@@ -1,7 +1,9 @@
 import threading
 import time
 import os
-from typing import Any, Dict, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 
 class StateManager:
@@ -16,12 +18,22 @@ class StateManager:
         self._timer_error_counter: int = 0
         # Handover tracking for thesis experiments
         self._handover_count: int = 0
-        self._handovers_by_ue: Dict[str, List[Dict[str, Any]]] = {}
+        self._handover_counts_by_ue: Dict[str, int] = {}
         self._session_start: float = time.time()
+        self._handover_listeners: List[Callable[[Dict[str, Any]], None]] = []
         try:
             self._notification_limit = int(os.getenv("NEF_NOTIFICATION_LIMIT", "100"))
         except ValueError:
             self._notification_limit = 100
+        try:
+            handover_log_limit = max(1, int(os.getenv("NEF_HANDOVER_LOG_LIMIT", "10000")))
+        except ValueError:
+            handover_log_limit = 10000
+        # Global handover log in recording order. Each event carries a
+        # ``seq`` cursor; sequence numbers keep increasing across resets so a
+        # stale cursor never matches new events.
+        self._handover_log: Deque[Dict[str, Any]] = deque(maxlen=handover_log_limit)
+        self._handover_seq: int = 0
 
     # Notification handling
     def add_notification(self, notification: Dict[str, Any]) -> Dict[str, Any]:
@@ -102,10 +114,10 @@ class StateManager:
     ) -> None:
         """Record a handover event for statistical analysis."""
         with self._lock:
-            self._handover_count += 1
-            if ue_id not in self._handovers_by_ue:
-                self._handovers_by_ue[ue_id] = []
-            self._handovers_by_ue[ue_id].append({
+            self._handover_seq += 1
+            event = {
+                "ue": ue_id,
+                "seq": self._handover_seq,
                 "time": time.time(),
                 "from": from_cell,
                 "to": to_cell,
@@ -113,39 +125,62 @@ class StateManager:
                 "confidence": confidence,
                 "rsrp": rsrp,
                 "sinr": sinr,
-            })
+            }
+            self._handover_count += 1
+            self._handover_counts_by_ue[ue_id] = self._handover_counts_by_ue.get(ue_id, 0) + 1
+            self._handover_log.append(event)
+            listeners = list(self._handover_listeners)
+        for listener in listeners:
+            listener(dict(event))
+
+    def add_handover_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call ``listener`` with each recorded handover, shaped like ``get_recent_handovers`` items."""
+        with self._lock:
+            if listener not in self._handover_listeners:
+                self._handover_listeners.append(listener)
 
     def get_handover_stats(self) -> Dict[str, Any]:
         """Get handover statistics for the current session."""
         with self._lock:
             return {
                 "total_handovers": self._handover_count,
-                "handovers_by_ue": {
-                    ue: len(events) for ue, events in self._handovers_by_ue.items()
-                },
+                "handovers_by_ue": dict(self._handover_counts_by_ue),
                 "session_start": self._session_start,
                 "session_duration": time.time() - self._session_start,
             }
 
     def get_recent_handovers(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get recent handover events with full details including ML confidence."""
-        with self._lock:
-            all_events = []
-            for ue_id, events in self._handovers_by_ue.items():
-                for event in events:
-                    all_events.append({
-                        "ue": ue_id,
-                        **event
-                    })
-            # Sort by time descending, return most recent
-            all_events.sort(key=lambda x: x["time"], reverse=True)
-            return all_events[:limit]
+        """Get recent handover events with full details including ML confidence.
+
+        Events are returned newest first; only the last ``limit`` entries of
+        the log are touched.
+        """
+        with self._lock:
+            return [dict(event) for event in islice(reversed(self._handover_log), max(0, limit))]
+
+    def get_handovers_since(
+        self, cursor: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return ``(events, next_cursor)`` for handovers recorded after ``cursor``.
+
+        Events are oldest first. Pass ``next_cursor`` back in to stream
+        incrementally. With ``limit`` only the newest ``limit`` events are
+        returned. Events that have already rotated out of the bounded log
+        are skipped.
+        """
+        with self._lock:
+            count = max(0, self._handover_seq - max(0, cursor))
+            if limit is not None:
+                count = min(count, max(0, limit))
+            newest_first = list(islice(reversed(self._handover_log), count))
+            return [dict(event) for event in reversed(newest_first)], self._handover_seq
 
     def reset_handover_stats(self) -> None:
         """Reset handover statistics for a new experiment session."""
         with self._lock:
             self._handover_count = 0
-            self._handovers_by_ue.clear()
+            self._handover_counts_by_ue.clear()
+            self._handover_log.clear()
             self._session_start = time.time()
 
     def reset(self) -> None:
@@ -165,7 +200,8 @@ class StateManager:
             self._timer_error_counter = 0
             # Reset handover tracking
             self._handover_count = 0
-            self._handovers_by_ue.clear()
+            self._handover_counts_by_ue.clear()
+            self._handover_log.clear()
             self._session_start = time.time()
 
 
@@ -0,0 +1,140 @@
+"""Tick-driven fan-out for the live dashboard websockets.
+
+``/ws/ue-metrics`` and ``/ws/handovers`` used to recompute their payloads
+once per second per socket, inside the event loop.  Instead, the UE movement
+loop publishes each UE's live snapshot once per tick and ``StateManager``
+publishes each recorded handover; a :class:`BroadcastHub` hands them to every
+subscribed socket.
+
+Publishing is thread-safe and never blocks the publisher. Each subscriber
+has its own bounded queue; when a slow client lets it fill up, the oldest
+message is dropped so the client always catches up to the latest state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .api_v1.state_manager import state_manager
+from ..core.env_utils import parse_env_int
+
+UE_METRICS_TOPIC = "ue-metrics"
+HANDOVERS_TOPIC = "handovers"
+
+DEFAULT_QUEUE_SIZE = parse_env_int("LIVE_FEED_QUEUE_SIZE", 32, min_value=1)
+
+
+class Subscription:
+    """One subscriber's bounded, drop-oldest message queue.
+
+    Use as a context manager so the subscription is removed from the hub
+    when the websocket handler exits.
+    """
+
+    def __init__(self, hub: "BroadcastHub", topic: str, key: Optional[str], maxsize: int) -> None:
+        self.hub = hub
+        self.topic = topic
+        self.key = key
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    async def get(self) -> Any:
+        """Wait for the next message."""
+        return await self.queue.get()
+
+    def offer(self, message: Any) -> None:
+        """Enqueue ``message``, dropping the oldest one if the queue is full.
+
+        Must run on the subscriber's event loop.
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+
+class BroadcastHub:
+    """Topic-based pub/sub between simulation threads and asyncio consumers.
+
+    Subscribers register for a ``(topic, key)`` pair; ``key`` narrows a topic
+    to one entity (e.g. a SUPI) and ``None`` means the whole topic.
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[Tuple[str, Optional[str]], List[Subscription]] = {}
+
+    def subscribe(self, topic: str, key: Optional[str] = None, *, maxsize: Optional[int] = None) -> Subscription:
+        """Register a subscriber; must be called from the consuming event loop."""
+        subscription = Subscription(self, topic, key, maxsize or self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault((topic, key), []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        slot = (subscription.topic, subscription.key)
+        with self._lock:
+            subscribers = self._subscribers.get(slot)
+            if subscribers and subscription in subscribers:
+                subscribers.remove(subscription)
+                if not subscribers:
+                    del self._subscribers[slot]
+
+    def has_subscribers(self, topic: str, key: Optional[str] = None) -> bool:
+        """Whether publishing to ``topic``/``key`` would reach anyone.
+
+        Publishers use this to skip building payloads nobody will read.
+        """
+        with self._lock:
+            return (topic, key) in self._subscribers or (
+                key is not None and (topic, None) in self._subscribers
+            )
+
+    def publish(self, topic: str, message: Any, key: Optional[str] = None) -> int:
+        """Hand ``message`` to every matching subscriber; returns how many."""
+        with self._lock:
+            targets = list(self._subscribers.get((topic, key), ()))
+            if key is not None:
+                targets.extend(self._subscribers.get((topic, None), ()))
+        delivered = 0
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+                delivered += 1
+            except RuntimeError:
+                # The subscriber's event loop has been closed.
+                self.unsubscribe(subscription)
+        return delivered
+
+
+hub = BroadcastHub()
+
+
+def publish_handover(event: Dict[str, Any]) -> None:
+    hub.publish(HANDOVERS_TOPIC, event)
+
+
+state_manager.add_handover_listener(publish_handover)
+
+
+__all__ = [
+    "BroadcastHub",
+    "HANDOVERS_TOPIC",
+    "Subscription",
+    "UE_METRICS_TOPIC",
+    "hub",
+    "publish_handover",
+]
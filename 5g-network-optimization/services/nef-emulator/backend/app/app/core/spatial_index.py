@@ -0,0 +1,227 @@
+# services/nef-emulator/backend/app/app/core/spatial_index.py
+"""Grid-bucketed spatial indexes for cell lookups.
+
+``check_distance``, ``HandoverEngine._find_nearest_cell`` and
+``NetworkStateManager._visible_antenna_ids`` used to scan every cell for
+every UE tick.  The indexes here bucket cells on a uniform grid in a metric
+embedding and only evaluate the exact distance for cells in nearby buckets.
+
+Exactness: the embedding distance never exceeds the exact metric (the chord
+through the sphere is never longer than the haversine arc, and planar
+coordinates are embedded unchanged), so every cell within ``r`` under the
+exact metric lies in the query box of half-width ``r``.  Candidates are then
+checked with the exact distance function in their original order, so the
+results, including tie-breaking, match the linear scans they replace.
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .geo_utils import EARTH_RADIUS_M, haversine_distance
+
+Point = Tuple[float, float, float]
+
+# Slack added to every pruning radius so float rounding in the embedding can
+# never drop a cell that the exact metric would accept.
+PRUNE_MARGIN = 1.0
+
+
+def sphere_point(lat: float, lon: float) -> Point:
+    """Embed ``lat``/``lon`` degrees on a sphere of radius ``EARTH_RADIUS_M``."""
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    cos_lat = math.cos(lat_r)
+    return (
+        EARTH_RADIUS_M * cos_lat * math.cos(lon_r),
+        EARTH_RADIUS_M * cos_lat * math.sin(lon_r),
+        EARTH_RADIUS_M * math.sin(lat_r),
+    )
+
+
+def is_geographic(lat: float, lon: float) -> bool:
+    """Whether ``lat``/``lon`` are valid degrees (else a synthetic planar grid)."""
+    return abs(lat) <= 90.0 and abs(lon) <= 180.0
+
+
+class GridIndex:
+    """Uniform 3-D grid over embedded points.
+
+    Queries return point indices in ascending order so callers can keep the
+    first-wins tie-breaking of a linear scan.
+    """
+
+    def __init__(self, points: Sequence[Point], bucket_size: float) -> None:
+        self.bucket_size = float(bucket_size) if bucket_size and bucket_size > 0 else 1.0
+        self._points = list(points)
+        self._buckets: Dict[Tuple[int, int, int], List[int]] = {}
+        for idx, point in enumerate(self._points):
+            self._buckets.setdefault(self._bucket(point), []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _bucket(self, point: Point) -> Tuple[int, int, int]:
+        size = self.bucket_size
+        return (
+            math.floor(point[0] / size),
+            math.floor(point[1] / size),
+            math.floor(point[2] / size),
+        )
+
+    def within_box(self, point: Point, half_width: float) -> List[int]:
+        """Indices of points whose buckets intersect the box around ``point``."""
+        if not math.isfinite(half_width):
+            return list(range(len(self._points)))
+        lo = self._bucket(tuple(c - half_width for c in point))
+        hi = self._bucket(tuple(c + half_width for c in point))
+        span = (hi[0] - lo[0] + 1) * (hi[1] - lo[1] + 1) * (hi[2] - lo[2] + 1)
+        if span >= len(self._buckets):
+            keys = [
+                key for key in self._buckets
+                if lo[0] <= key[0] <= hi[0] and lo[1] <= key[1] <= hi[1] and lo[2] <= key[2] <= hi[2]
+            ]
+        else:
+            keys = [
+                (i, j, k)
+                for i in range(lo[0], hi[0] + 1)
+                for j in range(lo[1], hi[1] + 1)
+                for k in range(lo[2], hi[2] + 1)
+                if (i, j, k) in self._buckets
+            ]
+        found: List[int] = []
+        for key in keys:
+            found.extend(self._buckets[key])
+        found.sort()
+        return found
+
+    def nearest(self, point: Point, exact: Callable[[int], float]) -> Optional[Tuple[int, float]]:
+        """Return ``(index, distance)`` minimising ``exact``; lowest index wins ties."""
+        if not self._points:
+            return None
+        half_width = self.bucket_size
+        seed: List[int] = []
+        while not seed:
+            seed = self.within_box(point, half_width)
+            half_width *= 2.0
+        bound = min(exact(idx) for idx in seed)
+        return _argmin(self.within_box(point, bound + PRUNE_MARGIN), exact)
+
+
+def _argmin(indices: Iterable[int], exact: Callable[[int], float]) -> Optional[Tuple[int, float]]:
+    best: Optional[int] = None
+    best_distance = float("inf")
+    for idx in indices:
+        distance = exact(idx)
+        if distance < best_distance:
+            best_distance = distance
+            best = idx
+    return None if best is None else (best, best_distance)
+
+
+class CellCoverageIndex:
+    """Nearest covering cell for NEF cell dicts, as ``check_distance`` scans it.
+
+    Cells without ``latitude``, ``longitude`` or ``radius`` are ignored, like
+    the linear scan does.
+    """
+
+    def __init__(self, cells: Iterable[dict]) -> None:
+        self.cells = list(cells)
+        self._slots: List[int] = []
+        points: List[Point] = []
+        max_radius = 0.0
+        for pos, cell in enumerate(self.cells):
+            lat, lon, radius = cell.get("latitude"), cell.get("longitude"), cell.get("radius")
+            if lat is None or lon is None or radius is None:
+                continue
+            self._slots.append(pos)
+            points.append(sphere_point(float(lat), float(lon)))
+            max_radius = max(max_radius, float(radius))
+        self.max_radius = max_radius
+        self._grid = GridIndex(points, bucket_size=max(max_radius, 1.0))
+
+    def covering_cell(self, lat: float, lon: float) -> Optional[dict]:
+        """Return the closest cell whose radius covers ``lat``/``lon``."""
+        best = None
+        best_distance = float("inf")
+        candidates = self._grid.within_box(sphere_point(float(lat), float(lon)), self.max_radius + PRUNE_MARGIN)
+        for slot in candidates:
+            cell = self.cells[self._slots[slot]]
+            distance = haversine_distance(lat, lon, cell["latitude"], cell["longitude"])
+            if distance <= cell["radius"] and distance < best_distance:
+                best_distance = distance
+                best = cell
+        return best
+
+
+class NearestCellIndex:
+    """Nearest cell over ``{key: {"latitude", "longitude"}}`` configs.
+
+    ``distance`` is the exact metric of the scan being replaced. It must be
+    the haversine distance when both points are geographic and the planar
+    distance otherwise (the convention of the thesis synthetic grid).
+    """
+
+    def __init__(
+        self,
+        configs: Mapping[str, Mapping[str, Any]],
+        distance: Callable[[float, float, float, float], float],
+        *,
+        bucket_size: float = 500.0,
+    ) -> None:
+        self.distance = distance
+        self._keys: List[str] = []
+        self._coords: List[Tuple[float, float]] = []
+        geo_slots: List[int] = []
+        planar_slots: List[int] = []
+        for key, config in configs.items():
+            try:
+                lat = float(config["latitude"])
+                lon = float(config["longitude"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            slot = len(self._keys)
+            self._keys.append(key)
+            self._coords.append((lat, lon))
+            (geo_slots if is_geographic(lat, lon) else planar_slots).append(slot)
+
+        self._all = self._planar_grid(range(len(self._keys)), bucket_size)
+        self._geo_slots = geo_slots
+        self._geo = GridIndex([sphere_point(*self._coords[s]) for s in geo_slots], bucket_size)
+        self._planar_slots = planar_slots
+        self._planar = self._planar_grid(planar_slots, bucket_size)
+
+    def _planar_grid(self, slots: Iterable[int], bucket_size: float) -> GridIndex:
+        return GridIndex([(*self._coords[s], 0.0) for s in slots], bucket_size)
+
+    def nearest(self, lat: float, lon: float) -> Optional[Tuple[str, float]]:
+        """Return ``(key, distance)`` of the nearest config; first key wins ties."""
+
+        def exact(slot: int) -> float:
+            cell_lat, cell_lon = self._coords[slot]
+            return self.distance(lat, lon, cell_lat, cell_lon)
+
+        if not is_geographic(lat, lon):
+            hit = self._all.nearest((lat, lon, 0.0), exact)
+            return None if hit is None else (self._keys[hit[0]], hit[1])
+
+        best: Optional[Tuple[float, int]] = None
+        geo_hit = self._geo.nearest(sphere_point(lat, lon), lambda i: exact(self._geo_slots[i]))
+        if geo_hit is not None:
+            best = (geo_hit[1], self._geo_slots[geo_hit[0]])
+        planar_hit = self._planar.nearest((lat, lon, 0.0), lambda i: exact(self._planar_slots[i]))
+        if planar_hit is not None:
+            candidate = (planar_hit[1], self._planar_slots[planar_hit[0]])
+            if best is None or candidate < best:
+                best = candidate
+        return None if best is None else (self._keys[best[1]], best[0])
+
+
+__all__ = [
+    "CellCoverageIndex",
+    "GridIndex",
+    "NearestCellIndex",
+    "PRUNE_MARGIN",
+    "is_geographic",
+    "sphere_point",
+]
@@ -4,6 +4,10 @@ from bson import ObjectId
 from pymongo.database import Database
 from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
 
+# Writes invalidate cached subscription lookups once they have completed, so
+# a lookup racing the write cannot re-cache the old document.
+from ..db.subscription_cache import subscription_cache
+
 
 def read_all(db: Database, collection_name: str, owner: int) -> List[Dict[str, Any]]:
     """Get all documents for an owner."""
@@ -35,29 +39,39 @@ def update(
     db: Database, collection_name: str, uuid: str, json_data: Dict[str, Any]
 ) -> UpdateResult:
     """Replace a document by its ObjectId."""
-    return db[collection_name].replace_one({"_id": ObjectId(uuid)}, json_data)
+    result = db[collection_name].replace_one({"_id": ObjectId(uuid)}, json_data)
+    subscription_cache.invalidate(collection_name)
+    return result
 
 
 def update_new_field(
     db: Database, collection_name: str, uuid: str, json_data: Dict[str, Any]
 ) -> UpdateResult:
     """Add/update fields in an existing document."""
-    return db[collection_name].update_one({'_id': ObjectId(uuid)}, {'$set': json_data})
+    result = db[collection_name].update_one({'_id': ObjectId(uuid)}, {'$set': json_data})
+    subscription_cache.invalidate(collection_name)
+    return result
 
 
 def create(db: Database, collection_name: str, json_data: Dict[str, Any]) -> InsertOneResult:
     """Insert a new document."""
-    return db[collection_name].insert_one(json_data)
+    result = db[collection_name].insert_one(json_data)
+    subscription_cache.invalidate(collection_name)
+    return result
 
 
 def delete_by_uuid(db: Database, collection_name: str, uuid: str) -> DeleteResult:
     """Delete a document by its ObjectId."""
-    return db[collection_name].delete_one({"_id": ObjectId(uuid)})
+    result = db[collection_name].delete_one({"_id": ObjectId(uuid)})
+    subscription_cache.invalidate(collection_name)
+    return result
 
 
 def delete_by_item(db: Database, collection_name: str, key: str, value: Any) -> DeleteResult:
     """Delete a document by key-value match."""
-    return db[collection_name].delete_one({key: value})
+    result = db[collection_name].delete_one({key: value})
+    subscription_cache.invalidate(collection_name)
+    return result
 
 
 def read_all_gNB_profiles(db: Database, collection_name: str, gnb_id: int) -> List[Dict[str, Any]]:
@@ -0,0 +1,125 @@
+"""In-process cache for subscription lookups made by the UE movement loop.
+
+Every movement tick looks up ``MonitoringEvent`` and ``QoSMonitoring``
+subscriptions for its UE, and the answer is almost always the same as on the
+previous tick.  Lookups are cached per collection and query; any write made
+through :mod:`app.crud.crud_mongo` invalidates the affected collection, so
+subscriptions created, updated or deleted through the API are seen on the
+next tick.  Writes made by other processes are picked up through a MongoDB
+change stream when ``SUBSCRIPTION_CACHE_CHANGE_STREAM`` is enabled and the
+server supports it, and otherwise after ``SUBSCRIPTION_CACHE_TTL_S``.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from ..core.env_utils import parse_env_bool, parse_env_float
+
+SUBSCRIPTION_COLLECTIONS = ("MonitoringEvent", "QoSMonitoring")
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionCache:
+    """Cache ``find_one``-style subscription lookups until invalidated.
+
+    ``ttl_s`` bounds how long an entry is trusted without an invalidation;
+    ``0`` disables caching. Cached documents are deep-copied on the way out
+    because the movement loop mutates the documents it is handed.
+    """
+
+    def __init__(self, ttl_s: float, *, collections: Iterable[str] = SUBSCRIPTION_COLLECTIONS) -> None:
+        self.ttl_s = max(0.0, float(ttl_s))
+        self.collections = frozenset(collections)
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, tuple], Tuple[int, float, Optional[dict]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._watcher: Optional[threading.Thread] = None
+
+    def lookup(self, collection: str, loader: Callable[[], Optional[dict]], **query: Any) -> Optional[dict]:
+        """Return the cached result of ``loader`` for ``collection``/``query``."""
+        if self.ttl_s <= 0 or collection not in self.collections:
+            return loader()
+        key = (collection, tuple(sorted(query.items())))
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generations.get(collection, 0)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == generation and now - entry[1] < self.ttl_s:
+                return copy.deepcopy(entry[2])
+
+        doc = loader()
+        with self._lock:
+            # A write that landed while the loader ran may not be reflected in
+            # ``doc``; only cache it if the collection is still unchanged.
+            if self._generations.get(collection, 0) == generation:
+                self._entries[key] = (generation, now, copy.deepcopy(doc))
+        return doc
+
+    def invalidate(self, collection: Optional[str] = None) -> None:
+        """Drop cached lookups for ``collection``, or for every collection."""
+        with self._lock:
+            targets = self.collections if collection is None else {collection}
+            for name in targets:
+                if name not in self.collections:
+                    continue
+                self._generations[name] = self._generations.get(name, 0) + 1
+            self._entries = {
+                key: entry for key, entry in self._entries.items() if key[0] not in targets
+            }
+
+    def clear(self) -> None:
+        """Drop every cached lookup."""
+        self.invalidate()
+
+    def watch(self, db: Any) -> bool:
+        """Invalidate on MongoDB change-stream events for the cached collections.
+
+        Starts one background watcher per process. Change streams need a
+        replica set; on a standalone server the watcher logs the failure and
+        exits, leaving the TTL as the only bound on staleness.
+        """
+        with self._lock:
+            if self._watcher is not None:
+                return True
+            self._watcher = threading.Thread(
+                target=self._watch, args=(db,), name="subscription-cache-watch", daemon=True
+            )
+        self._watcher.start()
+        return True
+
+    def _watch(self, db: Any) -> None:
+        pipeline = [{"$match": {"ns.coll": {"$in": sorted(self.collections)}}}]
+        try:
+            with db.watch(pipeline) as stream:
+                for change in stream:
+                    self.invalidate(change.get("ns", {}).get("coll"))
+        except Exception as exc:  # noqa: BLE001 - e.g. standalone server without change streams
+            logger.warning("Subscription change stream unavailable; relying on TTL: %s", exc)
+        # Anything may have changed while the stream was down.
+        self.invalidate()
+
+
+subscription_cache = SubscriptionCache(
+    parse_env_float("SUBSCRIPTION_CACHE_TTL_S", 10.0, min_value=0.0)
+)
+
+
+def watch_subscriptions(db: Any) -> bool:
+    """Start the change-stream watcher if ``SUBSCRIPTION_CACHE_CHANGE_STREAM`` is set."""
+    if not parse_env_bool("SUBSCRIPTION_CACHE_CHANGE_STREAM", False):
+        return False
+    return subscription_cache.watch(db)
+
+
+__all__ = [
+    "SUBSCRIPTION_COLLECTIONS",
+    "SubscriptionCache",
+    "subscription_cache",
+    "watch_subscriptions",
+]
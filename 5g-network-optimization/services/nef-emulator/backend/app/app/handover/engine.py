@@ -12,13 +12,16 @@ import logging
 import requests
 from jose import jwt
 from requests import RequestException
+from requests.adapters import HTTPAdapter
 
 from ..core.env_utils import parse_env_float, parse_env_int, parse_env_bool
+from ..core.spatial_index import NearestCellIndex
 from ..monitoring import metrics
 
 from ..network.state_manager import NetworkStateManager
 from .a3_rule import A3EventRule
 from .baseline_policy import BASELINE_HANDOVER_MODES, BaselinePolicyManager
+from .ml_batching import PredictionBatcher
 
 
 TRACE_CAPTURE_MODE = "trace_capture"
@@ -193,6 +196,14 @@ def _ml_result_from_response(data: dict, *, source: str) -> dict[str, Any]:
     return result
 
 
+class MLServiceStatusError(RequestException):
+    """The ML service answered a prediction request with an HTTP error."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"ML service returned status {status}")
+        self.status = int(status)
+
+
 def _get_cell_configs() -> dict:
     try:
         from ml_service.app.config.cells import CELL_CONFIGS
@@ -220,6 +231,10 @@ class HandoverEngine:
     DEFAULT_TOKEN_EXPIRY_SECONDS = 300
     # Coverage margin factor (1.5x = allow 50% beyond cell radius)
     COVERAGE_MARGIN_FACTOR = 1.5
+    # Connections kept alive per ML service host when pooling is enabled
+    DEFAULT_HTTP_POOL_SIZE = 16
+    # Largest number of UE payloads coalesced into one batch request
+    DEFAULT_PREDICT_BATCH_MAX = 64
 
     def __init__(
         self,
@@ -333,6 +348,28 @@ class HandoverEngine:
         self._last_ml_http_status: Optional[int] = None
         self._clock = clock
 
+        # Keep-alive connection pool and optional micro-batching for ML calls
+        self.http_keepalive = parse_env_bool("ML_HTTP_KEEPALIVE", False)
+        self.http_pool_size = parse_env_int(
+            "ML_HTTP_POOL_SIZE", self.DEFAULT_HTTP_POOL_SIZE, min_value=1
+        )
+        self._http_session: Optional[requests.Session] = None
+        self._http_session_lock = threading.Lock()
+        batch_window_s = parse_env_float("ML_PREDICT_BATCH_WINDOW_MS", 0.0, min_value=0.0) / 1000.0
+        self._predict_batcher: Optional[PredictionBatcher] = None
+        if batch_window_s > 0:
+            self._predict_batcher = PredictionBatcher(
+                self._send_prediction_batch,
+                window_s=batch_window_s,
+                max_batch=parse_env_int(
+                    "ML_PREDICT_BATCH_MAX", self.DEFAULT_PREDICT_BATCH_MAX, min_value=1
+                ),
+            )
+
+        # Spatial index over the configured cells for nearest-cell fallbacks
+        self._nearest_cell_index: Optional[NearestCellIndex] = None
+        self._nearest_cell_source: Optional[dict] = None
+
     def _now(self) -> datetime:
         if self._clock is not None:
             return self._clock()
@@ -551,32 +588,21 @@ class HandoverEngine:
                 return None
         
         # Make remote ML HTTP call (this is the slow part)
+        if self._predict_batcher is not None:
+            return self._predict_remote_batched(ue_id, ue_data, logger)
+
         url = f"{self.ml_service_url.rstrip('/')}/api/predict-with-qos"
         try:
             logger.debug("HandoverEngine POST to ML URL: %s", url)
             logger.debug("HandoverEngine UE payload: %s", ue_data)
-            
-            headers = self._get_ml_headers()
-            
-            def _post_with_optional_headers(auth_headers):
-                kwargs = {"json": ue_data, "timeout": self.http_timeout}
-                if auth_headers:
-                    kwargs["headers"] = auth_headers
-                try:
-                    return requests.post(url, **kwargs)
-                except TypeError as exc:
-                    if auth_headers and "headers" in str(exc):
-                        return requests.post(url, json=ue_data, timeout=self.http_timeout)
-                    raise
-            
-            resp = _post_with_optional_headers(headers)
+
+            started = time.perf_counter()
+            resp = self._post_ml(url, ue_data, timeout=self.http_timeout)
+            metrics.ML_PREDICT_LATENCY.labels(mode="single").observe(
+                time.perf_counter() - started
+            )
             status = getattr(resp, "status_code", None)
-            if status == 401 and headers:
-                headers = self._get_ml_headers(force_refresh=True)
-                if headers:
-                    resp = _post_with_optional_headers(headers)
-                    status = getattr(resp, "status_code", None)
-            
+
             if status is not None and 400 <= status < 600:
                 category = "ml_http_4xx" if status < 500 else "ml_http_5xx"
                 self._last_ml_error_reason = category
@@ -600,6 +626,97 @@ class HandoverEngine:
                 self._last_ml_error_reason = "ml_service_unavailable"
             logger.exception("Remote ML request failed", exc_info=exc)
             return None
+
+    def _predict_remote_batched(self, ue_id: str, ue_data: dict, logger) -> Optional[dict]:
+        """Resolve ``ue_data`` through the micro-batcher (``/api/predict-batch``)."""
+        try:
+            data = self._predict_batcher.submit(ue_data)
+        except MLServiceStatusError as exc:
+            self._last_ml_error_reason = "ml_http_4xx" if exc.status < 500 else "ml_http_5xx"
+            self._last_ml_http_status = exc.status
+            logger.warning("ML service returned status %s for UE %s", exc.status, ue_id)
+            return None
+        except RequestException as exc:
+            self._last_ml_error_reason = "ml_service_unavailable"
+            logger.exception("Remote ML batch request failed", exc_info=exc)
+            return None
+        except Exception as exc:
+            self._last_ml_error_reason = "ml_service_unavailable"
+            logger.exception("Remote ML batch request failed", exc_info=exc)
+            return None
+        if not isinstance(data, dict):
+            self._last_ml_error_reason = "ml_invalid_response"
+            return None
+        return _ml_result_from_response(data, source="ml_remote")
+
+    def _send_prediction_batch(self, payloads: list[dict]) -> list[Any]:
+        """Post ``payloads`` to ``/api/predict-batch`` and return the predictions."""
+        url = f"{self.ml_service_url.rstrip('/')}/api/predict-batch"
+        metrics.ML_PREDICT_BATCH_SIZE.observe(len(payloads))
+        started = time.perf_counter()
+        resp = self._post_ml(url, payloads, timeout=self.http_timeout)
+        metrics.ML_PREDICT_LATENCY.labels(mode="batch").observe(time.perf_counter() - started)
+        status = getattr(resp, "status_code", None)
+        if status is not None and 400 <= status < 600:
+            raise MLServiceStatusError(status)
+        resp.raise_for_status()
+        data = resp.json()
+        predictions = data.get("predictions") if isinstance(data, dict) else None
+        if not isinstance(predictions, list):
+            raise ValueError("ML batch response is missing 'predictions'")
+        return predictions
+
+    # ------------------------------------------------------------------
+    # ML service transport
+    # ------------------------------------------------------------------
+
+    def _http_post(self, url: str, **kwargs):
+        """POST through the pooled keep-alive session when it is enabled."""
+        if not self.http_keepalive:
+            return requests.post(url, **kwargs)
+        session = self._http_session
+        if session is None:
+            with self._http_session_lock:
+                session = self._http_session
+                if session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.http_pool_size,
+                        pool_maxsize=self.http_pool_size,
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._http_session = session
+        return session.post(url, **kwargs)
+
+    def _post_ml(self, url: str, payload: Any, *, timeout: float):
+        """POST an authenticated ML request, re-authenticating once on 401."""
+        headers = self._get_ml_headers()
+
+        def _post_with_optional_headers(auth_headers):
+            kwargs = {"json": payload, "timeout": timeout}
+            if auth_headers:
+                kwargs["headers"] = auth_headers
+            try:
+                return self._http_post(url, **kwargs)
+            except TypeError as exc:
+                if auth_headers and "headers" in str(exc):
+                    return self._http_post(url, json=payload, timeout=timeout)
+                raise
+
+        resp = _post_with_optional_headers(headers)
+        if getattr(resp, "status_code", None) == 401 and headers:
+            headers = self._get_ml_headers(force_refresh=True)
+            if headers:
+                resp = _post_with_optional_headers(headers)
+        return resp
+
+    def close(self) -> None:
+        """Release pooled ML service connections."""
+        with self._http_session_lock:
+            session, self._http_session = self._http_session, None
+        if session is not None:
+            session.close()
     
     def _select_rule_with_features(self, ue_id: str, fv: dict, now: Optional[datetime] = None) -> Optional[str]:
         """Make A3 rule decision using pre-computed features with per-UE TTT tracking.
@@ -796,7 +913,7 @@ class HandoverEngine:
             "password": self._ml_password,
         }
         try:
-            resp = requests.post(login_url, json=payload, timeout=self.http_timeout)
+            resp = self._http_post(login_url, json=payload, timeout=self.http_timeout)
             resp.raise_for_status()
             data = resp.json()
         except Exception as exc:  # noqa: BLE001
@@ -812,7 +929,7 @@ class HandoverEngine:
         refresh_url = f"{self.ml_service_url.rstrip('/')}/api/refresh"
         payload = {"refresh_token": self._ml_refresh_token}
         try:
-            resp = requests.post(refresh_url, json=payload, timeout=self.http_timeout)
+            resp = self._http_post(refresh_url, json=payload, timeout=self.http_timeout)
             resp.raise_for_status()
             data = resp.json()
         except Exception as exc:  # noqa: BLE001
@@ -1302,18 +1419,7 @@ class HandoverEngine:
         endpoint = f"{self.ml_service_url.rstrip('/')}/api/qos-feedback"
         try:
             self.logger.debug("Posting QoS feedback to %s: %s", endpoint, payload)
-            headers = self._get_ml_headers()
-            request_kwargs = {"json": payload, "timeout": self.feedback_timeout}
-            if headers:
-                request_kwargs["headers"] = headers
-            response = requests.post(endpoint, **request_kwargs)
-            status = getattr(response, "status_code", None)
-            if status == 401 and headers:
-                headers = self._get_ml_headers(force_refresh=True)
-                if headers:
-                    response = requests.post(
-                        endpoint, json=payload, headers=headers, timeout=self.feedback_timeout
-                    )
+            response = self._post_ml(endpoint, payload, timeout=self.feedback_timeout)
             response.raise_for_status()
         except Exception as exc:  # noqa: BLE001
             self.logger.warning("QoS feedback POST failed: %s", exc)
@@ -1331,22 +1437,17 @@ class HandoverEngine:
             return None
         
         cell_configs = _get_cell_configs()
-        
-        nearest_cell = None
-        min_distance = float('inf')
-        
-        for antenna_id, config in cell_configs.items():
-            try:
-                distance = _cell_distance(
-                    ue_position[0], ue_position[1],
-                    config["latitude"], config["longitude"]
-                )
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_cell = antenna_id
-            except (KeyError, TypeError, ValueError) as exc:
-                self.logger.debug("Failed to compute distance to %s: %s", antenna_id, exc)
-                continue
-        
-        return nearest_cell
+        index = self._nearest_cell_index
+        if index is None or self._nearest_cell_source is not cell_configs:
+            # The configs are a module-level constant, so the index is only
+            # rebuilt when a different mapping is returned.
+            index = NearestCellIndex(cell_configs, _cell_distance)
+            self._nearest_cell_index = index
+            self._nearest_cell_source = cell_configs
+
+        try:
+            hit = index.nearest(float(ue_position[0]), float(ue_position[1]))
+        except (TypeError, ValueError) as exc:
+            self.logger.debug("Failed to compute nearest cell for %s: %s", ue_position, exc)
+            return None
+        return hit[0] if hit else None
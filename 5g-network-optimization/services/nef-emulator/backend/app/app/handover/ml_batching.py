@@ -0,0 +1,101 @@
+"""Coalesce concurrent ML prediction requests into multi-UE batches.
+
+With ``ML_PREDICT_BATCH_WINDOW_MS`` set, :class:`HandoverEngine` hands each
+remote prediction payload to a :class:`PredictionBatcher` instead of posting
+it on its own.  The first caller of a window becomes its leader: it waits for
+the window to elapse (or for the batch to fill up), sends every pending
+payload in one request and hands each caller its own result.  Callers block
+until their result is available, so the engine code path stays synchronous.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, List, Sequence
+
+
+class _PendingPrediction:
+    __slots__ = ("payload", "result", "error", "done")
+
+    def __init__(self, payload: dict) -> None:
+        self.payload = payload
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.done = threading.Event()
+
+
+class PredictionBatcher:
+    """Group prediction payloads submitted within ``window_s`` of each other.
+
+    Parameters
+    ----------
+    send:
+        Callable taking a list of payloads and returning one result per
+        payload, in order. An exception is re-raised in every caller of the
+        batch.
+    window_s:
+        How long the leader of a batch waits for more payloads.
+    max_batch:
+        Flush as soon as this many payloads are pending.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[dict]], Sequence[Any]],
+        *,
+        window_s: float,
+        max_batch: int,
+    ) -> None:
+        self.send = send
+        self.window_s = max(0.0, float(window_s))
+        self.max_batch = max(1, int(max_batch))
+        self._lock = threading.Lock()
+        self._pending: List[_PendingPrediction] = []
+
+    def submit(self, payload: dict) -> Any:
+        """Return the result for ``payload`` once its batch has been sent."""
+        item = _PendingPrediction(payload)
+        with self._lock:
+            batch = self._pending
+            batch.append(item)
+            leader = len(batch) == 1
+            full = len(batch) >= self.max_batch
+            if full:
+                self._pending = []
+
+        if full:
+            self._flush(batch)
+        elif leader:
+            time.sleep(self.window_s)
+            with self._lock:
+                # A caller that filled the batch up has already sent it.
+                mine = self._pending is batch
+                if mine:
+                    self._pending = []
+            if mine:
+                self._flush(batch)
+
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def _flush(self, batch: List[_PendingPrediction]) -> None:
+        try:
+            results = list(self.send([item.payload for item in batch]))
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"batch prediction returned {len(results)} results for {len(batch)} payloads"
+                )
+        except BaseException as exc:  # noqa: BLE001 - surfaced to every caller
+            for item in batch:
+                item.error = exc
+                item.done.set()
+            return
+        for item, result in zip(batch, results):
+            item.result = result
+            item.done.set()
+
+
+__all__ = ["PredictionBatcher"]
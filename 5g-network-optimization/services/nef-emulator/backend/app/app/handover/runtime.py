@@ -14,9 +14,10 @@ import math
 import os
 import threading
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from app.core.env_utils import parse_env_float, parse_env_int
+from app.core.spatial_index import CellCoverageIndex
 
 RF_MODEL_FALLBACK = False
 try:  # pragma: no cover - import behavior is exercised in container smoke tests
@@ -68,6 +69,8 @@ DEFAULT_TX_POWER_DBM = parse_env_float("DEFAULT_TX_POWER_DBM", 40.0)
 RF_RANDOM_SEED = parse_env_int("RF_RANDOM_SEED", 0)
 THESIS_RF_STRICT = os.getenv("THESIS_RF_STRICT", "0").lower() in {"1", "true", "yes"}
 TRAJECTORY_LIMIT = parse_env_int("TRAJECTORY_LIMIT", 900)  # ~15 minutes of 1 Hz samples
+# Distinct cell layouts (e.g. one per owner) whose coverage index is kept.
+MAX_COVERAGE_INDEXES = 16
 
 # Speed mapping constants (m/s)
 HIGH_SPEED_MPS = parse_env_float("HIGH_SPEED_MPS", 10.0)  # Vehicular speed
@@ -91,6 +94,7 @@ class HandoverRuntime:
         self._ref_lon: Optional[float] = None
         self._cells_by_key: Dict[str, dict] = {}
         self._cells_by_alias: Dict[str, str] = {}
+        self._coverage_indexes: Dict[tuple, CellCoverageIndex] = {}
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = True
@@ -189,12 +193,34 @@ class HandoverRuntime:
                     after_aliases - before_aliases,
                 )
             self.state_manager.register_cell_lookup(self.get_cell_by_key)
+            self.coverage_index(cells_list)
             self.logger.info(
                 "ensure_topology complete; antenna_list_size=%d aliases=%d",
                 len(self.state_manager.antenna_list),
                 len(self._cells_by_alias),
             )
 
+    def coverage_index(self, cells: Iterable[dict]) -> CellCoverageIndex:
+        """Covering-cell index for ``cells``, built once per distinct layout.
+
+        The returned object can be passed to ``check_distance`` in place of
+        the cell list. Indexes are keyed by each cell's id and geometry, so a
+        cell that moves or changes radius gets a fresh index.
+        """
+        cells_list: List[dict] = list(cells)
+        key = tuple(
+            (cell.get("id"), cell.get("latitude"), cell.get("longitude"), cell.get("radius"))
+            for cell in cells_list
+        )
+        with self._lock:
+            index = self._coverage_indexes.get(key)
+            if index is None:
+                if len(self._coverage_indexes) >= MAX_COVERAGE_INDEXES:
+                    self._coverage_indexes.clear()
+                index = CellCoverageIndex(cells_list)
+                self._coverage_indexes[key] = index
+            return index
+
     def rf_provenance(self) -> dict:
         antennas = list(self.state_manager.antenna_list.values())
         model = antennas[0] if antennas else None
@@ -214,11 +240,13 @@ class HandoverRuntime:
         with self._lock:
             self.state_manager.antenna_list.clear()
             self.state_manager.ue_states.clear()
+            self.state_manager.reset_serving_loads()
             self.state_manager.handover_history.clear()
             if hasattr(self.state_manager, "_antenna_aliases"):
                 self.state_manager._antenna_aliases.clear()
             self._cells_by_key.clear()
             self._cells_by_alias.clear()
+            self._coverage_indexes.clear()
             self._ref_lat = None
             self._ref_lon = None
             # Clear per-UE TTT timers to avoid stale state
@@ -277,13 +305,14 @@ class HandoverRuntime:
                     "trajectory": [],
                 }
                 if conn_key is None and self.state_manager.antenna_list:
-                    ue_state["connected_to"] = next(iter(self.state_manager.antenna_list))
+                    conn_key = next(iter(self.state_manager.antenna_list))
                 self.state_manager.ue_states[supi] = ue_state
+                self.state_manager.set_serving_cell(supi, conn_key)
             else:
                 ue_state["position"] = position
                 ue_state["speed"] = speed
                 if conn_key is not None:
-                    ue_state["connected_to"] = conn_key
+                    self.state_manager.set_serving_cell(supi, conn_key)
 
             traj = ue_state.setdefault("trajectory", [])
             traj.append({
@@ -295,6 +324,11 @@ class HandoverRuntime:
 
             return ue_state.get("connected_to"), position
 
+    def remove_ue_state(self, supi: str) -> None:
+        """Drop a UE from the runtime, releasing its serving-cell load."""
+        with self._lock:
+            self.state_manager.remove_ue(supi)
+
     def set_ue_profile(self, supi: str, profile: dict) -> None:
         with self._lock:
             state = self.state_manager.ue_states.get(supi)
@@ -328,6 +362,21 @@ class HandoverRuntime:
             if state is not None:
                 state["movement_provenance"] = dict(provenance)
 
+    def feature_vectors(self, supis: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        """Feature vectors for the known UEs in ``supis`` from one RF pass.
+
+        ``None`` selects every UE currently tracked. The UE set and all
+        vectors are read under a single lock acquisition, so the result is
+        one consistent snapshot. Unknown UEs are skipped so a UE removed
+        mid-tick does not fail the whole batch.
+        """
+        with self._lock:
+            if supis is None:
+                known = list(self.state_manager.ue_states)
+            else:
+                known = [supi for supi in supis if supi in self.state_manager.ue_states]
+            return self.state_manager.get_feature_vectors(known)
+
     # ------------------------------------------------------------------
     # Decision helpers
     # ------------------------------------------------------------------
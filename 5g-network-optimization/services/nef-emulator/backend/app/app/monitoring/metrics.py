@@ -48,3 +48,20 @@ REQUEST_DURATION = Histogram(
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
     registry=REGISTRY
 )
+
+# Round-trip time of prediction calls to the ML service (single or batched)
+ML_PREDICT_LATENCY = Histogram(
+    'nef_ml_predict_latency_seconds',
+    'ML service prediction request latency in seconds',
+    ['mode'],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+    registry=REGISTRY,
+)
+
+# Number of UE payloads coalesced into each batched prediction request
+ML_PREDICT_BATCH_SIZE = Histogram(
+    'nef_ml_predict_batch_size',
+    'UE payloads per batched ML prediction request',
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+    registry=REGISTRY,
+)
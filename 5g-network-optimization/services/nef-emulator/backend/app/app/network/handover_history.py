@@ -0,0 +1,157 @@
+"""Bounded handover event history with a per-UE index.
+
+``NetworkStateManager`` used to keep every handover in one unbounded list and
+scan it on each feature-vector call to find one UE's events.  Over multi-hour
+campaigns both memory and per-decision latency grew without limit.
+
+``HandoverHistory`` keeps a small ring buffer per UE (O(1) append, O(k)
+lookup of the most recent events) plus exact per-UE totals, and a bounded
+window of the global event stream.  Events that fall out of the in-memory
+window are not lost when a sink is configured: every event is forwarded to
+the sink as it is recorded, e.g. ``JsonlHandoverSink`` which spills them to
+disk as JSON lines.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from ..core.env_utils import parse_env_int
+
+logger = logging.getLogger(__name__)
+
+HandoverSink = Callable[[Dict[str, Any]], None]
+
+
+class JsonlHandoverSink:
+    """Append handover events to a JSON-lines file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._handle = open(path, "a", encoding="utf-8", buffering=1)
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event, sort_keys=True, default=str)
+        with self._lock:
+            self._handle.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.close()
+
+
+class HandoverHistory:
+    """Per-UE indexed, bounded handover history.
+
+    The object keeps the small ``list`` surface the rest of the emulator
+    relied on (``append``, ``clear``, iteration, ``len`` and indexing over
+    the retained global window) so existing callers keep working.
+
+    Parameters
+    ----------
+    per_ue_limit:
+        Events retained per UE for ``recent``. Defaults to
+        ``HANDOVER_HISTORY_PER_UE`` or 32.
+    global_limit:
+        Events retained in the in-memory global window. Defaults to
+        ``HANDOVER_HISTORY_LIMIT`` or 10000.
+    sink:
+        Optional callable receiving every recorded event. Defaults to a
+        ``JsonlHandoverSink`` when ``HANDOVER_HISTORY_SPILL_PATH`` is set.
+    """
+
+    def __init__(
+        self,
+        per_ue_limit: Optional[int] = None,
+        global_limit: Optional[int] = None,
+        sink: Optional[HandoverSink] = None,
+    ) -> None:
+        if per_ue_limit is None:
+            per_ue_limit = parse_env_int("HANDOVER_HISTORY_PER_UE", 32, min_value=1)
+        if global_limit is None:
+            global_limit = parse_env_int("HANDOVER_HISTORY_LIMIT", 10000, min_value=1)
+        if sink is None:
+            spill_path = os.getenv("HANDOVER_HISTORY_SPILL_PATH")
+            if spill_path:
+                sink = JsonlHandoverSink(spill_path)
+        self.per_ue_limit = int(per_ue_limit)
+        self.global_limit = int(global_limit)
+        self.sink = sink
+        self._lock = threading.Lock()
+        self._by_ue: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._counts: Dict[str, int] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=self.global_limit)
+        self.total_events = 0
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Record one handover event."""
+        ue_id = event.get("ue_id")
+        with self._lock:
+            per_ue = self._by_ue.get(ue_id)
+            if per_ue is None:
+                per_ue = deque(maxlen=self.per_ue_limit)
+                self._by_ue[ue_id] = per_ue
+            per_ue.append(event)
+            self._counts[ue_id] = self._counts.get(ue_id, 0) + 1
+            self._recent.append(event)
+            self.total_events += 1
+        if self.sink is not None:
+            try:
+                self.sink(event)
+            except Exception:  # noqa: BLE001 - sinks must never break handovers
+                logger.exception("Handover history sink failed")
+
+    def recent(self, ue_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` most recent events of ``ue_id`` (oldest first)."""
+        with self._lock:
+            per_ue = self._by_ue.get(ue_id)
+            if not per_ue:
+                return []
+            if limit is None or limit >= len(per_ue):
+                return list(per_ue)
+            if limit <= 0:
+                return []
+            return [per_ue[idx] for idx in range(len(per_ue) - limit, len(per_ue))]
+
+    def last(self, ue_id: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent event of ``ue_id``."""
+        with self._lock:
+            per_ue = self._by_ue.get(ue_id)
+            return per_ue[-1] if per_ue else None
+
+    def count(self, ue_id: str) -> int:
+        """Return the total number of handovers recorded for ``ue_id``."""
+        return self._counts.get(ue_id, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_ue.clear()
+            self._counts.clear()
+            self._recent.clear()
+            self.total_events = 0
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            snapshot = list(self._recent)
+        return iter(snapshot)
+
+    def __getitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._recent)[index]
+            return self._recent[index]
+
+
+__all__ = ["HandoverHistory", "HandoverSink", "JsonlHandoverSink"]
@@ -6,9 +6,12 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from ..core.env_utils import parse_env_float, parse_env_int
+from ..core.env_utils import parse_env_bool, parse_env_float, parse_env_int
+from ..core.spatial_index import PRUNE_MARGIN, GridIndex
 from ..monitoring import QoSMonitor
 from ..simulation.qos_simulator import QoSSimulator
+from .handover_history import HandoverHistory
+from .rf_engine import VectorizedRFEngine, topology_signature
 
 
 class NetworkStateManager:
@@ -36,7 +39,8 @@ class NetworkStateManager:
         # 'connected_to': ant_id, 'trajectory': [...]}
         self.antenna_list = {}  # ant_id -> AntennaModel instance
         self._antenna_aliases: Dict[str, str] = {}
-        self.handover_history = []  # list of {ue_id, from, to, timestamp}
+        # {ue_id, from, to, timestamp} events, indexed per UE and bounded
+        self.handover_history = HandoverHistory()
         self.logger = logging.getLogger("NetworkStateManager")
         self.logger.setLevel(logging.INFO)
         self.logger.propagate = True
@@ -51,6 +55,40 @@ class NetworkStateManager:
         self.qos_monitor = QoSMonitor()
         self.qos_simulator = QoSSimulator()
         self._cell_lookup = None
+        self._rf_engine: Optional[VectorizedRFEngine] = None
+        self._rf_engine_signature: Optional[tuple] = None
+        # Planar grid of antenna coverage discs for ``_visible_antenna_ids``,
+        # rebuilt with the RF engine or when a new cell lookup is registered.
+        self._visibility: Optional[Dict[str, Any]] = None
+
+        # Serving-cell load counters, maintained incrementally by
+        # ``set_serving_cell``/``remove_ue`` instead of rescanning every UE
+        # on each feature-vector call. They are rebuilt lazily when the
+        # topology, the alias table or the ``ue_states`` mapping is replaced.
+        self._serving_counts: Dict[str, int] = {}
+        self._serving_assignment: Dict[str, Optional[str]] = {}
+        self._loads_ue_states: Optional[dict] = None
+        self._loads_signature: Optional[tuple] = None
+        self._loads_dirty = True
+        self.verify_load_counters = parse_env_bool("NEF_VERIFY_LOAD_COUNTERS", False)
+
+    def rf_engine(self) -> VectorizedRFEngine:
+        """Return the vectorised RF engine for the current antenna topology.
+
+        The engine is rebuilt whenever antennas are added, removed or
+        replaced, so callers can keep mutating ``antenna_list`` directly.
+        """
+        signature = topology_signature(
+            self.antenna_list, self.noise_floor_dbm, self.resource_blocks
+        )
+        if self._rf_engine is None or signature != self._rf_engine_signature:
+            self._rf_engine = VectorizedRFEngine(
+                self.antenna_list,
+                noise_floor_dbm=self.noise_floor_dbm,
+                resource_blocks=self.resource_blocks,
+            )
+            self._rf_engine_signature = signature
+        return self._rf_engine
 
     def get_feature_vector(self, ue_id, *, simulate_qos: bool = True):
         """
@@ -59,70 +97,45 @@ class NetworkStateManager:
         state = self.ue_states.get(ue_id)
         if not state:
             raise KeyError(f"UE {ue_id} not found")
+        measurements = self.rf_engine().evaluate_one(state["position"])
+        return self._assemble_feature_vector(
+            ue_id, state, measurements, simulate_qos=simulate_qos
+        )
+
+    def get_feature_vectors(self, ue_ids, *, simulate_qos: bool = True):
+        """Return feature vectors for several UEs from one batched RF pass.
 
+        The radio metrics of all requested UEs are evaluated in a single
+        ``VectorizedRFEngine.evaluate`` call; everything else matches
+        :meth:`get_feature_vector`. Unknown UEs raise ``KeyError``.
+        """
+        states = []
+        for ue_id in ue_ids:
+            state = self.ue_states.get(ue_id)
+            if not state:
+                raise KeyError(f"UE {ue_id} not found")
+            states.append((ue_id, state))
+        if not states:
+            return {}
+        batch = self.rf_engine().evaluate([state["position"] for _, state in states])
+        return {
+            ue_id: self._assemble_feature_vector(
+                ue_id, state, batch.row(idx), simulate_qos=simulate_qos
+            )
+            for idx, (ue_id, state) in enumerate(states)
+        }
+
+    def _assemble_feature_vector(self, ue_id, state, measurements, *, simulate_qos: bool):
         x, y, z = state["position"]
         speed = state.get("speed", 0.0)
         connected = self.resolve_antenna_id(state.get("connected_to"))
-        state["connected_to"] = connected
+        if connected != state.get("connected_to"):
+            self.set_serving_cell(ue_id, connected)
 
         visible_ids = self._visible_antenna_ids(state["position"], connected)
-        rsrp_dbm_all = {
-            ant_id: ant.rsrp_dbm(state["position"])
-            for ant_id, ant in self.antenna_list.items()
-        }
-        received_dbm_all = {
-            ant_id: (
-                ant.received_power_dbm(state["position"])
-                if hasattr(ant, "received_power_dbm")
-                else rsrp_dbm_all[ant_id]
-            )
-            for ant_id, ant in self.antenna_list.items()
-        }
-        received_mw_all = {
-            aid: 10 ** (dbm / 10.0) for aid, dbm in received_dbm_all.items()
-        }
-        rsrp_dbm = {aid: rsrp_dbm_all[aid] for aid in visible_ids}
-
-        # Compute per-antenna SINR and RSRQ
-        neighbor_sinrs = {}
-        neighbor_rsrqs = {}
-        for aid in visible_ids:
-            antenna = self.antenna_list[aid]
-            sig = received_mw_all[aid]
-            reuse_group = getattr(antenna, "frequency_reuse_group", 1)
-            carrier = getattr(antenna, "frequency_hz", getattr(antenna, "fc", None))
-            interf = sum(
-                power
-                for other, power in received_mw_all.items()
-                if other != aid
-                and getattr(self.antenna_list[other], "frequency_reuse_group", 1)
-                == reuse_group
-                and getattr(
-                    self.antenna_list[other],
-                    "frequency_hz",
-                    getattr(self.antenna_list[other], "fc", None),
-                )
-                == carrier
-            )
-            noise_dbm = (
-                antenna.thermal_noise_dbm()
-                if hasattr(antenna, "thermal_noise_dbm")
-                else self.noise_floor_dbm
-            )
-            noise_mw = 10 ** (noise_dbm / 10.0)
-            denom = noise_mw + interf
-            lin = sig / denom if denom > 0 else 0.0
-            neighbor_sinrs[aid] = (
-                10 * math.log10(lin) if lin > 0 else -float("inf")
-            )
-
-            rssi = sig + denom
-            rsrp_mw = 10 ** (rsrp_dbm[aid] / 10.0)
-            resource_blocks = getattr(antenna, "resource_blocks", self.resource_blocks)
-            rsrq_lin = (resource_blocks * rsrp_mw) / rssi if rssi > 0 else 0.0
-            neighbor_rsrqs[aid] = (
-                10 * math.log10(rsrq_lin) if rsrq_lin > 0 else -float("inf")
-            )
+        rsrp_dbm = {aid: measurements["rsrp_dbm"][aid] for aid in visible_ids}
+        neighbor_sinrs = {aid: measurements["sinr_db"][aid] for aid in visible_ids}
+        neighbor_rsrqs = {aid: measurements["rsrq_db"][aid] for aid in visible_ids}
 
         # Order neighbors by RSRP strength
         ordered = sorted(rsrp_dbm.items(), key=lambda x: x[1], reverse=True)
@@ -130,15 +143,9 @@ class NetworkStateManager:
         neighbor_sinrs = {aid: neighbor_sinrs[aid] for aid, _ in ordered}
         neighbor_rsrqs = {aid: neighbor_rsrqs[aid] for aid, _ in ordered}
 
-        # Calculate current load per antenna as number of connected UEs
-        antenna_loads = {aid: 0 for aid in self.antenna_list}
-        for u_state in self.ue_states.values():
-            conn = self.resolve_antenna_id(u_state.get("connected_to"))
-            if conn != u_state.get("connected_to"):
-                u_state["connected_to"] = conn
-            if conn in antenna_loads:
-                antenna_loads[conn] += 1
-        antenna_loads = {aid: antenna_loads[aid] for aid, _ in ordered}
+        # Current load per antenna as number of connected UEs
+        serving_counts = self._serving_loads()
+        antenna_loads = {aid: serving_counts.get(aid, 0) for aid, _ in ordered}
 
         features: Dict[str, object] = {
             "ue_id": ue_id,
@@ -194,6 +201,104 @@ class NetworkStateManager:
             features["observed_qos"] = observed_qos
         return features
 
+    # ------------------------------------------------------------------
+    # Serving-cell load counters
+    # ------------------------------------------------------------------
+    def set_serving_cell(self, ue_id, antenna_id) -> Optional[str]:
+        """Attach ``ue_id`` to ``antenna_id`` and update the load counters."""
+        state = self.ue_states.get(ue_id)
+        if state is None:
+            raise KeyError(f"UE {ue_id} not found")
+        resolved = self.resolve_antenna_id(antenna_id)
+        state["connected_to"] = resolved
+        if self._loads_dirty or self._loads_ue_states is not self.ue_states:
+            return resolved
+        if ue_id in self._serving_assignment:
+            self._decrement_load(self._serving_assignment[ue_id])
+        self._serving_assignment[ue_id] = resolved
+        if resolved is not None:
+            self._serving_counts[resolved] = self._serving_counts.get(resolved, 0) + 1
+        return resolved
+
+    def remove_ue(self, ue_id) -> Optional[dict]:
+        """Forget ``ue_id`` and release its serving-cell load."""
+        state = self.ue_states.pop(ue_id, None)
+        if (
+            not self._loads_dirty
+            and self._loads_ue_states is self.ue_states
+            and ue_id in self._serving_assignment
+        ):
+            self._decrement_load(self._serving_assignment.pop(ue_id))
+        return state
+
+    def reset_serving_loads(self) -> None:
+        """Drop the load counters; they are recounted on next use."""
+        self._serving_counts.clear()
+        self._serving_assignment.clear()
+        self._loads_dirty = True
+
+    def get_serving_loads(self) -> Dict[str, int]:
+        """Return the number of UEs served by each known antenna."""
+        counts = self._serving_loads()
+        return {aid: counts.get(aid, 0) for aid in self.antenna_list}
+
+    def verify_serving_loads(self) -> Dict[str, tuple]:
+        """Compare the incremental counters against a full recount.
+
+        Returns ``{antenna_id: (counted, recounted)}`` for every mismatch and
+        repairs the counters when any is found. Intended for debugging; it is
+        run on every feature vector when ``NEF_VERIFY_LOAD_COUNTERS`` is set.
+        """
+        recount: Dict[str, int] = {}
+        for state in self.ue_states.values():
+            conn = self.resolve_antenna_id(state.get("connected_to"))
+            if conn is not None:
+                recount[conn] = recount.get(conn, 0) + 1
+        mismatches = {
+            aid: (self._serving_counts.get(aid, 0), recount.get(aid, 0))
+            for aid in set(recount) | set(self._serving_counts)
+            if self._serving_counts.get(aid, 0) != recount.get(aid, 0)
+        }
+        if mismatches:
+            self.logger.warning("Serving load counters out of sync: %s", mismatches)
+            self._rebuild_serving_loads()
+        return mismatches
+
+    def _decrement_load(self, antenna_id: Optional[str]) -> None:
+        if antenna_id is None:
+            return
+        remaining = self._serving_counts.get(antenna_id, 0) - 1
+        if remaining > 0:
+            self._serving_counts[antenna_id] = remaining
+        else:
+            self._serving_counts.pop(antenna_id, None)
+
+    def _rebuild_serving_loads(self) -> None:
+        self._serving_counts = {}
+        self._serving_assignment = {}
+        for ue_id, state in self.ue_states.items():
+            conn = self.resolve_antenna_id(state.get("connected_to"))
+            if conn != state.get("connected_to"):
+                state["connected_to"] = conn
+            self._serving_assignment[ue_id] = conn
+            if conn is not None:
+                self._serving_counts[conn] = self._serving_counts.get(conn, 0) + 1
+        self._loads_ue_states = self.ue_states
+        self._loads_signature = self._rf_engine_signature
+        self._loads_dirty = False
+
+    def _serving_loads(self) -> Dict[str, int]:
+        if (
+            self._loads_dirty
+            or self._loads_ue_states is not self.ue_states
+            or self._loads_signature is not self._rf_engine_signature
+            or len(self._serving_assignment) != len(self.ue_states)
+        ):
+            self._rebuild_serving_loads()
+        elif self.verify_load_counters:
+            self.verify_serving_loads()
+        return self._serving_counts
+
     def _visible_antenna_ids(self, position, connected: Optional[str]) -> list[str]:
         if os.getenv("THESIS_TRACE_ALL_CELLS", "0").lower() in {
             "1",
@@ -201,17 +306,54 @@ class NetworkStateManager:
             "yes",
         }:
             return list(self.antenna_list)
-        visible: list[str] = []
-        for ant_id, antenna in self.antenna_list.items():
+        index = self._visibility_index()
+        px, py = float(position[0]), float(position[1])
+        orders = set(index["always"])
+        discs = index["discs"]
+        for slot in index["grid"].within_box((px, py, 0.0), index["max_radius"] + PRUNE_MARGIN):
+            order, ax, ay, radius = discs[slot]
+            if math.dist((ax, ay), (px, py)) <= radius:
+                orders.add(order)
+        connected_order = index["order"].get(connected)
+        if connected_order is not None:
+            orders.add(connected_order)
+        ids = index["ids"]
+        return [ids[order] for order in sorted(orders)]
+
+    def _visibility_index(self) -> Dict[str, Any]:
+        index = self._visibility
+        if (
+            index is not None
+            and index["signature"] is self._rf_engine_signature
+            and len(index["ids"]) == len(self.antenna_list)
+        ):
+            return index
+        ids: list[str] = []
+        always: list[int] = []
+        discs: list[tuple] = []
+        for order, (ant_id, antenna) in enumerate(self.antenna_list.items()):
+            ids.append(ant_id)
             if not hasattr(antenna, "position"):
-                visible.append(ant_id)
+                always.append(order)
                 continue
             cell = self._cell_lookup(ant_id) if callable(self._cell_lookup) else None
             radius = float(cell.get("radius") or 0.0) if isinstance(cell, dict) else 0.0
-            distance_2d = math.dist(antenna.position[:2], position[:2])
-            if radius <= 0.0 or distance_2d <= radius or ant_id == connected:
-                visible.append(ant_id)
-        return visible
+            if radius <= 0.0:
+                always.append(order)
+                continue
+            discs.append((order, float(antenna.position[0]), float(antenna.position[1]), radius))
+        max_radius = max((disc[3] for disc in discs), default=0.0)
+        index = {
+            "signature": self._rf_engine_signature,
+            "ids": ids,
+            "order": {ant_id: order for order, ant_id in enumerate(ids)},
+            "always": always,
+            "discs": discs,
+            "max_radius": max_radius,
+            "grid": GridIndex([(disc[1], disc[2], 0.0) for disc in discs], bucket_size=max_radius),
+        }
+        self._visibility = index
+        return index
 
     def _rf_provenance(self) -> Dict[str, Any]:
         antennas = list(self.antenna_list.values())
@@ -348,14 +490,10 @@ class NetworkStateManager:
         return features
 
     def _handover_features(self, ue_id: str) -> Dict[str, Any]:
-        history = [
-            dict(event)
-            for event in self.handover_history
-            if event.get("ue_id") == ue_id
-        ]
+        history = [dict(event) for event in self.handover_history.recent(ue_id, 10)]
         features: Dict[str, Any] = {
-            "handover_count": len(history),
-            "handover_history": history[-10:],
+            "handover_count": self.handover_history.count(ue_id),
+            "handover_history": history,
         }
         if history:
             timestamp = self._timestamp_seconds(history[-1].get("timestamp"))
@@ -432,7 +570,7 @@ class NetworkStateManager:
             raise KeyError(f"UE {ue_id} not found")
         prev = self.resolve_antenna_id(state.get("connected_to"))
         if prev != state.get("connected_to"):
-            state["connected_to"] = prev
+            self.set_serving_cell(ue_id, prev)
 
         resolved_target = self.resolve_antenna_id(target_antenna_id)
         if resolved_target == prev:
@@ -445,7 +583,7 @@ class NetworkStateManager:
         # The A3 rule is evaluated by the HandoverEngine when machine learning
         # is disabled. NetworkStateManager simply applies the decision here.
 
-        state["connected_to"] = resolved_target
+        self.set_serving_cell(ue_id, resolved_target)
 
         ev = {
             "ue_id": ue_id,
@@ -463,6 +601,7 @@ class NetworkStateManager:
     def register_cell_lookup(self, lookup_fn):
         """Allow external runtimes to provide cell metadata lookup."""
         self._cell_lookup = lookup_fn
+        self._visibility = None
 
     def get_cell(self, cell_key):
         """Return cell metadata if a lookup hook has been registered."""
@@ -526,6 +665,7 @@ class NetworkStateManager:
 
         self._antenna_aliases[alias_key] = canonical_key
         self._antenna_aliases[alias_key.lower()] = canonical_key
+        self._loads_dirty = True
 
     def resolve_antenna_id(self, antenna_id: Optional[str]) -> Optional[str]:
         """Normalise antenna identifiers using registered aliases."""
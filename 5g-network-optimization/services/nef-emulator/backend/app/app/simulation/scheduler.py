@@ -0,0 +1,259 @@
+"""Single-threaded shared-tick scheduler for UE movement sessions.
+
+By default every moving UE runs its own OS thread that sleeps for
+``UE_MOVEMENT_INTERVAL_SECONDS`` between ticks.  With hundreds of UEs the
+threads contend on the runtime lock, each one evaluates the RF model for its
+own position only, and context switching dominates.
+
+``TickScheduler`` advances all registered sessions from one thread on a
+shared tick.  A session is a generator that yields phase markers:
+
+``NEED_FEATURES``
+    The UE has moved and wants its feature vector.  The scheduler collects
+    these requests from every session and answers them with one batched
+    ``feature_provider`` call; ``None`` is sent back when no vector could be
+    produced and the session computes its own.
+``TICK_DONE``
+    The session finished its work for this tick.  It is resumed on the next
+    tick (or immediately once a stop has been requested).
+
+The remainder of a tick after the feature vector (handover decision and
+monitoring callbacks, which may block on HTTP) runs on a bounded worker pool.
+A session whose previous tick is still running on the pool simply skips the
+current tick; movement is elapsed-time based so no distance is lost.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generator, Hashable, List, Optional, Union
+
+from ..core.env_utils import parse_env_bool, parse_env_float, parse_env_int
+
+logger = logging.getLogger(__name__)
+
+NEED_FEATURES = "need_features"
+TICK_DONE = "tick_done"
+
+FeatureProvider = Callable[[List[Hashable]], Dict[Hashable, Any]]
+Steps = Generator[str, Optional[dict], None]
+
+
+def scheduler_enabled() -> bool:
+    """Return whether ``UE_MOVEMENT_SCHEDULER`` selects the shared-tick mode."""
+    return parse_env_bool("UE_MOVEMENT_SCHEDULER", False)
+
+
+class ScheduledSession:
+    """Bookkeeping for one session registered with a :class:`TickScheduler`."""
+
+    def __init__(self, key: Hashable, steps: Steps) -> None:
+        self.key = key
+        self.steps = steps
+        self.started = False
+        self.busy = False
+        self.stop_requested = False
+        self.done = threading.Event()
+
+
+class TickScheduler:
+    """Advance movement sessions from a single thread on a shared tick.
+
+    Parameters
+    ----------
+    feature_provider:
+        Callable mapping a list of session keys to ``{key: feature_vector}``.
+        Called once per tick for every session waiting on ``NEED_FEATURES``.
+    interval_s:
+        Tick period in seconds, or a callable returning it (re-read every
+        tick). Defaults to ``UE_MOVEMENT_INTERVAL_SECONDS`` or 1.0.
+    max_workers:
+        Size of the pool finishing ticks. Defaults to ``UE_MOVEMENT_WORKERS``
+        or 8.
+    """
+
+    def __init__(
+        self,
+        feature_provider: FeatureProvider,
+        *,
+        interval_s: Union[float, Callable[[], float], None] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if interval_s is None:
+            def interval_s() -> float:
+                return parse_env_float("UE_MOVEMENT_INTERVAL_SECONDS", 1.0, min_value=0.1)
+        if max_workers is None:
+            max_workers = parse_env_int("UE_MOVEMENT_WORKERS", 8, min_value=1)
+        self.feature_provider = feature_provider
+        self._interval = interval_s
+        self.max_workers = int(max_workers)
+        self._sessions: Dict[Hashable, ScheduledSession] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def register(self, key: Hashable, steps: Steps) -> ScheduledSession:
+        """Schedule ``steps`` under ``key`` starting with the next tick."""
+        session = ScheduledSession(key, steps)
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("scheduler has been shut down")
+            self._sessions[key] = session
+            self._ensure_running()
+        return session
+
+    def request_stop(self, key: Hashable) -> None:
+        """Resume ``key`` as soon as it is idle instead of on the next tick."""
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                session.stop_requested = True
+        self._wake.set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _ensure_running(self) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ue-movement"
+            )
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="ue-movement-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop ticking. Registered sessions are closed without finishing."""
+        with self._lock:
+            self._shutdown = True
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        self._wake.set()
+        if self._thread is not None and wait:
+            self._thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+        for session in sessions:
+            if not session.busy:
+                session.steps.close()
+            session.done.set()
+
+    # ------------------------------------------------------------------
+    # Tick loop
+    # ------------------------------------------------------------------
+    def _interval_s(self) -> float:
+        return float(self._interval() if callable(self._interval) else self._interval)
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while not self._shutdown:
+            now = time.monotonic()
+            if now >= next_tick:
+                try:
+                    self.tick()
+                except Exception:  # noqa: BLE001 - keep the shared loop alive
+                    logger.exception("UE movement tick failed")
+                next_tick = now + self._interval_s()
+                continue
+            self._wake.wait(next_tick - now)
+            self._wake.clear()
+            self._finish_stopping()
+
+    def tick(self) -> None:
+        """Run one shared tick over every idle session."""
+        with self._lock:
+            sessions = [s for s in self._sessions.values() if not s.busy]
+            for session in sessions:
+                session.busy = True
+
+        waiting: List[ScheduledSession] = []
+        for session in sessions:
+            phase = self._advance(session, None)
+            if phase == NEED_FEATURES:
+                waiting.append(session)
+            else:
+                session.busy = False
+
+        if not waiting:
+            return
+        vectors = self._batch_features([s.key for s in waiting])
+        pool = self._pool
+        for session in waiting:
+            vector = vectors.get(session.key)
+            if pool is None:
+                self._complete_tick(session, vector)
+            else:
+                pool.submit(self._complete_tick, session, vector)
+
+    def _batch_features(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        try:
+            return self.feature_provider(keys) or {}
+        except Exception as exc:  # noqa: BLE001 - sessions fall back to their own lookup
+            logger.debug("Batched feature vectors unavailable (%s); falling back per UE", exc)
+            return {}
+
+    def _advance(self, session: ScheduledSession, value: Optional[dict]) -> Optional[str]:
+        """Resume ``session`` once; ``None`` means it has finished."""
+        try:
+            if not session.started:
+                session.started = True
+                return next(session.steps)
+            return session.steps.send(value)
+        except StopIteration:
+            self._retire(session)
+        except Exception:  # noqa: BLE001 - one broken UE must not stop the others
+            logger.exception("UE movement session %s failed", session.key)
+            self._retire(session)
+        return None
+
+    def _complete_tick(self, session: ScheduledSession, vector: Optional[dict]) -> None:
+        phase = self._advance(session, vector)
+        while phase == NEED_FEATURES:
+            phase = self._advance(session, None)
+        session.busy = False
+        if session.stop_requested and not session.done.is_set():
+            self._wake.set()
+
+    def _finish_stopping(self) -> None:
+        with self._lock:
+            stopping = [
+                s for s in self._sessions.values() if s.stop_requested and not s.busy
+            ]
+            for session in stopping:
+                session.busy = True
+        for session in stopping:
+            if self._pool is None:
+                self._run_to_end(session)
+            else:
+                self._pool.submit(self._run_to_end, session)
+
+    def _run_to_end(self, session: ScheduledSession) -> None:
+        while self._advance(session, None) is not None:
+            pass
+        session.busy = False
+
+    def _retire(self, session: ScheduledSession) -> None:
+        with self._lock:
+            if self._sessions.get(session.key) is session:
+                del self._sessions[session.key]
+        session.done.set()
+
+
+__all__ = [
+    "NEED_FEATURES",
+    "TICK_DONE",
+    "ScheduledSession",
+    "TickScheduler",
+    "scheduler_enabled",
+]
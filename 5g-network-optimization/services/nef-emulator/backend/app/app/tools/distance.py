@@ -20,12 +20,17 @@ def check_distance(UE_lat, UE_long, cells):
     Args:
         UE_lat: UE's latitude in degrees.
         UE_long: UE's longitude in degrees.
-        cells: List of cell dictionaries with 'latitude', 'longitude', 'radius' keys.
+        cells: List of cell dictionaries with 'latitude', 'longitude', 'radius' keys,
+            or a ``CellCoverageIndex`` built over such a list (same result, but
+            only nearby cells are measured).
     
     Returns:
         The closest cell dict if UE is within any cell's radius, None otherwise.
         Returns None when UE is outside all cell coverage areas (out of coverage).
     """
+    if hasattr(cells, "covering_cell"):
+        return cells.covering_cell(UE_lat, UE_long)
+
     current_cell = None      
     current_cell_dist = float("inf")
 
@@ -17,11 +17,16 @@ class TestClient(FastAPITestClient):
 class DummyStateManager:
     """Minimal stand-in for NetworkStateManager."""
 
+    ue_states = {"ue1": {}, "ue2": {}}
+
     def get_feature_vector(self, ue_id: str):
         if ue_id == "ue1":
             return {"ue_id": ue_id, "feature": 1}
         raise KeyError("UE not found")
 
+    def get_feature_vectors(self, ue_ids):
+        return {ue_id: {"ue_id": ue_id, "feature": 1} for ue_id in ue_ids}
+
 
 class DummyEngine:
     """Minimal stand-in for HandoverEngine."""
@@ -115,6 +120,22 @@ def test_get_state_not_found(client: TestClient) -> None:
     assert resp.status_code == 404
 
 
+def test_get_bulk_state_for_selected_ues(client: TestClient) -> None:
+    resp = client.get("/api/v1/ml/state?ue_id=ue2&ue_id=missing&ue_id=ue2")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "features": {"ue2": {"ue_id": "ue2", "feature": 1}},
+        "missing": ["missing"],
+    }
+
+
+def test_get_bulk_state_for_all_ues(client: TestClient) -> None:
+    resp = client.get("/api/v1/ml/state")
+    assert resp.status_code == 200
+    assert sorted(resp.json()["features"]) == ["ue1", "ue2"]
+    assert resp.json()["missing"] == []
+
+
 def test_handover_applied(client: TestClient) -> None:
     resp = client.post("/api/v1/ml/handover?ue_id=ue1")
     assert resp.status_code == 200
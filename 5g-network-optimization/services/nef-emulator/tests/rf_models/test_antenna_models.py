@@ -127,3 +127,51 @@ def test_rsrp_is_reference_power_and_noise_uses_bandwidth():
     position = (500.0, 0.0, 1.5)
     assert antenna.received_power_dbm(position, False) > antenna.rsrp_dbm(position, False)
     assert math.isclose(antenna.thermal_noise_dbm(), -87.0, abs_tol=0.01)
+
+
+def _hash_reference(antenna, position):
+    """Uncached SHA-256 derivation of the LOS flag and shadowing sample."""
+    import hashlib
+    import random
+
+    quantized = tuple(round(float(value) / 10.0) for value in position)
+    payload = f"{antenna.random_seed}:{antenna.ant_id}:los:{quantized}".encode()
+    uniform = int.from_bytes(hashlib.sha256(payload).digest()[:8], "big") / float(2**64)
+    los = uniform < antenna.los_probability
+    payload = f"{antenna.random_seed}:{antenna.ant_id}:shadow:{los}:{quantized}".encode()
+    seed = int.from_bytes(hashlib.sha256(payload).digest()[:8], "big")
+    sigma = antenna.shadow_fading_std_db if los else max(6.0, antenna.shadow_fading_std_db)
+    return los, random.Random(seed).gauss(0.0, sigma)
+
+
+def test_grid_cache_is_bit_identical_to_hash_derivation():
+    antenna = MacroCellModel(
+        "grid", (0.0, 0.0, 25.0), 3.5e9, 43.0, los_probability=0.5, random_seed=9
+    )
+    positions = [(x * 7.3, y * 11.9, 1.5) for x in range(-15, 15) for y in range(-5, 5)]
+
+    for _ in range(2):  # cold, then warm cache
+        for position in positions:
+            expected = _hash_reference(antenna, position)
+            assert antenna.los_and_shadowing(position) == expected
+            assert antenna._is_los(position) == expected[0]
+            assert antenna._shadow_fading_db(position, los=expected[0]) == expected[1]
+
+
+def test_grid_cache_is_bounded_with_lru_eviction():
+    antenna = MacroCellModel("grid", (0.0, 0.0, 25.0), 3.5e9, 43.0, grid_cache_size=4)
+    for x in range(6):
+        antenna.path_loss_db((x * 100.0, 0.0, 1.5), include_shadowing=True)
+    assert len(antenna._grid_cache) == 4
+    assert antenna._quantize((0.0, 0.0, 1.5)) not in antenna._grid_cache
+
+    antenna.path_loss_db((200.0, 0.0, 1.5))  # refresh, then push one more bin
+    antenna.path_loss_db((900.0, 0.0, 1.5))
+    assert antenna._quantize((200.0, 0.0, 1.5)) in antenna._grid_cache
+    assert antenna._quantize((300.0, 0.0, 1.5)) not in antenna._grid_cache
+
+    uncached = MacroCellModel("grid", (0.0, 0.0, 25.0), 3.5e9, 43.0, grid_cache_size=0)
+    assert uncached.path_loss_db((900.0, 0.0, 1.5), True) == antenna.path_loss_db(
+        (900.0, 0.0, 1.5), True
+    )
+    assert not uncached._grid_cache
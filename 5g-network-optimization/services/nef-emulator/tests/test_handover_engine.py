@@ -116,6 +116,45 @@ def test_ml_handover(monkeypatch):
     assert ev and ev["to"] == "B"
 
 
+def test_ml_handover_micro_batching_posts_to_batch_endpoint(monkeypatch):
+    calls = []
+
+    class DummyResp:
+        status_code = 200
+
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {
+                "predictions": [
+                    {"predicted_antenna": "B", "confidence": 0.9} for _ in self._payload
+                ]
+            }
+
+    def fake_post(url, json=None, timeout=None):
+        calls.append((url, json))
+        return DummyResp(json)
+
+    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setenv("ML_SERVICE_URL", "http://ml")
+    monkeypatch.setenv("ML_PREDICT_BATCH_WINDOW_MS", "1")
+
+    nsm = NetworkStateManager()
+    nsm.antenna_list = {"A": DummyAntenna(-80), "B": DummyAntenna(-76)}
+    nsm.ue_states = {"u1": {"position": (0, 0, 0), "connected_to": "A", "speed": 0.0}}
+
+    eng = HandoverEngine(nsm, use_ml=True, confidence_threshold=0.0)
+    ev = eng.decide_and_apply("u1")
+
+    assert ev and ev["to"] == "B"
+    assert calls[0][0] == "http://ml/api/predict-batch"
+    assert [payload["ue_id"] for payload in calls[0][1]] == ["u1"]
+
+
 def test_engine_mode_env(monkeypatch):
     """Environment variable should control ML mode when use_ml is None."""
 
@@ -0,0 +1,53 @@
+import json
+
+from backend.app.app.network.handover_history import HandoverHistory, JsonlHandoverSink
+from backend.app.app.network.state_manager import NetworkStateManager
+
+
+def _event(ue_id, idx):
+    return {"ue_id": ue_id, "from": f"c{idx}", "to": f"c{idx + 1}", "timestamp": f"t{idx}"}
+
+
+def test_per_ue_ring_buffer_is_bounded_but_counts_are_exact():
+    history = HandoverHistory(per_ue_limit=3, global_limit=4)
+    for idx in range(5):
+        history.append(_event("ue1", idx))
+    history.append(_event("ue2", 0))
+
+    assert history.count("ue1") == 5
+    assert [ev["from"] for ev in history.recent("ue1")] == ["c2", "c3", "c4"]
+    assert [ev["from"] for ev in history.recent("ue1", 2)] == ["c3", "c4"]
+    assert history.last("ue2")["ue_id"] == "ue2"
+    assert history.recent("missing") == []
+    assert len(history) == 4
+    assert history[-1]["ue_id"] == "ue2"
+    assert history.total_events == 6
+
+    history.clear()
+    assert history.count("ue1") == 0 and len(history) == 0
+
+
+def test_jsonl_sink_receives_every_event(tmp_path):
+    path = tmp_path / "spill" / "handovers.jsonl"
+    sink = JsonlHandoverSink(str(path))
+    history = HandoverHistory(per_ue_limit=1, global_limit=1, sink=sink)
+    for idx in range(3):
+        history.append(_event("ue1", idx))
+    sink.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["from"] for line in lines] == ["c0", "c1", "c2"]
+
+
+def test_feature_vector_uses_per_ue_index():
+    nsm = NetworkStateManager()
+    nsm.handover_history = HandoverHistory(per_ue_limit=10)
+    for idx in range(12):
+        nsm.handover_history.append(_event("ue1", idx))
+    nsm.handover_history.append(_event("ue2", 0))
+
+    features = nsm._handover_features("ue1")
+
+    assert features["handover_count"] == 12
+    assert len(features["handover_history"]) == 10
+    assert features["handover_history"][-1]["from"] == "c11"
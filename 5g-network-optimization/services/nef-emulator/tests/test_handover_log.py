@@ -0,0 +1,51 @@
+from backend.app.app.api.api_v1.state_manager import StateManager
+
+
+def _record(manager, ue_id, target):
+    manager.record_handover(ue_id, "cell-a", target, method="A3")
+
+
+def test_recent_handovers_are_newest_first_across_ues():
+    manager = StateManager()
+    for index, ue_id in enumerate(["ue1", "ue2", "ue1", "ue3"]):
+        _record(manager, ue_id, f"cell-{index}")
+
+    recent = manager.get_recent_handovers(limit=3)
+
+    assert [event["to"] for event in recent] == ["cell-3", "cell-2", "cell-1"]
+    assert [event["ue"] for event in recent] == ["ue3", "ue1", "ue2"]
+    assert manager.get_handover_stats()["handovers_by_ue"] == {"ue1": 2, "ue2": 1, "ue3": 1}
+
+
+def test_handovers_since_cursor_streams_incrementally():
+    manager = StateManager()
+    _record(manager, "ue1", "cell-b")
+    events, cursor = manager.get_handovers_since(0)
+    assert [event["to"] for event in events] == ["cell-b"]
+
+    _record(manager, "ue2", "cell-c")
+    _record(manager, "ue1", "cell-d")
+    events, cursor = manager.get_handovers_since(cursor)
+    assert [event["to"] for event in events] == ["cell-c", "cell-d"]
+    assert manager.get_handovers_since(cursor) == ([], cursor)
+
+    events, _ = manager.get_handovers_since(0, limit=1)
+    assert [event["to"] for event in events] == ["cell-d"]
+
+
+def test_log_is_bounded_but_counters_are_not(monkeypatch):
+    monkeypatch.setenv("NEF_HANDOVER_LOG_LIMIT", "2")
+    manager = StateManager()
+    for index in range(5):
+        _record(manager, "ue1", f"cell-{index}")
+
+    assert [event["to"] for event in manager.get_recent_handovers(limit=10)] == ["cell-4", "cell-3"]
+    events, cursor = manager.get_handovers_since(0)
+    assert [event["seq"] for event in events] == [4, 5]
+    assert cursor == 5
+    assert manager.get_handover_stats()["total_handovers"] == 5
+    assert manager.get_handover_stats()["handovers_by_ue"] == {"ue1": 5}
+
+    manager.reset_handover_stats()
+    assert manager.get_recent_handovers() == []
+    assert manager.get_handovers_since(cursor) == ([], cursor)
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+from backend.app.app.api.api_v1.state_manager import StateManager
+from backend.app.app.api.live_feed import BroadcastHub
+
+
+def test_publish_reaches_keyed_and_topic_wide_subscribers():
+    async def scenario():
+        hub = BroadcastHub()
+        with hub.subscribe("ue-metrics", key="ue1") as ue1, hub.subscribe("ue-metrics") as everyone:
+            assert hub.has_subscribers("ue-metrics", "ue1")
+            assert hub.has_subscribers("ue-metrics", "ue2")
+            assert hub.publish("ue-metrics", {"supi": "ue1"}, key="ue1") == 2
+            assert hub.publish("ue-metrics", {"supi": "ue2"}, key="ue2") == 1
+            assert await ue1.get() == {"supi": "ue1"}
+            assert [await everyone.get(), await everyone.get()] == [{"supi": "ue1"}, {"supi": "ue2"}]
+        assert not hub.has_subscribers("ue-metrics", "ue1")
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_drops_oldest_messages():
+    async def scenario():
+        hub = BroadcastHub(queue_size=2)
+        with hub.subscribe("handovers") as subscription:
+            for index in range(5):
+                hub.publish("handovers", index)
+            await asyncio.sleep(0)
+            assert subscription.dropped == 3
+            assert [await subscription.get(), await subscription.get()] == [3, 4]
+
+    asyncio.run(scenario())
+
+
+def test_publish_from_simulation_thread():
+    async def scenario():
+        hub = BroadcastHub()
+        with hub.subscribe("ue-metrics", key="ue1") as subscription:
+            worker = threading.Thread(target=hub.publish, args=("ue-metrics", {"tick": 1}, "ue1"))
+            worker.start()
+            worker.join()
+            assert await asyncio.wait_for(subscription.get(), timeout=1.0) == {"tick": 1}
+
+    asyncio.run(scenario())
+
+
+def test_state_manager_notifies_handover_listeners():
+    manager = StateManager()
+    events = []
+    manager.add_handover_listener(events.append)
+
+    manager.record_handover("ue1", "cell-a", "cell-b", method="ML", confidence=0.9)
+
+    assert len(events) == 1
+    assert events[0]["ue"] == "ue1"
+    assert events[0] == manager.get_recent_handovers(limit=1)[0]
@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from backend.app.app.handover.ml_batching import PredictionBatcher
+
+
+def _submit_concurrently(batcher, payloads):
+    results = {}
+    errors = {}
+
+    def worker(payload):
+        try:
+            results[payload["ue_id"]] = batcher.submit(payload)
+        except Exception as exc:  # noqa: BLE001
+            errors[payload["ue_id"]] = exc
+
+    threads = [threading.Thread(target=worker, args=(p,)) for p in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def test_concurrent_payloads_share_one_batch():
+    sent = []
+
+    def send(payloads):
+        sent.append([p["ue_id"] for p in payloads])
+        return [{"predicted_antenna": f"cell_{p['ue_id']}"} for p in payloads]
+
+    batcher = PredictionBatcher(send, window_s=0.2, max_batch=100)
+    payloads = [{"ue_id": f"u{idx}"} for idx in range(5)]
+    results, errors = _submit_concurrently(batcher, payloads)
+
+    assert not errors
+    assert len(sent) == 1 and sorted(sent[0]) == [f"u{idx}" for idx in range(5)]
+    assert results["u3"] == {"predicted_antenna": "cell_u3"}
+
+
+def test_full_batch_flushes_before_the_window():
+    sent = []
+
+    def send(payloads):
+        sent.append(len(payloads))
+        return [None] * len(payloads)
+
+    batcher = PredictionBatcher(send, window_s=30.0, max_batch=1)
+    assert batcher.submit({"ue_id": "u1"}) is None
+    assert sent == [1]
+
+
+def test_send_errors_reach_every_caller():
+    def send(payloads):
+        raise RuntimeError("ml down")
+
+    batcher = PredictionBatcher(send, window_s=0.1, max_batch=2)
+    results, errors = _submit_concurrently(batcher, [{"ue_id": "u1"}, {"ue_id": "u2"}])
+
+    assert not results
+    assert set(errors) == {"u1", "u2"}
+    with pytest.raises(RuntimeError):
+        raise errors["u1"]
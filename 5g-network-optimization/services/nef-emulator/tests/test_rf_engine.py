@@ -0,0 +1,134 @@
+"""Equivalence tests for the vectorised RF engine."""
+
+import math
+import random
+
+import numpy as np
+
+from antenna_models.models import MacroCellModel
+from backend.app.app.network.rf_engine import VectorizedRFEngine
+from backend.app.app.network.state_manager import NetworkStateManager
+
+
+def _scalar_reference(antennas, position, noise_floor_dbm=-100.0, resource_blocks=50):
+    """Per-antenna computation used by get_feature_vector before vectorisation."""
+    rsrp = {aid: ant.rsrp_dbm(position) for aid, ant in antennas.items()}
+    received = {
+        aid: (
+            ant.received_power_dbm(position)
+            if hasattr(ant, "received_power_dbm")
+            else rsrp[aid]
+        )
+        for aid, ant in antennas.items()
+    }
+    received_mw = {aid: 10 ** (dbm / 10.0) for aid, dbm in received.items()}
+    sinr, rsrq = {}, {}
+    for aid, ant in antennas.items():
+        group = getattr(ant, "frequency_reuse_group", 1)
+        carrier = getattr(ant, "frequency_hz", getattr(ant, "fc", None))
+        interference = sum(
+            power
+            for other, power in received_mw.items()
+            if other != aid
+            and getattr(antennas[other], "frequency_reuse_group", 1) == group
+            and getattr(antennas[other], "frequency_hz", getattr(antennas[other], "fc", None))
+            == carrier
+        )
+        noise_dbm = (
+            ant.thermal_noise_dbm() if hasattr(ant, "thermal_noise_dbm") else noise_floor_dbm
+        )
+        denom = 10 ** (noise_dbm / 10.0) + interference
+        lin = received_mw[aid] / denom
+        sinr[aid] = 10 * math.log10(lin) if lin > 0 else -float("inf")
+        rssi = received_mw[aid] + denom
+        rb = getattr(ant, "resource_blocks", resource_blocks)
+        rsrq_lin = rb * 10 ** (rsrp[aid] / 10.0) / rssi
+        rsrq[aid] = 10 * math.log10(rsrq_lin) if rsrq_lin > 0 else -float("inf")
+    return {"rsrp_dbm": rsrp, "received_dbm": received, "sinr_db": sinr, "rsrq_db": rsrq}
+
+
+def _random_topology(seed=3, count=24):
+    rng = random.Random(seed)
+    antennas = {}
+    for idx in range(count):
+        ant_id = f"cell_{idx}"
+        antennas[ant_id] = MacroCellModel(
+            ant_id,
+            (rng.uniform(-3000, 3000), rng.uniform(-3000, 3000), rng.choice([8.0, 25.0, 30.0])),
+            rng.choice([2.6e9, 3.5e9]),
+            rng.uniform(38.0, 46.0),
+            azimuth_deg=rng.choice([0.0, 120.0, 240.0]),
+            tilt_deg=rng.uniform(0.0, 8.0),
+            frequency_reuse_group=rng.choice([1, 2]),
+            los_probability=rng.uniform(0.3, 1.0),
+            random_seed=7,
+        )
+    return antennas
+
+
+class _PlainAntenna:
+    def __init__(self, position, rsrp):
+        self.position = position
+        self._rsrp = rsrp
+
+    def rsrp_dbm(self, _position):
+        return self._rsrp
+
+
+def test_engine_matches_scalar_models_for_batch():
+    antennas = _random_topology()
+    engine = VectorizedRFEngine(antennas)
+    rng = random.Random(11)
+    positions = [
+        (rng.uniform(-4000, 4000), rng.uniform(-4000, 4000), 1.5) for _ in range(25)
+    ]
+
+    measurements = engine.evaluate(positions)
+
+    assert measurements.rsrp_dbm.shape == (len(positions), len(antennas))
+    for row, position in enumerate(positions):
+        reference = _scalar_reference(antennas, position)
+        values = measurements.row(row)
+        for metric, expected in reference.items():
+            assert list(values[metric]) == list(antennas)
+            assert np.array_equal(
+                [values[metric][aid] for aid in antennas],
+                [expected[aid] for aid in antennas],
+            ), metric
+
+
+def test_engine_falls_back_to_scalar_calls_for_other_models():
+    antennas = {
+        "macro": MacroCellModel("macro", (0.0, 0.0, 25.0), 3.5e9, 43.0),
+        "plain": _PlainAntenna((400.0, 0.0, 10.0), -80.0),
+    }
+    engine = VectorizedRFEngine(antennas, noise_floor_dbm=-95.0, resource_blocks=25)
+    position = (150.0, 40.0, 1.5)
+
+    values = engine.evaluate_one(position)
+    reference = _scalar_reference(antennas, position, noise_floor_dbm=-95.0, resource_blocks=25)
+
+    assert values["rsrp_dbm"]["plain"] == -80.0
+    for metric, expected in reference.items():
+        assert values[metric] == expected, metric
+
+
+def test_state_manager_rebuilds_engine_when_topology_changes():
+    nsm = NetworkStateManager()
+    nsm.antenna_list = {
+        "antA": MacroCellModel("antA", (0, 0, 10), 2.6e9, tx_power_dbm=46),
+    }
+    nsm.ue_states = {"ue1": {"position": (100.0, 0.0, 1.5), "connected_to": "antA"}}
+
+    first = nsm.rf_engine()
+    assert nsm.rf_engine() is first
+
+    nsm.antenna_list["antB"] = MacroCellModel("antB", (500, 0, 10), 2.6e9, tx_power_dbm=46)
+    fv = nsm.get_feature_vector("ue1")
+
+    assert nsm.rf_engine() is not first
+    assert set(fv["neighbor_sinrs"]) == {"antA", "antB"}
+    reference = _scalar_reference(nsm.antenna_list, (100.0, 0.0, 1.5))
+    for aid in ("antA", "antB"):
+        assert fv["neighbor_sinrs"][aid] == reference["sinr_db"][aid]
+        assert fv["neighbor_rsrqs"][aid] == reference["rsrq_db"][aid]
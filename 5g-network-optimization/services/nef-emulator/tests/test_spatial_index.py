@@ -0,0 +1,63 @@
+import math
+import random
+
+from backend.app.app.core.geo_utils import haversine_distance
+from backend.app.app.core.spatial_index import CellCoverageIndex, NearestCellIndex
+from backend.app.app.tools import distance as dist_mod
+
+
+def _cell_distance(lat1, lon1, lat2, lon2):
+    if max(abs(lat1), abs(lat2)) > 90.0 or max(abs(lon1), abs(lon2)) > 180.0:
+        return math.hypot(lat2 - lat1, lon2 - lon1)
+    return haversine_distance(lat1, lon1, lat2, lon2)
+
+
+def _linear_nearest(configs, lat, lon):
+    best, best_distance = None, float("inf")
+    for key, config in configs.items():
+        distance = _cell_distance(lat, lon, config["latitude"], config["longitude"])
+        if distance < best_distance:
+            best, best_distance = key, distance
+    return best
+
+
+def test_coverage_index_matches_linear_scan():
+    rng = random.Random(7)
+    cells = [
+        {
+            "id": idx,
+            "latitude": 37.99 + rng.random() * 0.02,
+            "longitude": 23.81 + rng.random() * 0.02,
+            "radius": rng.choice([50, 150, 400]),
+        }
+        for idx in range(60)
+    ]
+    cells.append({"id": 99, "latitude": None, "longitude": 23.8, "radius": 100})
+    index = CellCoverageIndex(cells)
+
+    for _ in range(300):
+        lat = 37.985 + rng.random() * 0.03
+        lon = 23.805 + rng.random() * 0.03
+        assert dist_mod.check_distance(lat, lon, index) is dist_mod.check_distance(lat, lon, cells)
+
+
+def test_nearest_cell_index_matches_linear_scan_for_mixed_grids():
+    rng = random.Random(11)
+    configs = {f"geo_{i}": {"latitude": 37.9 + rng.random() * 0.2, "longitude": 23.7 + rng.random() * 0.2} for i in range(40)}
+    configs.update(
+        {f"grid_{i}": {"latitude": rng.random() * 2000.0, "longitude": rng.random() * 2000.0} for i in range(40)}
+    )
+    # Duplicate positions keep the first key, as the scan does.
+    configs["grid_dup"] = dict(configs["grid_0"])
+    index = NearestCellIndex(configs, _cell_distance)
+
+    queries = [(37.9 + rng.random() * 0.2, 23.7 + rng.random() * 0.2) for _ in range(100)]
+    queries += [(rng.random() * 2000.0, rng.random() * 2000.0) for _ in range(100)]
+    queries.append((configs["grid_0"]["latitude"], configs["grid_0"]["longitude"]))
+    for lat, lon in queries:
+        key, _distance = index.nearest(lat, lon)
+        assert key == _linear_nearest(configs, lat, lon)
+
+
+def test_nearest_cell_index_empty():
+    assert NearestCellIndex({}, _cell_distance).nearest(0.0, 0.0) is None
@@ -134,3 +134,33 @@ def test_get_position_at_time_multiseg(nsm):
     assert pytest.approx(p[0]) == 15.0
     assert pytest.approx(p[1]) == 5.0
     assert p[2] == 0.0
+
+
+def test_serving_load_counters_track_handovers_and_removal(nsm):
+    nsm.ue_states['ue2'] = {'position': (400.0, 0.0, 1.5), 'connected_to': 'antB'}
+    assert nsm.get_serving_loads() == {'antA': 1, 'antB': 1}
+
+    nsm.apply_handover_decision('ue1', 'antB')
+    assert nsm.get_serving_loads() == {'antA': 0, 'antB': 2}
+    assert nsm.get_feature_vector('ue2')['neighbor_cell_loads'] == {'antA': 0, 'antB': 2}
+
+    nsm.remove_ue('ue2')
+    assert nsm.get_serving_loads() == {'antA': 0, 'antB': 1}
+    assert nsm.verify_serving_loads() == {}
+
+
+def test_serving_load_counters_resolve_late_aliases(nsm):
+    nsm.ue_states['ue2'] = {'position': (400.0, 0.0, 1.5), 'connected_to': 'antenna_2'}
+    assert nsm.get_serving_loads() == {'antA': 1, 'antB': 0}
+
+    nsm.register_antenna_alias('antenna_2', 'antB')
+    assert nsm.get_serving_loads() == {'antA': 1, 'antB': 1}
+    assert nsm.ue_states['ue2']['connected_to'] == 'antB'
+
+
+def test_verify_serving_loads_repairs_out_of_band_changes(nsm):
+    nsm.get_serving_loads()
+    nsm.ue_states['ue1']['connected_to'] = 'antB'  # bypasses set_serving_cell
+
+    assert nsm.verify_serving_loads() == {'antA': (1, 0), 'antB': (0, 1)}
+    assert nsm.get_serving_loads() == {'antA': 0, 'antB': 1}
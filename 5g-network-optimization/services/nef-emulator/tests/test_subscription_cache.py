@@ -0,0 +1,63 @@
+from backend.app.app.db.subscription_cache import SubscriptionCache
+
+
+def _counting_loader(result):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return result
+
+    return loader, calls
+
+
+def test_lookup_is_cached_until_collection_is_invalidated():
+    cache = SubscriptionCache(ttl_s=60.0)
+    loader, calls = _counting_loader(None)
+
+    for _ in range(5):
+        assert cache.lookup("MonitoringEvent", loader, externalId="ue1", monitoringType="LOCATION_REPORTING") is None
+    assert len(calls) == 1
+
+    cache.invalidate("QoSMonitoring")
+    cache.lookup("MonitoringEvent", loader, externalId="ue1", monitoringType="LOCATION_REPORTING")
+    assert len(calls) == 1
+
+    cache.invalidate("MonitoringEvent")
+    cache.lookup("MonitoringEvent", loader, externalId="ue1", monitoringType="LOCATION_REPORTING")
+    assert len(calls) == 2
+
+
+def test_cached_documents_are_copies():
+    cache = SubscriptionCache(ttl_s=60.0)
+    loader, _calls = _counting_loader({"maximumNumberOfReports": 3})
+
+    doc = cache.lookup("MonitoringEvent", loader, externalId="ue1")
+    doc["maximumNumberOfReports"] -= 1
+
+    assert cache.lookup("MonitoringEvent", loader, externalId="ue1") == {"maximumNumberOfReports": 3}
+
+
+def test_write_during_load_is_not_cached():
+    cache = SubscriptionCache(ttl_s=60.0)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        if len(calls) == 1:
+            cache.invalidate("QoSMonitoring")
+            return None
+        return {"ipv4Addr": "10.0.0.1"}
+
+    assert cache.lookup("QoSMonitoring", loader, ipv4Addr="10.0.0.1") is None
+    assert cache.lookup("QoSMonitoring", loader, ipv4Addr="10.0.0.1") == {"ipv4Addr": "10.0.0.1"}
+
+
+def test_zero_ttl_and_unknown_collections_bypass_cache():
+    loader, calls = _counting_loader(None)
+    SubscriptionCache(ttl_s=0.0).lookup("MonitoringEvent", loader, externalId="ue1")
+    SubscriptionCache(ttl_s=0.0).lookup("MonitoringEvent", loader, externalId="ue1")
+    cache = SubscriptionCache(ttl_s=60.0)
+    cache.lookup("QoSProfile", loader, value=1)
+    cache.lookup("QoSProfile", loader, value=1)
+    assert len(calls) == 4
@@ -0,0 +1,58 @@
+import threading
+
+from backend.app.app.simulation.scheduler import (
+    NEED_FEATURES,
+    TICK_DONE,
+    ScheduledSession,
+    TickScheduler,
+)
+
+
+def _session(log, key, stop_flag):
+    while True:
+        vector = yield NEED_FEATURES
+        log.append((key, vector))
+        yield TICK_DONE
+        if stop_flag.is_set():
+            log.append((key, "stopped"))
+            return
+
+
+def test_tick_batches_feature_requests_across_sessions():
+    calls = []
+
+    def provider(keys):
+        calls.append(sorted(keys))
+        return {key: {"ue": key} for key in keys if key != "ue3"}
+
+    # Without register() no loop thread or pool exists, so tick() runs inline.
+    scheduler = TickScheduler(provider, interval_s=60.0, max_workers=2)
+    log = []
+    stop = threading.Event()
+    for key in ("ue1", "ue2", "ue3"):
+        scheduler._sessions[key] = ScheduledSession(key, _session(log, key, stop))
+
+    scheduler.tick()
+    scheduler.tick()
+
+    assert calls == [["ue1", "ue2", "ue3"], ["ue1", "ue2", "ue3"]]
+    assert log.count(("ue1", {"ue": "ue1"})) == 2
+    assert ("ue3", None) in log
+
+
+def test_request_stop_runs_session_to_completion():
+    scheduler = TickScheduler(lambda keys: {}, interval_s=60.0, max_workers=1)
+    log = []
+    stop = threading.Event()
+    session = scheduler.register("ue1", _session(log, "ue1", stop))
+    for _ in range(100):
+        if log:
+            break
+        threading.Event().wait(0.01)
+
+    stop.set()
+    scheduler.request_stop("ue1")
+    assert session.done.wait(2.0)
+    assert log[-1] == ("ue1", "stopped")
+    assert len(scheduler) == 0
+    scheduler.shutdown()
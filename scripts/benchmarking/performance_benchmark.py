@@ -22,6 +22,8 @@ import logging
 import os
 import platform
 import statistics
+import sys
+import threading
 import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
@@ -32,6 +34,10 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+ML_SERVICE_ROOT = (
+    Path(__file__).resolve().parents[2] / "5g-network-optimization" / "services" / "ml-service"
+)
+
 
 # =============================================================================
 # SYSTEM INFORMATION
@@ -483,6 +489,96 @@ def benchmark_simulation_timestep() -> SingleBenchmark:
     )
 
 
+def benchmark_concurrent_selector_prediction(
+    thread_counts: Tuple[int, ...] = (1, 2, 4),
+    requests_per_thread: int = 200,
+) -> List[SingleBenchmark]:
+    """Benchmark ``LightGBMSelector.predict`` throughput from concurrent callers.
+
+    Each thread predicts for its own UEs against one shared selector. The
+    reported speedup is the aggregate throughput relative to one thread.
+    Predictions read the selector's model snapshot without taking the model
+    lock, so scaling is bounded by the CPU count and by the parts of the
+    request path that hold the GIL, not by the selector.
+    """
+    try:
+        if str(ML_SERVICE_ROOT) not in sys.path:
+            sys.path.insert(0, str(ML_SERVICE_ROOT))
+        from ml_service.app.models.lightgbm_selector import LightGBMSelector
+        from ml_service.app.utils.synthetic_data import generate_synthetic_training_data
+    except ImportError:
+        return [
+            SingleBenchmark(
+                name="Concurrent Selector Prediction",
+                iterations=0,
+                mean_time_ms=0,
+                std_time_ms=0,
+                min_time_ms=0,
+                max_time_ms=0,
+                ops_per_second=0,
+                passed=False,
+                threshold_ms=None,
+            )
+        ]
+
+    samples = generate_synthetic_training_data(500, num_antennas=3, seed=42)
+    selector = LightGBMSelector()
+    selector.train(samples)
+    requests = [
+        {key: value for key, value in sample.items() if key != "optimal_antenna"}
+        for sample in samples
+    ]
+
+    def run(threads: int) -> Tuple[float, List[float]]:
+        latencies: List[List[float]] = [[] for _ in range(threads)]
+        start_barrier = threading.Barrier(threads + 1)
+
+        def worker(idx: int) -> None:
+            times = latencies[idx]
+            start_barrier.wait()
+            for n in range(requests_per_thread):
+                request = dict(requests[(idx * requests_per_thread + n) % len(requests)])
+                request["ue_id"] = f"bench-{idx}-{n % 16}"
+                t0 = time.perf_counter()
+                selector.predict(request)
+                times.append((time.perf_counter() - t0) * 1000)
+
+        workers = [threading.Thread(target=worker, args=(idx,)) for idx in range(threads)]
+        for thread in workers:
+            thread.start()
+        start_barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        return elapsed, [t for times in latencies for t in times]
+
+    run(1)  # Warm up caches and lazy initialisation
+    gc.collect()
+
+    results = []
+    baseline = None
+    for threads in thread_counts:
+        elapsed, times = run(threads)
+        throughput = len(times) / elapsed if elapsed > 0 else 0.0
+        if baseline is None:
+            baseline = throughput
+        speedup = throughput / baseline if baseline else 0.0
+        results.append(
+            SingleBenchmark(
+                name=f"Concurrent Selector Prediction ({threads} threads, {speedup:.2f}x throughput)",
+                iterations=len(times),
+                mean_time_ms=statistics.mean(times),
+                std_time_ms=statistics.stdev(times) if len(times) > 1 else 0.0,
+                min_time_ms=min(times),
+                max_time_ms=max(times),
+                ops_per_second=throughput,
+                passed=True,
+            )
+        )
+    return results
+
+
 # =============================================================================
 # MAIN BENCHMARK SUITE
 # =============================================================================
@@ -524,6 +620,12 @@ def run_benchmark_suite(
         status = "✓" if result.passed else "✗"
         print(f"    {status} {result.mean_time_ms:.2f} ms")
     
+    print("  Running benchmark_concurrent_selector_prediction...")
+    for result in benchmark_concurrent_selector_prediction():
+        suite.add(result)
+        status = "✓" if result.passed else "✗"
+        print(f"    {status} {result.name}: {result.ops_per_second:.0f} predictions/s")
+
     print("-" * 40)
     
     # Save if path provided
@@ -574,6 +676,7 @@ __all__ = [
     'validate_system_performance',
     'benchmark_function',
     'run_timed_iterations',
+    'benchmark_concurrent_selector_prediction',
 ]
 
 
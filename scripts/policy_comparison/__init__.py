@@ -18,10 +18,15 @@ from .candidate_ranker_artifact import (
     load_candidate_ranker_artifact,
 )
 from .manifest import ReproducibilityManifest, build_reproducibility_manifest
-from .nef_trace import capture_nef_trace_records, feature_vector_to_trace_record
+from .nef_trace import (
+    capture_nef_trace_records,
+    feature_vector_to_trace_record,
+    iter_nef_trace_records,
+)
 from .output_validation import (
     OutputValidationReport,
     validate_comparison_output,
+    validate_replay_result,
 )
 from .policy_adapters import FixedA3PolicyAdapter, MLPolicyAdapter, TunedA3PolicyAdapter
 from .replay import OfflineReplayRunner, ReplayResult
@@ -31,7 +36,15 @@ from .schemas import (
     TraceSchemaError,
     VisibleCellMeasurement,
 )
-from .trace_io import read_trace_jsonl, write_trace_jsonl
+from .trace_io import (
+    read_decisions,
+    read_trace,
+    read_trace_jsonl,
+    stream_trace_jsonl,
+    write_decisions,
+    write_trace,
+    write_trace_jsonl,
+)
 from .trace_plan import TracePreparationPlan, build_trace_preparation_plan
 
 
@@ -71,9 +84,16 @@ __all__ = [
     "build_trace_preparation_plan",
     "capture_nef_trace_records",
     "feature_vector_to_trace_record",
+    "iter_nef_trace_records",
     "load_run_metrics",
     "load_candidate_ranker_artifact",
+    "read_decisions",
+    "read_trace",
     "read_trace_jsonl",
+    "stream_trace_jsonl",
     "validate_comparison_output",
+    "validate_replay_result",
+    "write_decisions",
+    "write_trace",
     "write_trace_jsonl",
 ]
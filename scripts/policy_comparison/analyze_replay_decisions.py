@@ -16,7 +16,7 @@ if __package__ in {None, ""}:  # pragma: no cover - direct script execution
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from scripts.policy_comparison.schemas import PolicyDecisionRecord
-from scripts.policy_comparison.trace_io import read_decisions_jsonl
+from scripts.policy_comparison.trace_io import decision_log_path, read_decisions
 
 
 def analyze_replay_decisions(args: argparse.Namespace) -> dict[str, Any]:
@@ -29,8 +29,7 @@ def analyze_replay_decisions(args: argparse.Namespace) -> dict[str, Any]:
 
     policy_reports = {}
     for policy in policies:
-        path = decisions_dir / f"{policy}.jsonl"
-        decisions = read_decisions_jsonl(path)
+        decisions = read_decisions(decision_log_path(decisions_dir, policy))
         policy_reports[policy] = _analyze_policy(policy, decisions)
 
     report = {
@@ -54,10 +53,14 @@ def _resolve_policies(decisions_dir: Path, raw: str | None) -> list[str]:
     if raw:
         policies = [item.strip() for item in raw.split(",") if item.strip()]
     else:
-        policies = sorted(path.stem for path in decisions_dir.glob("*.jsonl"))
+        policies = sorted(
+            {path.stem for pattern in ("*.jsonl", "*.npz") for path in decisions_dir.glob(pattern)}
+        )
     if not policies:
         raise ValueError("no decision policies selected")
-    missing = [policy for policy in policies if not (decisions_dir / f"{policy}.jsonl").is_file()]
+    missing = [
+        policy for policy in policies if not decision_log_path(decisions_dir, policy).is_file()
+    ]
     if missing:
         raise ValueError("missing decision log(s): " + ", ".join(missing))
     return policies
@@ -361,7 +364,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--replay-dir", required=True, help="Offline replay output directory.")
     parser.add_argument(
         "--policy",
-        help="Comma-separated policies to analyze. Defaults to every decisions/*.jsonl file.",
+        help="Comma-separated policies to analyze. Defaults to every decisions/*.jsonl or *.npz file.",
     )
     parser.add_argument("--output-dir", help="Output directory for JSON/Markdown diagnostics.")
     return parser
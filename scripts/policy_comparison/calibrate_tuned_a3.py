@@ -21,7 +21,7 @@ from scripts.policy_comparison.policy_adapters import (
 )
 from scripts.policy_comparison.replay import OfflineReplayRunner
 from scripts.policy_comparison.schemas import MeasurementTraceRecord
-from scripts.policy_comparison.trace_io import read_trace_jsonl
+from scripts.policy_comparison.trace_io import read_trace
 
 
 def ensure_fresh_output_file(path: Path) -> None:
@@ -210,7 +210,7 @@ def calibrate_tuned_a3_config(
     )
     if not trace_paths:
         raise ValueError("at least one calibration trace is required")
-    records_by_trace = {path: read_trace_jsonl(path) for path in trace_paths}
+    records_by_trace = {path: read_trace(path) for path in trace_paths}
     calibration = validate_calibration_traces(records_by_trace)
     records = [
         record
@@ -237,7 +237,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--calibration-trace",
         action="append",
         required=True,
-        help="Calibration trace JSONL. May be supplied multiple times.",
+        help="Calibration trace (JSONL or .npz). May be supplied multiple times.",
     )
     parser.add_argument("--output", required=True, help="Fresh tuned A3 config JSON path.")
     return parser
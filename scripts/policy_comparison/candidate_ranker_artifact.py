@@ -127,8 +127,16 @@ class CandidateRankerArtifact:
         }
 
     def score_rows(self, rows: Sequence[Mapping[str, Any]]) -> dict[str, float]:
+        return self.score_row_groups([rows])[0]
+
+    def score_row_groups(
+        self,
+        groups: Sequence[Sequence[Mapping[str, Any]]],
+    ) -> list[dict[str, float]]:
+        """Score several snapshots' candidate rows with one model call."""
+        rows = [row for group in groups for row in group]
         if not rows:
-            return {}
+            return [{} for _ in groups]
         matrix = np.array(
             [
                 row_to_feature_vector(row, feature_columns=self.feature_columns)
@@ -137,10 +145,17 @@ class CandidateRankerArtifact:
             dtype=float,
         )
         predictions = np.asarray(self.model.predict(matrix), dtype=float)
-        return {
-            str(row["candidate_cell"]): float(score)
-            for row, score in zip(rows, predictions)
-        }
+        scored: list[dict[str, float]] = []
+        offset = 0
+        for group in groups:
+            scored.append(
+                {
+                    str(row["candidate_cell"]): float(score)
+                    for row, score in zip(group, predictions[offset:offset + len(group)])
+                }
+            )
+            offset += len(group)
+        return scored
 
     def safe_metadata(self) -> dict[str, Any]:
         allowed = {
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Capture canonical measurement traces from the existing NEF feature endpoint."""
+"""Capture canonical measurement traces from the NEF bulk feature endpoint."""
 
 from __future__ import annotations
 
@@ -14,8 +14,8 @@ from typing import Sequence
 if __package__ in {None, ""}:  # pragma: no cover - direct script execution
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from scripts.policy_comparison.nef_trace import capture_nef_trace_records
-from scripts.policy_comparison.trace_io import write_trace_jsonl
+from scripts.policy_comparison.nef_trace import iter_nef_trace_records
+from scripts.policy_comparison.trace_io import stream_trace_jsonl
 
 
 def parse_ue_ids(raw_values: Sequence[str]) -> list[str]:
@@ -58,7 +58,7 @@ def run(args: argparse.Namespace) -> int:
     ensure_fresh_file(metadata_path)
 
     ue_ids = parse_ue_ids(args.ue_id)
-    records = capture_nef_trace_records(
+    records = iter_nef_trace_records(
         nef_url=resolve_nef_url(args.nef_url),
         ue_ids=ue_ids,
         scenario=args.scenario,
@@ -69,7 +69,7 @@ def run(args: argparse.Namespace) -> int:
         topology_hash=args.topology_hash,
         topology_json=Path(args.topology_json) if args.topology_json else None,
     )
-    write_trace_jsonl(records, output)
+    record_count = stream_trace_jsonl(records, output)
 
     metadata = {
         "created_at": datetime.now(timezone.utc).isoformat(),
@@ -78,9 +78,9 @@ def run(args: argparse.Namespace) -> int:
         "samples": args.samples,
         "interval_s": args.interval_s,
         "ue_ids": ue_ids,
-        "record_count": len(records),
+        "record_count": record_count,
         "source": "existing_nef_feature_endpoint",
-        "endpoint": "/api/v1/ml/state/{ue_id}",
+        "endpoint": "/api/v1/ml/state",
         "no_policy_decisions_captured": True,
         "no_handover_applied": True,
     }
@@ -89,7 +89,7 @@ def run(args: argparse.Namespace) -> int:
         encoding="utf-8",
     )
 
-    print(f"Captured {len(records)} records to {output}")
+    print(f"Captured {record_count} records to {output}")
     print(f"Metadata written to {metadata_path}")
     return 0
 
@@ -97,8 +97,8 @@ def run(args: argparse.Namespace) -> int:
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
-            "Capture policy-free canonical trace records from the existing "
-            "NEF /api/v1/ml/state/{ue_id} endpoint."
+            "Capture policy-free canonical trace records from the NEF "
+            "/api/v1/ml/state bulk feature endpoint."
         )
     )
     parser.add_argument("--scenario", required=True, help="Scenario name, e.g. highway.")
@@ -127,7 +127,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--timeout-s",
         type=float,
         default=5.0,
-        help="HTTP timeout per NEF feature-vector request. Default: 5.0.",
+        help="HTTP timeout per NEF feature-vector snapshot request. Default: 5.0.",
     )
     parser.add_argument("--topology-hash", help="Existing topology hash label.")
     parser.add_argument("--topology-json", help="Topology JSON file to hash.")
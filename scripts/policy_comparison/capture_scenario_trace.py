@@ -19,8 +19,8 @@ if __package__ in {None, ""}:  # pragma: no cover - direct script execution
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from scripts.policy_comparison.capture_nef_trace import parse_ue_ids, resolve_nef_url
-from scripts.policy_comparison.nef_trace import capture_nef_trace_records
-from scripts.policy_comparison.trace_io import write_trace_jsonl
+from scripts.policy_comparison.nef_trace import iter_nef_trace_records
+from scripts.policy_comparison.trace_io import stream_trace_jsonl
 from scripts.policy_comparison.v3_protocol import load_protocol, require_capture_allowed
 from scripts.run_enhanced_experiment import (
     DOCKER_COMPOSE_CMD,
@@ -166,7 +166,7 @@ def write_metadata(
         "topology_json": str(topology_path),
         "topology_hash": topology_hash_value,
         "source": "existing_shared_nef_trace_capture_mode",
-        "endpoint": "/api/v1/ml/state/{ue_id}",
+        "endpoint": "/api/v1/ml/state",
         "handover_mode": "trace_capture",
         "policy_free": True,
         "no_handover_applied_by_runner": True,
@@ -261,7 +261,7 @@ def capture_scenario_trace(
             timeout_s=timeout_s,
         )
 
-        records = capture_nef_trace_records(
+        records = iter_nef_trace_records(
             nef_url=resolved_nef_url,
             ue_ids=ue_ids,
             scenario=scenario_name,
@@ -271,7 +271,7 @@ def capture_scenario_trace(
             timeout_s=timeout_s,
             topology_hash=topology_hash_value,
         )
-        write_trace_jsonl(records, trace_path)
+        record_count = stream_trace_jsonl(records, trace_path)
         write_metadata(
             path=metadata_path,
             scenario_name=scenario_name,
@@ -280,7 +280,7 @@ def capture_scenario_trace(
             samples=samples,
             interval_s=interval_s,
             timeout_s=timeout_s,
-            record_count=len(records),
+            record_count=record_count,
             topology_path=topology_path,
             topology_hash_value=topology_hash_value,
             nef_url=resolved_nef_url,
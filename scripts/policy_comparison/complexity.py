@@ -69,7 +69,29 @@ def candidate_complexity_for_record(
     min_sinr_db: float = DEFAULT_MIN_VIABLE_SINR_DB,
     high_complexity_threshold: int = DEFAULT_HIGH_COMPLEXITY_THRESHOLD,
 ) -> CandidateComplexity:
-    """Count viable non-serving candidates in a canonical trace record."""
+    """Count viable non-serving candidates in a canonical trace record.
+
+    The result is memoized on the record (see ``MeasurementTraceRecord.derived``),
+    so callers must not mutate it.
+    """
+    return record.derived(
+        ("candidate_complexity", min_rsrp_dbm, min_sinr_db, high_complexity_threshold),
+        lambda item: _candidate_complexity(
+            item,
+            min_rsrp_dbm=min_rsrp_dbm,
+            min_sinr_db=min_sinr_db,
+            high_complexity_threshold=high_complexity_threshold,
+        ),
+    )
+
+
+def _candidate_complexity(
+    record: MeasurementTraceRecord,
+    *,
+    min_rsrp_dbm: float,
+    min_sinr_db: float,
+    high_complexity_threshold: int,
+) -> CandidateComplexity:
     viable_cells = [
         cell.cell_id
         for cell in record.visible_cells
@@ -102,6 +124,32 @@ def candidate_complexity_for_record(
     )
 
 
+def best_neighbour(
+    record: MeasurementTraceRecord,
+    *,
+    excluding: str | None = None,
+) -> VisibleCellMeasurement | None:
+    """Return the strongest-RSRP non-serving cell, ties broken by cell ID.
+
+    ``excluding`` drops one more cell, e.g. an active ML segment's target.
+    Memoized on the record like ``candidate_complexity_for_record``, but only
+    the winning cell ID: the measurement is looked up in this view, so it
+    carries this view's load.
+    """
+    cell_id = record.derived(
+        ("best_neighbour", excluding),
+        lambda item: max(
+            (
+                (cell.rsrp_dbm, cell.cell_id)
+                for cell in item.visible_cells
+                if cell.cell_id != excluding and cell.cell_id != item.serving_cell
+            ),
+            default=(None, None),
+        )[1],
+    )
+    return None if cell_id is None else record.visible_cell_map[cell_id]
+
+
 def candidate_complexity_for_feature_vector(
     feature_vector: Mapping[str, Any],
     *,
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Convert canonical traces and decision logs between JSONL and columnar npz."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence
+
+if __package__ in {None, ""}:  # pragma: no cover - direct script execution
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from scripts.policy_comparison.trace_columnar import (  # noqa: E402
+    is_columnar_path,
+    write_decisions_columnar,
+    write_trace_columnar,
+)
+from scripts.policy_comparison.trace_io import (  # noqa: E402
+    read_decisions,
+    read_trace,
+    write_decisions_jsonl,
+    write_trace_jsonl,
+)
+
+
+def run(args: argparse.Namespace) -> int:
+    source = Path(args.input)
+    output = Path(args.output)
+    if is_columnar_path(source) == is_columnar_path(output):
+        raise ValueError("exactly one of --input and --output must end in .npz")
+    if output.exists() and output.stat().st_size > 0:
+        raise ValueError(f"output already exists and is not empty: {output}")
+
+    if args.kind == "trace":
+        records = read_trace(source)
+        if is_columnar_path(output):
+            write_trace_columnar(records, output, compressed=args.compress)
+        else:
+            write_trace_jsonl(records, output)
+    else:
+        decisions = read_decisions(source)
+        if is_columnar_path(output):
+            write_decisions_columnar(decisions, output, compressed=args.compress)
+        else:
+            write_decisions_jsonl(decisions, output)
+        records = decisions
+
+    print(f"Converted {len(records)} {args.kind} records to {output}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__ or "")
+    parser.add_argument("--input", required=True, help="Source JSONL or .npz file.")
+    parser.add_argument("--output", required=True, help="Fresh destination JSONL or .npz file.")
+    parser.add_argument(
+        "--kind",
+        choices=("trace", "decisions"),
+        default="trace",
+        help="Record kind: canonical measurement trace or policy decision log. Default: trace",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Deflate the .npz members. Smaller on disk, slower to load.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return run(args)
+    except Exception as exc:  # noqa: BLE001 - command should fail visibly
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -25,7 +25,7 @@ from scripts.policy_comparison.schemas import MeasurementTraceRecord  # noqa: E4
 from scripts.policy_comparison.summarize_trace_complexity import (  # noqa: E402
     summarize_trace_records,
 )
-from scripts.policy_comparison.trace_io import read_trace_jsonl  # noqa: E402
+from scripts.policy_comparison.trace_io import read_trace  # noqa: E402
 
 
 DEFAULT_MIN_HIGH_COMPLEXITY_ROWS = 1000
@@ -50,7 +50,7 @@ def load_records_by_trace(
 ) -> dict[Path, list[MeasurementTraceRecord]]:
     records_by_trace: dict[Path, list[MeasurementTraceRecord]] = {}
     for path in trace_paths:
-        records_by_trace[path] = read_trace_jsonl(path)
+        records_by_trace[path] = read_trace(path)
     records = [
         record
         for trace_records in records_by_trace.values()
@@ -201,7 +201,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--trace",
         action="append",
         required=True,
-        help="Policy-free trace JSONL. May be supplied multiple times.",
+        help="Policy-free trace (JSONL or .npz). May be supplied multiple times.",
     )
     parser.add_argument("--output", required=True, help="Output candidate-ranker JSONL.")
     parser.add_argument("--manifest", help="Optional manifest JSON path.")
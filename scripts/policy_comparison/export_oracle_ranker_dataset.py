@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Sequence
 
 from .oracle_policy import ORACLE_LABEL_POLICY, feature_columns, solve_cost_to_go
-from .trace_io import read_trace_jsonl
+from .trace_io import read_trace
 from .validate_physical_trace import validate_trace
 
 
@@ -39,7 +39,7 @@ def export_dataset(
         validation = validate_trace(path, require_complexity=False)
         if not validation["pass"]:
             raise ValueError(f"physical trace validation failed for {path}: {validation['errors']}")
-        records = read_trace_jsonl(path)
+        records = read_trace(path)
         trace_seeds = {record.seed for record in records}
         if trace_seeds.intersection(forbidden_seeds):
             raise ValueError("evaluation seed leakage in oracle dataset")
@@ -24,7 +24,7 @@ from scripts.policy_comparison.schemas import MeasurementTraceRecord  # noqa: E4
 from scripts.policy_comparison.summarize_trace_complexity import (  # noqa: E402
     summarize_trace_records,
 )
-from scripts.policy_comparison.trace_io import read_trace_jsonl  # noqa: E402
+from scripts.policy_comparison.trace_io import read_trace  # noqa: E402
 
 
 DEFAULT_FORBIDDEN_EVALUATION_SEEDS = "61,62,63,64,65"
@@ -51,7 +51,7 @@ def load_records_by_trace(
 ) -> dict[Path, list[MeasurementTraceRecord]]:
     if not trace_paths:
         raise ValueError("at least one trace is required")
-    records_by_trace = {path: read_trace_jsonl(path) for path in trace_paths}
+    records_by_trace = {path: read_trace(path) for path in trace_paths}
     if not any(records_by_trace.values()):
         raise ValueError("segment traces produced no records")
     return records_by_trace
@@ -280,7 +280,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--trace",
         action="append",
         required=True,
-        help="Policy-free calibration trace JSONL. May be supplied multiple times.",
+        help="Policy-free calibration trace (JSONL or .npz). May be supplied multiple times.",
     )
     parser.add_argument("--output", required=True, help="Output segment dataset JSONL.")
     parser.add_argument("--manifest", help="Optional manifest JSON path.")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
 
 import requests  # type: ignore[import-untyped]
 
@@ -55,6 +55,7 @@ class NefTraceError(RuntimeError):
 
 
 FeatureFetcher = Callable[[str, str, float], Mapping[str, Any]]
+BatchFeatureFetcher = Callable[[str, Sequence[str], float], Mapping[str, Mapping[str, Any]]]
 
 
 def fetch_nef_feature_vector(
@@ -84,6 +85,36 @@ def fetch_nef_feature_vector(
     return data
 
 
+def fetch_nef_feature_vectors(
+    nef_url: str,
+    ue_ids: Sequence[str],
+    *,
+    timeout_s: float = 5.0,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch feature vectors for several UEs from one NEF runtime snapshot.
+
+    Uses GET /api/v1/ml/state?ue_id=...; an empty ``ue_ids`` asks for every
+    UE the NEF tracks. Pass a ``requests.Session`` to reuse its pooled
+    connection across calls. Any requested UE the NEF does not know raises
+    ``NefTraceError``, matching :func:`fetch_nef_feature_vector`.
+    """
+    if not nef_url:
+        raise NefTraceError("nef_url is required")
+
+    url = f"{nef_url.rstrip('/')}/api/v1/ml/state"
+    params = [("ue_id", ue_id) for ue_id in ue_ids]
+    response = (session or requests).get(url, params=params, timeout=timeout_s)
+    response.raise_for_status()
+    data = response.json()
+    if not isinstance(data, dict) or not isinstance(data.get("features"), dict):
+        raise NefTraceError("NEF bulk feature-vector response must contain a features object")
+    missing = data.get("missing") or []
+    if missing:
+        raise NefTraceError(f"UEs {sorted(missing)!r} were not found by the existing NEF path")
+    return data["features"]
+
+
 def capture_nef_trace_records(
     *,
     nef_url: str,
@@ -96,13 +127,57 @@ def capture_nef_trace_records(
     topology_hash: Optional[str] = None,
     topology_json: Optional[Path] = None,
     fetcher: Optional[FeatureFetcher] = None,
+    batch_fetcher: Optional[BatchFeatureFetcher] = None,
     sleeper: Callable[[float], None] = time.sleep,
     monotonic_clock: Callable[[], float] = time.monotonic,
 ) -> List[MeasurementTraceRecord]:
     """Sample canonical trace records from the existing NEF feature endpoint.
 
     This function only reads existing NEF feature vectors. It does not start
-    Docker, create scenarios, move UEs, call ML, or apply handovers.
+    Docker, create scenarios, move UEs, call ML, or apply handovers. See
+    :func:`iter_nef_trace_records` for the streaming form.
+    """
+    return list(
+        iter_nef_trace_records(
+            nef_url=nef_url,
+            ue_ids=ue_ids,
+            scenario=scenario,
+            seed=seed,
+            samples=samples,
+            interval_s=interval_s,
+            timeout_s=timeout_s,
+            topology_hash=topology_hash,
+            topology_json=topology_json,
+            fetcher=fetcher,
+            batch_fetcher=batch_fetcher,
+            sleeper=sleeper,
+            monotonic_clock=monotonic_clock,
+        )
+    )
+
+
+def iter_nef_trace_records(
+    *,
+    nef_url: str,
+    ue_ids: Sequence[str],
+    scenario: str,
+    seed: int,
+    samples: int,
+    interval_s: float,
+    timeout_s: float = 5.0,
+    topology_hash: Optional[str] = None,
+    topology_json: Optional[Path] = None,
+    fetcher: Optional[FeatureFetcher] = None,
+    batch_fetcher: Optional[BatchFeatureFetcher] = None,
+    sleeper: Callable[[float], None] = time.sleep,
+    monotonic_clock: Callable[[], float] = time.monotonic,
+) -> Iterator[MeasurementTraceRecord]:
+    """Yield canonical trace records step by step as they are sampled.
+
+    By default each step is one bulk request over a pooled session, so all
+    UEs in a step come from the same NEF runtime snapshot. A per-UE
+    ``fetcher`` keeps the older one-request-per-UE behaviour. Arguments are
+    validated before the first request is made.
     """
     if not nef_url:
         raise NefTraceError("nef_url is required")
@@ -115,6 +190,8 @@ def capture_nef_trace_records(
         raise NefTraceError("interval_s must be non-negative")
     if topology_hash and topology_json:
         raise NefTraceError("provide topology_hash or topology_json, not both")
+    if fetcher is not None and batch_fetcher is not None:
+        raise NefTraceError("provide fetcher or batch_fetcher, not both")
 
     resolved_topology_hash = (
         topology_hash
@@ -123,37 +200,75 @@ def capture_nef_trace_records(
         if topology_json is not None
         else None
     )
-    selected_fetcher = fetcher or _default_fetcher
-    start = monotonic_clock()
-    records: List[MeasurementTraceRecord] = []
-
-    for step_index in range(samples):
-        timestamp_s = monotonic_clock() - start
-        for ue_id in clean_ue_ids:
-            feature_vector = selected_fetcher(nef_url, ue_id, timeout_s)
-            records.append(
-                feature_vector_to_trace_record(
+    return _sample_trace_records(
+        nef_url=nef_url,
+        ue_ids=clean_ue_ids,
+        scenario=scenario,
+        seed=seed,
+        samples=samples,
+        interval_s=interval_s,
+        timeout_s=timeout_s,
+        topology_hash=resolved_topology_hash,
+        fetcher=fetcher,
+        batch_fetcher=batch_fetcher,
+        sleeper=sleeper,
+        monotonic_clock=monotonic_clock,
+    )
+
+
+def _sample_trace_records(
+    *,
+    nef_url: str,
+    ue_ids: List[str],
+    scenario: str,
+    seed: int,
+    samples: int,
+    interval_s: float,
+    timeout_s: float,
+    topology_hash: Optional[str],
+    fetcher: Optional[FeatureFetcher],
+    batch_fetcher: Optional[BatchFeatureFetcher],
+    sleeper: Callable[[float], None],
+    monotonic_clock: Callable[[], float],
+) -> Iterator[MeasurementTraceRecord]:
+    session = None
+    if fetcher is None and batch_fetcher is None:
+        session = requests.Session()
+        batch_fetcher = _session_batch_fetcher(session)
+
+    try:
+        start = monotonic_clock()
+        for step_index in range(samples):
+            timestamp_s = monotonic_clock() - start
+            if batch_fetcher is not None:
+                snapshot = batch_fetcher(nef_url, ue_ids, timeout_s)
+                feature_vectors = [snapshot[ue_id] for ue_id in ue_ids]
+            else:
+                feature_vectors = [fetcher(nef_url, ue_id, timeout_s) for ue_id in ue_ids]
+            for feature_vector in feature_vectors:
+                yield feature_vector_to_trace_record(
                     feature_vector,
                     scenario=scenario,
                     seed=seed,
                     step_index=step_index,
                     timestamp_s=timestamp_s,
-                    topology_hash=resolved_topology_hash,
+                    topology_hash=topology_hash,
                     source="nef_live_capture",
                 )
-            )
-        if step_index < samples - 1 and interval_s > 0:
-            sleeper(interval_s)
+            if step_index < samples - 1 and interval_s > 0:
+                sleeper(interval_s)
+    finally:
+        if session is not None:
+            session.close()
 
-    return records
 
+def _session_batch_fetcher(session: requests.Session) -> BatchFeatureFetcher:
+    def fetch(nef_url: str, ue_ids: Sequence[str], timeout_s: float):
+        return fetch_nef_feature_vectors(
+            nef_url, ue_ids, timeout_s=timeout_s, session=session
+        )
 
-def _default_fetcher(
-    nef_url: str,
-    ue_id: str,
-    timeout_s: float,
-) -> Mapping[str, Any]:
-    return fetch_nef_feature_vector(nef_url, ue_id, timeout_s=timeout_s)
+    return fetch
 
 
 def feature_vector_to_trace_record(
@@ -39,6 +39,20 @@ class OracleRankerArtifact:
         )
         return [float(value) for value in self.model.predict(matrix)]
 
+    def score_row_groups(
+        self,
+        groups: Sequence[Sequence[Mapping[str, Any]]],
+    ) -> list[list[float]]:
+        """Score several snapshots' action rows with one model call."""
+        rows = [row for group in groups for row in group]
+        scores = self.score_rows(rows) if rows else []
+        scored: list[list[float]] = []
+        offset = 0
+        for group in groups:
+            scored.append(scores[offset:offset + len(group)])
+            offset += len(group)
+        return scored
+
 
 def load_oracle_ranker_artifact(path: Path) -> OracleRankerArtifact:
     metadata_path = Path(f"{path}.meta.json")
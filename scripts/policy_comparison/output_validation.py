@@ -11,10 +11,13 @@ import math
 import re
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Mapping, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Sequence
 
 from .schemas import PolicyDecisionRecord
-from .trace_io import read_decisions_jsonl
+from .trace_io import decision_log_path, read_decisions
+
+if TYPE_CHECKING:
+    from .replay import ReplayResult
 
 
 Severity = Literal["critical", "high", "medium", "low"]
@@ -35,6 +38,7 @@ SUPPORTED_POLICIES = {
     "conditional_handover_baseline",
 }
 BLOCKING_SEVERITIES = {"critical", "high"}
+IN_MEMORY_SOURCE = "<in-memory replay>"
 LIVE_ML_POLICIES = {"ml", "complexity_aware_ml_a3"}
 LIVE_ML_LOG_POLICIES = {"ml", "hybrid", "complexity_aware_ml_a3"}
 LIVE_REQUIRED_POLICY_METRICS = ("total_handovers", "skipped_handovers")
@@ -117,6 +121,64 @@ def validate_comparison_output(
     )
 
 
+def validate_replay_result(
+    result: "ReplayResult",
+    *,
+    expected_policies: Optional[Sequence[str]] = None,
+    require_neighbour_measurements: bool = True,
+) -> OutputValidationReport:
+    """Validate an in-memory replay result without writing it to disk.
+
+    Applies the summary and decision checks of ``validate_comparison_output``.
+    The manifest and tuned A3 artifact checks need the output files and are
+    skipped.
+    """
+    source = Path(IN_MEMORY_SOURCE)
+    issues: List[OutputValidationIssue] = []
+    data = {
+        "scenario": result.scenario,
+        "seed": result.seed,
+        "topology_hash": result.topology_hash,
+        "policy_results": {
+            name: {"summary": policy_result.summary.to_dict()}
+            for name, policy_result in result.policy_results.items()
+        },
+    }
+    policy_results = _validate_offline_summary(
+        data,
+        source,
+        issues,
+        expected_policies=expected_policies,
+    )
+    for policy_name, payload in (policy_results or {}).items():
+        _validate_policy_payload(policy_name, payload, source, issues)
+        decisions = result.policy_results[policy_name].decisions
+        if not decisions:
+            _add_issue(
+                issues,
+                "high",
+                "empty_decision_log",
+                f"replay produced no decisions for policy {policy_name}",
+                source,
+            )
+            continue
+        _validate_decisions(
+            decisions,
+            policy_name=policy_name,
+            issues=issues,
+            source_path=source,
+            require_neighbour_measurements=require_neighbour_measurements,
+        )
+
+    ok = not any(issue.severity in BLOCKING_SEVERITIES for issue in issues)
+    return OutputValidationReport(
+        path=str(source),
+        artifact_type="offline_replay",
+        ok=ok,
+        issues=issues,
+    )
+
+
 def write_validation_report(report: OutputValidationReport, output_path: Path) -> None:
     """Write the validation report as JSON."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -220,6 +282,51 @@ def _validate_offline_output(
     if data is None:
         return
 
+    policy_results = _validate_offline_summary(
+        data,
+        summary_path,
+        issues,
+        expected_policies=expected_policies,
+    )
+    if policy_results is None:
+        return
+    if {"tuned_a3_baseline", "complexity_aware_ml_a3"}.intersection(
+        str(policy) for policy in policy_results
+    ):
+        _validate_offline_tuned_a3_artifact(root, issues)
+
+    manifest_path = root / "manifest.json"
+    if not manifest_path.is_file():
+        _add_issue(
+            issues,
+            "high",
+            "missing_manifest",
+            "offline output is missing reproducibility manifest.json",
+            manifest_path,
+        )
+
+    for policy_name, payload in policy_results.items():
+        if not _validate_policy_payload(str(policy_name), payload, summary_path, issues):
+            continue
+        decisions = _load_offline_decisions(root, str(policy_name), payload, issues)
+        if decisions is None:
+            continue
+        _validate_decisions(
+            decisions,
+            policy_name=str(policy_name),
+            issues=issues,
+            source_path=root,
+            require_neighbour_measurements=require_neighbour_measurements,
+        )
+
+
+def _validate_offline_summary(
+    data: Mapping[str, Any],
+    summary_path: Path,
+    issues: List[OutputValidationIssue],
+    *,
+    expected_policies: Optional[Sequence[str]],
+) -> Optional[Mapping[str, Any]]:
     _require_non_empty_string(data, "scenario", summary_path, issues)
     _require_int(data, "seed", summary_path, issues)
     if not data.get("topology_hash"):
@@ -240,61 +347,46 @@ def _validate_offline_output(
             "offline summary must include non-empty policy_results",
             summary_path,
         )
-        return
+        return None
 
     policy_names = sorted(str(policy) for policy in policy_results)
     _validate_policy_names(policy_names, expected_policies, issues, summary_path)
-    if {"tuned_a3_baseline", "complexity_aware_ml_a3"}.intersection(policy_names):
-        _validate_offline_tuned_a3_artifact(root, issues)
+    return policy_results
 
-    manifest_path = root / "manifest.json"
-    if not manifest_path.is_file():
+
+def _validate_policy_payload(
+    policy_name: str,
+    payload: Any,
+    summary_path: Path,
+    issues: List[OutputValidationIssue],
+) -> bool:
+    if not isinstance(payload, Mapping):
         _add_issue(
             issues,
             "high",
-            "missing_manifest",
-            "offline output is missing reproducibility manifest.json",
-            manifest_path,
+            "invalid_policy_result",
+            f"policy result for {policy_name} must be a JSON object",
+            summary_path,
         )
-
-    for policy_name, payload in policy_results.items():
-        if not isinstance(payload, Mapping):
-            _add_issue(
-                issues,
-                "high",
-                "invalid_policy_result",
-                f"policy result for {policy_name} must be a JSON object",
-                summary_path,
-            )
-            continue
-        summary = payload.get("summary")
-        if not isinstance(summary, Mapping):
-            _add_issue(
-                issues,
-                "high",
-                "missing_policy_summary",
-                f"policy {policy_name} is missing summary metrics",
-                summary_path,
-            )
-        elif not _has_numeric_metric(summary):
-            _add_issue(
-                issues,
-                "high",
-                "empty_policy_summary",
-                f"policy {policy_name} summary has no numeric metrics",
-                summary_path,
-            )
-
-        decisions = _load_offline_decisions(root, str(policy_name), payload, issues)
-        if decisions is None:
-            continue
-        _validate_decisions(
-            decisions,
-            policy_name=str(policy_name),
-            issues=issues,
-            source_path=root,
-            require_neighbour_measurements=require_neighbour_measurements,
+        return False
+    summary = payload.get("summary")
+    if not isinstance(summary, Mapping):
+        _add_issue(
+            issues,
+            "high",
+            "missing_policy_summary",
+            f"policy {policy_name} is missing summary metrics",
+            summary_path,
+        )
+    elif not _has_numeric_metric(summary):
+        _add_issue(
+            issues,
+            "high",
+            "empty_policy_summary",
+            f"policy {policy_name} summary has no numeric metrics",
+            summary_path,
         )
+    return True
 
 
 def _validate_live_output(
@@ -416,7 +508,7 @@ def _load_offline_decisions(
             )
             return None
 
-    decision_path = root / "decisions" / f"{policy_name}.jsonl"
+    decision_path = decision_log_path(root / "decisions", policy_name)
     if not decision_path.is_file():
         _add_issue(
             issues,
@@ -436,7 +528,7 @@ def _load_offline_decisions(
         )
         return None
     try:
-        decisions = read_decisions_jsonl(decision_path)
+        decisions = read_decisions(decision_path)
     except Exception as exc:  # noqa: BLE001 - include file context
         _add_issue(
             issues,
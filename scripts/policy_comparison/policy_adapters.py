@@ -5,7 +5,7 @@ from __future__ import annotations
 import sys
 import time
 from pathlib import Path
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from typing import Any, Dict, Mapping, Optional, Protocol, Sequence
 
 import requests  # type: ignore[import-untyped]
@@ -14,6 +14,7 @@ from .complexity import (
     DEFAULT_HIGH_COMPLEXITY_THRESHOLD,
     DEFAULT_MIN_VIABLE_RSRP_DBM,
     DEFAULT_MIN_VIABLE_SINR_DB,
+    best_neighbour,
     candidate_complexity_for_record,
     is_viable_cell,
 )
@@ -52,7 +53,17 @@ class PolicyAdapterError(RuntimeError):
 
 
 class ComparisonPolicyAdapter(Protocol):
-    """Common strategy interface for offline ML/A3 policy comparison."""
+    """Common strategy interface for offline ML/A3 policy comparison.
+
+    Adapters may also define ``warmup(record)``, ``set_replay_state(ue_id,
+    state)`` and ``score_snapshot(records)``; the replay runner calls them
+    when present. ``score_snapshot`` receives every UE's record of one
+    snapshot, after their replay state is set and before any of them is
+    decided. Model-backed adapters use it to score the whole snapshot in one
+    model call; ``decide`` then consumes those scores for the identical record
+    and applies its per-UE guards as usual, falling back to scoring the
+    record itself when there are none.
+    """
 
     @property
     def name(self) -> str:
@@ -69,6 +80,47 @@ class ComparisonPolicyAdapter(Protocol):
         """Reset any per-UE or global policy state."""
 
 
+@dataclass(frozen=True)
+class _SnapshotScores:
+    """Model output computed by ``score_snapshot`` for one UE's record."""
+
+    record: MeasurementTraceRecord
+    value: Any
+    elapsed_s: float
+
+
+def _snapshot_scores(
+    records: Sequence[MeasurementTraceRecord],
+    values: Sequence[Any],
+    *,
+    started: float,
+) -> Dict[str, _SnapshotScores]:
+    """Key batched model outputs by UE, each charged an equal share of the batch time."""
+    elapsed_s = (time.perf_counter() - started) / max(1, len(records))
+    return {
+        record.ue_id: _SnapshotScores(record=record, value=value, elapsed_s=elapsed_s)
+        for record, value in zip(records, values)
+    }
+
+
+def _take_snapshot_scores(
+    scores: Dict[str, _SnapshotScores],
+    record: MeasurementTraceRecord,
+) -> Optional[_SnapshotScores]:
+    """Pop the batched output for ``record``, ignoring outputs for other views."""
+    entry = scores.pop(record.ue_id, None)
+    return entry if entry is not None and entry.record is record else None
+
+
+def _forward_snapshot(
+    policy: ComparisonPolicyAdapter,
+    records: Sequence[MeasurementTraceRecord],
+) -> None:
+    score_snapshot = getattr(policy, "score_snapshot", None)
+    if callable(score_snapshot):
+        score_snapshot(records)
+
+
 def ensure_baseline_service_importable() -> None:
     """Expose the local baseline package path without creating a service."""
     if not BASELINE_SERVICE_PATH.exists():
@@ -789,6 +841,7 @@ class CandidateRankerPolicyAdapter:
         )
         self.emergency_rsrp_floor_dbm = float(emergency_rsrp_floor_dbm)
         self._replay_state_by_ue: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_scores: Dict[str, _SnapshotScores] = {}
 
     @property
     def name(self) -> str:
@@ -810,46 +863,35 @@ class CandidateRankerPolicyAdapter:
     def reset(self, ue_id: Optional[str] = None) -> None:
         if ue_id is None:
             self._replay_state_by_ue.clear()
+            self._snapshot_scores.clear()
         else:
             self._replay_state_by_ue.pop(ue_id, None)
+            self._snapshot_scores.pop(ue_id, None)
         return None
 
     def set_replay_state(self, ue_id: str, state: Mapping[str, Any]) -> None:
         self._replay_state_by_ue[str(ue_id)] = dict(state)
 
+    def score_snapshot(self, records: Sequence[MeasurementTraceRecord]) -> None:
+        """Score every record of one replay snapshot with a single model call."""
+        started = time.perf_counter()
+        scores = self.artifact.score_row_groups(
+            [
+                _ranker_feature_rows(record, self._replay_state_by_ue.get(record.ue_id, {}))
+                for record in records
+            ]
+        )
+        self._snapshot_scores = _snapshot_scores(records, scores, started=started)
+
     def decide(self, record: MeasurementTraceRecord) -> PolicyDecisionRecord:
         started = time.perf_counter()
         state = self._replay_state_by_ue.get(record.ue_id, {})
-        rows = build_candidate_ranker_features(
-            record,
-            recent_handover_count=_optional_int(
-                state.get("recent_handover_count"),
-                default=None,
-            ),
-            time_since_last_handover_s=_optional_float(
-                state.get("time_since_last_handover_s"),
-                default=None,
-            ),
-            current_dwell_time_s=_optional_float(
-                state.get("current_dwell_time_s"),
-                default=None,
-            ),
-            last_handover_source=(
-                None
-                if state.get("last_handover_source") is None
-                else str(state.get("last_handover_source"))
-            ),
-            previous_serving_cell=(
-                None
-                if state.get("previous_serving_cell") is None
-                else str(state.get("previous_serving_cell"))
-            ),
-            previous_target_cell=(
-                None
-                if state.get("previous_target_cell") is None
-                else str(state.get("previous_target_cell"))
-            ),
-        )
+        prescored = _take_snapshot_scores(self._snapshot_scores, record)
+        if prescored is None:
+            candidate_scores = self.artifact.score_rows(_ranker_feature_rows(record, state))
+        else:
+            started -= prescored.elapsed_s
+            candidate_scores = prescored.value
         complexity = candidate_complexity_for_record(record)
         visible = record.visible_cell_map
         serving = visible[record.serving_cell]
@@ -858,7 +900,6 @@ class CandidateRankerPolicyAdapter:
             for cell in record.visible_cells
             if cell.cell_id != record.serving_cell
         }
-        candidate_scores = self.artifact.score_rows(rows)
         selected_target = None
         selected_score = None
         best_candidate = None
@@ -973,6 +1014,7 @@ class OracleRankerPolicyAdapter:
             configured if min_utility_margin is None else min_utility_margin
         )
         self._replay_state_by_ue: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_scores: Dict[str, _SnapshotScores] = {}
 
     @property
     def name(self) -> str:
@@ -993,31 +1035,39 @@ class OracleRankerPolicyAdapter:
     def reset(self, ue_id: Optional[str] = None) -> None:
         if ue_id is None:
             self._replay_state_by_ue.clear()
+            self._snapshot_scores.clear()
         else:
             self._replay_state_by_ue.pop(ue_id, None)
+            self._snapshot_scores.pop(ue_id, None)
 
     def set_replay_state(self, ue_id: str, state: Mapping[str, Any]) -> None:
         self._replay_state_by_ue[str(ue_id)] = dict(state)
 
+    def score_snapshot(self, records: Sequence[MeasurementTraceRecord]) -> None:
+        """Score every record of one replay snapshot with a single model call."""
+        started = time.perf_counter()
+        actions = [self._actions(record) for record in records]
+        scores = self.artifact.score_row_groups(
+            [
+                self._action_rows(record, record_actions)
+                for record, record_actions in zip(records, actions)
+            ]
+        )
+        self._snapshot_scores = _snapshot_scores(
+            records,
+            list(zip(actions, scores)),
+            started=started,
+        )
+
     def decide(self, record: MeasurementTraceRecord) -> PolicyDecisionRecord:
         started = time.perf_counter()
-        state = self._replay_state_by_ue.get(record.ue_id, {})
-        actions = [record.serving_cell] + [
-            cell.cell_id
-            for cell in record.visible_cells
-            if cell.cell_id != record.serving_cell and is_viable_cell(cell)
-        ]
-        rows = [
-            action_features(
-                record,
-                serving_cell=record.serving_cell,
-                action_cell=action,
-                recent_handover_count=int(state.get("recent_handover_count") or 0),
-                dwell_time_s=float(state.get("current_dwell_time_s") or 0.0),
-            )
-            for action in actions
-        ]
-        scores = self.artifact.score_rows(rows)
+        prescored = _take_snapshot_scores(self._snapshot_scores, record)
+        if prescored is None:
+            actions = self._actions(record)
+            scores = self.artifact.score_rows(self._action_rows(record, actions))
+        else:
+            started -= prescored.elapsed_s
+            actions, scores = prescored.value
         score_by_action = dict(zip(actions, scores))
         stay_score = score_by_action[record.serving_cell]
         candidates = {
@@ -1107,6 +1157,49 @@ class OracleRankerPolicyAdapter:
             confidence=None,
         )
 
+    @staticmethod
+    def _actions(record: MeasurementTraceRecord) -> list[str]:
+        return [record.serving_cell] + [
+            cell.cell_id
+            for cell in record.visible_cells
+            if cell.cell_id != record.serving_cell and is_viable_cell(cell)
+        ]
+
+    def _action_rows(
+        self,
+        record: MeasurementTraceRecord,
+        actions: Sequence[str],
+    ) -> list[dict[str, Any]]:
+        state = self._replay_state_by_ue.get(record.ue_id, {})
+        return [
+            action_features(
+                record,
+                serving_cell=record.serving_cell,
+                action_cell=action,
+                recent_handover_count=int(state.get("recent_handover_count") or 0),
+                dwell_time_s=float(state.get("current_dwell_time_s") or 0.0),
+            )
+            for action in actions
+        ]
+
+
+@dataclass(frozen=True)
+class _SegmentEntryScores:
+    """Candidate and entry model outputs for one inactive high-complexity record."""
+
+    candidate_scores: Dict[str, float]
+    selected_candidate: Optional[str]
+    best_score: Optional[float]
+    entry_score: float
+
+
+def _best_scored_candidate(
+    candidate_scores: Mapping[str, float],
+) -> tuple[Optional[str], Optional[float]]:
+    if not candidate_scores:
+        return None, None
+    return max(candidate_scores.items(), key=lambda item: (item[1], item[0]))
+
 
 class SegmentControllerPolicyAdapter:
     """Offline two-stage segment controller.
@@ -1248,6 +1341,7 @@ class SegmentControllerPolicyAdapter:
         self._replay_state_by_ue: Dict[str, Dict[str, Any]] = {}
         self._segment_state_by_ue: Dict[str, Dict[str, Any]] = {}
         self._guard_state_by_ue: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_scores: Dict[str, _SnapshotScores] = {}
 
     @property
     def name(self) -> str:
@@ -1285,10 +1379,12 @@ class SegmentControllerPolicyAdapter:
             self._replay_state_by_ue.clear()
             self._segment_state_by_ue.clear()
             self._guard_state_by_ue.clear()
+            self._snapshot_scores.clear()
         else:
             self._replay_state_by_ue.pop(ue_id, None)
             self._segment_state_by_ue.pop(ue_id, None)
             self._guard_state_by_ue.pop(ue_id, None)
+            self._snapshot_scores.pop(ue_id, None)
 
     def set_replay_state(self, ue_id: str, state: Mapping[str, Any]) -> None:
         clean_state = dict(state)
@@ -1302,13 +1398,7 @@ class SegmentControllerPolicyAdapter:
         """Prime local model inference without retaining replay state or latency."""
         candidate_rows = self._candidate_rows(record)
         candidate_scores = self.artifact.score_candidates(candidate_rows)
-        selected_candidate = None
-        best_score = None
-        if candidate_scores:
-            selected_candidate, best_score = max(
-                candidate_scores.items(),
-                key=lambda item: (item[1], item[0]),
-            )
+        selected_candidate, best_score = _best_scored_candidate(candidate_scores)
         entry_row = self._entry_row(
             record,
             candidate_rows=candidate_rows,
@@ -1329,8 +1419,78 @@ class SegmentControllerPolicyAdapter:
             )
         )
 
+    def score_snapshot(self, records: Sequence[MeasurementTraceRecord]) -> None:
+        """Score one replay snapshot's entry and exit rows in batched model calls.
+
+        Active segments past the minimum duration get an exit score; inactive
+        high-complexity records get candidate scores and, when a candidate is
+        selected, an entry score. Each stage is one call per model.
+        """
+        started = time.perf_counter()
+        if self.sparse_policy is not None:
+            _forward_snapshot(self.sparse_policy, records)
+        entering: list[MeasurementTraceRecord] = []
+        exiting: list[MeasurementTraceRecord] = []
+        exit_rows: list[dict[str, Any]] = []
+        for record in records:
+            segment_state = self._segment_state_by_ue.get(record.ue_id)
+            if segment_state and segment_state.get("active") is True:
+                age_s = self._segment_age_s(record, segment_state)
+                if age_s >= self.min_segment_duration_s:
+                    exiting.append(record)
+                    exit_rows.append(
+                        self._exit_row(record, segment_state=segment_state, age_s=age_s)
+                    )
+            elif (
+                candidate_complexity_for_record(
+                    record,
+                    high_complexity_threshold=self.high_complexity_threshold,
+                ).complexity_bucket
+                == "high"
+            ):
+                entering.append(record)
+
+        candidate_rows = [self._candidate_rows(record) for record in entering]
+        candidate_scores = self.artifact.score_candidate_groups(candidate_rows)
+        selections = [_best_scored_candidate(scores) for scores in candidate_scores]
+        entry_rows = [
+            self._entry_row(
+                record,
+                candidate_rows=rows,
+                candidate_scores=scores,
+                selected_candidate=selected_candidate,
+                best_score=best_score,
+            )
+            for record, rows, scores, (selected_candidate, best_score) in zip(
+                entering, candidate_rows, candidate_scores, selections
+            )
+        ]
+        entry_scores = iter(
+            self.artifact.score_entries(
+                [row for row, (selected, _) in zip(entry_rows, selections) if selected]
+            )
+        )
+        entries = [
+            _SegmentEntryScores(
+                candidate_scores=scores,
+                selected_candidate=selected_candidate,
+                best_score=best_score,
+                entry_score=next(entry_scores) if selected_candidate else 0.0,
+            )
+            for scores, (selected_candidate, best_score) in zip(candidate_scores, selections)
+        ]
+        exit_scores = self.artifact.score_exits(exit_rows) if exit_rows else []
+        self._snapshot_scores = _snapshot_scores(
+            [*entering, *exiting],
+            [*entries, *exit_scores],
+            started=started,
+        )
+
     def decide(self, record: MeasurementTraceRecord) -> PolicyDecisionRecord:
         started = time.perf_counter()
+        prescored = _take_snapshot_scores(self._snapshot_scores, record)
+        if prescored is not None:
+            started -= prescored.elapsed_s
         complexity = candidate_complexity_for_record(
             record,
             high_complexity_threshold=self.high_complexity_threshold,
@@ -1342,6 +1502,11 @@ class SegmentControllerPolicyAdapter:
                 complexity=complexity,
                 segment_state=segment_state,
                 started=started,
+                exit_score=(
+                    prescored.value
+                    if prescored is not None and isinstance(prescored.value, float)
+                    else None
+                ),
             )
 
         if complexity.complexity_bucket != "high":
@@ -1402,23 +1567,15 @@ class SegmentControllerPolicyAdapter:
                 ),
             )
 
-        candidate_rows = self._candidate_rows(record)
-        candidate_scores = self.artifact.score_candidates(candidate_rows)
-        selected_candidate = None
-        best_score = None
-        if candidate_scores:
-            selected_candidate, best_score = max(
-                candidate_scores.items(),
-                key=lambda item: (item[1], item[0]),
-            )
-        entry_row = self._entry_row(
-            record,
-            candidate_rows=candidate_rows,
-            candidate_scores=candidate_scores,
-            selected_candidate=selected_candidate,
-            best_score=best_score,
+        entry = (
+            prescored.value
+            if prescored is not None and isinstance(prescored.value, _SegmentEntryScores)
+            else self._score_entry(record)
         )
-        entry_score = self.artifact.score_entry(entry_row) if selected_candidate else 0.0
+        candidate_scores = entry.candidate_scores
+        selected_candidate = entry.selected_candidate
+        best_score = entry.best_score
+        entry_score = entry.entry_score
         margin = float(best_score or 0.0)
         approved = (
             selected_candidate is not None
@@ -1496,6 +1653,28 @@ class SegmentControllerPolicyAdapter:
             segment_debug=segment_debug,
         )
 
+    def _score_entry(self, record: MeasurementTraceRecord) -> _SegmentEntryScores:
+        candidate_rows = self._candidate_rows(record)
+        candidate_scores = self.artifact.score_candidates(candidate_rows)
+        selected_candidate, best_score = _best_scored_candidate(candidate_scores)
+        entry_row = self._entry_row(
+            record,
+            candidate_rows=candidate_rows,
+            candidate_scores=candidate_scores,
+            selected_candidate=selected_candidate,
+            best_score=best_score,
+        )
+        return _SegmentEntryScores(
+            candidate_scores=candidate_scores,
+            selected_candidate=selected_candidate,
+            best_score=best_score,
+            entry_score=self.artifact.score_entry(entry_row) if selected_candidate else 0.0,
+        )
+
+    @staticmethod
+    def _segment_age_s(record: MeasurementTraceRecord, segment_state: Mapping[str, Any]) -> float:
+        return max(0.0, float(record.timestamp_s) - float(segment_state["entry_time_s"]))
+
     def _decide_active_segment(
         self,
         record: MeasurementTraceRecord,
@@ -1503,8 +1682,9 @@ class SegmentControllerPolicyAdapter:
         complexity: Any,
         segment_state: Dict[str, Any],
         started: float,
+        exit_score: Optional[float] = None,
     ) -> PolicyDecisionRecord:
-        age_s = max(0.0, float(record.timestamp_s) - float(segment_state["entry_time_s"]))
+        age_s = self._segment_age_s(record, segment_state)
         segment_state["last_age_s"] = age_s
         serving = record.visible_cell_map.get(record.serving_cell)
         segment_cell = str(segment_state.get("segment_cell") or record.serving_cell)
@@ -1524,14 +1704,15 @@ class SegmentControllerPolicyAdapter:
                 exit_reason="emergency_rsrp_floor_or_missing_serving",
             )
 
-        exit_score = None
         exit_reason = None
         if age_s < self.min_segment_duration_s:
+            exit_score = None
             segment_state["consecutive_exit_votes"] = 0
             exit_reason = "min_segment_duration_not_met"
         else:
-            exit_row = self._exit_row(record, segment_state=segment_state, age_s=age_s)
-            exit_score = self.artifact.score_exit(exit_row)
+            if exit_score is None:
+                exit_row = self._exit_row(record, segment_state=segment_state, age_s=age_s)
+                exit_score = self.artifact.score_exit(exit_row)
             if exit_score >= self.exit_threshold:
                 segment_state["consecutive_exit_votes"] = int(
                     segment_state.get("consecutive_exit_votes", 0)
@@ -1844,37 +2025,7 @@ class SegmentControllerPolicyAdapter:
         return debug
 
     def _candidate_rows(self, record: MeasurementTraceRecord) -> list[dict[str, Any]]:
-        state = self._replay_state_by_ue.get(record.ue_id, {})
-        rows = build_candidate_ranker_features(
-            record,
-            recent_handover_count=_optional_int(
-                state.get("recent_handover_count"),
-                default=None,
-            ),
-            time_since_last_handover_s=_optional_float(
-                state.get("time_since_last_handover_s"),
-                default=None,
-            ),
-            current_dwell_time_s=_optional_float(
-                state.get("current_dwell_time_s"),
-                default=None,
-            ),
-            last_handover_source=(
-                None
-                if state.get("last_handover_source") is None
-                else str(state.get("last_handover_source"))
-            ),
-            previous_serving_cell=(
-                None
-                if state.get("previous_serving_cell") is None
-                else str(state.get("previous_serving_cell"))
-            ),
-            previous_target_cell=(
-                None
-                if state.get("previous_target_cell") is None
-                else str(state.get("previous_target_cell"))
-            ),
-        )
+        rows = _ranker_feature_rows(record, self._replay_state_by_ue.get(record.ue_id, {}))
         for row in rows:
             row["row_type"] = "candidate"
             row["snapshot_group"] = (
@@ -1947,15 +2098,7 @@ class SegmentControllerPolicyAdapter:
         segment_cell = visible.get(selected_candidate)
         entry_serving = str(segment_state.get("entry_serving_cell") or "")
         original_serving = visible.get(entry_serving)
-        best = max(
-            [
-                cell
-                for cell in record.visible_cells
-                if cell.cell_id not in {selected_candidate, record.serving_cell}
-            ],
-            key=lambda cell: (cell.rsrp_dbm, cell.cell_id),
-            default=None,
-        )
+        best = best_neighbour(record, excluding=selected_candidate)
         segment_rsrp = segment_cell.rsrp_dbm if segment_cell is not None else -160.0
         best_rsrp = best.rsrp_dbm if best is not None else -160.0
         common = self._common_snapshot_features(record)
@@ -2280,14 +2423,21 @@ class ComplexityAwarePolicyAdapter:
             if callable(setter):
                 setter(ue_id, clean_state)
 
+    def score_snapshot(self, records: Sequence[MeasurementTraceRecord]) -> None:
+        """Forward each record to the delegate its complexity routes it to."""
+        high: list[MeasurementTraceRecord] = []
+        other: list[MeasurementTraceRecord] = []
+        for record in records:
+            if self._complexity(record).complexity_bucket == "high":
+                high.append(record)
+            else:
+                other.append(record)
+        _forward_snapshot(self.ml_policy, high)
+        _forward_snapshot(self.sparse_policy, other)
+
     def decide(self, record: MeasurementTraceRecord) -> PolicyDecisionRecord:
         started = time.perf_counter()
-        complexity = candidate_complexity_for_record(
-            record,
-            min_rsrp_dbm=self.min_rsrp_dbm,
-            min_sinr_db=self.min_sinr_db,
-            high_complexity_threshold=self.high_complexity_threshold,
-        )
+        complexity = self._complexity(record)
         source, delegate, segment_debug = self._select_delegate(record, complexity)
         if delegate is None:
             return self._segment_stay_decision(
@@ -2332,6 +2482,14 @@ class ComplexityAwarePolicyAdapter:
             debug=debug,
         )
 
+    def _complexity(self, record: MeasurementTraceRecord) -> Any:
+        return candidate_complexity_for_record(
+            record,
+            min_rsrp_dbm=self.min_rsrp_dbm,
+            min_sinr_db=self.min_sinr_db,
+            high_complexity_threshold=self.high_complexity_threshold,
+        )
+
     def _select_delegate(
         self,
         record: MeasurementTraceRecord,
@@ -2477,6 +2635,43 @@ class ComplexityAwarePolicyAdapter:
         return margin < self.a3_reentry_extra_margin_db
 
 
+def _ranker_feature_rows(
+    record: MeasurementTraceRecord,
+    state: Mapping[str, Any],
+) -> list[dict[str, Any]]:
+    """Candidate-ranker feature rows for ``record`` under the UE's replay state."""
+    return build_candidate_ranker_features(
+        record,
+        recent_handover_count=_optional_int(
+            state.get("recent_handover_count"),
+            default=None,
+        ),
+        time_since_last_handover_s=_optional_float(
+            state.get("time_since_last_handover_s"),
+            default=None,
+        ),
+        current_dwell_time_s=_optional_float(
+            state.get("current_dwell_time_s"),
+            default=None,
+        ),
+        last_handover_source=(
+            None
+            if state.get("last_handover_source") is None
+            else str(state.get("last_handover_source"))
+        ),
+        previous_serving_cell=(
+            None
+            if state.get("previous_serving_cell") is None
+            else str(state.get("previous_serving_cell"))
+        ),
+        previous_target_cell=(
+            None
+            if state.get("previous_target_cell") is None
+            else str(state.get("previous_target_cell"))
+        ),
+    )
+
+
 def trace_record_to_ml_payload(record: MeasurementTraceRecord) -> Dict[str, Any]:
     """Build the payload shape accepted by the existing ML service."""
     rf_metrics = {}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, replace
 from itertools import groupby
 from typing import Any, Dict, List, Mapping, Sequence
@@ -49,15 +51,31 @@ class ReplayResult:
 
 
 class OfflineReplayRunner:
-    """Replay the same measurement snapshots through multiple policies."""
+    """Replay the same measurement snapshots through multiple policies.
 
-    def __init__(self, policies: Sequence[ComparisonPolicyAdapter]) -> None:
+    With ``workers > 1`` policies are sharded across a process pool. Each
+    policy keeps its own serving, replay-state and decision structures, so
+    the result is identical to the serial replay. The policy objects held by
+    the runner are not advanced in that mode (their copies in the workers
+    are), and policies backed by a shared stateful service should be
+    replayed serially.
+    """
+
+    def __init__(
+        self,
+        policies: Sequence[ComparisonPolicyAdapter],
+        *,
+        workers: int = 1,
+    ) -> None:
         if not policies:
             raise ValueError("at least one policy adapter is required")
         names = [policy.name for policy in policies]
         if len(set(names)) != len(names):
             raise ValueError("policy adapter names must be unique")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.policies = list(policies)
+        self.workers = int(workers)
 
     def replay(self, records: Sequence[MeasurementTraceRecord]) -> ReplayResult:
         """Replay a canonical trace without mutating the original records."""
@@ -76,77 +94,13 @@ class OfflineReplayRunner:
             if record.topology_hash != topology_hash:
                 raise ValueError("all trace records must use the same topology_hash")
 
-        serving_by_policy: Dict[str, Dict[str, str]] = {
-            policy.name: {} for policy in self.policies
-        }
-        replay_state_by_policy: Dict[str, Dict[str, Dict[str, Any]]] = {
-            policy.name: {} for policy in self.policies
-        }
-        decisions_by_policy: Dict[str, List[PolicyDecisionRecord]] = {
-            policy.name: [] for policy in self.policies
-        }
-
         warmup_record = max(ordered, key=lambda item: len(item.visible_cells))
-        for policy in self.policies:
-            policy.reset()
-            warmup = getattr(policy, "warmup", None)
-            if callable(warmup):
-                warmup(warmup_record)
-        for policy in self.policies:
-            policy.reset()
-
-        for _snapshot_key, snapshot_items in groupby(
-            ordered,
-            key=lambda item: (item.timestamp_s, item.step_index),
-        ):
-            snapshot = list(snapshot_items)
-            for policy in self.policies:
-                policy_serving_by_ue = serving_by_policy[policy.name]
-                for item in snapshot:
-                    policy_serving_by_ue.setdefault(item.ue_id, item.serving_cell)
-                policy_loads: Dict[str, int] = {}
-                for serving in policy_serving_by_ue.values():
-                    policy_loads[serving] = policy_loads.get(serving, 0) + 1
-
-                for record in snapshot:
-                    current_serving = policy_serving_by_ue[record.ue_id]
-                    policy_record = _with_policy_context(
-                        record,
-                        current_serving=current_serving,
-                        policy_loads=policy_loads,
-                    )
-                    state = _state_for_decision(
-                        replay_state_by_policy[policy.name],
-                        policy_record,
-                        current_serving,
-                    )
-                    setter = getattr(policy, "set_replay_state", None)
-                    if callable(setter):
-                        setter(record.ue_id, state)
-                    decision = policy.decide(policy_record)
-                    compliance = qos_compliance(
-                        policy_record.qos_requirements,
-                        policy_record.observed_qos or {},
-                    )
-                    decision = replace(
-                        decision,
-                        debug={
-                            **decision.debug,
-                            "qos_compliance": compliance,
-                            "counterfactual_qos": policy_record.observed_qos,
-                            "policy_specific_loads": policy_loads,
-                        },
-                    )
-                    decisions_by_policy[policy.name].append(decision)
-                    if (
-                        decision.decision_type == "handover"
-                        and decision.selected_target_cell is not None
-                    ):
-                        policy_serving_by_ue[record.ue_id] = decision.selected_target_cell
-                        _record_handover_state(
-                            replay_state_by_policy[policy.name],
-                            decision,
-                        )
+        if self.workers > 1 and len(self.policies) > 1:
+            decisions_by_policy = _replay_parallel(
+                self.policies, ordered, warmup_record, self.workers
+            )
+        else:
+            decisions_by_policy = _replay_serial(self.policies, ordered, warmup_record)
 
         return ReplayResult(
             scenario=scenario,
@@ -167,24 +121,162 @@ class OfflineReplayRunner:
         )
 
 
+def _replay_serial(
+    policies: Sequence[ComparisonPolicyAdapter],
+    ordered: Sequence[MeasurementTraceRecord],
+    warmup_record: MeasurementTraceRecord,
+) -> Dict[str, List[PolicyDecisionRecord]]:
+    contexts = [_PolicyReplay(policy) for policy in policies]
+    for context in contexts:
+        context.warmup(warmup_record)
+    for context in contexts:
+        context.policy.reset()
+
+    for _snapshot_key, snapshot_items in groupby(
+        ordered,
+        key=lambda item: (item.timestamp_s, item.step_index),
+    ):
+        snapshot = list(snapshot_items)
+        for context in contexts:
+            context.replay_snapshot(snapshot)
+    return {context.policy.name: context.decisions for context in contexts}
+
+
+# Trace and policies for the pool workers. Set before the pool starts, so
+# forked workers inherit them instead of receiving a pickled copy per task.
+_WORKER_INPUTS: tuple | None = None
+
+
+def _init_replay_worker(inputs: tuple) -> None:
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = inputs
+
+
+def _replay_policy_worker(index: int) -> List[PolicyDecisionRecord]:
+    assert _WORKER_INPUTS is not None, "replay worker was not initialised"
+    policies, ordered, warmup_record = _WORKER_INPUTS
+    return _replay_serial([policies[index]], ordered, warmup_record)[policies[index].name]
+
+
+def _replay_parallel(
+    policies: Sequence[ComparisonPolicyAdapter],
+    ordered: Sequence[MeasurementTraceRecord],
+    warmup_record: MeasurementTraceRecord,
+    workers: int,
+) -> Dict[str, List[PolicyDecisionRecord]]:
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    inputs = (list(policies), list(ordered), warmup_record)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(policies)),
+        mp_context=context,
+        initializer=_init_replay_worker,
+        initargs=(inputs,),
+    ) as pool:
+        # ``map`` yields in submission order, so the merge does not depend
+        # on which worker finishes first.
+        decisions = list(pool.map(_replay_policy_worker, range(len(policies))))
+    return {policy.name: items for policy, items in zip(policies, decisions)}
+
+
+class _PolicyReplay:
+    """Serving, replay-state and decision log of one policy during replay."""
+
+    def __init__(self, policy: ComparisonPolicyAdapter) -> None:
+        self.policy = policy
+        self.serving_by_ue: Dict[str, str] = {}
+        self.replay_state: Dict[str, Dict[str, Any]] = {}
+        self.decisions: List[PolicyDecisionRecord] = []
+
+    def warmup(self, warmup_record: MeasurementTraceRecord) -> None:
+        self.policy.reset()
+        warmup = getattr(self.policy, "warmup", None)
+        if callable(warmup):
+            warmup(warmup_record)
+
+    def replay_snapshot(self, snapshot: Sequence[MeasurementTraceRecord]) -> None:
+        policy = self.policy
+        policy_serving_by_ue = self.serving_by_ue
+        for item in snapshot:
+            policy_serving_by_ue.setdefault(item.ue_id, item.serving_cell)
+        policy_loads: Dict[str, int] = {}
+        for serving in policy_serving_by_ue.values():
+            policy_loads[serving] = policy_loads.get(serving, 0) + 1
+
+        # A UE's view and replay state depend only on its own earlier
+        # decisions, so with one record per UE they can all be prepared
+        # before the first decision and the snapshot scored in one batch.
+        score_snapshot = getattr(policy, "score_snapshot", None)
+        prepared: List[MeasurementTraceRecord] = []
+        if callable(score_snapshot) and len({item.ue_id for item in snapshot}) == len(snapshot):
+            prepared = [self._prepare(record, policy_loads) for record in snapshot]
+            score_snapshot(prepared)
+
+        for index, record in enumerate(snapshot):
+            policy_record = (
+                prepared[index] if prepared else self._prepare(record, policy_loads)
+            )
+            decision = policy.decide(policy_record)
+            compliance = qos_compliance(
+                policy_record.qos_requirements,
+                policy_record.observed_qos or {},
+            )
+            decision = replace(
+                decision,
+                debug={
+                    **decision.debug,
+                    "qos_compliance": compliance,
+                    "counterfactual_qos": policy_record.observed_qos,
+                    "policy_specific_loads": policy_loads,
+                },
+            )
+            self.decisions.append(decision)
+            if (
+                decision.decision_type == "handover"
+                and decision.selected_target_cell is not None
+            ):
+                policy_serving_by_ue[record.ue_id] = decision.selected_target_cell
+                _record_handover_state(self.replay_state, decision)
+
+    def _prepare(
+        self,
+        record: MeasurementTraceRecord,
+        policy_loads: Mapping[str, int],
+    ) -> MeasurementTraceRecord:
+        """Build the policy's view of ``record`` and hand it the UE's replay state."""
+        current_serving = self.serving_by_ue[record.ue_id]
+        policy_record = _with_policy_context(
+            record,
+            current_serving=current_serving,
+            policy_loads=policy_loads,
+        )
+        state = _state_for_decision(
+            self.replay_state,
+            policy_record,
+            current_serving,
+        )
+        setter = getattr(self.policy, "set_replay_state", None)
+        if callable(setter):
+            setter(record.ue_id, state)
+        return policy_record
+
+
 def _with_policy_context(
     record: MeasurementTraceRecord,
     *,
     current_serving: str,
     policy_loads: Mapping[str, int],
 ) -> MeasurementTraceRecord:
-    serving_record = record.with_serving_cell(current_serving)
-    cells = [
-        replace(cell, load=float(policy_loads.get(cell.cell_id, 0)))
-        for cell in serving_record.visible_cells
-    ]
-    contextual = replace(serving_record, visible_cells=cells)
+    contextual = record.with_policy_context(
+        serving_cell=current_serving,
+        cell_loads=policy_loads,
+    )
     observed = estimate_counterfactual_qos(
         contextual,
         serving_cell=current_serving,
         load=float(policy_loads.get(current_serving, 0)),
     )
-    return replace(contextual, observed_qos=observed)
+    return contextual.with_policy_context(observed_qos=observed)
 
 
 def replay_summary_table(result: ReplayResult) -> Mapping[str, Mapping[str, object]]:
@@ -0,0 +1,496 @@
+"""Parallel, in-memory replay sweeps for the calibration tuners.
+
+The replay tuners score hundreds of decision-parameter configurations against
+the same few calibration traces. ``ReplaySweep`` reads each trace and the
+segment artifact once, forks a process pool that inherits them, and replays
+every configuration in memory; only the per-seed metric summaries come back
+to the parent. Finished configurations are appended to an optional JSONL
+checkpoint, keyed by the digests of the tuned A3 config and segment artifact,
+so an interrupted sweep resumes where it stopped. Full replay
+output directories are written only on request, through
+``write_replay_artifacts``, for the configurations worth keeping.
+``successive_halving`` spends most of the replay budget on the configurations
+that still look promising on short trace prefixes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence
+
+from .output_validation import (
+    OutputValidationReport,
+    validate_comparison_output,
+    validate_replay_result,
+)
+from .replay import OfflineReplayRunner, ReplayResult
+from .run_offline_replay import (
+    build_policy_adapters,
+    run as run_offline_replay,
+    validate_tuned_config_split,
+)
+from .schemas import MeasurementTraceRecord
+from .segment_controller_artifact import (
+    SegmentControllerArtifact,
+    load_segment_controller_artifact,
+    sha256_file,
+)
+from .trace_io import read_trace
+
+
+SWEEP_POLICIES = ("tuned_a3_baseline", "complexity_aware_ml_a3", "ml")
+SWEEP_EXPECTED_POLICIES = ("tuned_a3_baseline", "complexity_aware_ml_a3", "ml_policy")
+
+# Maps one sweep configuration to ``build_policy_adapters`` keyword
+# arguments, which share their names with the ``run_offline_replay`` CLI.
+ReplayOptions = Callable[[Mapping[str, Any]], Mapping[str, Any]]
+# Turns one replay into the tuner's per-seed result row.
+SeedSummarizer = Callable[[Path, Mapping[str, Any], OutputValidationReport], Dict[str, Any]]
+# Turns a replay failure into the tuner's per-seed result row.
+SeedFailure = Callable[[Path, Exception], Dict[str, Any]]
+
+_REPLAY_DEFAULTS: Dict[str, Any] = {
+    "high_complexity_threshold": 3,
+    "ranker_min_margin": None,
+    "ranker_min_ml_dwell_s": None,
+    "a3_reentry_extra_margin_db": None,
+    "ml_segment_hold_s": None,
+    "segment_entry_threshold": None,
+    "segment_candidate_margin_min": None,
+    "segment_exit_threshold": None,
+    "segment_consecutive_exit_votes": None,
+    "segment_min_duration_s": None,
+    "segment_max_duration_s": None,
+    "segment_emergency_rsrp_floor_dbm": None,
+    "segment_post_exit_a3_guard_s": None,
+    "segment_post_exit_a3_extra_margin_db": None,
+    "segment_high_reject_hold_s": None,
+    "segment_sparse_authority_mode": None,
+    "segment_sparse_serving_rsrp_floor_dbm": None,
+    "segment_sparse_serving_sinr_floor_db": None,
+    "segment_sparse_a3_extra_margin_db": None,
+}
+
+
+@dataclass(frozen=True)
+class SweepOutcome:
+    """Per-seed results of one configuration, fresh or from a checkpoint."""
+
+    config_index: int
+    config: Dict[str, Any]
+    seed_results: List[Dict[str, Any]]
+
+    @property
+    def failed(self) -> bool:
+        return any(not item.get("ok") for item in self.seed_results)
+
+
+class ReplaySweep:
+    """Replay many configurations of the segment-controller comparison.
+
+    Every configuration replays ``tuned_a3_baseline``,
+    ``complexity_aware_ml_a3`` and the segment-controller ``ml`` policy, like
+    the ``run_offline_replay`` command the tuners used to invoke per seed.
+    Results come back in the order the configurations were given, whatever
+    the worker count or checkpoint state.
+    """
+
+    def __init__(
+        self,
+        traces: Sequence[Path],
+        *,
+        tuned_a3_config: Path,
+        segment_artifact: Path,
+        replay_options: ReplayOptions,
+        summarize_seed: SeedSummarizer,
+        failed_seed: SeedFailure,
+        workers: int = 1,
+        checkpoint: Path | None = None,
+        stop_on_failure: bool = False,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.traces = [Path(path) for path in traces]
+        self.tuned_a3_config = Path(tuned_a3_config)
+        self.segment_artifact = Path(segment_artifact)
+        self.replay_options = replay_options
+        self.summarize_seed = summarize_seed
+        self.failed_seed = failed_seed
+        self.workers = int(workers)
+        self.checkpoint = Path(checkpoint) if checkpoint is not None else None
+        self.stop_on_failure = bool(stop_on_failure)
+        self._records: Dict[tuple[Path, float], List[MeasurementTraceRecord]] = {}
+        self._artifact: SegmentControllerArtifact | None = None
+        self._input_digests: Dict[str, str] | None = None
+        self._completed = _read_checkpoint(self.checkpoint)
+
+    def records(self, trace: Path, trace_fraction: float = 1.0) -> List[MeasurementTraceRecord]:
+        """Return the records of one trace, read from disk on first use.
+
+        A ``trace_fraction`` below 1 keeps only the earliest share of the
+        trace's snapshots, see ``trace_prefix``.
+        """
+        key = (Path(trace), float(trace_fraction))
+        if key not in self._records:
+            self._records[key] = (
+                read_trace(key[0])
+                if key[1] >= 1.0
+                else trace_prefix(self.records(key[0]), key[1])
+            )
+        return self._records[key]
+
+    def run(
+        self,
+        indexed_configs: Sequence[tuple[int, Mapping[str, Any]]],
+        *,
+        stage: str,
+        traces: Sequence[Path] | None = None,
+        trace_fraction: float = 1.0,
+    ) -> List[SweepOutcome]:
+        """Evaluate configurations on ``traces`` (default: every trace).
+
+        ``stage`` names the checkpoint rows, so the stages of one tuning run
+        can share a checkpoint file without mixing their results.
+        ``trace_fraction`` replays only a prefix of every trace. Checkpoint
+        rows recorded against a different tuned A3 config or segment artifact
+        are evaluated again.
+        """
+        selected_traces = [Path(path) for path in (traces or self.traces)]
+        trace_names = [str(path) for path in selected_traces]
+        digests = self.input_digests()
+        outcomes: Dict[int, SweepOutcome] = {}
+        pending: List[tuple[int, Dict[str, Any]]] = []
+        for config_index, config in indexed_configs:
+            row = self._completed.get((stage, int(config_index)))
+            if row is None or row.get("inputs") != digests:
+                pending.append((int(config_index), dict(config)))
+                continue
+            if (
+                row["config"] != dict(config)
+                or row["traces"] != trace_names
+                or row.get("trace_fraction", 1.0) != trace_fraction
+            ):
+                raise ValueError(
+                    f"checkpoint {self.checkpoint} does not match {stage} "
+                    f"config {config_index}; use a fresh checkpoint for a changed sweep"
+                )
+            outcomes[int(config_index)] = SweepOutcome(
+                config_index=int(config_index),
+                config=dict(config),
+                seed_results=list(row["seed_results"]),
+            )
+
+        if pending:
+            # Load inputs before the pool forks so workers inherit them.
+            for trace in selected_traces:
+                self.records(trace, trace_fraction)
+            self._segment_controller_artifact()
+            for outcome in self._evaluate_pending(pending, selected_traces, trace_fraction):
+                outcomes[outcome.config_index] = outcome
+                self._append_checkpoint(stage, trace_names, trace_fraction, outcome)
+        return [outcomes[int(config_index)] for config_index, _ in indexed_configs]
+
+    def input_digests(self) -> Dict[str, str]:
+        """Return sha256 digests of the tuned A3 config and segment artifact.
+
+        Computed once per sweep; the digests tie checkpoint rows to the
+        inputs that produced them.
+        """
+        if self._input_digests is None:
+            self._input_digests = {
+                "tuned_a3_config_sha256": sha256_file(self.tuned_a3_config),
+                "segment_artifact_sha256": sha256_file(self.segment_artifact),
+            }
+        return self._input_digests
+
+    def evaluate_config(
+        self,
+        config: Mapping[str, Any],
+        traces: Sequence[Path],
+        trace_fraction: float = 1.0,
+    ) -> List[Dict[str, Any]]:
+        """Replay one configuration on each trace and summarize every seed."""
+        seed_results: List[Dict[str, Any]] = []
+        for trace in traces:
+            try:
+                result = self._replay(config, trace, trace_fraction)
+                validation = validate_replay_result(
+                    result,
+                    expected_policies=list(SWEEP_EXPECTED_POLICIES),
+                )
+                seed_result = self.summarize_seed(trace, _metric_summary(result), validation)
+            except Exception as exc:  # noqa: BLE001 - preserve diagnostic detail
+                seed_result = self.failed_seed(trace, exc)
+            seed_results.append(seed_result)
+            if self.stop_on_failure and not seed_result.get("ok"):
+                break
+        return seed_results
+
+    def write_replay_artifacts(
+        self,
+        config: Mapping[str, Any],
+        output_dir: Path,
+        *,
+        replay_dir_name: Callable[[Path], str],
+        traces: Sequence[Path] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Write full ``run_offline_replay`` outputs for one configuration."""
+        written = []
+        for trace in traces or self.traces:
+            replay_dir = Path(output_dir) / replay_dir_name(Path(trace))
+            run_offline_replay(self._replay_namespace(config, Path(trace), replay_dir))
+            validation = validate_comparison_output(
+                replay_dir,
+                expected_policies=list(SWEEP_EXPECTED_POLICIES),
+            )
+            written.append(
+                {
+                    "trace": str(trace),
+                    "output_dir": str(replay_dir),
+                    "validation_ok": validation.ok,
+                }
+            )
+        return written
+
+    def _replay(
+        self,
+        config: Mapping[str, Any],
+        trace: Path,
+        trace_fraction: float,
+    ) -> ReplayResult:
+        records = self.records(trace, trace_fraction)
+        adapters, _, _, tuned_config_data = build_policy_adapters(
+            SWEEP_POLICIES,
+            evaluation_trace=trace,
+            calibration_trace=None,
+            tuned_a3_config=self.tuned_a3_config,
+            ml_base_url=None,
+            ml_backend="segment_controller",
+            segment_artifact=self._segment_controller_artifact(),
+            **self.replay_options(config),
+        )
+        validate_tuned_config_split(records, tuned_config_data, allow_seed_overlap=True)
+        return OfflineReplayRunner(adapters).replay(records)
+
+    def _replay_namespace(
+        self,
+        config: Mapping[str, Any],
+        trace: Path,
+        replay_dir: Path,
+    ) -> argparse.Namespace:
+        options = dict(_REPLAY_DEFAULTS)
+        options.update(self.replay_options(config))
+        return argparse.Namespace(
+            trace=str(trace),
+            output_dir=str(replay_dir),
+            policies=",".join(SWEEP_POLICIES),
+            calibration_trace=None,
+            tuned_a3_config=str(self.tuned_a3_config),
+            allow_tuned_a3_calibration_seed_overlap=True,
+            ml_base_url=None,
+            ml_backend="segment_controller",
+            ranker_artifact=None,
+            segment_artifact=str(self.segment_artifact),
+            oracle_artifact=None,
+            **options,
+        )
+
+    def _segment_controller_artifact(self) -> SegmentControllerArtifact:
+        if self._artifact is None:
+            self._artifact = load_segment_controller_artifact(self.segment_artifact)
+        return self._artifact
+
+    def _evaluate_pending(
+        self,
+        pending: Sequence[tuple[int, Dict[str, Any]]],
+        traces: Sequence[Path],
+        trace_fraction: float,
+    ) -> Iterator[SweepOutcome]:
+        if self.workers == 1 or len(pending) == 1:
+            for config_index, config in pending:
+                yield SweepOutcome(
+                    config_index,
+                    config,
+                    self.evaluate_config(config, traces, trace_fraction),
+                )
+            return
+
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(pending)),
+            mp_context=context,
+            initializer=_init_sweep_worker,
+            initargs=((self, list(traces), trace_fraction),),
+        ) as pool:
+            futures = {
+                pool.submit(_sweep_config_worker, config): (config_index, config)
+                for config_index, config in pending
+            }
+            # Completion order only decides when a row reaches the checkpoint;
+            # ``run`` reassembles results in the caller's order.
+            for future in as_completed(futures):
+                config_index, config = futures[future]
+                yield SweepOutcome(config_index, config, future.result())
+
+    def _append_checkpoint(
+        self,
+        stage: str,
+        trace_names: Sequence[str],
+        trace_fraction: float,
+        outcome: SweepOutcome,
+    ) -> None:
+        row = {
+            "stage": stage,
+            "config_index": outcome.config_index,
+            "config": outcome.config,
+            "traces": list(trace_names),
+            "trace_fraction": trace_fraction,
+            "inputs": self.input_digests(),
+            "seed_results": outcome.seed_results,
+        }
+        self._completed[(stage, outcome.config_index)] = row
+        if self.checkpoint is None:
+            return
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        with self.checkpoint.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(row, sort_keys=True) + "\n")
+
+
+# Sweep and traces for the pool workers. Set before the pool starts, so
+# forked workers inherit the loaded records instead of re-reading them.
+_WORKER_SWEEP: tuple | None = None
+
+
+def _init_sweep_worker(inputs: tuple) -> None:
+    global _WORKER_SWEEP
+    _WORKER_SWEEP = inputs
+
+
+def _sweep_config_worker(config: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    assert _WORKER_SWEEP is not None, "sweep worker was not initialised"
+    sweep, traces, trace_fraction = _WORKER_SWEEP
+    return sweep.evaluate_config(config, traces, trace_fraction)
+
+
+def successive_halving(
+    sweep: ReplaySweep,
+    indexed_configs: Sequence[tuple[int, Mapping[str, Any]]],
+    *,
+    build_entry: Callable[[SweepOutcome], Dict[str, Any]],
+    rank_key: Callable[[Mapping[str, Any]], Any],
+    eta: int = 3,
+    min_trace_fraction: float = 1.0 / 9.0,
+    traces: Sequence[Path] | None = None,
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Search a grid by successive halving over growing trace prefixes.
+
+    Every rung replays the surviving configurations on the same prefix of
+    every trace, starting at ``min_trace_fraction`` and growing by ``eta``
+    until the full traces. ``build_entry`` applies the tuner's pass criteria
+    to each outcome; survivors are the best ``1/eta`` by passing first, then
+    ``rank_key``. Returns the full-trace entries and a per-rung report.
+    """
+    if eta < 2:
+        raise ValueError("successive halving eta must be at least 2")
+    if not 0.0 < min_trace_fraction <= 1.0:
+        raise ValueError("min_trace_fraction must be in (0, 1]")
+    fractions = [1.0]
+    while fractions[0] / eta >= min_trace_fraction * (1.0 - 1e-9):
+        fractions.insert(0, fractions[0] / eta)
+
+    # Survivors keep the caller's grid order so later rungs stay deterministic.
+    order = {int(config_index): position for position, (config_index, _) in enumerate(indexed_configs)}
+    survivors = list(indexed_configs)
+    rungs: List[Dict[str, Any]] = []
+    for rung, fraction in enumerate(fractions):
+        entries = [
+            build_entry(outcome)
+            for outcome in sweep.run(
+                survivors,
+                stage=f"halving_rung{rung}",
+                traces=traces,
+                trace_fraction=fraction,
+            )
+        ]
+        ranked = sorted(entries, key=lambda entry: (not entry["pass"], rank_key(entry)))
+        report = {
+            "rung": rung,
+            "trace_fraction": fraction,
+            "config_count": len(entries),
+            "pass_count": sum(1 for entry in entries if entry["pass"]),
+        }
+        if fraction >= 1.0:
+            rungs.append(report)
+            return entries, rungs
+        keep = max(1, math.ceil(len(ranked) / eta))
+        survivors = sorted(
+            ((int(entry["config_index"]), entry["config"]) for entry in ranked[:keep]),
+            key=lambda item: order[item[0]],
+        )
+        report["kept_config_indices"] = [config_index for config_index, _ in survivors]
+        report["results"] = entries
+        rungs.append(report)
+    raise AssertionError("successive halving ended without a full-trace rung")
+
+
+def trace_prefix(
+    records: Sequence[MeasurementTraceRecord],
+    fraction: float,
+) -> List[MeasurementTraceRecord]:
+    """Records of the earliest ``fraction`` of snapshots, in input order.
+
+    Snapshots are ``(timestamp_s, step_index)`` groups, so every UE of a kept
+    snapshot stays in the prefix. At least one snapshot is always kept.
+    """
+    if not 0.0 < fraction <= 1.0:
+        raise ValueError("trace fraction must be in (0, 1]")
+    snapshots = sorted({(record.timestamp_s, record.step_index) for record in records})
+    if not snapshots:
+        return []
+    cutoff = snapshots[max(1, math.ceil(len(snapshots) * fraction)) - 1]
+    return [
+        record
+        for record in records
+        if (record.timestamp_s, record.step_index) <= cutoff
+    ]
+
+
+def _metric_summary(result: ReplayResult) -> Dict[str, Any]:
+    """The ``summary.json`` content the tuners read, minus the decision logs."""
+    return {
+        "scenario": result.scenario,
+        "seed": result.seed,
+        "topology_hash": result.topology_hash,
+        "policy_results": {
+            name: {"policy_name": name, "summary": policy_result.summary.to_dict()}
+            for name, policy_result in result.policy_results.items()
+        },
+    }
+
+
+def _read_checkpoint(path: Path | None) -> Dict[tuple[str, int], Dict[str, Any]]:
+    if path is None or not path.is_file():
+        return {}
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    completed: Dict[tuple[str, int], Dict[str, Any]] = {}
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            # A sweep killed mid-write leaves one torn final line; drop it so
+            # the resumed sweep appends after the last complete row.
+            if line_number == len(lines) and not line.endswith("\n"):
+                path.write_text("".join(lines[:-1]), encoding="utf-8")
+                break
+            raise ValueError(f"invalid checkpoint line {line_number} in {path}")
+        completed[(str(row["stage"]), int(row["config_index"]))] = row
+    return completed
@@ -33,9 +33,12 @@ from scripts.policy_comparison.policy_adapters import (
 )
 from scripts.policy_comparison.replay import OfflineReplayRunner
 from scripts.policy_comparison.schemas import MeasurementTraceRecord
+from scripts.policy_comparison.segment_controller_artifact import (
+    SegmentControllerArtifact,
+)
 from scripts.policy_comparison.trace_io import (
-    read_trace_jsonl,
-    write_decisions_jsonl,
+    read_trace,
+    write_decisions,
 )
 
 
@@ -81,7 +84,7 @@ def build_policy_adapters(
     ml_base_url: str | None,
     ml_backend: str = "service",
     ranker_artifact: Path | None = None,
-    segment_artifact: Path | None = None,
+    segment_artifact: Path | SegmentControllerArtifact | None = None,
     oracle_artifact: Path | None = None,
     high_complexity_threshold: int = 3,
     ranker_min_margin: float | None = None,
@@ -124,7 +127,7 @@ def build_policy_adapters(
         if calibration_trace is not None and calibration_trace.resolve() == evaluation_trace.resolve():
             raise ValueError("--calibration-trace must be different from --trace")
         if calibration_trace is not None:
-            calibration_records = read_trace_jsonl(calibration_trace)
+            calibration_records = read_trace(calibration_trace)
 
     def build_tuned_adapter() -> TunedA3PolicyAdapter:
         nonlocal tuning_result, tuned_config_data
@@ -427,7 +430,7 @@ def run(args: argparse.Namespace) -> int:
     segment_artifact = Path(args.segment_artifact) if args.segment_artifact else None
     oracle_artifact = Path(args.oracle_artifact) if args.oracle_artifact else None
 
-    evaluation_records = read_trace_jsonl(trace_path)
+    evaluation_records = read_trace(trace_path)
     ml_model_health = None
     if (
         args.ml_backend == "service"
@@ -493,13 +496,17 @@ def run(args: argparse.Namespace) -> int:
     )
     ensure_fresh_output_dir(output_dir)
 
-    result = OfflineReplayRunner(adapters).replay(evaluation_records)
+    result = OfflineReplayRunner(
+        adapters,
+        workers=getattr(args, "workers", 1) or 1,
+    ).replay(evaluation_records)
 
     decisions_dir = output_dir / "decisions"
+    decision_format = getattr(args, "decision_format", None) or "jsonl"
     for policy_name, policy_result in result.policy_results.items():
-        write_decisions_jsonl(
+        write_decisions(
             policy_result.decisions,
-            decisions_dir / f"{policy_name}.jsonl",
+            decisions_dir / f"{policy_name}.{decision_format}",
         )
 
     (output_dir / "summary.json").write_text(
@@ -607,12 +614,27 @@ def build_parser() -> argparse.ArgumentParser:
             "tuned-A3 policy adapters without running the full thesis experiment."
         )
     )
-    parser.add_argument("--trace", required=True, help="Evaluation trace JSONL path.")
+    parser.add_argument("--trace", required=True, help="Evaluation trace (JSONL or .npz) path.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Replay policies in parallel across this many processes. Output is "
+            "identical to the serial replay. Default: 1"
+        ),
+    )
     parser.add_argument(
         "--output-dir",
         required=True,
         help="Fresh output directory for replay summary, manifest, and decisions.",
     )
+    parser.add_argument(
+        "--decision-format",
+        choices=("jsonl", "npz"),
+        default="jsonl",
+        help="On-disk format for decisions/<policy>.*: JSONL or columnar npz. Default: jsonl",
+    )
     parser.add_argument(
         "--policies",
         default="fixed_a3_baseline",
@@ -1,10 +1,20 @@
-"""Canonical trace and decision schemas for fair policy comparison."""
+"""Canonical trace and decision schemas for fair policy comparison.
+
+Trace records are slotted and validated once at construction. Replay derives
+per-policy views (serving cell, cell loads, counterfactual QoS) through
+:meth:`MeasurementTraceRecord.with_policy_context`, which shares every
+unchanged field with the source record instead of re-running validation.
+Values derived from a record's measurements and serving cell (candidate
+complexity, best neighbour) are memoized on the record through
+:meth:`MeasurementTraceRecord.derived`; a view keeps that memo unless it
+changes the serving cell or the cell loads.
+"""
 
 from __future__ import annotations
 
 import math
-from dataclasses import asdict, dataclass, field, replace
-from typing import Any, Dict, List, Literal, Mapping, Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Dict, Hashable, List, Literal, Mapping, Optional, TypeVar
 
 
 DecisionType = Literal["stay", "handover"]
@@ -32,7 +42,22 @@ def _optional_float(value: Any) -> Optional[float]:
     return result
 
 
-@dataclass(frozen=True)
+_KEEP: Any = object()
+_T = TypeVar("_T")
+
+
+def _trusted(cls: type, values: Mapping[str, Any]) -> Any:
+    """Build an instance of a frozen slotted dataclass without validation.
+
+    Only for values derived from an already validated instance.
+    """
+    instance = object.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+@dataclass(frozen=True, slots=True)
 class VisibleCellMeasurement:
     """One visible cell measurement in the canonical trace."""
 
@@ -65,8 +90,25 @@ class VisibleCellMeasurement:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def with_load(self, load: float) -> "VisibleCellMeasurement":
+        """Return this measurement with ``load`` replaced, skipping validation."""
+        load = float(load)
+        _require_finite("load", load)
+        if load == self.load:
+            return self
+        return _trusted(
+            VisibleCellMeasurement,
+            {
+                "cell_id": self.cell_id,
+                "rsrp_dbm": self.rsrp_dbm,
+                "rsrq_db": self.rsrq_db,
+                "sinr_db": self.sinr_db,
+                "load": load,
+            },
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MeasurementTraceRecord:
     """Policy-free measurement snapshot shared by all comparison policies."""
 
@@ -88,6 +130,12 @@ class MeasurementTraceRecord:
     trace_schema_version: int = 1
     initial_serving_cell: Optional[str] = None
     topology_cell_ids: List[str] = field(default_factory=list)
+    _cell_index: Dict[str, VisibleCellMeasurement] = field(
+        init=False, repr=False, compare=False
+    )
+    # Memo per serving cell, shared by every policy view of this record.
+    _memos: Dict[str, Dict[Hashable, Any]] = field(init=False, repr=False, compare=False)
+    _derived: Dict[Hashable, Any] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         _require_non_empty("scenario", self.scenario)
@@ -112,25 +160,80 @@ class MeasurementTraceRecord:
         if self.trace_schema_version < 1:
             raise TraceSchemaError("trace_schema_version must be positive")
 
-        cell_ids = [cell.cell_id for cell in self.visible_cells]
-        if len(set(cell_ids)) != len(cell_ids):
+        cell_index = {cell.cell_id: cell for cell in self.visible_cells}
+        if len(cell_index) != len(self.visible_cells):
             raise TraceSchemaError("visible_cells contains duplicate cell IDs")
-        if self.serving_cell not in set(cell_ids):
+        if self.serving_cell not in cell_index:
             raise TraceSchemaError(
                 f"serving_cell {self.serving_cell!r} missing from visible_cells"
             )
+        derived: Dict[Hashable, Any] = {}
+        object.__setattr__(self, "_cell_index", cell_index)
+        object.__setattr__(self, "_memos", {self.serving_cell: derived})
+        object.__setattr__(self, "_derived", derived)
 
     @property
     def visible_cell_map(self) -> Dict[str, VisibleCellMeasurement]:
-        return {cell.cell_id: cell for cell in self.visible_cells}
+        """Cell ID to measurement, built once per record. Do not mutate."""
+        return self._cell_index
+
+    def derived(
+        self,
+        key: Hashable,
+        compute: Callable[["MeasurementTraceRecord"], _T],
+    ) -> _T:
+        """Return ``compute(self)``, memoized on this record under ``key``.
+
+        Only for values that depend on nothing but the serving cell and the
+        visible cells' radio measurements, not their loads. Every policy view
+        with the same serving cell shares the memo. Treat the result as
+        read-only.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = compute(self)
+            self._derived[key] = value
+            return value
 
     def with_serving_cell(self, serving_cell: str) -> "MeasurementTraceRecord":
-        if serving_cell not in self.visible_cell_map:
+        return self.with_policy_context(serving_cell=serving_cell)
+
+    def with_policy_context(
+        self,
+        *,
+        serving_cell: Optional[str] = None,
+        cell_loads: Optional[Mapping[str, float]] = None,
+        observed_qos: Any = _KEEP,
+    ) -> "MeasurementTraceRecord":
+        """Return a policy-specific view of this record.
+
+        ``cell_loads`` replaces every visible cell's load, defaulting to 0 for
+        cells it does not list. All other fields are shared with this record
+        rather than copied, and schema validation is not repeated. Views keep
+        the radio measurements, so they share the :meth:`derived` memo of any
+        view with the same serving cell.
+        """
+        if serving_cell is not None and serving_cell not in self._cell_index:
             raise TraceSchemaError(
                 f"policy serving cell {serving_cell!r} is not visible at "
                 f"step {self.step_index} for UE {self.ue_id}"
             )
-        return replace(self, serving_cell=serving_cell)
+        values = {name: getattr(self, name) for name in _RECORD_FIELDS}
+        if serving_cell is not None and serving_cell != self.serving_cell:
+            values["_derived"] = self._memos.setdefault(serving_cell, {})
+        if serving_cell is not None:
+            values["serving_cell"] = serving_cell
+        if observed_qos is not _KEEP:
+            values["observed_qos"] = observed_qos
+        if cell_loads is not None:
+            cells = [
+                cell.with_load(cell_loads.get(cell.cell_id, 0))
+                for cell in self.visible_cells
+            ]
+            values["visible_cells"] = cells
+            values["_cell_index"] = {cell.cell_id: cell for cell in cells}
+        return _trusted(MeasurementTraceRecord, values)
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "MeasurementTraceRecord":
@@ -207,6 +310,9 @@ class MeasurementTraceRecord:
         }
 
 
+_RECORD_FIELDS = tuple(item.name for item in fields(MeasurementTraceRecord))
+
+
 @dataclass(frozen=True)
 class PolicyDecisionRecord:
     """Canonical decision output shared by ML, fixed A3, and tuned A3."""
@@ -15,8 +15,10 @@ from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import Any, Iterable, Mapping, Optional, Sequence
 
+import numpy as np
+
 from .candidate_ranker import build_candidate_ranker_features
-from .complexity import candidate_complexity_for_record
+from .complexity import best_neighbour, candidate_complexity_for_record
 from .schemas import MeasurementTraceRecord, VisibleCellMeasurement
 
 
@@ -132,6 +134,7 @@ def build_segment_policy_dataset(
 
     for group_records in _group_records(records):
         ordered = sorted(group_records, key=lambda record: record.step_index)
+        horizon: Optional[_HorizonWindows] = None
         for index, record in enumerate(ordered):
             complexity = candidate_complexity_for_record(record)
             if complexity.complexity_bucket != "high":
@@ -148,53 +151,27 @@ def build_segment_policy_dataset(
 
             high_complexity_snapshot_count += 1
             high_complexity_candidate_count += len(feature_rows)
-            serving_score = _sequence_cell_score(
-                ordered,
-                index,
-                record.serving_cell,
-                segment_horizon_steps=segment_horizon_steps,
-                load_penalty=load_penalty,
-                sinr_weight=sinr_weight,
-                rsrq_weight=rsrq_weight,
-                missing_future_cell_score=missing_future_cell_score,
-                qos_violation_penalty=qos_violation_penalty,
-            )
-            recovery_features = _future_a3_recovery_features(
-                ordered,
-                index,
-                record.serving_cell,
-                segment_horizon_steps=segment_horizon_steps,
-                a3_recovery_margin_db=a3_recovery_margin_db,
-            )
-            candidate_scores: dict[str, float] = {}
-            candidate_reasons: dict[str, str] = {}
-            target_disappears: dict[str, bool] = {}
-            for base_row in feature_rows:
-                candidate_id = str(base_row["candidate_cell"])
-                raw_score = _sequence_cell_score(
+            if horizon is None:
+                horizon = _HorizonWindows(
                     ordered,
-                    index,
-                    candidate_id,
                     segment_horizon_steps=segment_horizon_steps,
                     load_penalty=load_penalty,
                     sinr_weight=sinr_weight,
                     rsrq_weight=rsrq_weight,
                     missing_future_cell_score=missing_future_cell_score,
                     qos_violation_penalty=qos_violation_penalty,
-                )
-                candidate_recovery_features = _future_a3_recovery_features(
-                    ordered,
-                    index,
-                    candidate_id,
-                    segment_horizon_steps=segment_horizon_steps,
                     a3_recovery_margin_db=a3_recovery_margin_db,
                 )
-                disappears = _cell_disappears_before_horizon(
-                    ordered,
-                    index,
-                    candidate_id,
-                    segment_horizon_steps=segment_horizon_steps,
-                )
+            serving_score = horizon.sequence_cell_score(index, record.serving_cell)
+            recovery_features = horizon.a3_recovery_features(index, record.serving_cell)
+            candidate_scores: dict[str, float] = {}
+            candidate_reasons: dict[str, str] = {}
+            target_disappears: dict[str, bool] = {}
+            for base_row in feature_rows:
+                candidate_id = str(base_row["candidate_cell"])
+                raw_score = horizon.sequence_cell_score(index, candidate_id)
+                candidate_recovery_features = horizon.a3_recovery_features(index, candidate_id)
+                disappears = horizon.cell_disappears(index, candidate_id)
                 if candidate_recovery_features["future_sparse_a3_trigger_count"] > 0:
                     raw_score -= float(post_segment_churn_penalty)
                 target_disappears[candidate_id] = disappears
@@ -250,13 +227,7 @@ def build_segment_policy_dataset(
 
             for base_row in feature_rows:
                 candidate_id = str(base_row["candidate_cell"])
-                candidate_recovery_features = _future_a3_recovery_features(
-                    ordered,
-                    index,
-                    candidate_id,
-                    segment_horizon_steps=segment_horizon_steps,
-                    a3_recovery_margin_db=a3_recovery_margin_db,
-                )
+                candidate_recovery_features = horizon.a3_recovery_features(index, candidate_id)
                 margin = float(candidate_scores[candidate_id] - serving_score)
                 if recovery_features["future_sparse_a3_trigger_count"] > 0 and not enter_label:
                     margin -= float(high_reject_recovery_risk_penalty)
@@ -452,15 +423,15 @@ def _exit_row(
     visible = record.visible_cell_map
     segment_cell = visible.get(selected_candidate)
     original_serving = visible.get(entry_record.serving_cell)
-    best_neighbour = _best_neighbour(record, excluding=selected_candidate)
+    best = best_neighbour(record, excluding=selected_candidate)
     segment_rsrp = segment_cell.rsrp_dbm if segment_cell is not None else -160.0
     original_rsrp = original_serving.rsrp_dbm if original_serving is not None else -160.0
-    best_rsrp = best_neighbour.rsrp_dbm if best_neighbour is not None else -160.0
+    best_rsrp = best.rsrp_dbm if best is not None else -160.0
     churn_risk = float(
-        best_neighbour is not None
+        best is not None
         and (
-            best_neighbour.cell_id == entry_record.serving_cell
-            or _same_site_sector(best_neighbour.cell_id, selected_candidate)
+            best.cell_id == entry_record.serving_cell
+            or _same_site_sector(best.cell_id, selected_candidate)
         )
     )
     common = _common_snapshot_features(record)
@@ -493,7 +464,7 @@ def _exit_label_for_record(
     current = visible.get(segment_cell)
     if current is None:
         return 1, "segment_cell_missing"
-    best = _best_neighbour(record, excluding=segment_cell)
+    best = best_neighbour(record, excluding=segment_cell)
     if best is None:
         return 0, "no_alternative"
     reverse_or_same_sector = (
@@ -575,116 +546,132 @@ def _segment_candidate_penalty(
     return {"total_penalty": penalty, "reason": "+".join(reasons)}
 
 
-def _sequence_cell_score(
-    records: Sequence[MeasurementTraceRecord],
-    start_index: int,
-    cell_id: str,
-    *,
-    segment_horizon_steps: int,
-    load_penalty: float,
-    sinr_weight: float,
-    rsrq_weight: float,
-    missing_future_cell_score: float,
-    qos_violation_penalty: float,
-) -> float:
-    scores: list[float] = []
-    for record in records[start_index : start_index + segment_horizon_steps]:
-        cell = record.visible_cell_map.get(cell_id)
-        if cell is None:
-            scores.append(float(missing_future_cell_score))
-            continue
-        score = _cell_score(
-            cell,
-            load_penalty=load_penalty,
-            sinr_weight=sinr_weight,
-            rsrq_weight=rsrq_weight,
+class _HorizonWindows:
+    """Look-ahead aggregates over one UE's step-ordered records.
+
+    Every window starts at a step and covers the next ``segment_horizon_steps``
+    records, truncated at the end of the trace. Measurements are laid out once
+    as a step x cell matrix and each aggregate is computed for all (start step,
+    cell) pairs with NumPy, so the dataset builder looks values up instead of
+    rescanning the horizon for the serving cell and every candidate.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[MeasurementTraceRecord],
+        *,
+        segment_horizon_steps: int,
+        load_penalty: float,
+        sinr_weight: float,
+        rsrq_weight: float,
+        missing_future_cell_score: float,
+        qos_violation_penalty: float,
+        a3_recovery_margin_db: float,
+    ) -> None:
+        cell_ids = sorted({cell.cell_id for record in records for cell in record.visible_cells})
+        self._columns = {cell_id: column for column, cell_id in enumerate(cell_ids)}
+        shape = (len(records), len(cell_ids))
+        present = np.zeros(shape, dtype=bool)
+        rsrp = np.zeros(shape)
+        sinr = np.zeros(shape)
+        rsrq = np.zeros(shape)
+        load = np.zeros(shape)
+        qos_violation = np.zeros(len(records), dtype=bool)
+        sparse_step = np.zeros(len(records), dtype=bool)
+        # Strongest and runner-up non-serving cell per step, so the best
+        # neighbour excluding any one cell is a lookup.
+        first = np.full(len(records), -1)
+        second = np.full(len(records), -1)
+        for step, record in enumerate(records):
+            for cell in record.visible_cells:
+                column = self._columns[cell.cell_id]
+                present[step, column] = True
+                rsrp[step, column] = float(cell.rsrp_dbm)
+                sinr[step, column] = _measurement_value(cell, "sinr_db", 0.0)
+                rsrq[step, column] = _measurement_value(cell, "rsrq_db", 0.0)
+                load[step, column] = float(cell.load or 0.0)
+            qos_violation[step] = _has_qos_violation(record)
+            sparse_step[step] = (
+                candidate_complexity_for_record(record).complexity_bucket != "high"
+            )
+            ranked = sorted(
+                (
+                    cell
+                    for cell in record.visible_cells
+                    if cell.cell_id != record.serving_cell
+                ),
+                key=lambda cell: (cell.rsrp_dbm, cell.cell_id),
+                reverse=True,
+            )[:2]
+            for slot, cell in zip((first, second), ranked):
+                slot[step] = self._columns[cell.cell_id]
+
+        score = rsrp + sinr_weight * sinr + rsrq_weight * rsrq - load_penalty * load
+        score = np.where(qos_violation[:, None], score - float(qos_violation_penalty), score)
+        score = np.where(present, score, float(missing_future_cell_score))
+
+        columns = np.arange(len(cell_ids))
+        best = np.where(first[:, None] == columns, second[:, None], first[:, None])
+        compared = present & (best >= 0)
+        best_rsrp = np.take_along_axis(rsrp, np.maximum(best, 0), axis=1)
+        margin = np.where(compared, best_rsrp - rsrp, 0.0)
+        trigger = compared & (margin >= a3_recovery_margin_db)
+        same_site = np.array(
+            [[_same_site_sector(a, b) for b in cell_ids] for a in cell_ids],
+            dtype=bool,
         )
-        if _has_qos_violation(record):
-            score -= float(qos_violation_penalty)
-        scores.append(score)
-    if not scores:
-        return float(missing_future_cell_score)
-    return float(sum(scores) / len(scores))
-
-
-def _cell_score(
-    cell: VisibleCellMeasurement,
-    *,
-    load_penalty: float,
-    sinr_weight: float,
-    rsrq_weight: float,
-) -> float:
-    return (
-        float(cell.rsrp_dbm)
-        + sinr_weight * _measurement_value(cell, "sinr_db", 0.0)
-        + rsrq_weight * _measurement_value(cell, "rsrq_db", 0.0)
-        - load_penalty * float(cell.load or 0.0)
-    )
-
-
-def _cell_disappears_before_horizon(
-    records: Sequence[MeasurementTraceRecord],
-    start_index: int,
-    cell_id: str,
-    *,
-    segment_horizon_steps: int,
-) -> bool:
-    return any(
-        cell_id not in record.visible_cell_map
-        for record in records[start_index : start_index + segment_horizon_steps]
-    )
-
-
-def _future_a3_recovery_features(
-    records: Sequence[MeasurementTraceRecord],
-    start_index: int,
-    serving_cell: str,
-    *,
-    segment_horizon_steps: int,
-    a3_recovery_margin_db: float,
-) -> dict[str, float]:
-    trigger_count = 0
-    sparse_trigger_count = 0
-    reverse_or_same_sector_count = 0
-    max_margin = 0.0
-    for future in records[start_index : start_index + segment_horizon_steps]:
-        current = future.visible_cell_map.get(serving_cell)
-        if current is None:
-            continue
-        best = _best_neighbour(future, excluding=serving_cell)
-        if best is None:
-            continue
-        margin = float(best.rsrp_dbm - current.rsrp_dbm)
-        max_margin = max(max_margin, margin)
-        if margin < a3_recovery_margin_db:
-            continue
-        trigger_count += 1
-        complexity = candidate_complexity_for_record(future)
-        if complexity.complexity_bucket != "high":
-            sparse_trigger_count += 1
-        if _same_site_sector(best.cell_id, serving_cell):
-            reverse_or_same_sector_count += 1
-    return {
-        "future_a3_recovery_trigger_count": float(trigger_count),
-        "future_sparse_a3_trigger_count": float(sparse_trigger_count),
-        "future_a3_reverse_churn_risk_count": float(reverse_or_same_sector_count),
-        "future_a3_max_margin_db": float(max_margin),
-    }
+        reverse = trigger & same_site[np.maximum(best, 0), columns]
+
+        horizon = min(int(segment_horizon_steps), len(records))
+        window_length = np.minimum(horizon, len(records) - np.arange(len(records)))
+        self._score = _window_reduce(score, horizon, np.add) / window_length[:, None]
+        self._disappears = _window_reduce(~present, horizon, np.logical_or)
+        self._trigger_count = _window_reduce(trigger.astype(np.int64), horizon, np.add)
+        self._sparse_trigger_count = _window_reduce(
+            (trigger & sparse_step[:, None]).astype(np.int64), horizon, np.add
+        )
+        self._reverse_count = _window_reduce(reverse.astype(np.int64), horizon, np.add)
+        self._max_margin = np.maximum(_window_reduce(margin, horizon, np.maximum, fill=-np.inf), 0.0)
+
+    def sequence_cell_score(self, index: int, cell_id: str) -> float:
+        """Mean cell score over the window, missing steps scored as missing."""
+        return float(self._score[index, self._columns[cell_id]])
+
+    def cell_disappears(self, index: int, cell_id: str) -> bool:
+        return bool(self._disappears[index, self._columns[cell_id]])
+
+    def a3_recovery_features(self, index: int, serving_cell: str) -> dict[str, float]:
+        """A3 triggers an A3 policy serving ``serving_cell`` would see ahead."""
+        column = self._columns[serving_cell]
+        return {
+            "future_a3_recovery_trigger_count": float(self._trigger_count[index, column]),
+            "future_sparse_a3_trigger_count": float(
+                self._sparse_trigger_count[index, column]
+            ),
+            "future_a3_reverse_churn_risk_count": float(self._reverse_count[index, column]),
+            "future_a3_max_margin_db": float(self._max_margin[index, column]),
+        }
 
 
-def _best_neighbour(
-    record: MeasurementTraceRecord,
+def _window_reduce(
+    values: np.ndarray,
+    horizon: int,
+    ufunc: np.ufunc,
     *,
-    excluding: Optional[str] = None,
-) -> Optional[VisibleCellMeasurement]:
-    candidates = [
-        cell
-        for cell in record.visible_cells
-        if cell.cell_id != excluding and cell.cell_id != record.serving_cell
-    ]
-    if not candidates:
-        return None
-    return max(candidates, key=lambda cell: (cell.rsrp_dbm, cell.cell_id))
+    fill: Any = 0,
+) -> np.ndarray:
+    """Fold ``ufunc`` over each step's forward window of ``horizon`` rows.
+
+    Windows running past the last step see ``fill``, which must be neutral for
+    ``ufunc``. Sums accumulate left to right, like the scalar loop they replace.
+    """
+    steps = values.shape[0]
+    padding = np.full((horizon - 1, *values.shape[1:]), fill, dtype=values.dtype)
+    padded = np.concatenate([values, padding])
+    result = padded[:steps].copy()
+    for offset in range(1, horizon):
+        ufunc(result, padded[offset : offset + steps], out=result)
+    return result
 
 
 def _group_records(
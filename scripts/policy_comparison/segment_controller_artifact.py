@@ -76,8 +76,16 @@ class SegmentControllerArtifact:
         return resolved
 
     def score_candidates(self, rows: Sequence[Mapping[str, Any]]) -> dict[str, float]:
+        return self.score_candidate_groups([rows])[0]
+
+    def score_candidate_groups(
+        self,
+        groups: Sequence[Sequence[Mapping[str, Any]]],
+    ) -> list[dict[str, float]]:
+        """Score several snapshots' candidate rows with one model call."""
+        rows = [row for group in groups for row in group]
         if not rows:
-            return {}
+            return [{} for _ in groups]
         matrix = np.array(
             [
                 row_to_segment_feature_vector(
@@ -89,16 +97,29 @@ class SegmentControllerArtifact:
             dtype=float,
         )
         predictions = np.asarray(self.candidate_model.predict(matrix), dtype=float)
-        return {
-            str(row["candidate_cell"]): float(score)
-            for row, score in zip(rows, predictions)
-        }
+        scored: list[dict[str, float]] = []
+        offset = 0
+        for group in groups:
+            scored.append(
+                {
+                    str(row["candidate_cell"]): float(score)
+                    for row, score in zip(group, predictions[offset:offset + len(group)])
+                }
+            )
+            offset += len(group)
+        return scored
 
     def score_entry(self, row: Mapping[str, Any]) -> float:
-        return _predict_score(self.entry_model, row, self.entry_feature_columns)
+        return self.score_entries([row])[0]
+
+    def score_entries(self, rows: Sequence[Mapping[str, Any]]) -> list[float]:
+        return _predict_scores(self.entry_model, rows, self.entry_feature_columns)
 
     def score_exit(self, row: Mapping[str, Any]) -> float:
-        return _predict_score(self.exit_model, row, self.exit_feature_columns)
+        return self.score_exits([row])[0]
+
+    def score_exits(self, rows: Sequence[Mapping[str, Any]]) -> list[float]:
+        return _predict_scores(self.exit_model, rows, self.exit_feature_columns)
 
     def safe_metadata(self) -> dict[str, Any]:
         allowed = {
@@ -191,22 +212,29 @@ def sha256_file(path: Path) -> str:
     return digest.hexdigest()
 
 
-def _predict_score(model: Any, row: Mapping[str, Any], feature_columns: Sequence[str]) -> float:
+def _predict_scores(
+    model: Any,
+    rows: Sequence[Mapping[str, Any]],
+    feature_columns: Sequence[str],
+) -> list[float]:
+    if not rows:
+        return []
     matrix = np.array(
         [
             row_to_segment_feature_vector(
                 row,
                 feature_columns=feature_columns,
             )
+            for row in rows
         ],
         dtype=float,
     )
     if hasattr(model, "predict_proba"):
         probabilities = np.asarray(model.predict_proba(matrix), dtype=float)
         if probabilities.ndim == 2 and probabilities.shape[1] >= 2:
-            return float(probabilities[0, 1])
+            return [float(value) for value in probabilities[:, 1]]
     predictions = np.asarray(model.predict(matrix), dtype=float)
-    return float(predictions[0])
+    return [float(value) for value in predictions]
 
 
 def _finite_float(value: Any, *, default: float) -> float:
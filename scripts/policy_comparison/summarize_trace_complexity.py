@@ -18,7 +18,7 @@ from scripts.policy_comparison.complexity import (  # noqa: E402
     complexity_bucket,
 )
 from scripts.policy_comparison.schemas import MeasurementTraceRecord  # noqa: E402
-from scripts.policy_comparison.trace_io import read_trace_jsonl  # noqa: E402
+from scripts.policy_comparison.trace_io import read_trace  # noqa: E402
 
 
 DEFAULT_THRESHOLDS = (3, 4, 5)
@@ -110,7 +110,7 @@ def summarize_trace_complexity(args: argparse.Namespace) -> dict[str, Any]:
     fail_reasons: list[str] = []
     for raw_path in args.trace:
         path = Path(raw_path)
-        records = read_trace_jsonl(path)
+        records = read_trace(path)
         summary = summarize_trace_records(
             records,
             trace_path=str(path),
@@ -193,7 +193,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--trace",
         action="append",
         required=True,
-        help="Canonical policy-free trace JSONL. Can be repeated.",
+        help="Canonical policy-free trace (JSONL or .npz). Can be repeated.",
     )
     parser.add_argument("--output-dir", required=True, help="Fresh output directory.")
     parser.add_argument(
@@ -0,0 +1,401 @@
+"""Columnar ``.npz`` storage for canonical traces and decision logs.
+
+JSONL traces are parsed line by line into dataclasses, which dominates load
+time for multi-seed campaigns. This module stores the same records as NumPy
+columns in an uncompressed ``.npz`` archive:
+
+* numeric fields are plain ``float64``/``int64`` arrays; optional floats use
+  NaN for ``None`` (the schemas reject non-finite values, so NaN is free);
+* string fields are dictionary encoded: ``<name>__codes`` (``int32``, ``-1``
+  for ``None``) index a UTF-8 blob ``<name>__data`` sliced by
+  ``<name>__offsets``;
+* mapping fields (metadata, QoS, policy state) are dictionary-encoded JSON
+  strings, so they round-trip exactly like the JSONL writer;
+* visible cells are flattened into ``cell_*`` columns with a
+  ``cell_offsets`` array giving each record's slice.
+
+Archives are opened with ``np.load``, which reads each member only when it
+is first accessed, so tools that need a few columns never decode the rest.
+No pickled objects are stored or loaded.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from .schemas import MeasurementTraceRecord, PolicyDecisionRecord
+
+COLUMNAR_SUFFIX = ".npz"
+TRACE_FORMAT = "policy_comparison.trace.columnar.v1"
+DECISION_FORMAT = "policy_comparison.decisions.columnar.v1"
+
+_POSITION_KEYS = ("latitude", "longitude", "altitude")
+
+
+def is_columnar_path(path: Path) -> bool:
+    """Whether ``path`` names a columnar archive rather than JSONL."""
+    return Path(path).suffix == COLUMNAR_SUFFIX
+
+
+class ColumnarArchive:
+    """Lazily loaded columnar archive of one record kind.
+
+    ``column(name)`` returns a numeric array as stored, or a list of decoded
+    values for string and JSON columns. Use as a context manager, or call
+    :meth:`close`, to release the file handle.
+    """
+
+    format_name = ""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._npz = np.load(self.path, allow_pickle=False)
+        stored = str(self._npz["format"]) if "format" in self._npz.files else None
+        if stored != self.format_name:
+            self._npz.close()
+            raise ValueError(
+                f"{self.path} is not a {self.format_name} archive (found {stored!r})"
+            )
+        self._length = int(self._npz["length"])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "ColumnarArchive":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._npz.close()
+
+    def column(self, name: str) -> Any:
+        if f"{name}__codes" in self._npz.files:
+            return self._strings(name)
+        return self._npz[name]
+
+    def _strings(self, name: str) -> List[Optional[str]]:
+        codes = self._npz[f"{name}__codes"]
+        offsets = self._npz[f"{name}__offsets"].tolist()
+        blob = self._npz[f"{name}__data"].tobytes()
+        values = [
+            blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])
+        ]
+        return [None if code < 0 else values[code] for code in codes.tolist()]
+
+    def _json(self, name: str) -> List[Any]:
+        return [None if raw is None else json.loads(raw) for raw in self._strings(name)]
+
+    def _flat_json(self, name: str) -> List[Any]:
+        """Like :meth:`_json` for flat lists/dicts: parse each distinct value once.
+
+        Rows get shallow copies, which is enough to keep them independent.
+        """
+        parsed: Dict[str, Any] = {}
+        values = []
+        for raw in self._strings(name):
+            if raw is None:
+                values.append(None)
+                continue
+            value = parsed.get(raw)
+            if value is None:
+                value = parsed[raw] = json.loads(raw)
+            values.append(value.copy())
+        return values
+
+
+class ColumnarTrace(ColumnarArchive):
+    """Columnar measurement trace; see :func:`write_trace_columnar`."""
+
+    format_name = TRACE_FORMAT
+
+    def records(self) -> Iterator[MeasurementTraceRecord]:
+        """Materialize records in file order through the JSONL ``from_dict`` path."""
+        scenario = self._strings("scenario")
+        seed = self._npz["seed"].tolist()
+        timestamp = self._npz["timestamp_s"].tolist()
+        step_index = self._npz["step_index"].tolist()
+        ue_id = self._strings("ue_id")
+        serving = self._strings("serving_cell")
+        latitude = self._npz["latitude"].tolist()
+        longitude = self._npz["longitude"].tolist()
+        altitude = _optional_floats(self._npz["altitude"])
+        position_extra = self._flat_json("ue_position_extra")
+        speed = _optional_floats(self._npz["speed_mps"])
+        topology_hash = self._strings("topology_hash")
+        service_type = self._strings("service_type")
+        qos_requirements = self._flat_json("qos_requirements")
+        observed_qos = self._flat_json("observed_qos")
+        source = self._strings("source")
+        metadata = self._json("metadata")
+        schema_version = self._npz["trace_schema_version"].tolist()
+        initial_serving = self._strings("initial_serving_cell")
+        topology_cell_ids = self._flat_json("topology_cell_ids")
+
+        offsets = self._npz["cell_offsets"].tolist()
+        cell_id = self._strings("cell_id")
+        rsrp = self._npz["cell_rsrp_dbm"].tolist()
+        rsrq = _optional_floats(self._npz["cell_rsrq_db"])
+        sinr = _optional_floats(self._npz["cell_sinr_db"])
+        load = _optional_floats(self._npz["cell_load"])
+
+        for row in range(self._length):
+            position = {"latitude": latitude[row], "longitude": longitude[row]}
+            if altitude[row] is not None:
+                position["altitude"] = altitude[row]
+            if position_extra[row]:
+                position.update(position_extra[row])
+            cells = [
+                {
+                    "cell_id": cell_id[index],
+                    "rsrp_dbm": rsrp[index],
+                    "rsrq_db": rsrq[index],
+                    "sinr_db": sinr[index],
+                    "load": load[index],
+                }
+                for index in range(offsets[row], offsets[row + 1])
+            ]
+            yield MeasurementTraceRecord.from_dict(
+                {
+                    "scenario": scenario[row],
+                    "seed": seed[row],
+                    "timestamp_s": timestamp[row],
+                    "step_index": step_index[row],
+                    "ue_id": ue_id[row],
+                    "serving_cell": serving[row],
+                    "ue_position": position,
+                    "visible_cells": cells,
+                    "speed_mps": speed[row],
+                    "topology_hash": topology_hash[row],
+                    "service_type": service_type[row],
+                    "qos_requirements": qos_requirements[row],
+                    "observed_qos": observed_qos[row],
+                    "source": source[row],
+                    "metadata": metadata[row],
+                    "trace_schema_version": schema_version[row],
+                    "initial_serving_cell": initial_serving[row],
+                    "topology_cell_ids": topology_cell_ids[row],
+                }
+            )
+
+
+class ColumnarDecisions(ColumnarArchive):
+    """Columnar policy decision log; see :func:`write_decisions_columnar`."""
+
+    format_name = DECISION_FORMAT
+
+    def records(self) -> Iterator[PolicyDecisionRecord]:
+        """Materialize decisions in file order through the JSONL ``from_dict`` path."""
+        ue_id = self._strings("ue_id")
+        timestamp = self._npz["timestamp_s"].tolist()
+        step_index = self._npz["step_index"].tolist()
+        current = self._strings("current_serving_cell")
+        target = self._strings("selected_target_cell")
+        decision_type = self._strings("decision_type")
+        policy_name = self._strings("policy_name")
+        parameters = self._json("policy_parameters")
+        serving_value = self._npz["serving_measurement_value"].tolist()
+        neighbours = self._flat_json("neighbour_measurements_considered")
+        triggered = self._npz["trigger_condition_result"].tolist()
+        ttt_state = self._json("time_to_trigger_state")
+        cooldown_state = self._json("cooldown_state")
+        reason = self._strings("reason")
+        debug = self._json("debug")
+        latency = _optional_floats(self._npz["decision_latency_ms"])
+        confidence = _optional_floats(self._npz["confidence"])
+
+        for row in range(self._length):
+            yield PolicyDecisionRecord.from_dict(
+                {
+                    "ue_id": ue_id[row],
+                    "timestamp_s": timestamp[row],
+                    "step_index": step_index[row],
+                    "current_serving_cell": current[row],
+                    "selected_target_cell": target[row],
+                    "decision_type": decision_type[row],
+                    "policy_name": policy_name[row],
+                    "policy_parameters": parameters[row],
+                    "serving_measurement_value": serving_value[row],
+                    "neighbour_measurements_considered": neighbours[row],
+                    "trigger_condition_result": triggered[row],
+                    "time_to_trigger_state": ttt_state[row],
+                    "cooldown_state": cooldown_state[row],
+                    "reason": reason[row],
+                    "debug": debug[row],
+                    "decision_latency_ms": latency[row],
+                    "confidence": confidence[row],
+                }
+            )
+
+
+def read_trace_columnar(path: Path) -> List[MeasurementTraceRecord]:
+    """Read canonical measurement trace records from a columnar archive."""
+    with ColumnarTrace(path) as trace:
+        return list(trace.records())
+
+
+def read_decisions_columnar(path: Path) -> List[PolicyDecisionRecord]:
+    """Read policy decision records from a columnar archive."""
+    with ColumnarDecisions(path) as decisions:
+        return list(decisions.records())
+
+
+def write_trace_columnar(
+    records: Sequence[MeasurementTraceRecord],
+    path: Path,
+    *,
+    compressed: bool = False,
+) -> None:
+    """Write canonical measurement trace records to a columnar archive."""
+    if not records:
+        raise ValueError("cannot write an empty measurement trace")
+    columns: Dict[str, np.ndarray] = {}
+    _put_strings(columns, "scenario", [record.scenario for record in records])
+    columns["seed"] = np.array([record.seed for record in records], dtype=np.int64)
+    columns["timestamp_s"] = _floats([record.timestamp_s for record in records])
+    columns["step_index"] = np.array([record.step_index for record in records], dtype=np.int64)
+    _put_strings(columns, "ue_id", [record.ue_id for record in records])
+    _put_strings(columns, "serving_cell", [record.serving_cell for record in records])
+    columns["latitude"] = _floats([record.ue_position["latitude"] for record in records])
+    columns["longitude"] = _floats([record.ue_position["longitude"] for record in records])
+    columns["altitude"] = _floats([record.ue_position.get("altitude") for record in records])
+    _put_json(
+        columns,
+        "ue_position_extra",
+        [
+            {
+                key: value
+                for key, value in record.ue_position.items()
+                if key not in _POSITION_KEYS
+            }
+            or None
+            for record in records
+        ],
+    )
+    columns["speed_mps"] = _floats([record.speed_mps for record in records])
+    _put_strings(columns, "topology_hash", [record.topology_hash for record in records])
+    _put_strings(columns, "service_type", [record.service_type for record in records])
+    _put_json(columns, "qos_requirements", [record.qos_requirements for record in records])
+    _put_json(columns, "observed_qos", [record.observed_qos for record in records])
+    _put_strings(columns, "source", [record.source for record in records])
+    _put_json(columns, "metadata", [record.metadata for record in records])
+    columns["trace_schema_version"] = np.array(
+        [record.trace_schema_version for record in records], dtype=np.int64
+    )
+    _put_strings(
+        columns, "initial_serving_cell", [record.initial_serving_cell for record in records]
+    )
+    _put_json(columns, "topology_cell_ids", [record.topology_cell_ids for record in records])
+
+    cells = [cell for record in records for cell in record.visible_cells]
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(record.visible_cells) for record in records], out=offsets[1:])
+    columns["cell_offsets"] = offsets
+    _put_strings(columns, "cell_id", [cell.cell_id for cell in cells])
+    columns["cell_rsrp_dbm"] = _floats([cell.rsrp_dbm for cell in cells])
+    columns["cell_rsrq_db"] = _floats([cell.rsrq_db for cell in cells])
+    columns["cell_sinr_db"] = _floats([cell.sinr_db for cell in cells])
+    columns["cell_load"] = _floats([cell.load for cell in cells])
+    _save(path, TRACE_FORMAT, len(records), columns, compressed)
+
+
+def write_decisions_columnar(
+    records: Sequence[PolicyDecisionRecord],
+    path: Path,
+    *,
+    compressed: bool = False,
+) -> None:
+    """Write policy decision records to a columnar archive."""
+    if not records:
+        raise ValueError("cannot write an empty decision log")
+    columns: Dict[str, np.ndarray] = {}
+    _put_strings(columns, "ue_id", [record.ue_id for record in records])
+    columns["timestamp_s"] = _floats([record.timestamp_s for record in records])
+    columns["step_index"] = np.array([record.step_index for record in records], dtype=np.int64)
+    _put_strings(
+        columns, "current_serving_cell", [record.current_serving_cell for record in records]
+    )
+    _put_strings(
+        columns, "selected_target_cell", [record.selected_target_cell for record in records]
+    )
+    _put_strings(columns, "decision_type", [record.decision_type for record in records])
+    _put_strings(columns, "policy_name", [record.policy_name for record in records])
+    _put_json(columns, "policy_parameters", [record.policy_parameters for record in records])
+    columns["serving_measurement_value"] = _floats(
+        [record.serving_measurement_value for record in records]
+    )
+    _put_json(
+        columns,
+        "neighbour_measurements_considered",
+        [record.neighbour_measurements_considered for record in records],
+    )
+    columns["trigger_condition_result"] = np.array(
+        [record.trigger_condition_result for record in records], dtype=np.bool_
+    )
+    _put_json(
+        columns, "time_to_trigger_state", [record.time_to_trigger_state for record in records]
+    )
+    _put_json(columns, "cooldown_state", [record.cooldown_state for record in records])
+    _put_strings(columns, "reason", [record.reason for record in records])
+    _put_json(columns, "debug", [record.debug for record in records])
+    columns["decision_latency_ms"] = _floats([record.decision_latency_ms for record in records])
+    columns["confidence"] = _floats([record.confidence for record in records])
+    _save(path, DECISION_FORMAT, len(records), columns, compressed)
+
+
+def _save(
+    path: Path,
+    format_name: str,
+    length: int,
+    columns: Dict[str, np.ndarray],
+    compressed: bool,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns["format"] = np.array(format_name)
+    columns["length"] = np.array(length, dtype=np.int64)
+    save = np.savez_compressed if compressed else np.savez
+    # A file handle stops NumPy from appending a second ``.npz`` suffix.
+    with path.open("wb") as handle:
+        save(handle, **columns)
+
+
+def _floats(values: Sequence[Optional[float]]) -> np.ndarray:
+    return np.array(
+        [math.nan if value is None else float(value) for value in values],
+        dtype=np.float64,
+    )
+
+
+def _optional_floats(column: np.ndarray) -> List[Optional[float]]:
+    return [None if value != value else value for value in column.tolist()]
+
+
+def _put_strings(
+    columns: Dict[str, np.ndarray],
+    name: str,
+    values: Sequence[Optional[str]],
+) -> None:
+    index: Dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for row, value in enumerate(values):
+        codes[row] = -1 if value is None else index.setdefault(value, len(index))
+    encoded = [value.encode("utf-8") for value in index]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    columns[f"{name}__codes"] = codes
+    columns[f"{name}__offsets"] = offsets
+    columns[f"{name}__data"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _put_json(columns: Dict[str, np.ndarray], name: str, values: Sequence[Any]) -> None:
+    _put_strings(
+        columns,
+        name,
+        [None if value is None else json.dumps(value, sort_keys=True) for value in values],
+    )
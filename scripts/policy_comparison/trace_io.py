@@ -8,6 +8,14 @@ from pathlib import Path
 from typing import Any, Iterable, List, Mapping, Sequence
 
 from .schemas import MeasurementTraceRecord, PolicyDecisionRecord
+from .trace_columnar import (
+    COLUMNAR_SUFFIX,
+    is_columnar_path,
+    read_decisions_columnar,
+    read_trace_columnar,
+    write_decisions_columnar,
+    write_trace_columnar,
+)
 
 
 def read_trace_jsonl(path: Path) -> List[MeasurementTraceRecord]:
@@ -36,6 +44,26 @@ def write_trace_jsonl(records: Sequence[MeasurementTraceRecord], path: Path) ->
             handle.write(json.dumps(record.to_dict(), sort_keys=True) + "\n")
 
 
+def stream_trace_jsonl(records: Iterable[MeasurementTraceRecord], path: Path) -> int:
+    """Write trace records to JSONL as they are produced; return the count.
+
+    Each record is flushed as soon as it is written, so a long capture never
+    holds the whole trace in memory and an interrupted one keeps every
+    complete line. An empty stream removes the file and raises.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record.to_dict(), sort_keys=True) + "\n")
+            handle.flush()
+            count += 1
+    if not count:
+        path.unlink()
+        raise ValueError("cannot write an empty measurement trace")
+    return count
+
+
 def write_decisions_jsonl(records: Sequence[PolicyDecisionRecord], path: Path) -> None:
     """Write policy decision records to JSONL."""
     if not records:
@@ -63,6 +91,49 @@ def read_decisions_jsonl(path: Path) -> List[PolicyDecisionRecord]:
     return decisions
 
 
+def read_trace(path: Path) -> List[MeasurementTraceRecord]:
+    """Read a canonical trace from JSONL or a columnar ``.npz`` archive."""
+    if is_columnar_path(path):
+        return read_trace_columnar(path)
+    return read_trace_jsonl(path)
+
+
+def write_trace(records: Sequence[MeasurementTraceRecord], path: Path) -> None:
+    """Write a canonical trace as JSONL, or columnar when ``path`` ends in ``.npz``."""
+    if is_columnar_path(path):
+        write_trace_columnar(records, path)
+    else:
+        write_trace_jsonl(records, path)
+
+
+def read_decisions(path: Path) -> List[PolicyDecisionRecord]:
+    """Read a decision log from JSONL or a columnar ``.npz`` archive."""
+    if is_columnar_path(path):
+        return read_decisions_columnar(path)
+    return read_decisions_jsonl(path)
+
+
+def write_decisions(records: Sequence[PolicyDecisionRecord], path: Path) -> None:
+    """Write a decision log as JSONL, or columnar when ``path`` ends in ``.npz``."""
+    if is_columnar_path(path):
+        write_decisions_columnar(records, path)
+    else:
+        write_decisions_jsonl(records, path)
+
+
+def decision_log_path(decisions_dir: Path, policy_name: str) -> Path:
+    """Return a policy's decision log in ``decisions_dir``, JSONL or columnar.
+
+    Prefers an existing ``.jsonl`` log, then an existing ``.npz`` one, and
+    falls back to the ``.jsonl`` name when neither exists.
+    """
+    jsonl_path = decisions_dir / f"{policy_name}.jsonl"
+    columnar_path = decisions_dir / f"{policy_name}{COLUMNAR_SUFFIX}"
+    if not jsonl_path.exists() and columnar_path.exists():
+        return columnar_path
+    return jsonl_path
+
+
 def stable_json_hash(payload: Mapping[str, Any] | Iterable[Any]) -> str:
     """Return a deterministic SHA-256 hash for JSON-serializable metadata."""
     encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
@@ -24,7 +24,7 @@ for import_path in (REPO_ROOT, ML_SERVICE_ROOT):
 
 from scripts.policy_comparison.policy_adapters import trace_record_to_ml_payload
 from scripts.policy_comparison.schemas import MeasurementTraceRecord, VisibleCellMeasurement
-from scripts.policy_comparison.trace_io import read_trace_jsonl
+from scripts.policy_comparison.trace_io import read_trace
 
 from ml_service.app.config.feature_specs import sanitize_feature_ranges
 from ml_service.app.core.qos_encoding import encode_service_type
@@ -68,7 +68,7 @@ def parse_seed_list(raw: str | None) -> List[int]:
 def _load_records(trace_paths: Sequence[Path]) -> List[MeasurementTraceRecord]:
     records: List[MeasurementTraceRecord] = []
     for path in trace_paths:
-        records.extend(read_trace_jsonl(path))
+        records.extend(read_trace(path))
     if not records:
         raise ValueError("training traces produced no records")
     return records
@@ -457,7 +457,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--trace",
         action="append",
         required=True,
-        help="Policy-free calibration trace JSONL. May be supplied multiple times.",
+        help="Policy-free calibration trace (JSONL or .npz). May be supplied multiple times.",
     )
     parser.add_argument(
         "--output-model",
@@ -26,7 +26,7 @@ from scripts.policy_comparison.policy_adapters import (
     TunedA3PolicyAdapter,
 )
 from scripts.policy_comparison.replay import OfflineReplayRunner
-from scripts.policy_comparison.trace_io import read_trace_jsonl
+from scripts.policy_comparison.trace_io import read_trace
 
 
 def tune_candidate_ranker_replay_params(args: argparse.Namespace) -> dict[str, Any]:
@@ -36,7 +36,7 @@ def tune_candidate_ranker_replay_params(args: argparse.Namespace) -> dict[str, A
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    records = read_trace_jsonl(calibration_trace)
+    records = read_trace(calibration_trace)
     artifact = load_candidate_ranker_artifact(artifact_path)
     margins = _parse_float_list(args.margin_thresholds)
     dwell_values = _parse_float_list(args.ml_dwell_s)
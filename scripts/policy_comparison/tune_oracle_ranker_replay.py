@@ -19,7 +19,7 @@ from .policy_adapters import (
     TunedA3PolicyAdapter,
 )
 from .replay import OfflineReplayRunner
-from .trace_io import read_trace_jsonl
+from .trace_io import read_trace
 from .validate_physical_trace import validate_trace
 
 
@@ -46,7 +46,7 @@ def tune(
                 validation = validate_trace(trace, require_complexity=True)
                 if not validation["pass"]:
                     raise ValueError(f"tuning trace failed physical validation: {validation}")
-                records = read_trace_jsonl(trace)
+                records = read_trace(trace)
                 tuned = TunedA3PolicyAdapter.from_tuned_config(tuned_a3_config)
                 adaptive = ComplexityAwarePolicyAdapter(
                     sparse_policy=TunedA3PolicyAdapter.from_tuned_config(tuned_a3_config),
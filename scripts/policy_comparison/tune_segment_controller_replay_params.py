@@ -19,9 +19,13 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from scripts.policy_comparison.output_validation import (  # noqa: E402
-    validate_comparison_output,
+    OutputValidationReport,
+)
+from scripts.policy_comparison.replay_sweep import (  # noqa: E402
+    ReplaySweep,
+    SweepOutcome,
+    successive_halving,
 )
-from scripts.policy_comparison.run_offline_replay import run as run_offline_replay  # noqa: E402
 from scripts.policy_comparison.segment_controller_artifact import (  # noqa: E402
     sha256_file,
 )
@@ -63,28 +67,46 @@ def tune_segment_controller_replay_params(args: argparse.Namespace) -> dict[str,
     if not configs:
         raise ValueError("parameter sweep produced no configurations")
 
+    sweep = ReplaySweep(
+        traces,
+        tuned_a3_config=tuned_a3_config,
+        segment_artifact=segment_artifact,
+        replay_options=_replay_options,
+        summarize_seed=_sweep_seed_result,
+        failed_seed=_sweep_seed_error,
+        workers=args.workers,
+        checkpoint=Path(args.checkpoint) if args.checkpoint else None,
+        stop_on_failure=args.stop_seed_on_failure,
+    )
     if args.staged:
         results, passing, stage_report = _run_staged_tuning(
             args=args,
+            sweep=sweep,
+            configs=configs,
+            traces=traces,
+        )
+    elif args.successive_halving:
+        results, passing, stage_report = _run_successive_halving(
+            args=args,
+            sweep=sweep,
             configs=configs,
             traces=traces,
-            tuned_a3_config=tuned_a3_config,
-            segment_artifact=segment_artifact,
-            output_dir=output_dir,
         )
     else:
         results, passing = _run_configs(
-            args=args,
+            sweep=sweep,
             indexed_configs=list(enumerate(configs, start=1)),
             traces=traces,
-            tuned_a3_config=tuned_a3_config,
-            segment_artifact=segment_artifact,
-            output_dir=output_dir,
-            stage_name="config",
+            stage_name="exhaustive",
         )
         stage_report = {"mode": "exhaustive"}
 
     selected = _select_best(passing)
+    replay_artifacts = _write_replay_artifacts(
+        sweep,
+        sorted(passing, key=_selection_key)[: max(0, int(args.artifact_configs))],
+        output_dir / "replays",
+    )
     summary = {
         "created_at": datetime.now(timezone.utc).isoformat(),
         "segment_artifact": str(segment_artifact),
@@ -96,6 +118,7 @@ def tune_segment_controller_replay_params(args: argparse.Namespace) -> dict[str,
         "selected": selected,
         "stage_report": stage_report,
         "results": results,
+        "replay_artifacts": replay_artifacts,
     }
     (output_dir / "segment_replay_tuning.json").write_text(
         json.dumps(summary, indent=2, sort_keys=True),
@@ -171,23 +194,18 @@ def _iter_configs(args: argparse.Namespace):
 def _run_staged_tuning(
     *,
     args: argparse.Namespace,
+    sweep: ReplaySweep,
     configs: Sequence[Mapping[str, Any]],
     traces: Sequence[Path],
-    tuned_a3_config: Path,
-    segment_artifact: Path,
-    output_dir: Path,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, Any]]:
     stage_a_trace = _select_stage_a_trace(traces, args.stage_a_seed)
     indexed = list(enumerate(configs, start=1))
     sampled = _stratified_sample(indexed, max_count=args.stage_a_max_configs)
     stage_a_results, _stage_a_passing = _run_configs(
-        args=args,
+        sweep=sweep,
         indexed_configs=sampled,
         traces=[stage_a_trace],
-        tuned_a3_config=tuned_a3_config,
-        segment_artifact=segment_artifact,
-        output_dir=output_dir / "stage_a_seed52",
-        stage_name="config",
+        stage_name="stage_a",
     )
     ranked = sorted(stage_a_results, key=_stage_a_sort_key)
     selected_stage_b = [
@@ -195,13 +213,10 @@ def _run_staged_tuning(
         for item in ranked[: max(1, int(args.stage_b_top_configs))]
     ]
     stage_b_results, passing = _run_configs(
-        args=args,
+        sweep=sweep,
         indexed_configs=selected_stage_b,
         traces=traces,
-        tuned_a3_config=tuned_a3_config,
-        segment_artifact=segment_artifact,
-        output_dir=output_dir / "stage_b_all_calibration",
-        stage_name="config",
+        stage_name="stage_b",
     )
     return stage_b_results, passing, {
         "mode": "staged",
@@ -213,89 +228,107 @@ def _run_staged_tuning(
     }
 
 
-def _run_configs(
+def _run_successive_halving(
     *,
     args: argparse.Namespace,
+    sweep: ReplaySweep,
+    configs: Sequence[Mapping[str, Any]],
+    traces: Sequence[Path],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, Any]]:
+    indexed = list(enumerate(configs, start=1))
+    sampled = _stratified_sample(indexed, max_count=args.halving_max_configs)
+    results, rungs = successive_halving(
+        sweep,
+        sampled,
+        build_entry=_config_entry,
+        rank_key=_stage_a_sort_key,
+        eta=args.halving_eta,
+        min_trace_fraction=args.halving_min_trace_fraction,
+        traces=traces,
+    )
+    passing = [entry for entry in results if entry["pass"]]
+    return results, passing, {
+        "mode": "successive_halving",
+        "total_grid_config_count": len(configs),
+        "halving_config_count": len(sampled),
+        "eta": args.halving_eta,
+        "rungs": rungs,
+    }
+
+
+def _run_configs(
+    *,
+    sweep: ReplaySweep,
     indexed_configs: Sequence[tuple[int, Mapping[str, Any]]],
     traces: Sequence[Path],
-    tuned_a3_config: Path,
-    segment_artifact: Path,
-    output_dir: Path,
     stage_name: str,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    results: list[dict[str, Any]] = []
-    passing: list[dict[str, Any]] = []
-    for config_index, config in indexed_configs:
-        config_dir = output_dir / f"{stage_name}_{config_index:04d}"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        seed_results = []
-        config_failed = False
-        for trace in traces:
-            seed = _trace_seed_hint(trace)
-            replay_dir = config_dir / f"calibration_{seed or trace.stem}"
-            replay_args = argparse.Namespace(
-                trace=str(trace),
-                output_dir=str(replay_dir),
-                policies="tuned_a3_baseline,complexity_aware_ml_a3,ml",
-                calibration_trace=None,
-                tuned_a3_config=str(tuned_a3_config),
-                allow_tuned_a3_calibration_seed_overlap=True,
-                ml_base_url=None,
-                ml_backend="segment_controller",
-                ranker_artifact=None,
-                segment_artifact=str(segment_artifact),
-                high_complexity_threshold=config["high_complexity_threshold"],
-                ranker_min_margin=None,
-                ranker_min_ml_dwell_s=None,
-                a3_reentry_extra_margin_db=None,
-                ml_segment_hold_s=None,
-                segment_entry_threshold=config["entry_threshold"],
-                segment_candidate_margin_min=config["candidate_margin_min"],
-                segment_exit_threshold=config["exit_threshold"],
-                segment_consecutive_exit_votes=config["consecutive_exit_votes"],
-                segment_min_duration_s=config["min_segment_duration_s"],
-                segment_max_duration_s=config["max_segment_duration_s"],
-                segment_emergency_rsrp_floor_dbm=config["emergency_rsrp_floor_dbm"],
-                segment_post_exit_a3_guard_s=config["post_exit_a3_guard_s"],
-                segment_post_exit_a3_extra_margin_db=config["post_exit_a3_extra_margin_db"],
-                segment_high_reject_hold_s=config["high_reject_hold_s"],
-            )
-            try:
-                run_offline_replay(replay_args)
-                validation = validate_comparison_output(
-                    replay_dir,
-                    expected_policies=[
-                        "tuned_a3_baseline",
-                        "complexity_aware_ml_a3",
-                        "ml_policy",
-                    ],
-                )
-                summary = json.loads((replay_dir / "summary.json").read_text(encoding="utf-8"))
-                seed_result = _summarize_seed(summary, validation.ok)
-            except Exception as exc:  # noqa: BLE001 - preserve diagnostic detail
-                seed_result = {
-                    "trace": str(trace),
-                    "ok": False,
-                    "error": str(exc),
-                }
-            seed_results.append(seed_result)
-            if not seed_result.get("ok"):
-                config_failed = True
-                if args.stop_seed_on_failure:
-                    break
-        evaluation = _evaluate_config(config, seed_results)
-        entry = {
-            "config_index": config_index,
-            "config": dict(config),
-            "seed_results": seed_results,
-            "evaluation": evaluation,
-            "pass": (not config_failed and evaluation["pass"]),
+    results = [
+        _config_entry(outcome)
+        for outcome in sweep.run(indexed_configs, traces=traces, stage=stage_name)
+    ]
+    return results, [entry for entry in results if entry["pass"]]
+
+
+def _config_entry(outcome: SweepOutcome) -> dict[str, Any]:
+    evaluation = _evaluate_config(outcome.config, outcome.seed_results)
+    return {
+        "config_index": outcome.config_index,
+        "config": outcome.config,
+        "seed_results": outcome.seed_results,
+        "evaluation": evaluation,
+        "pass": (not outcome.failed and evaluation["pass"]),
+    }
+
+
+def _replay_options(config: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "high_complexity_threshold": config["high_complexity_threshold"],
+        "segment_entry_threshold": config["entry_threshold"],
+        "segment_candidate_margin_min": config["candidate_margin_min"],
+        "segment_exit_threshold": config["exit_threshold"],
+        "segment_consecutive_exit_votes": config["consecutive_exit_votes"],
+        "segment_min_duration_s": config["min_segment_duration_s"],
+        "segment_max_duration_s": config["max_segment_duration_s"],
+        "segment_emergency_rsrp_floor_dbm": config["emergency_rsrp_floor_dbm"],
+        "segment_post_exit_a3_guard_s": config["post_exit_a3_guard_s"],
+        "segment_post_exit_a3_extra_margin_db": config["post_exit_a3_extra_margin_db"],
+        "segment_high_reject_hold_s": config["high_reject_hold_s"],
+    }
+
+
+def _sweep_seed_result(
+    trace: Path,
+    summary: Mapping[str, Any],
+    validation: OutputValidationReport,
+) -> dict[str, Any]:
+    return _summarize_seed(summary, validation.ok)
+
+
+def _sweep_seed_error(trace: Path, exc: Exception) -> dict[str, Any]:
+    return {
+        "trace": str(trace),
+        "ok": False,
+        "error": str(exc),
+    }
+
+
+def _write_replay_artifacts(
+    sweep: ReplaySweep,
+    entries: Sequence[Mapping[str, Any]],
+    output_dir: Path,
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "config_index": entry["config_index"],
+            "replays": sweep.write_replay_artifacts(
+                entry["config"],
+                output_dir / f"config_{int(entry['config_index']):04d}",
+                replay_dir_name=lambda trace: f"calibration_{_trace_seed_hint(trace)}",
+            ),
         }
-        results.append(entry)
-        if entry["pass"]:
-            passing.append(entry)
-    return results, passing
+        for entry in entries
+    ]
 
 
 def _select_stage_a_trace(traces: Sequence[Path], seed: int) -> Path:
@@ -430,15 +463,16 @@ def _evaluate_config(config: Mapping[str, Any], seed_results: Sequence[Mapping[s
 def _select_best(entries: Sequence[Mapping[str, Any]]) -> Mapping[str, Any] | None:
     if not entries:
         return None
-    return min(
-        entries,
-        key=lambda entry: (
-            float(entry["evaluation"]["mean_adaptive_high_cost"]),
-            float(entry["evaluation"]["mean_adaptive_ping_pong"]),
-            float(entry["evaluation"]["mean_adaptive_handovers"]),
-            float(entry["config"]["max_segment_duration_s"]),
-            int(entry["config"]["high_complexity_threshold"]),
-        ),
+    return min(entries, key=_selection_key)
+
+
+def _selection_key(entry: Mapping[str, Any]) -> tuple[float, float, float, float, int]:
+    return (
+        float(entry["evaluation"]["mean_adaptive_high_cost"]),
+        float(entry["evaluation"]["mean_adaptive_ping_pong"]),
+        float(entry["evaluation"]["mean_adaptive_handovers"]),
+        float(entry["config"]["max_segment_duration_s"]),
+        int(entry["config"]["high_complexity_threshold"]),
     )
 
 
@@ -512,7 +546,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--calibration-trace",
         action="append",
         required=True,
-        help="Calibration trace JSONL. May be supplied multiple times.",
+        help="Calibration trace (JSONL or .npz). May be supplied multiple times.",
     )
     parser.add_argument("--tuned-a3-config", required=True)
     parser.add_argument("--segment-artifact", required=True)
@@ -538,12 +572,51 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--post-exit-a3-guard-s", default="0,10,20,30")
     parser.add_argument("--post-exit-a3-extra-margin-db", default="0,3,6,9")
     parser.add_argument("--high-reject-hold-s", default="0,6,12,20")
-    parser.add_argument("--staged", action="store_true")
+    search = parser.add_mutually_exclusive_group()
+    search.add_argument("--staged", action="store_true")
+    search.add_argument(
+        "--successive-halving",
+        action="store_true",
+        help=(
+            "Replay every configuration on a short prefix of all calibration "
+            "traces and keep the best 1/eta on each longer prefix."
+        ),
+    )
+    parser.add_argument("--halving-eta", type=int, default=3)
+    parser.add_argument("--halving-min-trace-fraction", type=float, default=1.0 / 9.0)
+    parser.add_argument(
+        "--halving-max-configs",
+        type=int,
+        default=0,
+        help="Stratified grid sample for --successive-halving. Default: 0, the full grid",
+    )
     parser.add_argument("--stage-a-seed", type=int, default=52)
     parser.add_argument("--stage-a-max-configs", type=int, default=48)
     parser.add_argument("--stage-b-top-configs", type=int, default=20)
     parser.add_argument("--stop-seed-on-failure", action="store_true")
     parser.add_argument("--fail-if-no-pass", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Replay configurations in this many forked processes. Default: 1",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help=(
+            "JSONL file of finished configurations. An existing file is resumed; "
+            "keep it outside --output-dir."
+        ),
+    )
+    parser.add_argument(
+        "--artifact-configs",
+        type=int,
+        default=1,
+        help=(
+            "Write full replay outputs for the best N passing configurations "
+            "of the final stage. Default: 1, the selected configuration"
+        ),
+    )
     return parser
 
 
@@ -18,9 +18,13 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from scripts.policy_comparison.output_validation import (  # noqa: E402
-    validate_comparison_output,
+    OutputValidationReport,
+)
+from scripts.policy_comparison.replay_sweep import (  # noqa: E402
+    ReplaySweep,
+    SweepOutcome,
+    successive_halving,
 )
-from scripts.policy_comparison.run_offline_replay import run as run_offline_replay  # noqa: E402
 from scripts.policy_comparison.segment_controller_artifact import (  # noqa: E402
     SEGMENT_SPARSE_AUTHORITY_MODES,
     load_segment_controller_artifact,
@@ -62,27 +66,35 @@ def tune_sparse_authority_replay_params(args: argparse.Namespace) -> dict[str, A
     if not configs:
         raise ValueError("sparse authority sweep produced no configurations")
 
+    sweep = ReplaySweep(
+        traces,
+        tuned_a3_config=tuned_a3_config,
+        segment_artifact=segment_artifact,
+        replay_options=_replay_options,
+        summarize_seed=_sweep_seed_result,
+        failed_seed=_sweep_seed_error,
+        workers=args.workers,
+        checkpoint=Path(args.checkpoint) if args.checkpoint else None,
+    )
     indexed = list(enumerate(configs, start=1))
     if args.staged:
         stage_a_trace = _select_stage_a_trace(traces, args.stage_a_seed)
         sampled = _balanced_sample(indexed, max_count=args.stage_a_max_configs)
         stage_a_results, _ = _run_configs(
+            sweep=sweep,
             indexed_configs=sampled,
             traces=[stage_a_trace],
-            tuned_a3_config=tuned_a3_config,
-            segment_artifact=segment_artifact,
-            output_dir=output_dir / f"stage_a_seed{args.stage_a_seed}",
+            stage_name="stage_a",
         )
         stage_b_configs = _select_stage_b(
             stage_a_results,
             max_count=args.stage_b_top_configs,
         )
         results, passing = _run_configs(
+            sweep=sweep,
             indexed_configs=stage_b_configs,
             traces=traces,
-            tuned_a3_config=tuned_a3_config,
-            segment_artifact=segment_artifact,
-            output_dir=output_dir / "stage_b_all_calibration",
+            stage_name="stage_b",
         )
         stage_report = {
             "mode": "staged",
@@ -92,17 +104,39 @@ def tune_sparse_authority_replay_params(args: argparse.Namespace) -> dict[str, A
             "stage_b_config_count": len(stage_b_configs),
             "stage_a_results": stage_a_results,
         }
+    elif args.successive_halving:
+        sampled = _balanced_sample(indexed, max_count=args.halving_max_configs)
+        results, rungs = successive_halving(
+            sweep,
+            sampled,
+            build_entry=_config_entry,
+            rank_key=_stage_a_sort_key,
+            eta=args.halving_eta,
+            min_trace_fraction=args.halving_min_trace_fraction,
+        )
+        passing = [entry for entry in results if entry["pass"]]
+        stage_report = {
+            "mode": "successive_halving",
+            "total_grid_config_count": len(configs),
+            "halving_config_count": len(sampled),
+            "eta": args.halving_eta,
+            "rungs": rungs,
+        }
     else:
         results, passing = _run_configs(
+            sweep=sweep,
             indexed_configs=indexed,
             traces=traces,
-            tuned_a3_config=tuned_a3_config,
-            segment_artifact=segment_artifact,
-            output_dir=output_dir / "all_configs",
+            stage_name="exhaustive",
         )
         stage_report = {"mode": "exhaustive"}
 
     selected = _select_best(passing)
+    replay_artifacts = _write_replay_artifacts(
+        sweep,
+        sorted(passing, key=_selection_key)[: max(0, int(args.artifact_configs))],
+        output_dir / "replays",
+    )
     summary: dict[str, Any] = {
         "created_at": datetime.now(timezone.utc).isoformat(),
         "segment_artifact": str(segment_artifact),
@@ -115,6 +149,7 @@ def tune_sparse_authority_replay_params(args: argparse.Namespace) -> dict[str, A
         "selected": selected,
         "stage_report": stage_report,
         "results": results,
+        "replay_artifacts": replay_artifacts,
         "gate_policy": {
             "adaptive_beats_ml_only_every_calibration_seed": True,
             "adaptive_beats_tuned_a3_every_calibration_seed": True,
@@ -173,96 +208,76 @@ def _iter_configs(args: argparse.Namespace):
 
 def _run_configs(
     *,
+    sweep: ReplaySweep,
     indexed_configs: Sequence[tuple[int, Mapping[str, Any]]],
     traces: Sequence[Path],
-    tuned_a3_config: Path,
-    segment_artifact: Path,
-    output_dir: Path,
+    stage_name: str,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    results: list[dict[str, Any]] = []
-    passing: list[dict[str, Any]] = []
-    for config_index, config in indexed_configs:
-        config_dir = output_dir / f"config_{config_index:04d}"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        seed_results: list[dict[str, Any]] = []
-        for trace in traces:
-            seed = _trace_seed(trace)
-            replay_dir = config_dir / f"calibration_seed{seed}"
-            replay_args = argparse.Namespace(
-                trace=str(trace),
-                output_dir=str(replay_dir),
-                policies="tuned_a3_baseline,complexity_aware_ml_a3,ml",
-                calibration_trace=None,
-                tuned_a3_config=str(tuned_a3_config),
-                allow_tuned_a3_calibration_seed_overlap=True,
-                ml_base_url=None,
-                ml_backend="segment_controller",
-                ranker_artifact=None,
-                segment_artifact=str(segment_artifact),
-                high_complexity_threshold=config["high_complexity_threshold"],
-                ranker_min_margin=None,
-                ranker_min_ml_dwell_s=None,
-                a3_reentry_extra_margin_db=None,
-                ml_segment_hold_s=None,
-                segment_entry_threshold=None,
-                segment_candidate_margin_min=None,
-                segment_exit_threshold=None,
-                segment_consecutive_exit_votes=None,
-                segment_min_duration_s=None,
-                segment_max_duration_s=None,
-                segment_emergency_rsrp_floor_dbm=None,
-                segment_post_exit_a3_guard_s=None,
-                segment_post_exit_a3_extra_margin_db=None,
-                segment_high_reject_hold_s=None,
-                segment_sparse_authority_mode=config["sparse_authority_mode"],
-                segment_sparse_serving_rsrp_floor_dbm=config[
-                    "sparse_serving_rsrp_floor_dbm"
-                ],
-                segment_sparse_serving_sinr_floor_db=config[
-                    "sparse_serving_sinr_floor_db"
-                ],
-                segment_sparse_a3_extra_margin_db=config[
-                    "sparse_a3_extra_margin_db"
-                ],
-            )
-            try:
-                run_offline_replay(replay_args)
-                validation = validate_comparison_output(
-                    replay_dir,
-                    expected_policies=[
-                        "tuned_a3_baseline",
-                        "complexity_aware_ml_a3",
-                        "ml_policy",
-                    ],
-                )
-                summary = json.loads(
-                    (replay_dir / "summary.json").read_text(encoding="utf-8")
-                )
-                seed_result = _summarize_seed(summary, validation.ok)
-                if not validation.ok:
-                    seed_result["validation_issues"] = [
-                        issue.to_dict() for issue in validation.issues
-                    ]
-            except Exception as exc:  # noqa: BLE001 - preserve diagnostics
-                seed_result = {
-                    "seed": seed,
-                    "ok": False,
-                    "error": str(exc),
-                }
-            seed_results.append(seed_result)
-        evaluation = _evaluate_config(seed_results)
-        entry = {
-            "config_index": int(config_index),
-            "config": dict(config),
-            "seed_results": seed_results,
-            "evaluation": evaluation,
-            "pass": bool(evaluation["pass"]),
+    results = [
+        _config_entry(outcome)
+        for outcome in sweep.run(indexed_configs, traces=traces, stage=stage_name)
+    ]
+    return results, [entry for entry in results if entry["pass"]]
+
+
+def _config_entry(outcome: SweepOutcome) -> dict[str, Any]:
+    evaluation = _evaluate_config(outcome.seed_results)
+    return {
+        "config_index": int(outcome.config_index),
+        "config": outcome.config,
+        "seed_results": outcome.seed_results,
+        "evaluation": evaluation,
+        "pass": bool(evaluation["pass"]),
+    }
+
+
+def _replay_options(config: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "high_complexity_threshold": config["high_complexity_threshold"],
+        "segment_sparse_authority_mode": config["sparse_authority_mode"],
+        "segment_sparse_serving_rsrp_floor_dbm": config["sparse_serving_rsrp_floor_dbm"],
+        "segment_sparse_serving_sinr_floor_db": config["sparse_serving_sinr_floor_db"],
+        "segment_sparse_a3_extra_margin_db": config["sparse_a3_extra_margin_db"],
+    }
+
+
+def _sweep_seed_result(
+    trace: Path,
+    summary: Mapping[str, Any],
+    validation: OutputValidationReport,
+) -> dict[str, Any]:
+    seed_result = _summarize_seed(summary, validation.ok)
+    if not validation.ok:
+        seed_result["validation_issues"] = [
+            issue.to_dict() for issue in validation.issues
+        ]
+    return seed_result
+
+
+def _sweep_seed_error(trace: Path, exc: Exception) -> dict[str, Any]:
+    return {
+        "seed": _trace_seed(trace),
+        "ok": False,
+        "error": str(exc),
+    }
+
+
+def _write_replay_artifacts(
+    sweep: ReplaySweep,
+    entries: Sequence[Mapping[str, Any]],
+    output_dir: Path,
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "config_index": int(entry["config_index"]),
+            "replays": sweep.write_replay_artifacts(
+                entry["config"],
+                output_dir / f"config_{int(entry['config_index']):04d}",
+                replay_dir_name=lambda trace: f"calibration_seed{_trace_seed(trace)}",
+            ),
         }
-        results.append(entry)
-        if entry["pass"]:
-            passing.append(entry)
-    return results, passing
+        for entry in entries
+    ]
 
 
 def _summarize_seed(summary: Mapping[str, Any], validation_ok: bool) -> dict[str, Any]:
@@ -489,15 +504,16 @@ def _stage_a_sort_key(entry: Mapping[str, Any]) -> tuple[float, float, float, in
 def _select_best(entries: Sequence[Mapping[str, Any]]) -> Mapping[str, Any] | None:
     if not entries:
         return None
-    return min(
-        entries,
-        key=lambda entry: (
-            float(entry["evaluation"]["mean_adaptive_overall_cost"]),
-            float(entry["evaluation"]["mean_adaptive_high_cost"]),
-            float(entry["evaluation"]["mean_adaptive_ping_pong"]),
-            float(entry["evaluation"]["mean_adaptive_handovers"]),
-            int(entry["config"]["high_complexity_threshold"]),
-        ),
+    return min(entries, key=_selection_key)
+
+
+def _selection_key(entry: Mapping[str, Any]) -> tuple[float, float, float, float, int]:
+    return (
+        float(entry["evaluation"]["mean_adaptive_overall_cost"]),
+        float(entry["evaluation"]["mean_adaptive_high_cost"]),
+        float(entry["evaluation"]["mean_adaptive_ping_pong"]),
+        float(entry["evaluation"]["mean_adaptive_handovers"]),
+        int(entry["config"]["high_complexity_threshold"]),
     )
 
 
@@ -618,11 +634,50 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
     parser.add_argument("--sparse-extra-margins", default="0,3,6,9")
-    parser.add_argument("--staged", action="store_true")
+    search = parser.add_mutually_exclusive_group()
+    search.add_argument("--staged", action="store_true")
+    search.add_argument(
+        "--successive-halving",
+        action="store_true",
+        help=(
+            "Replay every configuration on a short prefix of all calibration "
+            "traces and keep the best 1/eta on each longer prefix."
+        ),
+    )
+    parser.add_argument("--halving-eta", type=int, default=3)
+    parser.add_argument("--halving-min-trace-fraction", type=float, default=1.0 / 9.0)
+    parser.add_argument(
+        "--halving-max-configs",
+        type=int,
+        default=0,
+        help="Balanced grid sample for --successive-halving. Default: 0, the full grid",
+    )
     parser.add_argument("--stage-a-seed", type=int, default=52)
     parser.add_argument("--stage-a-max-configs", type=int, default=36)
     parser.add_argument("--stage-b-top-configs", type=int, default=12)
     parser.add_argument("--fail-if-no-pass", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Replay configurations in this many forked processes. Default: 1",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help=(
+            "JSONL file of finished configurations. An existing file is resumed; "
+            "keep it outside --output-dir."
+        ),
+    )
+    parser.add_argument(
+        "--artifact-configs",
+        type=int,
+        default=1,
+        help=(
+            "Write full replay outputs for the best N passing configurations "
+            "of the final stage. Default: 1, the selected configuration"
+        ),
+    )
     return parser
 
 
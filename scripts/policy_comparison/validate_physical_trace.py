@@ -13,7 +13,7 @@ from pathlib import Path
 from typing import Sequence
 
 from .complexity import candidate_complexity_for_record
-from .trace_io import read_trace_jsonl
+from .trace_io import read_trace
 
 
 EXPECTED_CELL_COUNTS = {
@@ -30,7 +30,7 @@ def _quantile(values: list[float], fraction: float) -> float:
 
 
 def validate_trace(path: Path, *, require_complexity: bool = False) -> dict:
-    records = read_trace_jsonl(path)
+    records = read_trace(path)
     if not records:
         raise ValueError("trace is empty")
     errors: list[str] = []
@@ -2,8 +2,13 @@ import json
 
 import scripts.policy_comparison.capture_nef_trace as capture_cli
 from scripts.policy_comparison.capture_nef_trace import main, parse_ue_ids
-from scripts.policy_comparison.nef_trace import capture_nef_trace_records
-from scripts.policy_comparison.trace_io import read_trace_jsonl
+from scripts.policy_comparison.nef_trace import (
+    NefTraceError,
+    capture_nef_trace_records,
+    fetch_nef_feature_vectors,
+    iter_nef_trace_records,
+)
+from scripts.policy_comparison.trace_io import read_trace_jsonl, stream_trace_jsonl
 
 
 def feature_vector(ue_id, connected_to="cell-a"):
@@ -67,6 +72,106 @@ def test_capture_records_uses_existing_feature_fetcher_without_policy_decisions(
     assert "decision_type" not in records[0].to_dict()
 
 
+def test_capture_records_fetches_one_snapshot_per_step_with_batch_fetcher():
+    calls = []
+
+    def fake_batch_fetcher(nef_url, ue_ids, timeout_s):
+        calls.append(list(ue_ids))
+        return {ue_id: feature_vector(ue_id) for ue_id in reversed(ue_ids)}
+
+    records = capture_nef_trace_records(
+        nef_url="http://nef.local",
+        ue_ids=["ue-1", "ue-2"],
+        scenario="highway",
+        seed=42,
+        samples=3,
+        interval_s=0.0,
+        batch_fetcher=fake_batch_fetcher,
+        monotonic_clock=lambda: 0.0,
+    )
+
+    assert calls == [["ue-1", "ue-2"]] * 3
+    assert [(record.step_index, record.ue_id) for record in records[:2]] == [
+        (0, "ue-1"),
+        (0, "ue-2"),
+    ]
+
+
+def test_iter_records_streams_each_step_before_the_next_fetch(tmp_path):
+    steps = []
+
+    def fake_batch_fetcher(nef_url, ue_ids, timeout_s):
+        steps.append(len(steps))
+        return {ue_id: feature_vector(ue_id) for ue_id in ue_ids}
+
+    records = iter_nef_trace_records(
+        nef_url="http://nef.local",
+        ue_ids=["ue-1"],
+        scenario="highway",
+        seed=42,
+        samples=2,
+        interval_s=0.0,
+        batch_fetcher=fake_batch_fetcher,
+        monotonic_clock=lambda: 0.0,
+    )
+    assert steps == []
+    assert next(records).step_index == 0
+    assert steps == [0]
+
+    output = tmp_path / "trace.jsonl"
+    assert stream_trace_jsonl(records, output) == 1
+    assert [record.step_index for record in read_trace_jsonl(output)] == [1]
+
+
+def test_stream_trace_jsonl_rejects_empty_stream(tmp_path):
+    output = tmp_path / "trace.jsonl"
+    try:
+        stream_trace_jsonl(iter(()), output)
+    except ValueError as exc:
+        assert "empty" in str(exc)
+    else:
+        raise AssertionError("empty trace should be rejected")
+    assert not output.exists()
+
+
+def test_fetch_feature_vectors_uses_bulk_endpoint_and_rejects_missing_ues():
+    class FakeResponse:
+        def __init__(self, payload):
+            self.payload = payload
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.payload
+
+    class FakeSession:
+        def __init__(self, payload):
+            self.payload = payload
+            self.calls = []
+
+        def get(self, url, params, timeout):
+            self.calls.append((url, params, timeout))
+            return FakeResponse(self.payload)
+
+    session = FakeSession({"features": {"ue-1": feature_vector("ue-1")}, "missing": []})
+    features = fetch_nef_feature_vectors(
+        "http://nef.local/", ["ue-1"], timeout_s=2.0, session=session
+    )
+    assert list(features) == ["ue-1"]
+    assert session.calls == [
+        ("http://nef.local/api/v1/ml/state", [("ue_id", "ue-1")], 2.0)
+    ]
+
+    session = FakeSession({"features": {}, "missing": ["ue-9"]})
+    try:
+        fetch_nef_feature_vectors("http://nef.local", ["ue-9"], session=session)
+    except NefTraceError as exc:
+        assert "ue-9" in str(exc)
+    else:
+        raise AssertionError("missing UEs should be rejected")
+
+
 def test_capture_records_hashes_topology_json(tmp_path):
     topology = tmp_path / "topology.json"
     topology.write_text('{"cells": [{"id": "cell-a"}]}', encoding="utf-8")
@@ -151,7 +256,7 @@ def test_capture_cli_resolves_nef_url_from_env_and_writes_files(tmp_path, monkey
             monotonic_clock=lambda: 0.0,
         )
 
-    monkeypatch.setattr(capture_cli, "capture_nef_trace_records", fake_capture)
+    monkeypatch.setattr(capture_cli, "iter_nef_trace_records", fake_capture)
 
     code = main(
         [
@@ -149,7 +149,7 @@ def test_capture_scenario_trace_uses_shared_nef_trace_capture_mode(tmp_path, mon
             )
         ]
 
-    monkeypatch.setattr(runner, "capture_nef_trace_records", fake_capture)
+    monkeypatch.setattr(runner, "iter_nef_trace_records", fake_capture)
 
     def fake_run(command, **kwargs):
         calls["compose"].append((command, kwargs.get("env", {})))
@@ -1,4 +1,5 @@
 from scripts.policy_comparison.complexity import (
+    best_neighbour,
     candidate_complexity_for_feature_vector,
     candidate_complexity_for_record,
     complexity_bucket,
@@ -48,6 +49,16 @@ def test_candidate_complexity_counts_viable_non_serving_cells_only():
     assert complexity.viable_candidate_count == 2
     assert complexity.complexity_bucket == "moderate"
     assert complexity.viable_candidates == ["cell-b", "cell-e"]
+    assert candidate_complexity_for_record(record) is complexity
+    assert candidate_complexity_for_record(record, min_sinr_db=5.0).viable_candidate_count == 0
+    assert best_neighbour(record).cell_id == "cell-d"
+    assert best_neighbour(record, excluding="cell-d").cell_id == "cell-b"
+    assert best_neighbour(record.with_serving_cell("cell-d"), excluding="cell-b").cell_id == "cell-e"
+
+    loaded = record.with_policy_context(cell_loads={"cell-d": 0.7})
+    assert best_neighbour(loaded) is loaded.visible_cell_map["cell-d"]
+    assert best_neighbour(loaded).load == 0.7
+    assert best_neighbour(record).load != 0.7
 
 
 def test_candidate_complexity_for_feature_vector_high_bucket():
@@ -8,7 +8,9 @@ from scripts.policy_comparison.candidate_ranker_artifact import sha256_file
 from scripts.policy_comparison.nef_trace import feature_vector_to_trace_record
 from scripts.policy_comparison import run_offline_replay as replay_cli
 from scripts.policy_comparison.run_offline_replay import main
-from scripts.policy_comparison.trace_io import write_trace_jsonl
+from scripts.policy_comparison.output_validation import validate_comparison_output
+from scripts.policy_comparison.trace_io import read_decisions, write_trace_jsonl
+from scripts.policy_comparison.trace_columnar import write_trace_columnar
 
 
 def make_record(seed, step, rsrp_b=-78.0):
@@ -58,6 +60,31 @@ def test_offline_replay_cli_writes_summary_manifest_and_decisions(tmp_path):
     assert (output_dir / "decisions" / "fixed_a3_baseline.jsonl").exists()
 
 
+def test_offline_replay_cli_accepts_columnar_trace_and_decisions(tmp_path):
+    trace_path = tmp_path / "eval.npz"
+    output_dir = tmp_path / "out"
+    write_trace_columnar([make_record(10, 0), make_record(10, 1)], trace_path)
+
+    code = main(
+        [
+            "--trace",
+            str(trace_path),
+            "--output-dir",
+            str(output_dir),
+            "--policies",
+            "fixed_a3_baseline",
+            "--decision-format",
+            "npz",
+        ]
+    )
+
+    assert code == 0
+    decision_path = output_dir / "decisions" / "fixed_a3_baseline.npz"
+    assert len(read_decisions(decision_path)) == 2
+    report = validate_comparison_output(output_dir, expected_policies=["fixed_a3_baseline"])
+    assert report.ok, report.to_dict()
+
+
 def test_offline_replay_cli_rejects_nonempty_output_dir(tmp_path):
     trace_path = tmp_path / "eval.jsonl"
     output_dir = tmp_path / "out"
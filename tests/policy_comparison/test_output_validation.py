@@ -1,6 +1,12 @@
 import json
 
-from scripts.policy_comparison.output_validation import validate_comparison_output
+from scripts.policy_comparison.nef_trace import feature_vector_to_trace_record
+from scripts.policy_comparison.output_validation import (
+    validate_comparison_output,
+    validate_replay_result,
+)
+from scripts.policy_comparison.policy_adapters import FixedA3PolicyAdapter
+from scripts.policy_comparison.replay import OfflineReplayRunner
 from scripts.policy_comparison.validate_comparison_outputs import main as validate_main
 
 
@@ -1164,3 +1170,31 @@ def test_validation_cli_writes_report_and_sets_exit_code(tmp_path):
     assert ok_exit == 0
     assert report_path.is_file()
     assert bad_exit == 1
+
+
+def test_in_memory_replay_result_is_validated_without_files():
+    records = [
+        feature_vector_to_trace_record(
+            {
+                "ue_id": "ue-1",
+                "latitude": 37.1,
+                "longitude": 23.2,
+                "connected_to": "cell-a",
+                "neighbor_rsrp_dbm": {"cell-a": -84.0, "cell-b": -78.0},
+            },
+            scenario="highway",
+            seed=7,
+            step_index=step,
+            timestamp_s=float(step),
+            topology_hash="topology",
+        )
+        for step in range(3)
+    ]
+    result = OfflineReplayRunner([FixedA3PolicyAdapter()]).replay(records)
+
+    report = validate_replay_result(result, expected_policies=["fixed_a3_baseline"])
+    assert report.ok, report.issues
+
+    missing = validate_replay_result(result, expected_policies=["ml_policy"])
+    assert not missing.ok
+    assert [issue.code for issue in missing.issues] == ["missing_expected_policy"]
@@ -1,5 +1,6 @@
 import json
 import math
+from dataclasses import replace
 
 from scripts.policy_comparison.oracle_policy import action_features, solve_cost_to_go
 from scripts.policy_comparison.oracle_ranker_artifact import load_oracle_ranker_artifact
@@ -109,7 +110,7 @@ def test_physical_trace_validator_blocks_rf_fallback(tmp_path):
     metadata = dict(record.metadata)
     metadata["rf_provenance"] = {**metadata["rf_provenance"], "fallback": True}
     path = tmp_path / "trace.jsonl"
-    write_trace_jsonl([record.__class__(**{**record.__dict__, "metadata": metadata})], path)
+    write_trace_jsonl([replace(record, metadata=metadata)], path)
     report = validate_trace(path)
     assert report["pass"] is False
     assert "rf_fallback_active" in report["errors"]
@@ -120,12 +121,7 @@ def test_physical_trace_validator_requires_all_cell_measurements(tmp_path):
     path = tmp_path / "trace.jsonl"
     write_trace_jsonl(
         [
-            record.__class__(
-                **{
-                    **record.__dict__,
-                    "visible_cells": record.visible_cells[:-1],
-                }
-            )
+            replace(record, visible_cells=record.visible_cells[:-1])
         ],
         path,
     )
@@ -139,9 +135,7 @@ def test_physical_trace_validator_requires_movement_provenance(tmp_path):
     metadata = dict(record.metadata)
     metadata.pop("movement_provenance")
     path = tmp_path / "trace.jsonl"
-    write_trace_jsonl(
-        [record.__class__(**{**record.__dict__, "metadata": metadata})], path
-    )
+    write_trace_jsonl([replace(record, metadata=metadata)], path)
     report = validate_trace(path)
     assert report["pass"] is False
     assert "missing_movement_provenance" in report["errors"]
@@ -160,7 +154,7 @@ def test_physical_trace_validator_allows_ping_pong_endpoint_reversal(tmp_path):
             record.step_index,
             {"velocity": 33.3, "heading_change_rate": 0.0},
         )
-        adjusted.append(record.__class__(**{**record.__dict__, "metadata": metadata}))
+        adjusted.append(replace(record, metadata=metadata))
     path = tmp_path / "trace.jsonl"
     write_trace_jsonl(adjusted, path)
     assert validate_trace(path)["pass"] is True
@@ -177,12 +171,10 @@ def test_physical_trace_validator_detects_reversal_between_feature_reads(tmp_pat
             "heading_change_rate": 0.0,
         }
         adjusted.append(
-            record.__class__(
-                **{
-                    **record.__dict__,
-                    "ue_position": {"latitude": position, "longitude": 0.0},
-                    "metadata": metadata,
-                }
+            replace(
+                record,
+                ue_position={"latitude": position, "longitude": 0.0},
+                metadata=metadata,
             )
         )
     path = tmp_path / "trace.jsonl"
@@ -194,9 +186,7 @@ def test_physical_trace_validator_blocks_non_reversal_velocity_error(tmp_path):
     records = [_record(step) for step in range(5)]
     metadata = dict(records[2].metadata)
     metadata["ml_features"] = {"velocity": 20.0, "heading_change_rate": 0.0}
-    records[2] = records[2].__class__(
-        **{**records[2].__dict__, "metadata": metadata}
-    )
+    records[2] = replace(records[2], metadata=metadata)
     path = tmp_path / "trace.jsonl"
     write_trace_jsonl(records, path)
     report = validate_trace(path)
@@ -1,6 +1,7 @@
 import pytest
 import requests
 
+from dataclasses import replace
 from pathlib import Path
 
 from scripts.policy_comparison.nef_trace import feature_vector_to_trace_record
@@ -90,6 +91,10 @@ class FakeRankerArtifact:
             for row in rows
         }
 
+    def score_row_groups(self, groups):
+        self.batch_calls = getattr(self, "batch_calls", 0) + 1
+        return [self.score_rows(rows) for rows in groups]
+
     def safe_metadata(self):
         return {
             "model_type": "candidate_ranker_lightgbm_regressor",
@@ -146,6 +151,17 @@ class FakeSegmentArtifact:
     def score_exit(self, row):
         return 0.1
 
+    def score_candidate_groups(self, groups):
+        self.batch_calls = getattr(self, "batch_calls", 0) + 1
+        return [self.score_candidates(rows) for rows in groups]
+
+    def score_entries(self, rows):
+        return [self.score_entry(row) for row in rows]
+
+    def score_exits(self, rows):
+        self.exit_batches = getattr(self, "exit_batches", []) + [len(rows)]
+        return [self.score_exit(row) for row in rows]
+
     def safe_metadata(self):
         return {
             "model_type": "segment_controller_lightgbm_v1",
@@ -484,6 +500,69 @@ def test_candidate_ranker_policy_adapter_dwell_guard_suppresses_recent_ml_handov
     assert decision.reason == "ranker_dwell_guard"
 
 
+def _without_latency(decision):
+    return replace(decision, decision_latency_ms=None)
+
+
+def test_candidate_ranker_snapshot_scoring_matches_per_record_decisions():
+    scores = {"cell-b": 1.0, "cell-c": 4.0, "cell-d": 3.0}
+    records = [
+        high_complexity_trace_record(),
+        replace(high_complexity_trace_record(), ue_id="ue-2"),
+    ]
+    batched = CandidateRankerPolicyAdapter(FakeRankerArtifact(scores))
+    single = CandidateRankerPolicyAdapter(FakeRankerArtifact(scores))
+
+    batched.score_snapshot(records)
+    decisions = [batched.decide(record) for record in records]
+
+    assert batched.artifact.batch_calls == 1
+    assert [_without_latency(item) for item in decisions] == [
+        _without_latency(single.decide(record)) for record in records
+    ]
+    assert not hasattr(single.artifact, "batch_calls")
+
+
+def test_segment_controller_snapshot_scoring_batches_entry_and_exit_rows():
+    def adapter():
+        return SegmentControllerPolicyAdapter(
+            ExitingFakeSegmentArtifact(),
+            policy_name="ml_policy",
+            high_complexity_threshold=3,
+            candidate_margin_min=1.0,
+            min_segment_duration_s=0.0,
+            consecutive_exit_votes=1,
+        )
+
+    entry = [
+        high_complexity_trace_record(),
+        replace(high_complexity_trace_record(), ue_id="ue-2"),
+    ]
+    exit_step = [
+        replace(record, step_index=1, timestamp_s=1.0, serving_cell="cell-b")
+        for record in entry
+    ]
+    batched = adapter()
+    single = adapter()
+    decisions = []
+    for snapshot in (entry, exit_step):
+        batched.score_snapshot(snapshot)
+        decisions.extend(batched.decide(record) for record in snapshot)
+    expected = [single.decide(record) for record in entry + exit_step]
+
+    assert batched.artifact.batch_calls == 2
+    assert batched.artifact.exit_batches == [2]
+    assert [item.debug["decision_source"] for item in decisions] == [
+        "ml_segment_entry",
+        "ml_segment_entry",
+        "ml_segment_exit_to_a3",
+        "ml_segment_exit_to_a3",
+    ]
+    assert [_without_latency(item) for item in decisions] == [
+        _without_latency(item) for item in expected
+    ]
+
+
 def test_segment_controller_high_complexity_rejection_stays_without_a3_fallback():
     adapter = SegmentControllerPolicyAdapter(
         FakeSegmentArtifact(),
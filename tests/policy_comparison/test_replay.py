@@ -3,10 +3,10 @@ from scripts.policy_comparison.replay import OfflineReplayRunner
 from scripts.policy_comparison.schemas import MeasurementTraceRecord, PolicyDecisionRecord
 
 
-def record(step, serving="cell-a"):
+def record(step, serving="cell-a", ue_id="ue-1"):
     return feature_vector_to_trace_record(
         {
-            "ue_id": "ue-1",
+            "ue_id": ue_id,
             "latitude": 37.1,
             "longitude": 23.2,
             "connected_to": serving,
@@ -77,6 +77,25 @@ class WarmRecordingPolicy(RecordingPolicy):
         self.seen_serving_cells.append(f"warm:{trace_record.serving_cell}")
 
 
+class BatchRecordingPolicy(RecordingPolicy):
+    def __init__(self, name):
+        super().__init__(name)
+        self.events = []
+        self.scored = []
+
+    def set_replay_state(self, ue_id, state):
+        self.events.append(f"state:{ue_id}")
+
+    def score_snapshot(self, records):
+        self.scored.extend(records)
+        self.events.append("score:" + ",".join(item.ue_id for item in records))
+
+    def decide(self, trace_record):
+        self.events.append(f"decide:{trace_record.ue_id}")
+        assert trace_record is self.scored.pop(0)
+        return super().decide(trace_record)
+
+
 def test_replay_uses_separate_serving_state_per_policy():
     handover_policy = RecordingPolicy("handover-policy", handover_on_first_step=True)
     stay_policy = RecordingPolicy("stay-policy")
@@ -123,3 +142,34 @@ def test_replay_warms_policy_then_resets_state_before_measurement():
 
     assert policy.warmup_calls == 1
     assert policy.seen_serving_cells == ["cell-a", "cell-a"]
+
+
+def test_parallel_replay_matches_serial_replay():
+    records = [record(step) for step in range(4)]
+
+    serial = OfflineReplayRunner(
+        [RecordingPolicy("handover-policy", handover_on_first_step=True), RecordingPolicy("stay-policy")]
+    ).replay(records)
+    parallel = OfflineReplayRunner(
+        [RecordingPolicy("handover-policy", handover_on_first_step=True), RecordingPolicy("stay-policy")],
+        workers=2,
+    ).replay(records)
+
+    assert list(parallel.policy_results) == ["handover-policy", "stay-policy"]
+    assert parallel.to_dict() == serial.to_dict()
+
+
+def test_replay_scores_each_snapshot_before_deciding_its_ues():
+    policy = BatchRecordingPolicy("batch-policy")
+    records = [record(step, ue_id=ue_id) for step in range(2) for ue_id in ("ue-1", "ue-2")]
+
+    OfflineReplayRunner([policy]).replay(records)
+
+    assert policy.events == [
+        "state:ue-1",
+        "state:ue-2",
+        "score:ue-1,ue-2",
+        "decide:ue-1",
+        "decide:ue-2",
+    ] * 2
+    assert policy.scored == []
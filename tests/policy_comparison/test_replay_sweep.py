@@ -0,0 +1,167 @@
+import json
+
+import pytest
+
+from scripts.policy_comparison.nef_trace import feature_vector_to_trace_record
+from scripts.policy_comparison.replay_sweep import (
+    ReplaySweep,
+    successive_halving,
+    trace_prefix,
+)
+
+
+def fake_evaluate(self, config, traces, trace_fraction=1.0):
+    return [
+        {
+            "trace": str(trace),
+            "ok": config["value"] % 3 != 0,
+            "value": config["value"],
+            "trace_fraction": trace_fraction,
+        }
+        for trace in traces
+    ]
+
+
+def make_sweep(tmp_path, monkeypatch, **kwargs):
+    monkeypatch.setattr(ReplaySweep, "evaluate_config", fake_evaluate)
+    monkeypatch.setattr(ReplaySweep, "records", lambda self, trace, trace_fraction=1.0: [])
+    monkeypatch.setattr(ReplaySweep, "_segment_controller_artifact", lambda self: None)
+    for name, content in (("tuned_a3_config.json", "{}"), ("segment_controller.joblib", "artifact")):
+        if not (tmp_path / name).exists():
+            (tmp_path / name).write_text(content, encoding="utf-8")
+    return ReplaySweep(
+        [tmp_path / "seed51.jsonl", tmp_path / "seed52.jsonl"],
+        tuned_a3_config=tmp_path / "tuned_a3_config.json",
+        segment_artifact=tmp_path / "segment_controller.joblib",
+        replay_options=dict,
+        summarize_seed=lambda trace, summary, validation: dict(summary),
+        failed_seed=lambda trace, exc: {"ok": False, "error": str(exc)},
+        **kwargs,
+    )
+
+
+def indexed(count):
+    return [(index, {"value": index}) for index in range(count, 0, -1)]
+
+
+def test_parallel_sweep_returns_results_in_config_order(tmp_path, monkeypatch):
+    sweep = make_sweep(tmp_path, monkeypatch, workers=3)
+
+    outcomes = sweep.run(indexed(7), stage="stage_a")
+
+    assert [outcome.config_index for outcome in outcomes] == [7, 6, 5, 4, 3, 2, 1]
+    assert [outcome.failed for outcome in outcomes] == [False, True, False, False, True, False, False]
+    assert outcomes[0].seed_results[1]["trace"].endswith("seed52.jsonl")
+
+
+def test_sweep_resumes_from_checkpoint_and_skips_finished_configs(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    first = make_sweep(tmp_path, monkeypatch, checkpoint=checkpoint)
+    first.run(indexed(3), stage="stage_a")
+    with checkpoint.open("a", encoding="utf-8") as handle:
+        handle.write('{"stage": "stage_a", "config_in')
+
+    calls = []
+
+    def counting_evaluate(self, config, traces, trace_fraction=1.0):
+        calls.append(config["value"])
+        return fake_evaluate(self, config, traces, trace_fraction)
+
+    resumed = make_sweep(tmp_path, monkeypatch, checkpoint=checkpoint)
+    monkeypatch.setattr(ReplaySweep, "evaluate_config", counting_evaluate)
+    outcomes = resumed.run(indexed(5), stage="stage_a")
+
+    assert calls == [5, 4]
+    assert [outcome.config_index for outcome in outcomes] == [5, 4, 3, 2, 1]
+    rows = [json.loads(line) for line in checkpoint.read_text(encoding="utf-8").splitlines()]
+    assert sorted(row["config_index"] for row in rows) == [1, 2, 3, 4, 5]
+
+
+def test_checkpoint_rows_for_other_inputs_are_evaluated_again(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    make_sweep(tmp_path, monkeypatch, checkpoint=checkpoint).run(indexed(2), stage="stage_a")
+    (tmp_path / "segment_controller.joblib").write_text("retrained", encoding="utf-8")
+
+    calls = []
+
+    def counting_evaluate(self, config, traces, trace_fraction=1.0):
+        calls.append(config["value"])
+        return fake_evaluate(self, config, traces, trace_fraction)
+
+    def resume():
+        sweep = make_sweep(tmp_path, monkeypatch, checkpoint=checkpoint)
+        monkeypatch.setattr(ReplaySweep, "evaluate_config", counting_evaluate)
+        sweep.run(indexed(2), stage="stage_a")
+
+    resume()
+    (tmp_path / "tuned_a3_config.json").write_text('{"ttt_ms": 160}', encoding="utf-8")
+    resume()
+    resume()
+
+    assert calls == [2, 1, 2, 1]
+    rows = [json.loads(line) for line in checkpoint.read_text(encoding="utf-8").splitlines()]
+    assert len({json.dumps(row["inputs"], sort_keys=True) for row in rows}) == 3
+
+
+def test_checkpoint_for_a_different_grid_is_rejected(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    make_sweep(tmp_path, monkeypatch, checkpoint=checkpoint).run(indexed(2), stage="stage_a")
+
+    sweep = make_sweep(tmp_path, monkeypatch, checkpoint=checkpoint)
+    with pytest.raises(ValueError, match="does not match"):
+        sweep.run([(1, {"value": 10})], stage="stage_a")
+
+
+def test_successive_halving_keeps_best_third_on_growing_prefixes(tmp_path, monkeypatch):
+    sweep = make_sweep(tmp_path, monkeypatch)
+
+    def entry(outcome):
+        return {
+            "config_index": outcome.config_index,
+            "config": outcome.config,
+            "pass": not outcome.failed,
+            "fraction": outcome.seed_results[0]["trace_fraction"],
+        }
+
+    results, rungs = successive_halving(
+        sweep,
+        indexed(9),
+        build_entry=entry,
+        rank_key=lambda item: -item["config"]["value"],
+    )
+
+    assert [rung["trace_fraction"] for rung in rungs] == pytest.approx([1 / 9, 1 / 3, 1.0])
+    assert [rung["config_count"] for rung in rungs] == [9, 3, 1]
+    # Failing configs (multiples of three) are cut first, then the lower values.
+    assert rungs[0]["kept_config_indices"] == [8, 7, 5]
+    assert [(item["config_index"], item["fraction"]) for item in results] == [(8, 1.0)]
+
+
+def test_trace_prefix_keeps_whole_snapshots():
+    records = [
+        feature_vector_to_trace_record(
+            {
+                "ue_id": ue_id,
+                "latitude": 37.1,
+                "longitude": 23.2,
+                "connected_to": "cell-a",
+                "neighbor_rsrp_dbm": {"cell-a": -84.0},
+            },
+            scenario="highway",
+            seed=51,
+            step_index=step,
+            timestamp_s=float(step),
+        )
+        for step in range(4)
+        for ue_id in ("ue-1", "ue-2")
+    ]
+
+    prefix = trace_prefix(records, 0.3)
+
+    assert [(record.step_index, record.ue_id) for record in prefix] == [
+        (0, "ue-1"),
+        (0, "ue-2"),
+        (1, "ue-1"),
+        (1, "ue-2"),
+    ]
+    assert trace_prefix(records, 1.0) == records
@@ -1,4 +1,5 @@
 import json
+from dataclasses import replace
 from types import SimpleNamespace
 
 import pytest
@@ -120,6 +121,36 @@ def test_segment_dataset_has_entry_candidate_and_exit_labels():
     assert "future_a3_reverse_churn_risk_count" not in entry_features
 
 
+def test_segment_horizon_windows_truncate_at_trace_end_and_track_missing_cells():
+    records = [make_record(step=step) for step in range(3)]
+    records[-1] = replace(
+        records[-1],
+        visible_cells=[cell for cell in records[-1].visible_cells if cell.cell_id != "D"],
+    )
+
+    dataset = build_segment_policy_dataset(
+        records,
+        segment_horizon_steps=5,
+        load_penalty=0.0,
+        sinr_weight=0.0,
+        rsrq_weight=0.0,
+    )
+
+    entry = {row["step_index"]: row for row in dataset.entry_rows}
+    assert sorted(entry) == [0, 1]
+    assert entry[0]["stay_score"] == -100.0
+    assert entry[0]["future_a3_recovery_trigger_count"] == 3.0
+    assert entry[0]["future_sparse_a3_trigger_count"] == 1.0
+    assert entry[0]["future_a3_max_margin_db"] == 30.0
+    assert entry[1]["future_a3_recovery_trigger_count"] == 2.0
+    candidates = {
+        (row["step_index"], row["candidate_cell"]): row for row in dataset.candidate_rows
+    }
+    assert candidates[(0, "D")]["segment_target_disappears"] == 1
+    assert candidates[(0, "B")]["segment_target_disappears"] == 0
+    assert candidates[(1, "D")]["segment_candidate_sequence_score"] < -100.0
+
+
 def test_export_segment_dataset_writes_manifest(tmp_path):
     trace = tmp_path / "trace.jsonl"
     output = tmp_path / "segment.jsonl"
@@ -0,0 +1,138 @@
+from dataclasses import replace
+
+import pytest
+
+from scripts.policy_comparison.convert_trace_format import main
+from scripts.policy_comparison.nef_trace import feature_vector_to_trace_record
+from scripts.policy_comparison.schemas import PolicyDecisionRecord
+from scripts.policy_comparison.trace_columnar import ColumnarTrace, read_trace_columnar
+from scripts.policy_comparison.trace_io import (
+    read_decisions,
+    read_trace,
+    read_trace_jsonl,
+    write_decisions,
+    write_trace,
+    write_trace_jsonl,
+)
+
+
+def records():
+    first = feature_vector_to_trace_record(
+        {
+            "ue_id": "ue-1",
+            "latitude": 37.1,
+            "longitude": 23.2,
+            "altitude": 12.0,
+            "speed": 30.0,
+            "connected_to": "cell-a",
+            "neighbor_rsrp_dbm": {"cell-a": -84.0, "cell-b": -78.0, "cell-c": -99.5},
+            "neighbor_sinrs": {"cell-a": 7.0, "cell-b": 10.0},
+            "neighbor_cell_loads": {"cell-a": 3, "cell-c": 0},
+            "service_type": "urllc",
+            "qos_requirements": {"latency_ms": 10.0},
+            "observed_qos": {"latest": {"latency_ms": 8.5}},
+        },
+        scenario="highway",
+        seed=42,
+        step_index=0,
+        timestamp_s=0.0,
+        topology_hash="topology",
+    )
+    second = feature_vector_to_trace_record(
+        {
+            "ue_id": "ue-2",
+            "latitude": 37.2,
+            "longitude": 23.3,
+            "connected_to": "cell-b",
+            "neighbor_rsrp_dbm": {"cell-b": -70.0},
+        },
+        scenario="highway",
+        seed=42,
+        step_index=0,
+        timestamp_s=0.0,
+    )
+    third = replace(
+        first,
+        step_index=1,
+        timestamp_s=1.0,
+        ue_position={"latitude": 37.11, "longitude": 23.21, "x_m": 5.0},
+        topology_cell_ids=["cell-a", "cell-b", "cell-c"],
+    )
+    return [first, second, third]
+
+
+def decision(step, target=None):
+    return PolicyDecisionRecord(
+        ue_id="ue-1",
+        timestamp_s=float(step),
+        step_index=step,
+        current_serving_cell="cell-a",
+        selected_target_cell=target,
+        decision_type="handover" if target else "stay",
+        policy_name="fixed_a3_baseline",
+        policy_parameters={"hysteresis_db": 2.0},
+        serving_measurement_value=-80.0,
+        neighbour_measurements_considered={"cell-b": -78.0},
+        trigger_condition_result=target is not None,
+        time_to_trigger_state={"cell-b": {"elapsed_s": 0.16}},
+        cooldown_state={},
+        reason="test",
+        debug={"nested": {"values": [1, 2]}},
+        decision_latency_ms=0.5 if target else None,
+        confidence=None,
+    )
+
+
+def test_trace_round_trips_through_columnar_and_matches_jsonl(tmp_path):
+    original = records()
+    jsonl_path = tmp_path / "trace.jsonl"
+    columnar_path = tmp_path / "trace.npz"
+    write_trace(original, jsonl_path)
+    write_trace(original, columnar_path)
+
+    assert not (tmp_path / "trace.npz.npz").exists()
+    assert read_trace(columnar_path) == original
+    assert read_trace(columnar_path) == read_trace(jsonl_path)
+    restored = read_trace(columnar_path)[0]
+    assert restored.visible_cell_map["cell-b"].load is None
+    assert restored.visible_cell_map["cell-c"].load == 0.0
+    assert restored.observed_qos == {"latency_ms": 8.5}
+
+
+def test_columnar_trace_loads_columns_lazily(tmp_path):
+    path = tmp_path / "trace.npz"
+    write_trace(records(), path)
+
+    with ColumnarTrace(path) as trace:
+        assert len(trace) == 3
+        assert trace.column("ue_id") == ["ue-1", "ue-2", "ue-1"]
+        assert trace.column("cell_offsets").tolist() == [0, 3, 4, 7]
+        assert trace.column("topology_hash") == ["topology", None, "topology"]
+
+
+def test_decisions_round_trip_through_columnar(tmp_path):
+    decisions = [decision(0), decision(1, target="cell-b")]
+    path = tmp_path / "decisions" / "fixed_a3_baseline.npz"
+    write_decisions(decisions, path)
+
+    assert read_decisions(path) == decisions
+
+
+def test_columnar_reader_rejects_wrong_kind(tmp_path):
+    path = tmp_path / "decisions.npz"
+    write_decisions([decision(0)], path)
+
+    with pytest.raises(ValueError, match="columnar"):
+        read_trace_columnar(path)
+
+
+def test_convert_cli_round_trips_trace(tmp_path):
+    source = tmp_path / "trace.jsonl"
+    write_trace_jsonl(records(), source)
+    columnar = tmp_path / "trace.npz"
+    back = tmp_path / "back.jsonl"
+
+    assert main(["--input", str(source), "--output", str(columnar), "--compress"]) == 0
+    assert main(["--input", str(columnar), "--output", str(back)]) == 0
+    assert read_trace_jsonl(back) == read_trace_jsonl(source)
+    assert main(["--input", str(source), "--output", str(tmp_path / "copy.jsonl")]) == 1
@@ -101,6 +101,68 @@ def test_trace_jsonl_round_trip(tmp_path):
     assert read_trace_jsonl(path) == [record]
 
 
+def test_policy_context_overlays_share_unchanged_fields():
+    record = feature_vector_to_trace_record(
+        feature_vector(),
+        scenario="highway",
+        seed=42,
+        step_index=0,
+        timestamp_s=0.0,
+    )
+    assert record.visible_cell_map is record.visible_cell_map
+
+    view = record.with_policy_context(serving_cell="cell-b", cell_loads={"cell-a": 4})
+
+    assert view.serving_cell == "cell-b"
+    assert view.visible_cell_map["cell-a"] is record.visible_cell_map["cell-a"]
+    assert view.visible_cell_map["cell-b"].load == 0.0
+    assert view.ue_position is record.ue_position
+    assert record.serving_cell == "cell-a"
+    assert record.visible_cell_map["cell-b"].load == 2.0
+
+    with_qos = view.with_policy_context(observed_qos={"latency_ms": 5.0})
+    assert with_qos.observed_qos == {"latency_ms": 5.0}
+    assert with_qos.visible_cells is view.visible_cells
+    assert MeasurementTraceRecord.from_dict(with_qos.to_dict()) == with_qos
+
+    with pytest.raises(TraceSchemaError):
+        record.with_serving_cell("cell-z")
+
+
+def test_derived_memo_is_shared_per_serving_cell_across_views():
+    record = feature_vector_to_trace_record(
+        feature_vector(),
+        scenario="highway",
+        seed=42,
+        step_index=0,
+        timestamp_s=0.0,
+    )
+    calls = []
+
+    def strongest(item):
+        calls.append(item.serving_cell)
+        return max(item.visible_cells, key=lambda cell: cell.rsrp_dbm).cell_id
+
+    assert record.derived("strongest", strongest) == "cell-b"
+    assert record.derived("strongest", strongest) == "cell-b"
+    with_qos = record.with_policy_context(observed_qos={"latency_ms": 5.0})
+    assert with_qos.derived("strongest", strongest) == "cell-b"
+    same_serving = record.with_policy_context(serving_cell="cell-a")
+    assert same_serving.derived("strongest", strongest) == "cell-b"
+    assert calls == ["cell-a"]
+
+    loaded = record.with_policy_context(cell_loads={"cell-a": 1})
+    assert loaded.derived("strongest", strongest) == "cell-b"
+    assert calls == ["cell-a"]
+
+    record.with_serving_cell("cell-b").derived("strongest", strongest)
+    loaded.with_policy_context(serving_cell="cell-b", cell_loads={"cell-b": 2}).derived(
+        "strongest", strongest
+    )
+    assert calls == ["cell-a", "cell-b"]
+    assert MeasurementTraceRecord.from_dict(with_qos.to_dict()) == with_qos
+
+
 def test_topology_hash_ignores_volatile_created_at(tmp_path):
     left = tmp_path / "left_topology.json"
     right = tmp_path / "right_topology.json"